@@ -4,6 +4,7 @@ from pcs.cli.cluster_property.output import PropertyConfigurationFacade
 from pcs.cli.common.errors import CmdLineInputError
 from pcs.cli.common.parse_args import Argv, InputModifiers
 from pcs.cli.reports.output import deprecation_warning
+from pcs.common.pacemaker.acl import CibAclEffectivePermissionsDto
 from pcs.common.str_tools import indent
 from pcs.lib.pacemaker.values import is_true
 
@@ -71,6 +72,24 @@ def acl_disable(lib, argv, modifiers):
     lib.cluster_property.set_properties({"enable-acl": "false"})
 
 
+def acl_effective(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+      * -f - CIB file
+    """
+    modifiers.ensure_only_supported("-f")
+    if len(argv) < 2:
+        raise CmdLineInputError()
+    target_type, target_id, *group_id_list = argv
+    if target_type == "user":
+        dto = lib.acl.get_effective_permissions(target_id, group_id_list)
+    elif target_type == "group" and not group_id_list:
+        dto = lib.acl.get_effective_permissions(None, [target_id])
+    else:
+        raise CmdLineInputError()
+    print("\n".join(effective_permissions_to_str(dto)))
+
+
 def user_create(lib, argv, modifiers):
     """
     Options:
@@ -324,3 +343,38 @@ def _permission_to_str(permission):
         out += ["id", permission.get("reference")]
     out.append(f"({permission.get('id')})")
     return " ".join(out)
+
+
+def effective_permissions_to_str(
+    dto: CibAclEffectivePermissionsDto,
+) -> list[str]:
+    out = []
+    if dto.user_id is not None:
+        title = f"User: {dto.user_id}"
+        if dto.group_id_list:
+            out.append(" ".join(["Groups:"] + dto.group_id_list))
+    else:
+        title = " ".join(["Group:"] + dto.group_id_list)
+    out.append(" ".join(["Roles:"] + dto.role_id_list))
+    if not dto.acl_enabled:
+        default_reason = "ACLs are disabled"
+    elif not dto.restricted:
+        default_reason = "user is not restricted by ACLs"
+    else:
+        default_reason = "default"
+    out.append("Access:")
+    out += indent(
+        [
+            "{access} {path} ({permissions})".format(
+                access=access.access,
+                path=access.path,
+                permissions=(
+                    ", ".join(access.permission_id_list)
+                    if access.permission_id_list
+                    else default_reason
+                ),
+            )
+            for access in dto.access_list
+        ]
+    )
+    return [title] + indent(out)
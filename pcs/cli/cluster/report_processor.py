@@ -22,6 +22,10 @@ class NodeRemoveRemoteReportProcessor(reports.ReportProcessor):
         self._save_in_memory = True
         self._reports: reports.ReportItemList = []
 
+    @property
+    def is_debug_enabled(self) -> bool:
+        return self._include_debug
+
     def _do_report(self, report_item: reports.ReportItem) -> None:
         if (
             report_item.severity.level == reports.ReportItemSeverity.DEBUG
@@ -125,6 +125,7 @@ def load_module(env, middleware_factory, name):  # noqa: PLR0911, PLR0912
                 "add_permission": acl.add_permission,
                 "remove_permission": acl.remove_permission,
                 "get_config": acl.get_config,
+                "get_effective_permissions": acl.get_effective_permissions,
             },
         )
 
@@ -169,6 +170,7 @@ def load_module(env, middleware_factory, name):  # noqa: PLR0911, PLR0912
             "enable_booth": booth.enable_booth,
             "get_resource_ids_from_cluster": booth.get_resource_ids_from_cluster,
             "get_status": booth.get_status,
+            "get_status_dto": booth.get_status_dto,
             "pull_config": booth.pull_config,
             "remove_from_cluster": booth.remove_from_cluster,
             "restart": booth.restart,
@@ -346,6 +348,8 @@ def load_module(env, middleware_factory, name):  # noqa: PLR0911, PLR0912
                 "maintenance_unmaintenance_local": (
                     node.maintenance_unmaintenance_local
                 ),
+                "rolling_standby": node.rolling_standby,
+                "rolling_standby_plan": node.rolling_standby_plan,
                 "standby_unstandby_all": node.standby_unstandby_all,
                 "standby_unstandby_list": node.standby_unstandby_list,
                 "standby_unstandby_local": node.standby_unstandby_local,
@@ -449,6 +453,7 @@ def load_module(env, middleware_factory, name):  # noqa: PLR0911, PLR0912
                 "create_as_clone": resource.create_as_clone,
                 "create_in_group": resource.create_in_group,
                 "create_into_bundle": resource.create_into_bundle,
+                "create_many": resource.create_many,
                 "disable": resource.disable,
                 "disable_safe": resource.disable_safe,
                 "disable_simulate": resource.disable_simulate,
@@ -466,6 +471,7 @@ def load_module(env, middleware_factory, name):  # noqa: PLR0911, PLR0912
                 "update_meta": resource.update_meta,
                 "move": resource.move,
                 "move_autoclean": resource.move_autoclean,
+                "refresh_staged": resource.refresh_staged,
                 "restart": resource.restart,
                 "stop": resource.stop,
                 "unmanage": resource.unmanage,
@@ -499,6 +505,7 @@ def load_module(env, middleware_factory, name):  # noqa: PLR0911, PLR0912
                 middleware_factory.corosync_conf_existing,
             ),
             {
+                "cluster_status_revision": status.cluster_status_revision,
                 "pacemaker_status_xml": status.pacemaker_status_xml,
                 "full_cluster_status_plaintext": (
                     status.full_cluster_status_plaintext
@@ -74,6 +74,7 @@ MODIFIER_OPTIONS_BOOL: Final[frozenset[str]] = frozenset(
         "--show-secrets",
         "--simulate",
         "--skip-offline",
+        "--staged",
         "--start",
         "--strict",
         "--yes",
@@ -133,6 +134,8 @@ PCS_LONG_OPTIONS: Final = [
     "no-strict",
     # resource cleanup | refresh
     "strict",
+    # resource refresh in waves
+    "staged",
     "pacemaker",
     "corosync",
     "no-default-ops",
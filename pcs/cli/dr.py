@@ -77,7 +77,7 @@ def status(
     Options:
       * --full - show full details, node attributes and failcount
       * --hide-inactive - hide inactive resources
-      * --request-timeout - HTTP timeout for node authorization check
+      * --request-timeout - HTTP timeout for getting status of each site
     """
     modifiers.ensure_only_supported(
         "--full",
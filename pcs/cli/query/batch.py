@@ -0,0 +1,95 @@
+import json
+import shlex
+import sys
+from typing import Any
+
+from pcs.cli.common.errors import CmdLineInputError
+from pcs.cli.common.parse_args import Argv, InputModifiers
+from pcs.cli.query import resource
+from pcs.common.resource_status import ResourcesStatusFacade
+from pcs.common.tools import format_os_error
+
+
+def _read_query_lines(argv: Argv) -> list[str]:
+    if len(argv) > 1:
+        raise CmdLineInputError()
+    if not argv or argv[0] == "-":
+        return sys.stdin.read().splitlines()
+    try:
+        with open(argv[0], encoding="utf-8") as query_file:
+            return query_file.read().splitlines()
+    except OSError as e:
+        raise CmdLineInputError(
+            f"Unable to read file '{argv[0]}': {format_os_error(e)}"
+        ) from e
+
+
+def _parse_query_line(line: str) -> resource.ResourceQuery | None:
+    try:
+        argv = shlex.split(line, comments=True)
+    except ValueError as e:
+        raise CmdLineInputError(f"Unable to parse the query: {e}") from e
+    if not argv:
+        return None
+    if argv[0] != "resource":
+        raise CmdLineInputError(
+            f"Unknown query type '{argv[0]}', only 'resource' is supported"
+        )
+    return resource.parse_query(argv[1:])
+
+
+def _error_to_str(e: CmdLineInputError) -> str:
+    return e.message or "Invalid query"
+
+
+def batch(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+        * -f - CIB file
+    """
+    modifiers.ensure_only_supported("-f")
+    query_lines = _read_query_lines(argv)
+
+    parsed_queries: list[
+        tuple[str, resource.ResourceQuery | CmdLineInputError]
+    ] = []
+    for line in query_lines:
+        try:
+            query = _parse_query_line(line)
+        except CmdLineInputError as e:
+            parsed_queries.append((line.strip(), e))
+            continue
+        if query is not None:
+            parsed_queries.append((line.strip(), query))
+
+    output = []
+    exit_code = 0
+    # All the queries are evaluated against a single snapshot of the status.
+    status: ResourcesStatusFacade | None = None
+    for line, parsed_query in parsed_queries:
+        query_output: dict[str, Any] = {
+            "query": line,
+            "result": None,
+            "value": None,
+            "error": None,
+        }
+        try:
+            if isinstance(parsed_query, CmdLineInputError):
+                raise parsed_query
+            if status is None:
+                status = ResourcesStatusFacade.from_resources_status_dto(
+                    lib.status.resources_status()
+                )
+            result = resource.evaluate_query(parsed_query, status)
+            query_output["result"] = result.result
+            query_output["value"] = result.value
+            if result.result is False and exit_code == 0:
+                exit_code = 2
+        except CmdLineInputError as e:
+            query_output["error"] = _error_to_str(e)
+            exit_code = 1
+        output.append(query_output)
+
+    print(json.dumps(output, indent=4))
+    if exit_code:
+        raise SystemExit(exit_code)
@@ -1,4 +1,7 @@
-from typing import Any, cast
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, NoReturn, cast
 
 from pcs.cli.common.errors import CmdLineInputError
 from pcs.cli.common.parse_args import (
@@ -6,6 +9,7 @@ from pcs.cli.common.parse_args import (
     Argv,
     InputModifiers,
     group_by_keywords,
+    wait_to_timeout,
 )
 from pcs.common import reports
 from pcs.common.resource_status import (
@@ -27,17 +31,43 @@ from pcs.common.resource_status import (
 )
 from pcs.common.str_tools import format_list, format_optional
 
+# how often to check if the status of resources has changed while waiting
+_WAIT_POLL_INTERVAL = 1
+
+
+@dataclass(frozen=True)
+class QueryResult:
+    # True or False for queries checking a condition, None for queries getting
+    # a value
+    result: bool | None
+    # value provided by the query, None for queries only checking a condition
+    value: Any
+    # items printed in plain text output, each on a separate line
+    text: list[Any]
+
+
+QueryEvaluator = Callable[[ResourcesStatusFacade], QueryResult]
+
+
+@dataclass(frozen=True)
+class ResourceQuery:
+    name: str
+    evaluate: QueryEvaluator
+
+    @property
+    def is_predicate(self) -> bool:
+        return self.name not in _VALUE_QUERIES
 
-def _handle_query_result(result: bool, quiet: bool) -> SystemExit:
-    if not quiet:
-        print(result)
 
-    if result:
-        return SystemExit(0)
-    return SystemExit(2)
+def _predicate_result(result: bool) -> QueryResult:
+    return QueryResult(result, None, [result])
 
 
-def _handle_resource_exception(e: ResourceException) -> None:
+def _value_result(value: Any, text: Any) -> QueryResult:
+    return QueryResult(None, value, [text])
+
+
+def _handle_resource_exception(e: ResourceException) -> NoReturn:
     resource_id = f"{e.resource_id}{format_optional(e.instance_id, ':{}')}"
     if isinstance(e, ResourceNonExistentException):
         raise CmdLineInputError(f"Resource '{resource_id}' does not exist")
@@ -57,7 +87,7 @@ def _handle_resource_exception(e: ResourceException) -> None:
     raise CmdLineInputError(f"Unknown error with resource '{resource_id}'")
 
 
-def _handle_query_exception(e: QueryException) -> None:
+def _handle_query_exception(e: QueryException) -> NoReturn:
     if isinstance(e, MembersQuantifierUnsupportedException):
         raise CmdLineInputError(
             "'members' quantifier can be used only on group resources or "
@@ -155,34 +185,20 @@ def _pop_resource_id(argv: Argv) -> tuple[str, str | None]:
     return resource_id, None
 
 
-def exists(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
-    """
-    Options:
-        * -f - CIB file
-        * --quiet - do not print anything to output
-    """
-    resource_id, instance_id = _pop_resource_id(argv)
+def _parse_exists(
+    resource_id: str, instance_id: str | None, argv: Argv
+) -> QueryEvaluator:
     if argv:
         raise CmdLineInputError()
 
-    quiet = _handle_is_modifiers(modifiers)
-
-    raise _handle_query_result(
-        _get_resource_status_facade(lib).exists(resource_id, instance_id),
-        quiet,
+    return lambda status: _predicate_result(
+        status.exists(resource_id, instance_id)
     )
 
 
-def is_type(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
-    """
-    Options:
-        * -f - CIB file
-        * --quiet - do not print anything to output
-    """
-    resource_id, instance_id = _pop_resource_id(argv)
-
-    quiet = _handle_is_modifiers(modifiers)
-
+def _parse_is_type(
+    resource_id: str, instance_id: str | None, argv: Argv
+) -> QueryEvaluator:
     sections = group_by_keywords(argv, ["unique", "promotable"], "type")
     sections.ensure_unique_keywords()
 
@@ -220,129 +236,79 @@ def is_type(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
                 f"type '{expected_type.value}' cannot be promotable"
             )
 
-    resources_status = _get_resource_status_facade(lib)
-    try:
-        result = (
-            resources_status.get_type(resource_id, instance_id) == expected_type
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
-
-    if result and check_unique:
-        result = resources_status.is_unique(resource_id, instance_id)
-
-    if result and check_promotable:
-        result = resources_status.is_promotable(resource_id, instance_id)
+    def evaluate(status: ResourcesStatusFacade) -> QueryResult:
+        result = status.get_type(resource_id, instance_id) == expected_type
+        if result and check_unique:
+            result = status.is_unique(resource_id, instance_id)
+        if result and check_promotable:
+            result = status.is_promotable(resource_id, instance_id)
+        return _predicate_result(result)
 
-    raise _handle_query_result(result, quiet)
+    return evaluate
 
 
-def get_type(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
-    """
-    Options:
-        * -f - CIB file
-        * --quiet - do not print anything to output
-    """
-    resource_id, instance_id = _pop_resource_id(argv)
-
+def _parse_get_type(
+    resource_id: str, instance_id: str | None, argv: Argv
+) -> QueryEvaluator:
     if argv:
         raise CmdLineInputError()
 
-    _handle_get_modifiers(modifiers)
-    resource_status = _get_resource_status_facade(lib)
-
-    try:
-        resource_type = resource_status.get_type(resource_id, instance_id)
-    except ResourceException as e:
-        _handle_resource_exception(e)
-
-    output = [resource_type.value]
-    if can_be_unique(resource_type) and resource_status.is_unique(
-        resource_id, instance_id
-    ):
-        output.append("unique")
-    if can_be_promotable(resource_type) and resource_status.is_promotable(
-        resource_id, instance_id
-    ):
-        output.append("promotable")
+    def evaluate(status: ResourcesStatusFacade) -> QueryResult:
+        resource_type = status.get_type(resource_id, instance_id)
+        output = [resource_type.value]
+        if can_be_unique(resource_type) and status.is_unique(
+            resource_id, instance_id
+        ):
+            output.append("unique")
+        if can_be_promotable(resource_type) and status.is_promotable(
+            resource_id, instance_id
+        ):
+            output.append("promotable")
+        return _value_result(" ".join(output), " ".join(output))
 
-    print(" ".join(output))
+    return evaluate
 
 
-def is_stonith(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
-    """
-    Options:
-        * -f - CIB file
-        * --quiet - do not print anything to output
-    """
-    resource_id, instance_id = _pop_resource_id(argv)
+def _parse_is_stonith(
+    resource_id: str, instance_id: str | None, argv: Argv
+) -> QueryEvaluator:
     if argv:
         raise CmdLineInputError()
 
-    quiet = _handle_is_modifiers(modifiers)
-
-    try:
-        result = _get_resource_status_facade(lib).is_stonith(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
-
-    raise _handle_query_result(result, quiet)
+    return lambda status: _predicate_result(
+        status.is_stonith(resource_id, instance_id)
+    )
 
 
-def get_members(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
-    """
-    Options:
-        * -f - CIB file
-        * --quiet - do not print anything to output
-    """
-    resource_id, instance_id = _pop_resource_id(argv)
+def _parse_get_members(
+    resource_id: str, instance_id: str | None, argv: Argv
+) -> QueryEvaluator:
     if argv:
         raise CmdLineInputError()
 
-    _handle_get_modifiers(modifiers)
+    def evaluate(status: ResourcesStatusFacade) -> QueryResult:
+        members = status.get_members(resource_id, instance_id)
+        return _value_result(list(members), "\n".join(members))
 
-    try:
-        members = _get_resource_status_facade(lib).get_members(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
+    return evaluate
 
-    print("\n".join(members))
-
-
-def get_nodes(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
-    """
-    Options:
-        * -f - CIB file
-        * --quiet - do not print anything to output
-    """
-    resource_id, instance_id = _pop_resource_id(argv)
 
+def _parse_get_nodes(
+    resource_id: str, instance_id: str | None, argv: Argv
+) -> QueryEvaluator:
     if argv:
         raise CmdLineInputError()
 
-    _handle_get_modifiers(modifiers)
-    try:
-        nodes = _get_resource_status_facade(lib).get_nodes(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
-
-    print("\n".join(nodes))
+    def evaluate(status: ResourcesStatusFacade) -> QueryResult:
+        nodes = status.get_nodes(resource_id, instance_id)
+        return _value_result(list(nodes), "\n".join(nodes))
 
+    return evaluate
 
-def is_state(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
-    """
-    Options:
-        * -f - CIB file
-        * --quiet - do not print anything to output
-    """
-    resource_id, instance_id = _pop_resource_id(argv)
 
+def _parse_is_state(
+    resource_id: str, instance_id: str | None, argv: Argv
+) -> QueryEvaluator:
     sections = group_by_keywords(
         argv,
         {"on-node", "members", "instances"},
@@ -364,24 +330,23 @@ def is_state(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     members_quantifier = _parse_more_members_quantifier(sections, "members")
     instances_quantifier = _parse_more_members_quantifier(sections, "instances")
 
-    quiet = _handle_is_modifiers(modifiers)
-
-    resource_status = _get_resource_status_facade(lib)
-    try:
+    def evaluate(status: ResourcesStatusFacade) -> QueryResult:
         if expected_value is not None and (
             expected_state in (ResourceState.LOCKED_TO, ResourceState.PENDING)
         ):
-            result = resource_status.is_state_exact_value(
-                resource_id,
-                instance_id,
-                cast(ResourceStateExactCheck, expected_state),
-                expected_value,
-                expected_node_name,
-                members_quantifier,
-                instances_quantifier,
+            return _predicate_result(
+                status.is_state_exact_value(
+                    resource_id,
+                    instance_id,
+                    cast(ResourceStateExactCheck, expected_state),
+                    expected_value,
+                    expected_node_name,
+                    members_quantifier,
+                    instances_quantifier,
+                )
             )
-        else:
-            result = resource_status.is_state(
+        return _predicate_result(
+            status.is_state(
                 resource_id,
                 instance_id,
                 expected_state,
@@ -389,6 +354,114 @@ def is_state(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
                 members_quantifier,
                 instances_quantifier,
             )
+        )
+
+    return evaluate
+
+
+def _parse_is_in_container(
+    get_container_id: Callable[
+        [ResourcesStatusFacade, str, str | None], str | None
+    ],
+) -> Callable[[str, str | None, Argv], QueryEvaluator]:
+    def parse(
+        resource_id: str, instance_id: str | None, argv: Argv
+    ) -> QueryEvaluator:
+        if len(argv) > 1:
+            raise CmdLineInputError()
+        expected_id = argv[0] if argv else None
+
+        def evaluate(status: ResourcesStatusFacade) -> QueryResult:
+            real_id = get_container_id(status, resource_id, instance_id)
+            is_in_container = real_id is not None and (
+                expected_id is None or real_id == expected_id
+            )
+            text: list[Any] = [is_in_container]
+            if real_id is not None:
+                text.append(real_id)
+            return QueryResult(is_in_container, real_id, text)
+
+        return evaluate
+
+    return parse
+
+
+def _parse_get_index_in_group(
+    resource_id: str, instance_id: str | None, argv: Argv
+) -> QueryEvaluator:
+    if argv:
+        raise CmdLineInputError()
+
+    def evaluate(status: ResourcesStatusFacade) -> QueryResult:
+        index = status.get_index_in_group(resource_id, instance_id)
+        return _value_result(index, index)
+
+    return evaluate
+
+
+_QUERY_PARSERS: dict[str, Callable[[str, str | None, Argv], QueryEvaluator]] = {
+    "exists": _parse_exists,
+    "is-in-bundle": _parse_is_in_container(
+        ResourcesStatusFacade.get_parent_bundle_id
+    ),
+    "is-in-clone": _parse_is_in_container(
+        ResourcesStatusFacade.get_parent_clone_id
+    ),
+    "is-in-group": _parse_is_in_container(
+        ResourcesStatusFacade.get_parent_group_id
+    ),
+    "is-state": _parse_is_state,
+    "is-stonith": _parse_is_stonith,
+    "is-type": _parse_is_type,
+    "get-type": _parse_get_type,
+    "get-members": _parse_get_members,
+    "get-nodes": _parse_get_nodes,
+    "get-index-in-group": _parse_get_index_in_group,
+}
+
+_VALUE_QUERIES = frozenset(
+    ["get-type", "get-members", "get-nodes", "get-index-in-group"]
+)
+
+
+def _parse_query(query_name: str, argv: Argv) -> ResourceQuery:
+    resource_id, instance_id = _pop_resource_id(argv)
+    return ResourceQuery(
+        query_name, _QUERY_PARSERS[query_name](resource_id, instance_id, argv)
+    )
+
+
+def parse_query(argv: Argv) -> ResourceQuery:
+    """
+    Parse a query of a resource status
+
+    argv -- resource id followed by a query name and its arguments, e.g.
+        ['resource_id', 'is-state', 'started']
+    """
+    if len(argv) < 2:
+        raise CmdLineInputError()
+    query_name = argv.pop(1)
+    if query_name not in _QUERY_PARSERS:
+        raise CmdLineInputError(
+            reports.messages.InvalidOptionValue(
+                "query", query_name, sorted(_QUERY_PARSERS)
+            ).message
+        )
+    return _parse_query(query_name, argv)
+
+
+def evaluate_query(
+    query: ResourceQuery, status: ResourcesStatusFacade
+) -> QueryResult:
+    """
+    Evaluate a query against status of resources, raise CmdLineInputError if
+    the query cannot be evaluated
+
+    query -- parsed query
+    status -- status of resources
+    """
+    try:
+        return query.evaluate(status)
     except ResourceException as e:
         _handle_resource_exception(e)
     except QueryException as e:
@@ -396,95 +469,117 @@ def is_state(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     except NotImplementedError as e:
         raise CmdLineInputError(str(e)) from e
 
-    raise _handle_query_result(result, quiet)
 
+def _print_result(result: QueryResult) -> None:
+    for line in result.text:
+        print(line)
 
-def _handle_is_in_container(
-    real_id: str | None, expected_id: str | None, quiet: bool
-) -> SystemExit:
-    is_in_container = real_id is not None and (
-        expected_id is None or real_id == expected_id
-    )
+
+def _run_query(
+    lib: Any, query: ResourceQuery, modifiers: InputModifiers
+) -> None:
+    quiet = False
+    if query.is_predicate:
+        quiet = _handle_is_modifiers(modifiers)
+    else:
+        _handle_get_modifiers(modifiers)
+
+    result = evaluate_query(query, _get_resource_status_facade(lib))
 
     if not quiet:
-        print(is_in_container)
-        if real_id is not None:
-            print(real_id)
+        _print_result(result)
+    if result.result is not None:
+        raise SystemExit(0 if result.result else 2)
+
 
-    if not is_in_container:
-        return SystemExit(2)
-    return SystemExit(0)
+def exists(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+        * -f - CIB file
+        * --quiet - do not print anything to output
+    """
+    _run_query(lib, _parse_query("exists", argv), modifiers)
 
 
-def is_in_group(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+def is_type(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
         * -f - CIB file
         * --quiet - do not print anything to output
     """
-    resource_id, instance_id = _pop_resource_id(argv)
-    if len(argv) > 1:
-        raise CmdLineInputError()
-    expected_group_id = argv[0] if argv else None
+    _run_query(lib, _parse_query("is-type", argv), modifiers)
 
-    quiet = _handle_is_modifiers(modifiers)
 
-    try:
-        group_id = _get_resource_status_facade(lib).get_parent_group_id(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
+def get_type(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+        * -f - CIB file
+        * --quiet - do not print anything to output
+    """
+    _run_query(lib, _parse_query("get-type", argv), modifiers)
+
 
-    raise _handle_is_in_container(group_id, expected_group_id, quiet)
+def is_stonith(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+        * -f - CIB file
+        * --quiet - do not print anything to output
+    """
+    _run_query(lib, _parse_query("is-stonith", argv), modifiers)
 
 
-def is_in_clone(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+def get_members(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
         * -f - CIB file
         * --quiet - do not print anything to output
     """
-    resource_id, instance_id = _pop_resource_id(argv)
+    _run_query(lib, _parse_query("get-members", argv), modifiers)
 
-    if len(argv) > 1:
-        raise CmdLineInputError()
-    expected_clone_id = argv[0] if argv else None
 
-    quiet = _handle_is_modifiers(modifiers)
+def get_nodes(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+        * -f - CIB file
+        * --quiet - do not print anything to output
+    """
+    _run_query(lib, _parse_query("get-nodes", argv), modifiers)
 
-    try:
-        clone_id = _get_resource_status_facade(lib).get_parent_clone_id(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
 
-    raise _handle_is_in_container(clone_id, expected_clone_id, quiet)
+def is_state(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+        * -f - CIB file
+        * --quiet - do not print anything to output
+    """
+    _run_query(lib, _parse_query("is-state", argv), modifiers)
 
 
-def is_in_bundle(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+def is_in_group(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
         * -f - CIB file
         * --quiet - do not print anything to output
     """
-    resource_id, instance_id = _pop_resource_id(argv)
+    _run_query(lib, _parse_query("is-in-group", argv), modifiers)
 
-    if len(argv) > 1:
-        raise CmdLineInputError()
-    expected_bundle_id = argv[0] if argv else None
 
-    quiet = _handle_is_modifiers(modifiers)
+def is_in_clone(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+        * -f - CIB file
+        * --quiet - do not print anything to output
+    """
+    _run_query(lib, _parse_query("is-in-clone", argv), modifiers)
 
-    try:
-        bundle_id = _get_resource_status_facade(lib).get_parent_bundle_id(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
 
-    raise _handle_is_in_container(bundle_id, expected_bundle_id, quiet)
+def is_in_bundle(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+        * -f - CIB file
+        * --quiet - do not print anything to output
+    """
+    _run_query(lib, _parse_query("is-in-bundle", argv), modifiers)
 
 
 def get_index_in_group(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
@@ -493,18 +588,45 @@ def get_index_in_group(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
         * -f - CIB file
         * --quiet - do not print anything to output
     """
-    resource_id, instance_id = _pop_resource_id(argv)
-
-    if argv:
-        raise CmdLineInputError()
+    _run_query(lib, _parse_query("get-index-in-group", argv), modifiers)
 
-    _handle_get_modifiers(modifiers)
 
-    try:
-        index = _get_resource_status_facade(lib).get_index_in_group(
-            resource_id, instance_id
+def wait_until(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+        * -f - CIB file
+        * --quiet - do not print anything to output
+        * --wait - timeout in seconds, wait indefinitely if not specified
+    """
+    query = parse_query(argv)
+    if not query.is_predicate:
+        raise CmdLineInputError(
+            f"Query '{query.name}' does not check a condition and cannot be "
+            "waited for"
+        )
+    modifiers.ensure_only_supported("--quiet", "--wait", "-f")
+    quiet = modifiers.is_specified("--quiet")
+    timeout = wait_to_timeout(modifiers.get("--wait"))
+    deadline = time.monotonic() + timeout if timeout > 0 else None
+
+    # Getting and processing status of resources is expensive. Do it only if
+    # the status has changed since the query was evaluated last time.
+    last_revision = None
+    while True:
+        revision = lib.status.cluster_status_revision()
+        if revision != last_revision:
+            result = evaluate_query(query, _get_resource_status_facade(lib))
+            last_revision = revision
+            if result.result:
+                break
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        time.sleep(
+            _WAIT_POLL_INTERVAL
+            if deadline is None
+            else max(0, min(_WAIT_POLL_INTERVAL, deadline - time.monotonic()))
         )
-    except ResourceException as e:
-        _handle_resource_exception(e)
 
-    print(index)
+    if not quiet:
+        _print_result(result)
+    raise SystemExit(0 if result.result else 2)
@@ -11,6 +11,7 @@ acl_cmd = create_router(
         "config": acl.acl_config,
         "enable": acl.acl_enable,
         "disable": acl.acl_disable,
+        "effective": acl.acl_effective,
         "role": create_router(
             {
                 "create": acl.role_create,
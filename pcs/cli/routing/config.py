@@ -13,6 +13,7 @@ config_cmd = create_router(
                 "view": config.config_checkpoint_view,
                 "restore": config.config_checkpoint_restore,
                 "diff": config.config_checkpoint_diff,
+                "log": config.config_checkpoint_log,
             },
             ["config", "checkpoint"],
             default_cmd="list",
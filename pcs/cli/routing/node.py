@@ -36,6 +36,7 @@ node_cmd = create_router(
         "unmaintenance": partial(node.node_maintenance_cmd, enable=False),
         "standby": partial(node.node_standby_cmd, enable=True),
         "unstandby": partial(node.node_standby_cmd, enable=False),
+        "rolling-standby": node.node_rolling_standby_cmd,
         "attribute": _node_attribute_cmd,
         "utilization": _node_utilization_cmd,
         # pcs-to-pcsd use only
@@ -5,7 +5,7 @@ from pcs.cli.booth.command import status as booth_status_cmd
 from pcs.cli.common.errors import CmdLineInputError
 from pcs.cli.common.parse_args import Argv, InputModifiers
 from pcs.cli.common.routing import create_router
-from pcs.cli.query import resource
+from pcs.cli.query import batch, resource
 from pcs.cli.status import command as status_command
 from pcs.pcsd import pcsd_status_cmd
 from pcs.qdevice import qdevice_status_cmd
@@ -39,6 +39,7 @@ def _query_resource_router(
             "get-members": resource.get_members,
             "get-nodes": resource.get_nodes,
             "get-index-in-group": resource.get_index_in_group,
+            "wait-until": resource.wait_until,
         },
         ["status", "query", "resource", "<resource-id>"],
     )(lib, argv, modifiers)
@@ -58,7 +59,8 @@ status_cmd = create_router(
         "xml": status.xml_status,
         "status": status.full_status,
         "query": create_router(
-            {"resource": _query_resource_router}, ["status", "query"]
+            {"batch": batch.batch, "resource": _query_resource_router},
+            ["status", "query"],
         ),
         "wait": status_command.wait_for_pcmk_idle,
     },
@@ -13,3 +13,29 @@ class BoothConfigFileDto(DataTransferObject):
 class BoothConfigAndAuthfileDto(DataTransferObject):
     config: BoothConfigFileDto
     authfile: BoothConfigFileDto | None
+
+
+@dataclass(frozen=True)
+class BoothTicketStatusDto(DataTransferObject):
+    name: str
+    # None if no site has been granted the ticket
+    leader: str | None
+    expires: str | None
+
+
+@dataclass(frozen=True)
+class BoothPeerStatusDto(DataTransferObject):
+    # site or arbitrator
+    peer_type: str
+    address: str
+    # None if nothing has been received from the peer yet
+    last_received: str | None
+
+
+@dataclass(frozen=True)
+class BoothStatusDto(DataTransferObject):
+    daemon_running: bool
+    # information provided by a running daemon, e.g. booth_state, booth_type
+    daemon_attributes: dict[str, str]
+    ticket_list: list[BoothTicketStatusDto]
+    peer_list: list[BoothPeerStatusDto]
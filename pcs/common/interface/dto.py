@@ -1,7 +1,20 @@
-from collections.abc import Callable, Iterable
+import contextlib
+import copy
+import dataclasses
+import types as builtin_types
+from collections.abc import Callable, Collection, Iterable, Mapping
 from dataclasses import asdict
 from enum import Enum
-from typing import TYPE_CHECKING, Any, TypeVar
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 import dacite
 
@@ -93,6 +106,29 @@ DTO_TYPE_HOOKS_MAP: dict[type[Any], Callable[[Any], Any]] = {
 
 def from_dict(
     cls: type[DTOTYPE], data: DtoPayload, strict: bool = False
+) -> DTOTYPE:
+    # Transfer objects are decoded by a decoder compiled for their class,
+    # which is much faster than dacite. If the decoder cannot handle the data,
+    # dacite is run to produce the result or the error.
+    if type(data) is dict and issubclass(cls, DataTransferObject):
+        decoder = _get_dataclass_decoder(cls, strict)
+        if decoder is not None:
+            try:
+                return decoder(data)
+            except (_PayloadMismatchError, _UnsupportedPayloadError):
+                pass
+    return _dacite_from_dict(cls, data, strict)
+
+
+def to_dict(obj: DataTransferObject) -> DtoPayload:
+    # produces the same result as dataclasses.asdict
+    if isinstance(obj, DataTransferObject):
+        return _get_dto_encoder(type(obj))(obj)
+    return asdict(obj)
+
+
+def _dacite_from_dict(
+    cls: type[DTOTYPE], data: DtoPayload, strict: bool
 ) -> DTOTYPE:
     return dacite.from_dict(
         data_class=cls,
@@ -104,8 +140,430 @@ def from_dict(
     )
 
 
-def to_dict(obj: DataTransferObject) -> DtoPayload:
-    return asdict(obj)
+# Compiled decoders
+#
+# A decoder is compiled for each data class and strict mode on first use. It
+# is composed of converters compiled for the types of the class fields. A
+# converter either returns a value built the same way dacite builds it, or it
+# raises an exception:
+# * _PayloadMismatchError if dacite would fail to build the value as well
+# * _UnsupportedPayloadError if it cannot tell what dacite would do
+# In both cases, the whole payload is then processed by dacite so that its
+# result and errors stay the source of truth. Types which the compiler does
+# not understand make the whole class to be processed by dacite.
+
+_Converter = Callable[[Any], Any]
+
+
+class _PayloadMismatchError(Exception):
+    pass
+
+
+class _UnsupportedPayloadError(Exception):
+    pass
+
+
+class _UnsupportedTypeError(Exception):
+    pass
+
+
+_decoder_cache: dict[tuple[type[Any], bool], _Converter | None] = {}
+
+
+def _get_dataclass_decoder(cls: type[Any], strict: bool) -> _Converter | None:
+    key = (cls, strict)
+    if key not in _decoder_cache:
+        # Store a placeholder first, so that recursive data classes do not
+        # loop. Converters of data classes look up their decoder when used.
+        _decoder_cache[key] = None
+        with contextlib.suppress(_UnsupportedTypeError):
+            _decoder_cache[key] = _compile_dataclass_decoder(cls, strict)
+    return _decoder_cache[key]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _is_union(type_: Any) -> bool:
+    return get_origin(type_) in (Union, builtin_types.UnionType)
+
+
+def _is_optional(type_: Any) -> bool:
+    return _is_union(type_) and builtin_types.NoneType in get_args(type_)
+
+
+def _compile_dataclass_decoder(cls: type[Any], strict: bool) -> _Converter:
+    try:
+        type_hints = get_type_hints(cls)
+    except Exception as e:
+        raise _UnsupportedTypeError() from e
+    field_list = dataclasses.fields(cls)
+    # InitVar and non-init fields are handled specially by dacite
+    if any(
+        isinstance(type_hints.get(name), dataclasses.InitVar)
+        for name in cls.__dataclass_fields__
+    ) or any(not field.init for field in field_list):
+        raise _UnsupportedTypeError()
+
+    field_spec_list = []
+    for field in field_list:
+        field_type = type_hints[field.name]
+        default_factory: Callable[[], Any] | None = None
+        if field.default is not dataclasses.MISSING:
+            default_factory = _constant(field.default)
+        elif field.default_factory is not dataclasses.MISSING:
+            default_factory = field.default_factory
+        elif _is_optional(field_type):
+            default_factory = _none
+        field_spec_list.append(
+            (
+                field.name,
+                _compile_converter(field_type, strict),
+                default_factory,
+            )
+        )
+    field_name_set = frozenset(field.name for field in field_list)
+
+    def decode(data: dict[str, Any]) -> Any:
+        if strict and not data.keys() <= field_name_set:
+            raise _PayloadMismatchError()
+        init_values = {}
+        for name, converter, default_factory in field_spec_list:
+            if name in data:
+                init_values[name] = converter(data[name])
+            elif default_factory is not None:
+                init_values[name] = default_factory()
+            else:
+                raise _PayloadMismatchError()
+        try:
+            return cls(**init_values)
+        except Exception as e:
+            raise _PayloadMismatchError() from e
+
+    return decode
+
+
+def _none() -> None:
+    return None
+
+
+def _constant(value: Any) -> Callable[[], Any]:
+    return lambda: value
+
+
+def _compile_converter(type_: Any, strict: bool) -> _Converter:
+    converter = _compile_type_converter(type_, strict)
+    try:
+        hook = DTO_TYPE_HOOKS_MAP.get(type_)
+    except TypeError:
+        # unhashable type
+        hook = None
+    if hook is None:
+        return converter
+
+    def convert_hooked(data: Any) -> Any:
+        try:
+            data = hook(data)
+        except Exception as e:
+            raise _PayloadMismatchError() from e
+        return converter(data)
+
+    return convert_hooked
+
+
+def _compile_type_converter(  # noqa: PLR0911
+    type_: Any, strict: bool
+) -> _Converter:
+    if type_ is Any:
+        return _identity
+    if _is_union(type_):
+        return _compile_union_converter(get_args(type_), strict)
+    if hasattr(type_, "__supertype__"):
+        # NewType, dacite only checks the value is of the supertype
+        return _compile_instance_converter(type_.__supertype__)
+    origin = get_origin(type_)
+    if origin is not None:
+        type_args = get_args(type_)
+        if not isinstance(origin, type) or not type_args:
+            raise _UnsupportedTypeError()
+        if issubclass(origin, tuple):
+            return _compile_tuple_converter(type_args, strict)
+        if issubclass(origin, Mapping):
+            return _compile_mapping_converter(origin, type_args, strict)
+        if issubclass(origin, Collection):
+            return _compile_collection_converter(origin, type_args, strict)
+        raise _UnsupportedTypeError()
+    if isinstance(type_, type):
+        if dataclasses.is_dataclass(type_):
+            return _compile_dataclass_converter(type_, strict)
+        return _compile_instance_converter(type_)
+    raise _UnsupportedTypeError()
+
+
+def _compile_instance_converter(type_: Any) -> _Converter:
+    if not isinstance(type_, type) or dataclasses.is_dataclass(type_):
+        raise _UnsupportedTypeError()
+    # numeric tower as defined in PEP 484 and implemented by dacite
+    accepted_types: tuple[type[Any], ...] = (type_,)
+    if type_ is float:
+        accepted_types = (int, float)
+    elif type_ is complex:
+        accepted_types = (int, float, complex)
+
+    def convert_instance(data: Any) -> Any:
+        if isinstance(data, accepted_types):
+            return data
+        raise _PayloadMismatchError()
+
+    return convert_instance
+
+
+def _compile_dataclass_converter(cls: type[Any], strict: bool) -> _Converter:
+    def convert_dataclass(data: Any) -> Any:
+        if type(data) is dict:
+            decoder = _get_dataclass_decoder(cls, strict)
+            if decoder is None:
+                raise _UnsupportedPayloadError()
+            return decoder(data)
+        if isinstance(data, cls):
+            return data
+        if isinstance(data, Mapping):
+            raise _UnsupportedPayloadError()
+        raise _PayloadMismatchError()
+
+    return convert_dataclass
+
+
+def _compile_union_converter(
+    type_args: tuple[Any, ...], strict: bool
+) -> _Converter:
+    none_allowed = builtin_types.NoneType in type_args
+    if none_allowed and len(type_args) == 2:
+        if type_args[0] is builtin_types.NoneType:
+            # dacite builds the value as None in this case
+            raise _UnsupportedTypeError()
+        converter = _compile_converter(type_args[0], strict)
+
+        def convert_optional(data: Any) -> Any:
+            if data is None:
+                return None
+            return converter(data)
+
+        return convert_optional
+
+    converter_list = [
+        _compile_converter(type_arg, strict) for type_arg in type_args
+    ]
+
+    def convert_union(data: Any) -> Any:
+        if none_allowed and data is None:
+            return None
+        # the first matching type is used, like in dacite
+        for converter in converter_list:
+            try:
+                return converter(data)
+            except _PayloadMismatchError:
+                continue
+        raise _PayloadMismatchError()
+
+    return convert_union
+
+
+def _compile_tuple_converter(
+    type_args: tuple[Any, ...], strict: bool
+) -> _Converter:
+    if len(type_args) == 2 and type_args[1] is Ellipsis:
+        item_converter = _compile_converter(type_args[0], strict)
+
+        def convert_variadic_tuple(data: Any) -> Any:
+            if type(data) is tuple:
+                return tuple(item_converter(item) for item in data)
+            if isinstance(data, tuple):
+                raise _UnsupportedPayloadError()
+            raise _PayloadMismatchError()
+
+        return convert_variadic_tuple
+
+    converter_list = [
+        _compile_converter(type_arg, strict) for type_arg in type_args
+    ]
+
+    def convert_tuple(data: Any) -> Any:
+        if type(data) is tuple:
+            if len(data) != len(converter_list):
+                raise _PayloadMismatchError()
+            return tuple(
+                converter(item)
+                for converter, item in zip(converter_list, data, strict=True)
+            )
+        if isinstance(data, tuple):
+            raise _UnsupportedPayloadError()
+        raise _PayloadMismatchError()
+
+    return convert_tuple
+
+
+def _compile_mapping_converter(
+    origin: type[Any], type_args: tuple[Any, ...], strict: bool
+) -> _Converter:
+    if len(type_args) != 2 or not issubclass(dict, origin):
+        raise _UnsupportedTypeError()
+    # dacite does not build keys, it only checks their type
+    key_type = type_args[0]
+    if hasattr(key_type, "__supertype__"):
+        key_type = key_type.__supertype__
+    key_checker = (
+        _identity if key_type is Any else _compile_instance_converter(key_type)
+    )
+    value_converter = _compile_converter(type_args[1], strict)
+
+    def convert_mapping(data: Any) -> Any:
+        if type(data) is dict:
+            for key in data:
+                key_checker(key)
+            return {key: value_converter(value) for key, value in data.items()}
+        if isinstance(data, Mapping):
+            raise _UnsupportedPayloadError()
+        raise _PayloadMismatchError()
+
+    return convert_mapping
+
+
+def _compile_collection_converter(
+    origin: type[Any], type_args: tuple[Any, ...], strict: bool
+) -> _Converter:
+    if len(type_args) != 1:
+        raise _UnsupportedTypeError()
+    item_converter = _compile_converter(type_args[0], strict)
+    list_accepted = issubclass(list, origin)
+
+    def convert_collection(data: Any) -> Any:
+        data_type = type(data)
+        if data_type is list:
+            if not list_accepted:
+                raise _PayloadMismatchError()
+            return [item_converter(item) for item in data]
+        if data_type in (tuple, set, frozenset):
+            if not issubclass(data_type, origin):
+                raise _PayloadMismatchError()
+            return data_type(item_converter(item) for item in data)
+        if isinstance(data, Collection):
+            raise _UnsupportedPayloadError()
+        raise _PayloadMismatchError()
+
+    return convert_collection
+
+
+# Compiled encoders
+#
+# Encoders produce the same result as dataclasses.asdict. They are compiled
+# for each transfer object class and for builtin container types. Other
+# values are processed the same way asdict does it.
+
+_Encoder = Callable[[Any], Any]
+
+_ATOMIC_TYPES = frozenset(
+    {builtin_types.NoneType, bool, int, float, complex, bytes, str}
+)
+
+_encoder_cache: dict[type[Any], _Encoder] = {}
+
+
+def _encode_value(value: Any) -> Any:
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value
+    encoder = _encoder_cache.get(value_type)
+    if encoder is None:
+        encoder = _get_encoder(value_type)
+    return encoder(value)
+
+
+def _get_encoder(value_type: type[Any]) -> _Encoder:
+    encoder: _Encoder
+    if issubclass(value_type, DataTransferObject):
+        encoder = _compile_dto_encoder(value_type)
+    elif value_type is list:
+        encoder = _encode_list
+    elif value_type is tuple:
+        encoder = _encode_tuple
+    elif value_type is dict:
+        encoder = _encode_dict
+    elif (
+        issubclass(value_type, Enum)
+        and value_type.__deepcopy__ is Enum.__deepcopy__
+    ):
+        # enum members are not copied by deepcopy
+        encoder = _identity
+    else:
+        # Do not cache other types, e.g. data classes created dynamically.
+        return _encode_other
+    _encoder_cache[value_type] = encoder
+    return encoder
+
+
+def _get_dto_encoder(cls: type[Any]) -> _Encoder:
+    encoder = _encoder_cache.get(cls)
+    if encoder is None:
+        encoder = _get_encoder(cls)
+    return encoder
+
+
+def _compile_dto_encoder(cls: type[Any]) -> _Encoder:
+    name_list = tuple(field.name for field in dataclasses.fields(cls))
+    if len(name_list) < 2:
+        # attrgetter returns a tuple only for two or more attributes
+        return _encode_other
+    get_values = attrgetter(*name_list)
+
+    def encode_dto(obj: Any) -> dict[str, Any]:
+        return {
+            name: (
+                value if type(value) in _ATOMIC_TYPES else _encode_value(value)
+            )
+            for name, value in zip(name_list, get_values(obj), strict=True)
+        }
+
+    return encode_dto
+
+
+def _encode_list(value: list[Any]) -> list[Any]:
+    return [_encode_value(item) for item in value]
+
+
+def _encode_tuple(value: tuple[Any, ...]) -> tuple[Any, ...]:
+    return tuple(_encode_value(item) for item in value)
+
+
+def _encode_dict(value: dict[Any, Any]) -> dict[Any, Any]:
+    return {
+        _encode_value(key): _encode_value(item) for key, item in value.items()
+    }
+
+
+def _encode_other(value: Any) -> Any:
+    # the same steps as dataclasses.asdict does
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: _encode_value(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*[_encode_value(item) for item in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_encode_value(item) for item in value)
+    if isinstance(value, dict):
+        if hasattr(type(value), "default_factory"):
+            result = type(value)(value.default_factory)  # type: ignore[attr-defined]
+            for key, item in value.items():
+                result[_encode_value(key)] = _encode_value(item)
+            return result
+        return type(value)(
+            (_encode_value(key), _encode_value(item))
+            for key, item in value.items()
+        )
+    return copy.deepcopy(value)
 
 
 class ImplementsToDto:
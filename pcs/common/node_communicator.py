@@ -454,16 +454,29 @@ class NodeCommunicatorFactory:
         self._request_timeout = request_timeout
 
     def get_communicator(
-        self, request_timeout: int | None = None
+        self,
+        request_timeout: int | None = None,
+        communicator_logger: CommunicatorLoggerInterface | None = None,
     ) -> Communicator:
-        return self.get_simple_communicator(request_timeout=request_timeout)
+        return self.get_simple_communicator(
+            request_timeout=request_timeout,
+            communicator_logger=communicator_logger,
+        )
 
     def get_simple_communicator(
-        self, request_timeout: int | None = None
+        self,
+        request_timeout: int | None = None,
+        communicator_logger: CommunicatorLoggerInterface | None = None,
     ) -> Communicator:
+        """
+        communicator_logger -- logger used instead of the factory's one
+        """
         timeout = request_timeout if request_timeout else self._request_timeout
         return Communicator(
-            self._logger, self._user, self._groups, request_timeout=timeout
+            communicator_logger or self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
         )
 
     def get_communicator_no_privilege_transition(
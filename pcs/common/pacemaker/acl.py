@@ -0,0 +1,28 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from pcs.common.interface.dto import DataTransferObject
+
+
+@dataclass(frozen=True)
+class CibAclEffectiveAccessDto(DataTransferObject):
+    # position of the element in the CIB, e.g.
+    # /cib/configuration/resources/primitive[@id='R1']
+    path: str
+    element_id: str | None
+    tag: str
+    # read, write or deny, applies to descendants of the element as well
+    access: str
+    # permissions setting the access, empty if no permission applies
+    permission_id_list: list[str]
+
+
+@dataclass(frozen=True)
+class CibAclEffectivePermissionsDto(DataTransferObject):
+    user_id: str | None
+    group_id_list: list[str]
+    role_id_list: list[str]
+    acl_enabled: bool
+    # False for users pacemaker never applies ACLs to, e.g. root
+    restricted: bool
+    access_list: Sequence[CibAclEffectiveAccessDto]
@@ -1,5 +1,5 @@
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from pcs.common.interface.dto import DataTransferObject
 from pcs.common.pacemaker.nvset import CibNvsetDto
@@ -17,3 +17,13 @@ class CibResourcePrimitiveDto(DataTransferObject):
     meta_attributes: Sequence[CibNvsetDto]
     instance_attributes: Sequence[CibNvsetDto]
     utilization: Sequence[CibNvsetDto]
+
+
+@dataclass(frozen=True)
+class CibResourcePrimitiveCreateDto(DataTransferObject):
+    id: str
+    # standard:provider:type or just type of the agent
+    agent_name: str
+    instance_attributes: dict[str, str] = field(default_factory=dict)
+    meta_attributes: dict[str, str] = field(default_factory=dict)
+    operations: list[dict[str, str]] = field(default_factory=list)
@@ -101,6 +101,7 @@ STOPPED_RESOURCES_BEFORE_DELETE_CHECK_SKIPPED = M(
 CANNOT_CREATE_DEFAULT_CLUSTER_PROPERTY_SET = M(
     "CANNOT_CREATE_DEFAULT_CLUSTER_PROPERTY_SET"
 )
+CANNOT_CREATE_RESOURCES = M("CANNOT_CREATE_RESOURCES")
 CANNOT_GROUP_RESOURCE_WRONG_TYPE = M("CANNOT_GROUP_RESOURCE_WRONG_TYPE")
 CANNOT_LEAVE_GROUP_EMPTY_AFTER_MOVE = M("CANNOT_LEAVE_GROUP_EMPTY_AFTER_MOVE")
 CANNOT_MOVE_RESOURCE_BUNDLE_INNER = M("CANNOT_MOVE_RESOURCE_BUNDLE_INNER")
@@ -129,6 +130,7 @@ CANNOT_SET_ORDER_CONSTRAINTS_FOR_RESOURCES_IN_THE_SAME_GROUP = M(
 CANNOT_UNMOVE_UNBAN_RESOURCE_MASTER_RESOURCE_NOT_PROMOTABLE = M(
     "CANNOT_UNMOVE_UNBAN_RESOURCE_MASTER_RESOURCE_NOT_PROMOTABLE"
 )
+CIB_ACL_PERMISSION_XPATH_INVALID = M("CIB_ACL_PERMISSION_XPATH_INVALID")
 CIB_ACL_ROLE_IS_ALREADY_ASSIGNED_TO_TARGET = M(
     "CIB_ACL_ROLE_IS_ALREADY_ASSIGNED_TO_TARGET"
 )
@@ -308,12 +310,14 @@ COROSYNC_TRANSPORT_UNSUPPORTED_OPTIONS = M(
     "COROSYNC_TRANSPORT_UNSUPPORTED_OPTIONS"
 )
 CRM_MON_ERROR = M("CRM_MON_ERROR")
+DATA_COLLECTION_TIMINGS = M("DATA_COLLECTION_TIMINGS")
 DEFAULTS_CAN_BE_OVERRIDDEN = M("DEFAULTS_CAN_BE_OVERRIDDEN")
 DEPRECATED_OPTION = M("DEPRECATED_OPTION")
 DEPRECATED_OPTION_VALUE = M("DEPRECATED_OPTION_VALUE")
 DLM_CLUSTER_RENAME_NEEDED = M("DLM_CLUSTER_RENAME_NEEDED")
 DR_CONFIG_ALREADY_EXIST = M("DR_CONFIG_ALREADY_EXIST")
 DR_CONFIG_DOES_NOT_EXIST = M("DR_CONFIG_DOES_NOT_EXIST")
+DR_SITE_STATUS_TIMED_OUT = M("DR_SITE_STATUS_TIMED_OUT")
 DUPLICATE_CONSTRAINTS_EXIST = M("DUPLICATE_CONSTRAINTS_EXIST")
 EMPTY_RESOURCE_SET = M("EMPTY_RESOURCE_SET")
 EMPTY_RESOURCE_SET_LIST = M("EMPTY_RESOURCE_SET_LIST")
@@ -410,6 +414,12 @@ NODE_NOT_IN_CLUSTER = M("NODE_NOT_IN_CLUSTER")
 NODE_REMOVE_IN_PACEMAKER_FAILED = M("NODE_REMOVE_IN_PACEMAKER_FAILED")
 NODE_REMOVE_IN_PACEMAKER_SKIPPED = M("NODE_REMOVE_IN_PACEMAKER_SKIPPED")
 NODE_REPORTS_UNEXPECTED_CLUSTER_NAME = M("NODE_REPORTS_UNEXPECTED_CLUSTER_NAME")
+NODE_STANDBY_LEAVES_RESOURCES_STOPPED = M(
+    "NODE_STANDBY_LEAVES_RESOURCES_STOPPED"
+)
+NODE_STANDBY_WAVE_FINISHED = M("NODE_STANDBY_WAVE_FINISHED")
+NODE_STANDBY_WAVE_STARTED = M("NODE_STANDBY_WAVE_STARTED")
+NODE_STANDBY_WAVE_WAITING_FOR_NODES = M("NODE_STANDBY_WAVE_WAITING_FOR_NODES")
 NONE_HOST_FOUND = M("NONE_HOST_FOUND")
 NODE_USED_AS_TIE_BREAKER = M("NODE_USED_AS_TIE_BREAKER")
 NODES_TO_REMOVE_UNREACHABLE = M("NODES_TO_REMOVE_UNREACHABLE")
@@ -538,6 +548,7 @@ RESOURCE_OPERATION_INTERVAL_DUPLICATION = M(
 )
 RESOURCE_REFRESH_ERROR = M("RESOURCE_REFRESH_ERROR")
 RESOURCE_REFRESH_TOO_TIME_CONSUMING = M("RESOURCE_REFRESH_TOO_TIME_CONSUMING")
+RESOURCE_REFRESH_WAVE_STARTED = M("RESOURCE_REFRESH_WAVE_STARTED")
 RESOURCE_RESTART_ERROR = M("RESOURCE_RESTART_ERROR")
 RESOURCE_RESTART_NODE_IS_FOR_MULTIINSTANCE_ONLY = M(
     "RESOURCE_RESTART_NODE_IS_FOR_MULTIINSTANCE_ONLY"
@@ -575,6 +586,7 @@ RULE_NO_EXPRESSION_SPECIFIED = M("RULE_NO_EXPRESSION_SPECIFIED")
 RUN_EXTERNAL_PROCESS_ERROR = M("RUN_EXTERNAL_PROCESS_ERROR")
 RUN_EXTERNAL_PROCESS_FINISHED = M("RUN_EXTERNAL_PROCESS_FINISHED")
 RUN_EXTERNAL_PROCESS_STARTED = M("RUN_EXTERNAL_PROCESS_STARTED")
+RUN_EXTERNAL_PROCESS_TIMED_OUT = M("RUN_EXTERNAL_PROCESS_TIMED_OUT")
 SBD_CHECK_STARTED = M("SBD_CHECK_STARTED")
 SBD_CHECK_SUCCESS = M("SBD_CHECK_SUCCESS")
 SBD_CONFIG_ACCEPTED_BY_NODE = M("SBD_CONFIG_ACCEPTED_BY_NODE")
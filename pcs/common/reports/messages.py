@@ -981,6 +981,30 @@ class RunExternalProcessFinished(ReportItemMessage):
         )
 
 
+@dataclass(frozen=True)
+class DataCollectionTimings(ReportItemMessage):
+    """
+    Information about how long it took to collect data from various sources
+
+    timings -- names of data collectors and their duration in seconds
+    """
+
+    timings: Mapping[str, float]
+    _code = codes.DATA_COLLECTION_TIMINGS
+
+    @property
+    def message(self) -> str:
+        return "\n".join(
+            ["Data collection timings:"]
+            + indent(
+                [
+                    f"{name}: {duration:.3f} s"
+                    for name, duration in self.timings.items()
+                ]
+            )
+        )
+
+
 @dataclass(frozen=True)
 class RunExternalProcessError(ReportItemMessage):
     """
@@ -999,6 +1023,27 @@ class RunExternalProcessError(ReportItemMessage):
         return f"unable to run command {self.command}: {self.reason}"
 
 
+@dataclass(frozen=True)
+class RunExternalProcessTimedOut(ReportItemMessage):
+    """
+    An external process has not finished in time and has been killed
+
+    command -- the external process command
+    timeout -- number of seconds the process has been given
+    """
+
+    command: str
+    timeout: int
+    _code = codes.RUN_EXTERNAL_PROCESS_TIMED_OUT
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Command {self.command} has not finished in {self.timeout} "
+            f"{format_plural(self.timeout, 'second')}, it has been terminated"
+        )
+
+
 @dataclass(frozen=True)
 class NoActionNecessary(ReportItemMessage):
     """
@@ -3693,6 +3738,41 @@ class ResourceRefreshTooTimeConsuming(ReportItemMessage):
         )
 
 
+@dataclass(frozen=True)
+class ResourceRefreshWaveStarted(ReportItemMessage):
+    """
+    A wave of a staged refresh of all resources has started
+
+    wave -- number of the wave, starting from 1
+    wave_count -- number of all waves
+    node_list -- nodes on which history of all resources is deleted
+    resource_list -- resources whose history is deleted on all nodes
+    """
+
+    wave: int
+    wave_count: int
+    node_list: list[str] = field(default_factory=list)
+    resource_list: list[str] = field(default_factory=list)
+    _code = codes.RESOURCE_REFRESH_WAVE_STARTED
+
+    @property
+    def message(self) -> str:
+        if self.node_list:
+            target = "all resources on {node} {node_list}".format(
+                node=format_plural(self.node_list, "node"),
+                node_list=format_list(self.node_list),
+            )
+        else:
+            target = "{resource} {resource_list} on all nodes".format(
+                resource=format_plural(self.resource_list, "resource"),
+                resource_list=format_list(self.resource_list),
+            )
+        return (
+            f"Deleting history of {target} (wave {self.wave} of "
+            f"{self.wave_count})"
+        )
+
+
 @dataclass(frozen=True)
 class ResourceOperationIntervalDuplication(ReportItemMessage):
     """
@@ -3829,6 +3909,130 @@ class NodeRemoveInPacemakerFailed(ReportItemMessage):
         )
 
 
+@dataclass(frozen=True)
+class NodeStandbyLeavesResourcesStopped(ReportItemMessage):
+    """
+    Putting a node into standby would leave resources stopped or demoted,
+    since they cannot move to other nodes
+
+    node -- the node
+    resource_list -- resources left stopped or demoted
+    """
+
+    node: str
+    resource_list: list[str]
+    _code = codes.NODE_STANDBY_LEAVES_RESOURCES_STOPPED
+
+    @property
+    def message(self) -> str:
+        return (
+            "Putting node '{node}' into standby would leave {resource} "
+            "{resource_list} stopped or demoted"
+        ).format(
+            node=self.node,
+            resource=format_plural(self.resource_list, "resource"),
+            resource_list=format_list(self.resource_list),
+        )
+
+
+@dataclass(frozen=True)
+class NodeStandbyWaveStarted(ReportItemMessage):
+    """
+    A wave of a rolling standby has started, its nodes are being put into
+    standby
+
+    wave -- number of the wave, starting from 1
+    wave_count -- number of all waves
+    node_list -- nodes of the wave
+    """
+
+    wave: int
+    wave_count: int
+    node_list: list[str]
+    _code = codes.NODE_STANDBY_WAVE_STARTED
+
+    @property
+    def message(self) -> str:
+        return (
+            "Putting {node} {node_list} into standby (wave {wave} of "
+            "{wave_count})"
+        ).format(
+            node=format_plural(self.node_list, "node"),
+            node_list=format_list(self.node_list),
+            wave=self.wave,
+            wave_count=self.wave_count,
+        )
+
+
+@dataclass(frozen=True)
+class NodeStandbyWaveFinished(ReportItemMessage):
+    """
+    Resources have moved away from nodes of a wave of a rolling standby, the
+    nodes stay in standby for their maintenance
+
+    wave -- number of the wave, starting from 1
+    wave_count -- number of all waves
+    node_list -- nodes of the wave
+    remaining_node_list -- nodes of the next waves
+    """
+
+    wave: int
+    wave_count: int
+    node_list: list[str]
+    remaining_node_list: list[str]
+    _code = codes.NODE_STANDBY_WAVE_FINISHED
+
+    @property
+    def message(self) -> str:
+        remaining = (
+            ", nodes of the next waves: {}".format(
+                format_list(self.remaining_node_list)
+            )
+            if self.remaining_node_list
+            else ""
+        )
+        return (
+            "{node} {node_list} {_are} in standby and ready for maintenance "
+            "(wave {wave} of {wave_count}){remaining}"
+        ).format(
+            node=format_plural(self.node_list, "Node"),
+            node_list=format_list(self.node_list),
+            _are=format_plural(self.node_list, "is", "are"),
+            wave=self.wave,
+            wave_count=self.wave_count,
+            remaining=remaining,
+        )
+
+
+@dataclass(frozen=True)
+class NodeStandbyWaveWaitingForNodes(ReportItemMessage):
+    """
+    Waiting for nodes of a wave of a rolling standby to be online and out of
+    standby before the next wave is started
+
+    wave -- number of the wave, starting from 1
+    wave_count -- number of all waves
+    node_list -- nodes of the wave
+    """
+
+    wave: int
+    wave_count: int
+    node_list: list[str]
+    _code = codes.NODE_STANDBY_WAVE_WAITING_FOR_NODES
+
+    @property
+    def message(self) -> str:
+        return (
+            "Waiting for {node} {node_list} to be online and taken out of "
+            "standby before starting wave {next_wave} of {wave_count}"
+        ).format(
+            node=format_plural(self.node_list, "node"),
+            node_list=format_list(self.node_list),
+            next_wave=self.wave + 1,
+            wave_count=self.wave_count,
+        )
+
+
 @dataclass(frozen=True)
 class NodeRemoveInPacemakerSkipped(ReportItemMessage):
     """
@@ -5294,6 +5498,27 @@ class CorosyncQuorumAtbWillBeEnabledDueToSbdClusterIsRunning(ReportItemMessage):
         )
 
 
+@dataclass(frozen=True)
+class CibAclPermissionXpathInvalid(ReportItemMessage):
+    """
+    Xpath of an ACL permission cannot be evaluated, the permission is ignored
+
+    permission_id -- id of the permission
+    xpath -- the invalid xpath
+    """
+
+    permission_id: str
+    xpath: str
+    _code = codes.CIB_ACL_PERMISSION_XPATH_INVALID
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Permission '{self.permission_id}' is ignored, its xpath "
+            f"'{self.xpath}' is not valid"
+        )
+
+
 @dataclass(frozen=True)
 class CibAclRoleIsAlreadyAssignedToTarget(ReportItemMessage):
     """
@@ -6778,6 +7003,28 @@ class CannotRemoveResourcesNotStopped(ReportItemMessage):
         )
 
 
+@dataclass(frozen=True)
+class CannotCreateResources(ReportItemMessage):
+    """
+    Resources cannot be created due to errors, no resources have been created
+
+    resource_id_list -- ids of resources which cannot be created
+    """
+
+    resource_id_list: list[str]
+    _code = codes.CANNOT_CREATE_RESOURCES
+
+    @property
+    def message(self) -> str:
+        return (
+            "Unable to create {resources} {resource_list}, no resources have "
+            "been created"
+        ).format(
+            resources=format_plural(self.resource_id_list, "resource"),
+            resource_list=format_list(self.resource_id_list),
+        )
+
+
 @dataclass(frozen=True)
 class ConfiguredResourceMissingInStatus(ReportItemMessage):
     """
@@ -7194,6 +7441,33 @@ class DrConfigDoesNotExist(ReportItemMessage):
         return "Disaster-recovery is not configured"
 
 
+@dataclass(frozen=True)
+class DrSiteStatusTimedOut(ReportItemMessage):
+    """
+    Status of a disaster recovery site has not been obtained in time, some of
+    the site's nodes have not been asked for it
+
+    node_list -- nodes of the site
+    timeout -- time in seconds to get the status in
+    """
+
+    node_list: list[str]
+    timeout: int
+    _code = codes.DR_SITE_STATUS_TIMED_OUT
+
+    @property
+    def message(self) -> str:
+        return (
+            "Unable to get status of the site with {nodes} {node_list} in "
+            "{timeout} {seconds}"
+        ).format(
+            nodes=format_plural(self.node_list, "node"),
+            node_list=format_list(self.node_list),
+            timeout=self.timeout,
+            seconds=format_plural(self.timeout, "second"),
+        )
+
+
 @dataclass(frozen=True)
 class NodeInLocalCluster(ReportItemMessage):
     """
@@ -1,4 +1,5 @@
 import abc
+import logging
 from logging import Logger
 
 from pcs.common.reports.utils import add_context_to_message
@@ -14,6 +15,14 @@ class ReportProcessor(abc.ABC):
     def has_errors(self) -> bool:
         return self._has_errors
 
+    @property
+    def is_debug_enabled(self) -> bool:
+        """
+        Tell whether debug reports are processed. Building of expensive debug
+        reports may be skipped if not.
+        """
+        return True
+
     def report(self, report_item: ReportItem) -> "ReportProcessor":
         if _is_error(report_item):
             self._has_errors = True
@@ -43,6 +52,10 @@ class ReportProcessorToLog(ReportProcessor):
         super().__init__()
         self._logger = logger
 
+    @property
+    def is_debug_enabled(self) -> bool:
+        return self._logger.isEnabledFor(logging.DEBUG)
+
     def _do_report(self, report_item: ReportItem) -> None:
         severity = report_item.severity.level
 
@@ -1,10 +1,29 @@
 import os.path
 import re
+import time
 
-from pcs.common.types import StringIterable
+from pcs.common.types import StringIterable, StringSequence
 
 from .. import errors
 from ..interfaces import ExecutorInterface, ServiceManagerInterface
+from ..types import ServiceState
+
+# states of a unit file for which 'systemctl is-enabled' returns 0
+_ENABLED_UNIT_FILE_STATES = frozenset(
+    (
+        "alias",
+        "enabled",
+        "enabled-runtime",
+        "generated",
+        "indirect",
+        "static",
+        "transient",
+    )
+)
+# states of a unit for which 'systemctl is-active' returns 0
+_RUNNING_ACTIVE_STATES = frozenset(("active", "reloading", "refreshing"))
+# how long (in seconds) is a snapshot of services state considered up to date
+_STATE_SNAPSHOT_TTL = 2.0
 
 
 class SystemdDriver(ServiceManagerInterface):
@@ -27,8 +46,10 @@ class SystemdDriver(ServiceManagerInterface):
         self._systemctl_bin = systemctl_bin
         self._systemd_unit_paths = systemd_unit_paths
         self._available_services: list[str] = []
+        self._state_snapshot: dict[str, tuple[float, ServiceState]] = {}
 
     def start(self, service: str, instance: str | None = None) -> None:
+        self._state_snapshot.clear()
         result = self._executor.run(
             [
                 self._systemctl_bin,
@@ -42,6 +63,7 @@ class SystemdDriver(ServiceManagerInterface):
             )
 
     def stop(self, service: str, instance: str | None = None) -> None:
+        self._state_snapshot.clear()
         result = self._executor.run(
             [
                 self._systemctl_bin,
@@ -55,6 +77,7 @@ class SystemdDriver(ServiceManagerInterface):
             )
 
     def enable(self, service: str, instance: str | None = None) -> None:
+        self._state_snapshot.clear()
         result = self._executor.run(
             [
                 self._systemctl_bin,
@@ -70,6 +93,7 @@ class SystemdDriver(ServiceManagerInterface):
     def disable(self, service: str, instance: str | None = None) -> None:
         if not self.is_installed(service):
             return
+        self._state_snapshot.clear()
         result = self._executor.run(
             [
                 self._systemctl_bin,
@@ -105,6 +129,56 @@ class SystemdDriver(ServiceManagerInterface):
     def is_installed(self, service: str) -> bool:
         return service in self.get_available_services()
 
+    def get_services_state(
+        self, service_list: StringSequence
+    ) -> dict[str, ServiceState]:
+        now = time.monotonic()
+        to_query = [
+            service
+            for service in dict.fromkeys(service_list)
+            if service not in self._state_snapshot
+            or now - self._state_snapshot[service][0] > _STATE_SNAPSHOT_TTL
+        ]
+        if to_query:
+            queried_state = self._query_services_state(to_query)
+            if queried_state is None:
+                # systemctl failed or its output is not usable, fall back to
+                # querying the services one by one
+                queried_state = super().get_services_state(to_query)
+            for service, state in queried_state.items():
+                self._state_snapshot[service] = (now, state)
+        return {
+            service: self._state_snapshot[service][1]
+            for service in service_list
+        }
+
+    def _query_services_state(
+        self, service_list: StringSequence
+    ) -> dict[str, ServiceState] | None:
+        result = self._executor.run(
+            [
+                self._systemctl_bin,
+                "show",
+                "--property=Id,ActiveState,UnitFileState",
+                "--",
+            ]
+            + [_format_service_name(service, None) for service in service_list]
+        )
+        if result.retval != 0:
+            return None
+        unit_list = _parse_show_output(result.stdout)
+        # systemctl prints the units in the same order they were specified
+        if len(unit_list) != len(service_list):
+            return None
+        return {
+            service: ServiceState(
+                installed=bool(unit.get("UnitFileState")),
+                enabled=unit.get("UnitFileState") in _ENABLED_UNIT_FILE_STATES,
+                running=unit.get("ActiveState") in _RUNNING_ACTIVE_STATES,
+            )
+            for service, unit in zip(service_list, unit_list, strict=True)
+        }
+
     def get_available_services(self) -> list[str]:
         if not self._available_services:
             self._available_services = self._get_available_services()
@@ -136,3 +210,24 @@ class SystemdDriver(ServiceManagerInterface):
 def _format_service_name(service: str, instance: str | None) -> str:
     instance_str = f"@{instance}" if instance else ""
     return f"{service}{instance_str}.service"
+
+
+def _parse_show_output(output: str) -> list[dict[str, str]]:
+    """
+    Parse output of 'systemctl show' called for several units
+
+    output -- blocks of 'property=value' lines separated by an empty line
+    """
+    unit_list = []
+    unit: dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            if unit:
+                unit_list.append(unit)
+                unit = {}
+            continue
+        name, _, value = line.partition("=")
+        unit[name] = value
+    if unit:
+        unit_list.append(unit)
+    return unit_list
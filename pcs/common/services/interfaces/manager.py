@@ -1,3 +1,8 @@
+from pcs.common.types import StringSequence
+
+from ..types import ServiceState
+
+
 class ServiceManagerInterface:
     def start(self, service: str, instance: str | None = None) -> None:
         """
@@ -68,6 +73,24 @@ class ServiceManagerInterface:
         """
         raise NotImplementedError()
 
+    def get_services_state(
+        self, service_list: StringSequence
+    ) -> dict[str, ServiceState]:
+        """
+        service_list -- names of services to be checked
+
+        Returns installed, enabled and running state of all specified services.
+        Drivers able to query many services at once should override this.
+        """
+        return {
+            service: ServiceState(
+                installed=self.is_installed(service),
+                enabled=self.is_enabled(service),
+                running=self.is_running(service),
+            )
+            for service in service_list
+        }
+
     def get_available_services(self) -> list[str]:
         """
         Returns list of service names recognized by init system.
@@ -12,3 +12,10 @@ class ExecutorResult:
     @property
     def joined_output(self) -> str:
         return join_multilines([self.stderr, self.stdout])
+
+
+@dataclass(frozen=True)
+class ServiceState:
+    installed: bool
+    enabled: bool
+    running: bool
@@ -11,10 +11,12 @@ import sys
 import tarfile
 import tempfile
 import time
-from io import BytesIO
+from contextlib import nullcontext
 from typing import cast
 from xml.dom.minidom import parse
 
+from lxml import etree
+
 from pcs import cluster, quorum, settings, status, usage, utils
 from pcs.cli.alert.output import config_dto_to_lines as alerts_to_lines
 from pcs.cli.cluster_property.output import (
@@ -37,9 +39,21 @@ from pcs.cli.tag.output import tags_to_text
 from pcs.common.interface import dto
 from pcs.common.pacemaker.constraint import CibConstraintsDto
 from pcs.common.str_tools import indent
+from pcs.lib.cib import checkpoint_index
 from pcs.lib.errors import LibraryError
 from pcs.lib.node import get_existing_nodes_names
 
+# Compression of a backup tarball is chosen by the extension of its file name.
+# Tarballs are extracted with compression autodetection, so any of them can be
+# restored by older pcs versions as well.
+_BACKUP_EXTENSION_COMPRESSION = {
+    ".tar.bz2": "bz2",
+    ".tar.gz": "gz",
+    ".tgz": "gz",
+    ".tar.xz": "xz",
+}
+_BACKUP_DEFAULT_EXTENSION = ".tar.bz2"
+
 
 def config_show(lib, argv, modifiers):
     """
@@ -231,33 +245,54 @@ def config_backup(lib, argv, modifiers):
     if len(argv) > 1:
         raise CmdLineInputError()
 
-    outfile_name = None
-    if argv:
-        outfile_name = argv[0]
-        if not outfile_name.endswith(".tar.bz2"):
-            outfile_name += ".tar.bz2"
-
-    tar_data = config_backup_local()
-    if outfile_name:
-        ok, message = utils.write_file(
-            outfile_name, tar_data, permissions=0o600, binary=True
-        )
-        if not ok:
-            utils.err(message)
-    else:
+    if not argv:
         # in python3 stdout accepts str so we need to use buffer
-        sys.stdout.buffer.write(tar_data)
+        config_backup_local(
+            sys.stdout.buffer,
+            _BACKUP_EXTENSION_COMPRESSION[_BACKUP_DEFAULT_EXTENSION],
+        )
+        return
 
+    outfile_name = argv[0]
+    extension = next(
+        (
+            extension
+            for extension in _BACKUP_EXTENSION_COMPRESSION
+            if outfile_name.endswith(extension)
+        ),
+        None,
+    )
+    if extension is None:
+        extension = _BACKUP_DEFAULT_EXTENSION
+        outfile_name += extension
 
-def config_backup_local():
+    outfile, message = utils.open_file_for_writing(
+        outfile_name, permissions=0o600, binary=True
+    )
+    if outfile is None:
+        utils.err(message)
+    try:
+        with outfile:
+            config_backup_local(
+                outfile, _BACKUP_EXTENSION_COMPRESSION[extension]
+            )
+    except SystemExit:
+        # do not leave an incomplete tarball behind
+        os.remove(outfile_name)
+        raise
+
+
+def config_backup_local(outfile, compression):
     """
     Commandline options: no options
+
+    outfile -- binary file the tarball is written to as it is being created
+    compression -- tarfile compression method: bz2, gz or xz
     """
     file_list = config_backup_path_list()
-    tar_data = BytesIO()
 
     try:
-        with tarfile.open(fileobj=tar_data, mode="w|bz2") as tarball:
+        with tarfile.open(fileobj=outfile, mode=f"w|{compression}") as tarball:
             config_backup_add_version_to_tarball(tarball)
             for tar_path, path_info in file_list.items():
                 if (
@@ -269,10 +304,6 @@ def config_backup_local():
     except (tarfile.TarError, OSError) as e:
         utils.err("unable to create tarball: %s" % e)
 
-    tar = tar_data.getvalue()
-    tar_data.close()
-    return tar
-
 
 def config_restore(lib, argv, modifiers):
     """
@@ -290,8 +321,12 @@ def config_restore(lib, argv, modifiers):
     if argv:
         infile_name = argv[0]
     if not infile_name:
-        # in python3 stdin returns str so we need to use buffer
-        infile_obj = BytesIO(sys.stdin.buffer.read())
+        # Keep the tarball in a temporary file, so that it can be read several
+        # times without holding it in memory. In python3 stdin returns str so
+        # we need to use buffer. The file is removed once pcs exits.
+        infile_obj = tempfile.TemporaryFile()  # noqa: SIM115
+        shutil.copyfileobj(sys.stdin.buffer, infile_obj)
+        infile_obj.seek(0)
 
     if os.getuid() == 0:
         if modifiers.get("--local"):
@@ -391,20 +426,23 @@ def config_restore_remote(infile_name, infile_obj):  # noqa: PLR0912
         if not (retval == 0 or "(HTTP error: 404)" in output):
             utils.err(output)
 
-    if infile_obj:
-        infile_obj.seek(0)
-        tarball_data = infile_obj.read()
-    else:
-        with open(infile_name, "rb") as tarball:
-            tarball_data = tarball.read()
-
-    error_list = []
-    for node in node_list:
-        retval, error = utils.restoreConfig(node, tarball_data)
-        if retval != 0:
-            error_list.append(error)
-    if error_list:
-        utils.err("unable to restore all nodes\n" + "\n".join(error_list))
+    # The tarball is sent to all nodes at once. Each request reads it from
+    # the file in chunks, so the memory used does not depend on its size.
+    try:
+        with (
+            nullcontext(infile_obj) if infile_obj else open(infile_name, "rb")
+        ) as tarball:
+            node_errors = utils.parallel_for_nodes(
+                utils.restoreConfig,
+                node_list,
+                utils.UrlencodedFileForm("tarball", tarball),
+            )
+    except OSError as e:
+        utils.err("unable to read the tarball: %s" % e)
+    if node_errors:
+        utils.err(
+            "unable to restore all nodes\n" + "\n".join(node_errors.values())
+        )
 
 
 def config_restore_local(infile_name, infile_obj):  # noqa: PLR0912, PLR0915
@@ -753,12 +791,102 @@ def config_checkpoint_view(lib, argv, modifiers):
     print("\n".join(lines))
 
 
+def _get_indexed_checkpoints():
+    try:
+        return checkpoint_index.CheckpointIndex(
+            settings.cib_dir, settings.cib_checkpoint_index
+        ).get_checkpoints()
+    except OSError as e:
+        utils.err("unable to list checkpoints: %s" % e)
+    return []
+
+
+def config_checkpoint_log(lib, argv, modifiers):
+    """
+    Options: no options
+    """
+    del lib
+    modifiers.ensure_only_supported()
+    if len(argv) != 1:
+        raise CmdLineInputError()
+
+    history = checkpoint_index.get_element_history(
+        _get_indexed_checkpoints(), argv[0]
+    )
+    if not history:
+        print_to_stderr(f"No checkpoints with changes of element '{argv[0]}'")
+        return
+    for checkpoint, change in history:
+        print(
+            "checkpoint {0}: date {1}: {2} {3}".format(
+                checkpoint.name,
+                datetime.datetime.fromtimestamp(round(checkpoint.mtime)),
+                change.tag,
+                change.change,
+            )
+        )
+
+
+def _checkpoint_label(label):
+    return "live configuration" if label == "live" else f"checkpoint {label}"
+
+
+def _checkpoint_diff_brief(argv):
+    """
+    Commandline options:
+      * -f - CIB file
+    """
+    checkpoints = {
+        checkpoint.name: checkpoint.digests
+        for checkpoint in _get_indexed_checkpoints()
+    }
+    errors = []
+    digests_list = []
+    for label in argv:
+        if label == "live":
+            try:
+                digests_list.append(
+                    checkpoint_index.get_cib_digests(
+                        etree.fromstring(utils.get_cib())
+                    )
+                )
+            except (etree.XMLSyntaxError, ValueError):
+                errors.append("unable to read live configuration")
+        elif label in checkpoints:
+            digests_list.append(checkpoints[label])
+        else:
+            errors.append("unable to read checkpoint '{0}'".format(label))
+    if errors:
+        utils.err("\n".join(errors))
+
+    print(
+        "Elements changed between {0} (-) and {1} (+):".format(
+            *[_checkpoint_label(label) for label in argv]
+        )
+    )
+    change_marks = {
+        checkpoint_index.CHANGE_CREATED: "+",
+        checkpoint_index.CHANGE_CHANGED: "~",
+        checkpoint_index.CHANGE_REMOVED: "-",
+    }
+    for change in checkpoint_index.diff_cib_digests(*digests_list):
+        print(
+            "{0}{1} {2} '{3}'".format(
+                " " * (INDENT_STEP * change.depth),
+                change_marks[change.change],
+                change.tag,
+                change.element_id,
+            )
+        )
+
+
 def config_checkpoint_diff(lib, argv, modifiers):
     """
     Commandline options:
       * -f - CIB file
+      * --brief - list changed elements only
     """
-    modifiers.ensure_only_supported("-f")
+    modifiers.ensure_only_supported("-f", "--brief")
     if len(argv) != 2:
         print_to_stderr(usage.config(["checkpoint diff"]))
         sys.exit(1)
@@ -766,6 +894,10 @@ def config_checkpoint_diff(lib, argv, modifiers):
     if argv[0] == argv[1]:
         utils.err("cannot diff a checkpoint against itself")
 
+    if modifiers.get("--brief"):
+        _checkpoint_diff_brief(argv)
+        return
+
     errors = []
     checkpoints_lines = []
     for checkpoint in argv:
@@ -789,14 +921,7 @@ def config_checkpoint_diff(lib, argv, modifiers):
 
     print(
         "Differences between {0} (-) and {1} (+):".format(
-            *[
-                (
-                    "live configuration"
-                    if label == "live"
-                    else f"checkpoint {label}"
-                )
-                for label in argv
-            ]
+            *[_checkpoint_label(label) for label in argv]
         )
     )
     print(
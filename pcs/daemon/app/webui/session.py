@@ -1,6 +1,7 @@
 from time import time as now
 
 from pcs.common.tools import get_unique_uuid
+from pcs.daemon.expiry import ExpiryQueue
 
 
 class Session:
@@ -33,6 +34,10 @@ class Session:
         """
         self.__last_access = now()
 
+    @property
+    def last_access(self) -> float:
+        return self.__last_access
+
     def was_unused_last(self, seconds: int) -> bool:
         return now() > self.__last_access + seconds
 
@@ -41,6 +46,10 @@ class Storage:
     def __init__(self, lifetime_seconds: int) -> None:
         self.__sessions: dict[str, Session] = {}
         self.__lifetime_seconds = lifetime_seconds
+        # Sessions are refreshed on each access without letting the storage
+        # know. Therefore, the expiration times are the earliest times the
+        # sessions can expire and they are checked again once reached.
+        self.__expiry = ExpiryQueue()
 
     def get(self, sid: str) -> Session | None:
         self.drop_expired()
@@ -50,21 +59,25 @@ class Storage:
         return session
 
     def drop_expired(self) -> None:
-        obsolete_sid_list = [
-            sid
-            for sid, session in self.__sessions.items()
-            if session.was_unused_last(self.__lifetime_seconds)
-        ]
-        for sid in obsolete_sid_list:
-            self.destroy(sid)
+        for sid in self.__expiry.pop_expired(now()):
+            session = self.__sessions[sid]
+            if session.was_unused_last(self.__lifetime_seconds):
+                self.destroy(sid)
+            else:
+                self.__expire_later(sid, session)
 
     def destroy(self, sid: str) -> None:
         if sid in self.__sessions:
             del self.__sessions[sid]
+            self.__expiry.discard(sid)
 
     def login(self, username: str) -> Session:
         self.drop_expired()
-        sid = get_unique_uuid(tuple(self.__sessions.keys()))
+        sid = get_unique_uuid(self.__sessions.keys())
         session = Session(sid, username)
         self.__sessions[sid] = session
+        self.__expire_later(sid, session)
         return session
+
+    def __expire_later(self, sid: str, session: Session) -> None:
+        self.__expiry.set(sid, session.last_access + self.__lifetime_seconds)
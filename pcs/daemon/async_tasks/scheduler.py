@@ -1,3 +1,4 @@
+import datetime
 import multiprocessing as mp
 import sys
 from collections import defaultdict
@@ -11,6 +12,7 @@ from pcs.common.async_tasks.dto import TaskResultDto
 from pcs.common.async_tasks.types import TaskKillReason
 from pcs.common.tools import get_unique_uuid
 from pcs.daemon.async_tasks.types import Command
+from pcs.daemon.expiry import ExpiryQueue
 from pcs.daemon.log import pcsd as pcsd_logger
 from pcs.lib.auth.types import AuthUser
 
@@ -65,6 +67,13 @@ class Scheduler:
             initargs=[self._worker_message_q, self._logging_q],
         )
         self._task_register: dict[str, Task] = {}
+        # Tasks change only when they receive a message, when users act on
+        # them or when their timeouts pass. Only such tasks are processed
+        # instead of all the registered tasks.
+        # task_ident of tasks to be processed in the next pass, ordered
+        self._tasks_to_process: dict[str, None] = {}
+        # task_ident of tasks to be processed once their timeouts pass
+        self._task_timeouts = ExpiryQueue()
         self._logger.info("Scheduler was successfully initialized.")
         self._logger.debug(
             "Scheduler initialized with config: %s", self._config
@@ -87,6 +96,7 @@ class Scheduler:
         self._check_user(task, auth_user)
         if task.state == TaskState.FINISHED:
             task.request_deletion()
+            self._mark_for_processing(task_ident)
         return task.to_dto()
 
     @staticmethod
@@ -101,6 +111,7 @@ class Scheduler:
         self._check_user(task, auth_user)
         await task.wait_until_finished()
         task.request_deletion()
+        self._mark_for_processing(task_ident)
         return task.to_dto()
 
     def kill_task(self, task_ident: str, auth_user: AuthUser) -> None:
@@ -115,6 +126,7 @@ class Scheduler:
 
         self._logger.debug("User is killing a task %s.", task_ident)
         task.request_kill(TaskKillReason.USER)
+        self._mark_for_processing(task_ident)
 
     def new_task(self, command: Command, auth_user: AuthUser) -> str:
         """
@@ -122,11 +134,12 @@ class Scheduler:
         :param command: Command and its parameters
         :return: Task identifier
         """
-        task_ident = get_unique_uuid(tuple(self._task_register.keys()))
+        task_ident = get_unique_uuid(self._task_register.keys())
 
         self._task_register[task_ident] = Task(
             task_ident, command, auth_user, self._config.task_config
         )
+        self._mark_for_processing(task_ident)
         self._logger.debug(
             (
                 "New task %s created (command: %s, parameters: %s, "
@@ -173,9 +186,31 @@ class Scheduler:
             sys.exit(1)
         task.state = TaskState.QUEUED
 
+    def _mark_for_processing(self, task_ident: str) -> None:
+        self._tasks_to_process[task_ident] = None
+
     async def _process_tasks(self) -> None:
-        for task in list(self._task_register.values()):
+        task_ident_list = list(self._tasks_to_process)
+        self._tasks_to_process.clear()
+        task_ident_list.extend(
+            self._task_timeouts.pop_expired(datetime.datetime.now().timestamp())
+        )
+        for task_ident in dict.fromkeys(task_ident_list):
+            task = self._task_register.get(task_ident)
+            if task is None:
+                continue
             await self._process_task(task)
+            if task.task_ident not in self._task_register:
+                self._task_timeouts.discard(task.task_ident)
+                continue
+            if task.state != TaskState.FINISHED and task.is_kill_requested():
+                # killing has not succeeded yet, try again in the next pass
+                self._mark_for_processing(task.task_ident)
+            check_time = task.get_next_check_time()
+            if check_time is None:
+                self._task_timeouts.discard(task.task_ident)
+            else:
+                self._task_timeouts.set(task.task_ident, check_time.timestamp())
 
     async def _process_task(self, task: Task) -> None:
         if task.state == TaskState.CREATED:
@@ -271,6 +306,7 @@ class Scheduler:
                     message.task_ident,
                 )
                 continue
+            self._mark_for_processing(message.task_ident)
             try:
                 task.receive_message(message)
             except UnknownMessageError as exc:
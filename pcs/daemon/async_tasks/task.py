@@ -170,6 +170,34 @@ class Task(ImplementsToDto):
             return self._is_timed_out(timeout)
         return False
 
+    def get_next_check_time(self) -> datetime.datetime | None:
+        """
+        Get the time when the task may become defunct, abandoned or ready to
+        be deleted
+
+        Until then, the state of the task changes only when it receives a
+        message or when it is killed or marked for deletion.
+        :return: Time to check the task, None if no such time is known
+        """
+        check_time_list = []
+        if self._to_delete_timestamp is not None:
+            check_time_list.append(self._to_delete_timestamp)
+        last_message_at = self._get_last_updated_timestamp()
+        if last_message_at is not None:
+            if self.state == TaskState.EXECUTED:
+                check_time_list.append(
+                    last_message_at
+                    + datetime.timedelta(
+                        seconds=self._config.unresponsive_timeout
+                    )
+                )
+            elif self.state == TaskState.FINISHED:
+                check_time_list.append(
+                    last_message_at
+                    + datetime.timedelta(seconds=self._config.abandoned_timeout)
+                )
+        return min(check_time_list, default=None)
+
     def _task_updated(self) -> None:
         """
         Helper function for setting the last message timestamp to now
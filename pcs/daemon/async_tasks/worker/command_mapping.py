@@ -62,6 +62,10 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
         cmd=acl.create_target,
         required_permission=p.GRANT,
     ),
+    "acl.get_effective_permissions": _Cmd(
+        cmd=acl.get_effective_permissions,
+        required_permission=p.GRANT,
+    ),
     "acl.remove_group": _Cmd(
         cmd=acl.remove_group,
         required_permission=p.GRANT,
@@ -126,6 +130,10 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
         cmd=booth.get_config_and_authfile,
         required_permission=p.READ,
     ),
+    "booth.get_status_dto": _Cmd(
+        cmd=booth.get_status_dto,
+        required_permission=p.READ,
+    ),
     "booth.ticket_cleanup": _Cmd(
         cmd=booth.ticket_cleanup,
         required_permission=p.WRITE,
@@ -318,6 +326,14 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
         cmd=node.maintenance_unmaintenance_list,
         required_permission=p.WRITE,
     ),
+    "node.rolling_standby": _Cmd(
+        cmd=node.rolling_standby,
+        required_permission=p.WRITE,
+    ),
+    "node.rolling_standby_plan": _Cmd(
+        cmd=node.rolling_standby_plan,
+        required_permission=p.READ,
+    ),
     "node.standby_unstandby_all": _Cmd(
         cmd=node.standby_unstandby_all,
         required_permission=p.WRITE,
@@ -436,6 +452,10 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
         cmd=resource.create_in_group,
         required_permission=p.WRITE,
     ),
+    "resource.create_many": _Cmd(
+        cmd=resource.create_many,
+        required_permission=p.WRITE,
+    ),
     "resource.disable": _Cmd(
         cmd=resource.disable,
         required_permission=p.WRITE,
@@ -480,6 +500,10 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
         cmd=resource.move_autoclean,
         required_permission=p.WRITE,
     ),
+    "resource.refresh_staged": _Cmd(
+        cmd=resource.refresh_staged,
+        required_permission=p.WRITE,
+    ),
     "resource.restart": _Cmd(
         cmd=resource.restart,
         required_permission=p.WRITE,
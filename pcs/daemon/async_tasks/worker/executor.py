@@ -17,6 +17,7 @@ from pcs.lib.auth.types import AuthUser
 from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
 from pcs.lib.permissions.checker import PermissionsChecker
+from pcs.lib.resource_agent.cache import preload_pacemaker_metadata
 from pcs.utils import read_known_hosts_file_not_cached
 
 from .command_mapping import COMMAND_MAP, LEGACY_API_COMMANDS
@@ -56,6 +57,10 @@ def worker_init(message_q: mp.Queue, logging_q: mp.Queue) -> None:
     signal.signal(signal.SIGINT, ignore_signals)
     signal.signal(signal.SIGTERM, _sigterm_handler)
 
+    # Commands validating cluster properties and resource meta attributes
+    # use metadata from pacemaker. Have them ready for all tasks of the worker.
+    preload_pacemaker_metadata()
+
 
 def _pause_worker() -> None:
     logger = getLogger(WORKER_LOGGER)
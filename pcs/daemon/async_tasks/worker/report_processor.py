@@ -20,6 +20,10 @@ class WorkerReportProcessor(pcs_reports.ReportProcessor):
         self._task_ident: str = task_ident
         self._debug_enabled = enable_debug
 
+    @property
+    def is_debug_enabled(self) -> bool:
+        return self._debug_enabled
+
     def _do_report(self, report_item: pcs_reports.item.ReportItem) -> None:
         if (
             self._debug_enabled
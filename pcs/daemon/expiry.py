@@ -0,0 +1,95 @@
+"""
+Tracking of objects which expire at a given time
+
+pcsd keeps web UI sessions and async tasks which have to be dropped or checked
+once their time comes. Finding them by walking all the objects on each request
+makes each request slower as the number of the objects grows. ExpiryQueue keeps
+the objects ordered by their expiration time, so that only the expired ones are
+visited.
+"""
+
+import heapq
+import itertools
+from collections.abc import Iterator
+
+
+class ExpiryQueue:
+    """
+    Keys ordered by their expiration time
+
+    Setting an expiration time is O(log n), removing a key and looking up its
+    expiration time is O(1). Popping expired keys is O(log n) per popped key.
+    """
+
+    # Entries of removed keys and replaced expiration times are left in the
+    # heap and skipped when popped. The heap is rebuilt once they outnumber
+    # live entries, so that it does not grow without limit.
+    _COMPACT_MIN_SIZE = 64
+
+    def __init__(self) -> None:
+        # key: its expiration time
+        self._expire_at: dict[str, float] = {}
+        # (expiration time, insertion order, key)
+        self._heap: list[tuple[float, int, str]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._expire_at)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._expire_at
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._expire_at)
+
+    def get(self, key: str) -> float | None:
+        """
+        Return the expiration time of a key, None if the key is not tracked
+        """
+        return self._expire_at.get(key)
+
+    def set(self, key: str, expire_at: float) -> None:
+        """
+        Track a key or change its expiration time
+
+        key -- key to be tracked
+        expire_at -- time when the key expires
+        """
+        if self._expire_at.get(key) == expire_at:
+            return
+        self._expire_at[key] = expire_at
+        heapq.heappush(self._heap, (expire_at, next(self._counter), key))
+        self._compact_if_needed()
+
+    def discard(self, key: str) -> None:
+        """
+        Stop tracking a key, do nothing if the key is not tracked
+        """
+        if self._expire_at.pop(key, None) is not None:
+            self._compact_if_needed()
+
+    def pop_expired(self, now: float) -> list[str]:
+        """
+        Stop tracking keys which have expired and return them ordered by their
+        expiration time
+
+        now -- current time, keys expiring at this time or sooner are expired
+        """
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            expire_at, _, key = heapq.heappop(self._heap)
+            if self._expire_at.get(key) == expire_at:
+                del self._expire_at[key]
+                expired.append(key)
+        return expired
+
+    def _compact_if_needed(self) -> None:
+        if len(self._heap) <= max(
+            self._COMPACT_MIN_SIZE, 2 * len(self._expire_at)
+        ):
+            return
+        self._heap = [
+            (expire_at, next(self._counter), key)
+            for key, expire_at in self._expire_at.items()
+        ]
+        heapq.heapify(self._heap)
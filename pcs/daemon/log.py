@@ -1,5 +1,7 @@
 import logging
 import logging.handlers
+from collections.abc import Sequence
+from typing import NamedTuple
 
 LOGGER_NAMES = [
     "pcs.daemon",
@@ -12,16 +14,63 @@ LOGGER_NAMES = [
 pcsd = logging.getLogger("pcs.daemon")
 
 
-def from_external_source(level, created: float, usecs: int, message, group_id):
+class ExternalLogEntry(NamedTuple):
+    level: int
+    # time of creating the entry in seconds since the epoch
+    created: float
+    # microseconds part of the time of creating the entry
+    usecs: int
+    message: str
+
+
+def from_external_source(
+    entry_list: Sequence[ExternalLogEntry], group_id: int
+) -> None:
+    """
+    Log entries coming from an external source, e.g. from the ruby daemon
+
+    All the entries are passed to handlers at once, so that handlers able to
+    process batches write them to the log in one go.
+
+    entry_list -- entries to be logged in the order they have been created
+    group_id -- identifier shared by all the entries
+    """
+    record_list = [
+        record
+        for record in (
+            _external_record(entry, group_id)
+            for entry in entry_list
+            if pcsd.isEnabledFor(entry.level)
+        )
+        if pcsd.filter(record)
+    ]
+    if not record_list:
+        return
+    # go through handlers the same way logging.Logger.callHandlers does
+    logger: logging.Logger | None = pcsd
+    while logger:
+        for handler in logger.handlers:
+            if isinstance(handler, BatchFileHandler):
+                handler.handle_batch(record_list)
+                continue
+            for record in record_list:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+        logger = logger.parent if logger.propagate else None
+
+
+def _external_record(
+    entry: ExternalLogEntry, group_id: int
+) -> logging.LogRecord:
     record = pcsd.makeRecord(
         name=pcsd.name,
-        level=level,
+        level=entry.level,
         # Information about stack frame is not needed here. Values are
         # inspired by the code of the logging module.
         fn="(external)",
         lno=0,
         # Message from ruby does not need args.
-        msg=message,
+        msg=entry.message,
         args=tuple(),
         # The exception information makes not sense here.
         exc_info=None,
@@ -33,11 +82,46 @@ def from_external_source(level, created: float, usecs: int, message, group_id):
     # To update it, we need to reduce it by difference between current value
     # of attribute created (which is newer, so higher) and the correct one
     # (which comes from an external source)
-    record.relativeCreated -= (record.created - created) * 1000
-    record.created = created
-    record.msec = usecs // 1000
+    record.relativeCreated -= (record.created - entry.created) * 1000
+    record.created = entry.created
+    record.msec = entry.usecs // 1000
     record.pcsd_group_id = str(group_id).zfill(5)
-    pcsd.handle(record)
+    return record
+
+
+class BatchFileHandler(logging.handlers.WatchedFileHandler):
+    """
+    Log file handler able to write a batch of records at once
+
+    Checking whether the log file has been rotated and flushing it is done once
+    per batch instead of once per record.
+    """
+
+    def handle_batch(self, record_list: Sequence[logging.LogRecord]) -> None:
+        record_list = [
+            record
+            for record in record_list
+            if record.levelno >= self.level and self.filter(record)
+        ]
+        if not record_list:
+            return
+        self.acquire()
+        try:
+            self.reopenIfNeeded()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(
+                "".join(
+                    self.format(record) + self.terminator
+                    for record in record_list
+                )
+            )
+            self.flush()
+        except Exception:
+            # the same as in logging.StreamHandler.emit
+            self.handleError(record_list[0])
+        finally:
+            self.release()
 
 
 class Formatter(logging.Formatter):
@@ -63,7 +147,7 @@ class Formatter(logging.Formatter):
 
 
 def setup(log_file):
-    handler = logging.handlers.WatchedFileHandler(log_file, encoding="utf8")
+    handler = BatchFileHandler(log_file, encoding="utf8")
     handler.setFormatter(Formatter())
     handler.setLevel(logging.INFO)
 
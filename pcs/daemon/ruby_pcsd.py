@@ -4,12 +4,13 @@ from base64 import b64decode, b64encode, binascii
 from collections import namedtuple
 
 import pycurl
-from tornado.curl_httpclient import CurlError
+from tornado.curl_httpclient import CurlAsyncHTTPClient, CurlError
 from tornado.gen import convert_yielded
-from tornado.httpclient import AsyncHTTPClient, HTTPClientError
+from tornado.httpclient import HTTPClientError
 from tornado.httputil import HTTPHeaders, HTTPServerRequest
 from tornado.web import HTTPError
 
+from pcs import settings
 from pcs.daemon import log
 from pcs.lib.auth.types import AuthUser
 
@@ -55,15 +56,18 @@ def process_response_logs(rb_log_list):
     if not rb_log_list:
         return
 
-    group_id = next(LOG_GROUP_ID)
-    for rb_log in rb_log_list:
-        log.from_external_source(
-            level=RUBY_LOG_LEVEL_MAP.get(rb_log["level"], logging.NOTSET),
-            created=rb_log["timestamp_usec"] / 1000000,
-            usecs=int(str(rb_log["timestamp_usec"])[-6:]),
-            message=rb_log["message"],
-            group_id=group_id,
-        )
+    log.from_external_source(
+        [
+            log.ExternalLogEntry(
+                level=RUBY_LOG_LEVEL_MAP.get(rb_log["level"], logging.NOTSET),
+                created=rb_log["timestamp_usec"] / 1000000,
+                usecs=int(str(rb_log["timestamp_usec"])[-6:]),
+                message=rb_log["message"],
+            )
+            for rb_log in rb_log_list
+        ],
+        next(LOG_GROUP_ID),
+    )
 
 
 class RubyDaemonRequest(
@@ -141,17 +145,49 @@ def log_ruby_daemon_request(label, request: RubyDaemonRequest):
 
 
 class Wrapper:
-    def __init__(self, pcsd_ruby_socket, debug=False):
+    def __init__(
+        self,
+        pcsd_ruby_socket,
+        debug=False,
+        max_connections=settings.pcsd_ruby_max_connections,
+        max_queued_requests=settings.pcsd_ruby_max_queued_requests,
+    ):
+        """
+        pcsd_ruby_socket -- path to the unix socket the ruby daemon listens on
+        debug -- log requests and responses
+        max_connections -- maximal number of requests sent to the ruby daemon
+            at the same time
+        max_queued_requests -- maximal number of requests waiting for a free
+            connection, further requests are rejected
+        """
         self.__debug = debug
-        AsyncHTTPClient.configure("tornado.curl_httpclient.CurlAsyncHTTPClient")
-        self.__client = AsyncHTTPClient()
+        # The client has its own pool of curl handles, one for each request
+        # being sent. Connections to the ruby daemon are kept open by libcurl
+        # and reused by following requests. Requests over the limit wait in
+        # the client's queue for a free handle.
+        self.__client = CurlAsyncHTTPClient(
+            force_instance=True, max_clients=max_connections
+        )
         self.__pcsd_ruby_socket = pcsd_ruby_socket
+        self.__max_pending_requests = max_connections + max_queued_requests
+        self.__pending_requests = 0
 
     def prepare_curl_callback(self, curl):
         curl.setopt(pycurl.UNIX_SOCKET_PATH, self.__pcsd_ruby_socket)
         curl.setopt(pycurl.TIMEOUT, 0)
 
     async def send_to_ruby(self, request: RubyDaemonRequest):
+        if self.__pending_requests >= self.__max_pending_requests:
+            # Do not let the queue grow without limits when the ruby daemon
+            # cannot keep up with incoming requests.
+            log.pcsd.warning(
+                "Ruby daemon is busy, %d requests are pending. Rejecting "
+                "request '%s'",
+                self.__pending_requests,
+                request.path,
+            )
+            raise HTTPError(503)
+        self.__pending_requests += 1
         try:
             return (
                 await self.__client.fetch(
@@ -186,6 +222,8 @@ class Wrapper:
                 e,
             )
             raise HTTPError(500) from e
+        finally:
+            self.__pending_requests -= 1
 
     async def run_ruby(
         self,
@@ -271,6 +271,8 @@ def main(argv=None) -> None:
     ruby_pcsd_wrapper = ruby_pcsd.Wrapper(
         settings.pcsd_ruby_socket,
         debug=env.PCSD_DEBUG,
+        max_connections=settings.pcsd_ruby_max_connections,
+        max_queued_requests=settings.pcsd_ruby_max_queued_requests,
     )
 
     try:
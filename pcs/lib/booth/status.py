@@ -1,26 +1,53 @@
+import re
+import shlex
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from pcs import settings
 from pcs.common import reports
+from pcs.common.booth_dto import (
+    BoothPeerStatusDto,
+    BoothStatusDto,
+    BoothTicketStatusDto,
+)
 from pcs.common.file import RawFileError
 from pcs.common.str_tools import join_multilines
 from pcs.lib.booth.constants import AUTHFILE_FIX_OPTION
 from pcs.lib.booth.env import BoothEnv
 from pcs.lib.errors import LibraryError
+from pcs.lib.external import CommandRunner
 from pcs.lib.file.raw_file import raw_file_error_report
 from pcs.lib.interface.config import ParserErrorException
+from pcs.lib.parallel import CollectorPool
 
 if TYPE_CHECKING:
     from pcs.lib.booth.config_facade import ConfigFacade
 
 
-def get_daemon_status(runner, name=None):
+# 7 means that there is no booth instance running
+_DAEMON_NOT_RUNNING_RETVAL = 7
+_PEER_LINE_RE = re.compile(
+    r"^(?P<type>\w+):\s+(?P<address>\S+), last recv: (?P<last_received>.*)$"
+)
+
+
+@dataclass(frozen=True)
+class BoothStatus:
+    daemon_running: bool
+    daemon_status: str
+    tickets_status: str
+    peers_status: str
+
+
+def _get_daemon_status(
+    runner: CommandRunner, name: str | None = None
+) -> tuple[bool, str]:
     cmd = [settings.booth_exec, "status"]
     if name:
         cmd += ["-c", name]
     stdout, stderr, return_value = runner.run(cmd)
-    # 7 means that there is no booth instance running
-    if return_value not in [0, 7]:
+    if return_value not in [0, _DAEMON_NOT_RUNNING_RETVAL]:
         raise LibraryError(
             reports.ReportItem.error(
                 reports.messages.BoothDaemonStatusError(
@@ -28,7 +55,11 @@ def get_daemon_status(runner, name=None):
                 )
             )
         )
-    return stdout
+    return return_value == 0, stdout
+
+
+def get_daemon_status(runner, name=None):
+    return _get_daemon_status(runner, name)[1]
 
 
 def get_tickets_status(runner, name=None):
@@ -63,6 +94,135 @@ def get_peers_status(runner, name=None):
     return stdout
 
 
+def get_status(
+    runner: CommandRunner,
+    name: str | None = None,
+    tolerate_stopped_daemon: bool = False,
+) -> BoothStatus:
+    """
+    Get status of a booth daemon, its tickets and peers
+
+    Booth provides each of them by a different command, so the commands are
+    run concurrently.
+
+    runner -- runs the booth commands
+    name -- booth instance name
+    tolerate_stopped_daemon -- if True and the daemon is not running, do not
+        fail when getting tickets and peers status fails, as booth cannot
+        provide them without a running daemon, and return them empty
+    """
+
+    def _collect(
+        getter: Callable[[CommandRunner, str | None], str],
+    ) -> Callable[[], str | LibraryError]:
+        # Whether the daemon is running is not known until all the commands
+        # finish, so errors are kept and raised only if they are not tolerated
+        def collector() -> str | LibraryError:
+            try:
+                return getter(runner, name)
+            except LibraryError as e:
+                if not tolerate_stopped_daemon:
+                    raise
+                return e
+
+        return collector
+
+    with CollectorPool(settings.pcs_parallel_collectors_max) as pool:
+        daemon_future = pool.submit(
+            "booth_status", lambda: _get_daemon_status(runner, name)
+        )
+        tickets_future = pool.submit("booth_list", _collect(get_tickets_status))
+        peers_future = pool.submit("booth_peers", _collect(get_peers_status))
+        daemon_running, daemon_status = daemon_future.result()
+        tickets_status = tickets_future.result()
+        peers_status = peers_future.result()
+
+    if not daemon_running and tolerate_stopped_daemon:
+        return BoothStatus(
+            daemon_running=False,
+            daemon_status=daemon_status,
+            tickets_status="",
+            peers_status="",
+        )
+    if isinstance(tickets_status, LibraryError):
+        raise tickets_status
+    if isinstance(peers_status, LibraryError):
+        raise peers_status
+    return BoothStatus(
+        daemon_running=daemon_running,
+        daemon_status=daemon_status,
+        tickets_status=tickets_status,
+        peers_status=peers_status,
+    )
+
+
+def _parse_daemon_status(status: str) -> dict[str, str]:
+    # booth prints key=value pairs, values may be quoted
+    try:
+        token_list = shlex.split(status)
+    except ValueError:
+        token_list = status.split()
+    return dict(token.split("=", 1) for token in token_list if "=" in token)
+
+
+def _parse_tickets_status(status: str) -> list[BoothTicketStatusDto]:
+    # ticket: ticketA, leader: 192.168.122.81, expires: 2024-05-29 13:41:48
+    ticket_list = []
+    for line in status.splitlines():
+        ticket_attrs = dict(
+            part.split(": ", 1) for part in line.split(", ") if ": " in part
+        )
+        if "ticket" not in ticket_attrs:
+            continue
+        leader = ticket_attrs.get("leader")
+        ticket_list.append(
+            BoothTicketStatusDto(
+                name=ticket_attrs["ticket"],
+                leader=None if leader in (None, "NONE") else leader,
+                expires=ticket_attrs.get("expires"),
+            )
+        )
+    return ticket_list
+
+
+def _parse_peers_status(status: str) -> list[BoothPeerStatusDto]:
+    # site:        192.168.122.81, last recv: 2024-05-29 13:41:40
+    #         Sent pkts:5 error:0 resends:0
+    #         Recv pkts:6 error:0 authfail:0 invalid:0 tick:0 rej:0
+    peer_list = []
+    for line in status.splitlines():
+        match = _PEER_LINE_RE.match(line.strip())
+        if not match:
+            continue
+        last_received = match.group("last_received").strip()
+        peer_list.append(
+            BoothPeerStatusDto(
+                peer_type=match.group("type"),
+                address=match.group("address"),
+                last_received=(
+                    None if last_received == "never" else last_received
+                ),
+            )
+        )
+    return peer_list
+
+
+def status_to_dto(status: BoothStatus) -> BoothStatusDto:
+    """
+    Transform a plaintext booth status to a structured one
+    """
+    return BoothStatusDto(
+        daemon_running=status.daemon_running,
+        daemon_attributes=(
+            _parse_daemon_status(status.daemon_status)
+            if status.daemon_running
+            else {}
+        ),
+        ticket_list=_parse_tickets_status(status.tickets_status),
+        peer_list=_parse_peers_status(status.peers_status),
+    )
+
+
 def check_authfile_misconfiguration(
     env: BoothEnv, report_processor: reports.ReportProcessor
 ) -> reports.item.ReportItemMessage | None:
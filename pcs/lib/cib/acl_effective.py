@@ -0,0 +1,380 @@
+"""
+Evaluation of effective ACL permissions of users and groups
+
+Pacemaker marks each element matched by a permission of a user with the kind
+of the permission. An element which has not been marked gets its access from
+its nearest marked ancestor. If an element has been marked with 'deny', it is
+denied, otherwise 'write' wins over 'read'. Elements with no marked ancestor
+are denied.
+
+Users root and hacluster are not restricted by ACLs, as well as any user when
+ACLs are disabled. They have write access to the whole CIB.
+
+Permissions of each role are compiled once and the compiled roles are cached,
+so that they can be reused for all users and groups having the role.
+Permissions specified by a reference or an object type are looked up in
+a single pass over the CIB, only permissions specified by an xpath are
+evaluated separately.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Final
+
+from lxml import etree
+from lxml.etree import _Element
+
+from pcs import settings
+from pcs.common import reports
+from pcs.common.pacemaker.acl import (
+    CibAclEffectiveAccessDto,
+    CibAclEffectivePermissionsDto,
+)
+from pcs.common.types import StringSequence
+from pcs.lib.pacemaker.values import is_true
+
+from .acl import TAG_GROUP, TAG_PERMISSION, TAG_ROLE, TAG_TARGET
+from .nvpair import get_value
+from .tools import get_crm_config
+
+ACCESS_READ: Final = "read"
+ACCESS_WRITE: Final = "write"
+ACCESS_DENY: Final = "deny"
+# the first kind of permissions marking an element wins
+_ACCESS_PRECEDENCE = (ACCESS_DENY, ACCESS_WRITE, ACCESS_READ)
+# users pacemaker never applies ACLs to
+_UNRESTRICTED_USERS = frozenset(("root", settings.pacemaker_uname))
+
+
+@dataclass(frozen=True)
+class _Permission:
+    permission_id: str
+    kind: str
+    # the permission only applies to elements with this tag
+    tag: str | None = None
+    # the permission only applies to elements with this attribute
+    attribute: str | None = None
+
+    def matches(self, element: _Element) -> bool:
+        return (self.tag is None or element.tag == self.tag) and (
+            self.attribute is None or self.attribute in element.attrib
+        )
+
+
+@dataclass(frozen=True)
+class _XpathPermission:
+    permission_id: str
+    kind: str
+    xpath: etree.XPath
+
+
+@dataclass(frozen=True)
+class CompiledRole:
+    # permissions specified by a reference, keyed by the referenced id
+    by_id: Mapping[str, Sequence[_Permission]]
+    # permissions specified by an object type only, keyed by the type
+    by_tag: Mapping[str, Sequence[_Permission]]
+    xpath_list: Sequence[_XpathPermission]
+    report_list: reports.ReportItemList
+
+
+def _compile_role(role_el: _Element) -> CompiledRole:
+    by_id: dict[str, list[_Permission]] = defaultdict(list)
+    by_tag: dict[str, list[_Permission]] = defaultdict(list)
+    xpath_list: list[_XpathPermission] = []
+    report_list: reports.ReportItemList = []
+    for permission_el in role_el.iterfind(TAG_PERMISSION):
+        permission_id = str(permission_el.get("id", ""))
+        kind = str(permission_el.get("kind", ""))
+        if kind not in _ACCESS_PRECEDENCE:
+            continue
+        xpath = permission_el.get("xpath")
+        reference = permission_el.get("reference")
+        object_type = permission_el.get("object-type")
+        attribute = permission_el.get("attribute")
+        if xpath is not None:
+            # Pacemaker applies permissions matching the document to its root
+            # element. Lxml does not return the document as a match.
+            query = "/*" if str(xpath).strip() == "/" else str(xpath)
+            try:
+                xpath_list.append(
+                    _XpathPermission(permission_id, kind, etree.XPath(query))
+                )
+            except etree.XPathSyntaxError:
+                report_list.append(
+                    reports.ReportItem.warning(
+                        reports.messages.CibAclPermissionXpathInvalid(
+                            permission_id, str(xpath)
+                        )
+                    )
+                )
+            continue
+        permission = _Permission(
+            permission_id,
+            kind,
+            tag=None if object_type is None else str(object_type),
+            attribute=None if attribute is None else str(attribute),
+        )
+        if reference is not None:
+            by_id[str(reference)].append(permission)
+        elif object_type is not None:
+            by_tag[str(object_type)].append(permission)
+    return CompiledRole(dict(by_id), dict(by_tag), xpath_list, report_list)
+
+
+@lru_cache(maxsize=256)
+def _compile_role_cached(role_xml: bytes) -> CompiledRole:
+    return _compile_role(etree.fromstring(role_xml))
+
+
+def compile_role(role_el: _Element) -> CompiledRole:
+    """
+    Compile permissions of a role, reuse roles compiled before
+
+    role_el -- acl_role element
+    """
+    # Roles are identified by their content, so that a role changed in the
+    # CIB is compiled again.
+    return _compile_role_cached(etree.tostring(role_el))
+
+
+def _get_role_id_list(
+    acl_section: _Element, tag: str, name: str
+) -> list[str] | None:
+    # pacemaker matches users and groups by their name attribute, falling
+    # back to their id
+    for element in acl_section.iterfind(tag):
+        if element.get("name", element.get("id")) == name:
+            return [
+                str(role_el.attrib["id"])
+                for role_el in element.iterfind("role")
+                if "id" in role_el.attrib
+            ]
+    return None
+
+
+def get_role_id_list(
+    acl_section: _Element,
+    user_id: str | None,
+    group_id_list: StringSequence,
+) -> tuple[list[str], reports.ReportItemList]:
+    """
+    Get ids of roles of a user and groups, report users and groups missing in
+    the ACL configuration
+
+    acl_section -- acls element
+    user_id -- name of the user
+    group_id_list -- names of groups the user is a member of
+    """
+    role_id_list: list[str] = []
+    report_list: reports.ReportItemList = []
+    for tag, name_list in (
+        (TAG_TARGET, [user_id] if user_id is not None else []),
+        (TAG_GROUP, group_id_list),
+    ):
+        for name in name_list:
+            target_role_id_list = _get_role_id_list(acl_section, tag, name)
+            if target_role_id_list is None:
+                report_list.append(
+                    reports.ReportItem.error(
+                        reports.messages.IdNotFound(name, [tag])
+                    )
+                )
+                continue
+            role_id_list.extend(
+                role_id
+                for role_id in target_role_id_list
+                if role_id not in role_id_list
+            )
+    return role_id_list, report_list
+
+
+def _get_compiled_roles(
+    acl_section: _Element, role_id_list: StringSequence
+) -> list[CompiledRole]:
+    role_el_map = {
+        str(role_el.attrib["id"]): role_el
+        for role_el in acl_section.iterfind(TAG_ROLE)
+        if "id" in role_el.attrib
+    }
+    return [
+        compile_role(role_el_map[role_id])
+        for role_id in role_id_list
+        if role_id in role_el_map
+    ]
+
+
+def _get_xpath_marks(
+    cib: _Element, role_list: Iterable[CompiledRole]
+) -> dict[_Element, list[tuple[str, str]]]:
+    marks: dict[_Element, list[tuple[str, str]]] = defaultdict(list)
+    for role in role_list:
+        for permission in role.xpath_list:
+            try:
+                result = permission.xpath(cib)
+            except etree.XPathEvalError:
+                continue
+            if not isinstance(result, list):
+                continue
+            for match in result:
+                # pacemaker applies permissions matching an attribute or
+                # a text to the element containing it
+                element = (
+                    match
+                    if isinstance(match, _Element)
+                    else getattr(match, "getparent", lambda: None)()
+                )
+                if isinstance(element, _Element):
+                    marks[element].append(
+                        (permission.kind, permission.permission_id)
+                    )
+    return marks
+
+
+def _element_path_step(element: _Element, position: int | None) -> str:
+    if "id" in element.attrib:
+        return f"{element.tag!s}[@id='{element.attrib['id']!s}']"
+    if position is not None:
+        return f"{element.tag!s}[{position}]"
+    return str(element.tag)
+
+
+def evaluate(
+    cib: _Element, role_list: Sequence[CompiledRole]
+) -> list[CibAclEffectiveAccessDto]:
+    """
+    Get elements whose access is set by permissions of the roles, in document
+    order, descendants of each listed element have the same access unless
+    listed as well
+
+    cib -- the whole cib
+    role_list -- compiled roles of a user and their groups
+    """
+    xpath_marks = _get_xpath_marks(cib, role_list)
+    access_list: list[CibAclEffectiveAccessDto] = []
+
+    def walk(element: _Element, path: str, inherited: str | None) -> None:
+        marks = list(xpath_marks.get(element, []))
+        element_id = element.get("id")
+        for role in role_list:
+            if element_id is not None:
+                marks.extend(
+                    (permission.kind, permission.permission_id)
+                    for permission in role.by_id.get(str(element_id), [])
+                    if permission.matches(element)
+                )
+            marks.extend(
+                (permission.kind, permission.permission_id)
+                for permission in role.by_tag.get(str(element.tag), [])
+                if permission.matches(element)
+            )
+        access = inherited
+        if marks:
+            access = next(
+                kind
+                for kind in _ACCESS_PRECEDENCE
+                if any(mark_kind == kind for mark_kind, _ in marks)
+            )
+        elif inherited is None:
+            # the whole CIB is denied unless a permission says otherwise
+            access = ACCESS_DENY
+        if access != inherited or marks:
+            access_list.append(
+                CibAclEffectiveAccessDto(
+                    path=path,
+                    element_id=None if element_id is None else str(element_id),
+                    tag=str(element.tag),
+                    access=str(access),
+                    permission_id_list=sorted(
+                        {
+                            permission_id
+                            for mark_kind, permission_id in marks
+                            if mark_kind == access
+                        }
+                    ),
+                )
+            )
+        children = [child for child in element if isinstance(child.tag, str)]
+        tag_count: dict[str, int] = defaultdict(int)
+        for child in children:
+            tag_count[str(child.tag)] += 1
+        tag_position: dict[str, int] = defaultdict(int)
+        for child in children:
+            tag = str(child.tag)
+            tag_position[tag] += 1
+            walk(
+                child,
+                path
+                + "/"
+                + _element_path_step(
+                    child, tag_position[tag] if tag_count[tag] > 1 else None
+                ),
+                access,
+            )
+
+    walk(cib, "/" + _element_path_step(cib, None), None)
+    return access_list
+
+
+def is_acl_enabled(cib: _Element) -> bool:
+    """
+    Check whether pacemaker applies ACLs at all
+
+    cib -- the whole cib
+    """
+    return is_true(
+        get_value(
+            "cluster_property_set", get_crm_config(cib), "enable-acl", "false"
+        )
+    )
+
+
+def get_effective_permissions(
+    cib: _Element,
+    acl_section: _Element,
+    user_id: str | None,
+    group_id_list: StringSequence,
+) -> tuple[CibAclEffectivePermissionsDto, reports.ReportItemList]:
+    """
+    Evaluate access of a user and groups to all elements of the CIB
+
+    cib -- the whole cib
+    acl_section -- acls element
+    user_id -- name of the user, None to evaluate groups only
+    group_id_list -- names of groups the user is a member of
+    """
+    privileged = user_id in _UNRESTRICTED_USERS
+    # privileged users do not need to be present in the ACL configuration
+    role_id_list, report_list = get_role_id_list(
+        acl_section, None if privileged else user_id, group_id_list
+    )
+    acl_enabled = is_acl_enabled(cib)
+    restricted = acl_enabled and not privileged
+    if restricted:
+        role_list = _get_compiled_roles(acl_section, role_id_list)
+        for role in role_list:
+            report_list.extend(role.report_list)
+        access_list = evaluate(cib, role_list)
+    else:
+        access_list = [
+            CibAclEffectiveAccessDto(
+                path="/" + _element_path_step(cib, None),
+                element_id=None,
+                tag=str(cib.tag),
+                access=ACCESS_WRITE,
+                permission_id_list=[],
+            )
+        ]
+    return (
+        CibAclEffectivePermissionsDto(
+            user_id=user_id,
+            group_id_list=list(group_id_list),
+            role_id_list=role_id_list,
+            acl_enabled=acl_enabled,
+            restricted=restricted,
+            access_list=access_list,
+        ),
+        report_list,
+    )
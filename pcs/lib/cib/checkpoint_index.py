@@ -0,0 +1,330 @@
+"""
+Index of CIB checkpoints
+
+Pacemaker stores a copy of the CIB in a cib-N.raw file in its CIB directory on
+each change. Finding in which checkpoints an element has changed requires
+parsing all of them, which gets slow with hundreds of checkpoints. The index
+keeps a digest of each element with an id for each checkpoint. Digests of an
+element cover the whole element including its descendants, so subtrees with
+unchanged digests are skipped when comparing two checkpoints.
+
+The index is stored in a file and updated incrementally: only checkpoints which
+are new or have changed since the index has been stored are parsed.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Final, NamedTuple
+
+from lxml import etree
+from lxml.etree import _Element
+
+from pcs.common.types import StringSequence
+from pcs.lib.tools import write_file_atomically
+
+CHANGE_CREATED: Final = "created"
+CHANGE_CHANGED: Final = "changed"
+CHANGE_REMOVED: Final = "removed"
+
+_CHECKPOINT_FILE_RE = re.compile(r"^cib-(\d+)\.raw$")
+# These elements use their id attribute to refer to other elements. They
+# would clash with the referenced elements in the index.
+_ID_REFERENCE_TAGS = frozenset(["obj_ref", "resource_ref"])
+_ID_REFERENCE_PARENT_TAGS = frozenset(["acl_group", "acl_target"])
+
+
+class ElementDigest(NamedTuple):
+    tag: str
+    digest: str
+    # ids of the nearest descendants with an id
+    children: StringSequence
+
+
+@dataclass(frozen=True)
+class CibDigests:
+    # digest of the whole configuration section
+    digest: str
+    # ids of the outermost elements with an id
+    roots: StringSequence
+    elements: Mapping[str, ElementDigest]
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    name: str
+    mtime: float
+    digests: CibDigests
+
+
+@dataclass(frozen=True)
+class ElementChange:
+    element_id: str
+    tag: str
+    change: str
+    # number of changed ancestors of the element
+    depth: int = 0
+
+
+def _has_own_id(element: _Element) -> bool:
+    if "id" not in element.attrib or element.tag in _ID_REFERENCE_TAGS:
+        return False
+    parent = element.getparent()
+    return not (
+        element.tag == "role"
+        and parent is not None
+        and parent.tag in _ID_REFERENCE_PARENT_TAGS
+    )
+
+
+def get_cib_digests(cib: _Element) -> CibDigests:
+    """
+    Compute digests of all elements with an id in the configuration section
+
+    cib -- the cib element
+    """
+    elements: dict[str, ElementDigest] = {}
+
+    # Each element is hashed once, digests of its children are hashed instead
+    # of their content.
+    def walk(element: _Element, id_children: list[str]) -> bytes:
+        own_id_children: list[str] = []
+        is_indexed = _has_own_id(element)
+        child_list = own_id_children if is_indexed else id_children
+        hasher = hashlib.sha256()
+        hasher.update(str(element.tag).encode())
+        for name, value in sorted(element.attrib.items()):
+            hasher.update(f"\0{name!s}={value!s}".encode())
+        hasher.update(b"\0" + (element.text or "").strip().encode())
+        for child in element:
+            if isinstance(child.tag, str):
+                hasher.update(b"\0" + walk(child, child_list))
+        digest = hasher.digest()
+        if is_indexed:
+            element_id = str(element.attrib["id"])
+            id_children.append(element_id)
+            elements[element_id] = ElementDigest(
+                str(element.tag), digest.hex(), own_id_children
+            )
+        return digest
+
+    roots: list[str] = []
+    configuration = cib.find("configuration")
+    digest = b"" if configuration is None else walk(configuration, roots)
+    return CibDigests(digest.hex(), roots, elements)
+
+
+def diff_cib_digests(
+    old_digests: CibDigests, new_digests: CibDigests
+) -> list[ElementChange]:
+    """
+    Get elements which differ in two CIBs ordered as in the CIBs
+
+    Descendants of created and removed elements are not listed. Only subtrees
+    of changed elements are compared.
+    """
+    if old_digests.digest == new_digests.digest:
+        return []
+    changes: list[ElementChange] = []
+
+    def compare(id_list: StringSequence, depth: int) -> None:
+        for element_id in id_list:
+            old = old_digests.elements.get(element_id)
+            new = new_digests.elements.get(element_id)
+            if new is None and old is not None:
+                changes.append(
+                    ElementChange(element_id, old.tag, CHANGE_REMOVED, depth)
+                )
+            elif old is None and new is not None:
+                changes.append(
+                    ElementChange(element_id, new.tag, CHANGE_CREATED, depth)
+                )
+            elif old is not None and new is not None:
+                if old.digest == new.digest:
+                    continue
+                if old.tag != new.tag:
+                    changes.append(
+                        ElementChange(
+                            element_id, old.tag, CHANGE_REMOVED, depth
+                        )
+                    )
+                    changes.append(
+                        ElementChange(
+                            element_id, new.tag, CHANGE_CREATED, depth
+                        )
+                    )
+                    continue
+                changes.append(
+                    ElementChange(element_id, new.tag, CHANGE_CHANGED, depth)
+                )
+                compare(_merge_id_lists(old.children, new.children), depth + 1)
+
+    compare(_merge_id_lists(old_digests.roots, new_digests.roots), 0)
+    return changes
+
+
+def _merge_id_lists(
+    old_id_list: StringSequence, new_id_list: StringSequence
+) -> StringSequence:
+    # Elements moved to a different parent are reported as removed from the
+    # old one and created in the new one. Keep them at one place only.
+    return list(dict.fromkeys([*new_id_list, *old_id_list]))
+
+
+def get_element_history(
+    checkpoint_list: list[Checkpoint], element_id: str
+) -> list[tuple[Checkpoint, ElementChange]]:
+    """
+    Get checkpoints in which an element has been created, changed or removed
+
+    checkpoint_list -- checkpoints ordered from the oldest one
+    element_id -- id of the element to look for
+    """
+    history = []
+    previous: ElementDigest | None = None
+    for checkpoint in checkpoint_list:
+        current = checkpoint.digests.elements.get(element_id)
+        change = None
+        if previous is None and current is not None:
+            change = ElementChange(element_id, current.tag, CHANGE_CREATED)
+        elif previous is not None and current is None:
+            change = ElementChange(element_id, previous.tag, CHANGE_REMOVED)
+        elif (
+            previous is not None
+            and current is not None
+            and previous.digest != current.digest
+        ):
+            change = ElementChange(element_id, current.tag, CHANGE_CHANGED)
+        if change:
+            history.append((checkpoint, change))
+        previous = current
+    return history
+
+
+def _digests_to_dict(digests: CibDigests) -> dict[str, Any]:
+    return {
+        "digest": digests.digest,
+        "roots": list(digests.roots),
+        "elements": {
+            element_id: [element.tag, element.digest, list(element.children)]
+            for element_id, element in digests.elements.items()
+        },
+    }
+
+
+def _digests_from_dict(data: dict[str, Any]) -> CibDigests:
+    return CibDigests(
+        str(data["digest"]),
+        [str(element_id) for element_id in data["roots"]],
+        {
+            str(element_id): ElementDigest(
+                str(tag), str(digest), [str(child) for child in children]
+            )
+            for element_id, (tag, digest, children) in data["elements"].items()
+        },
+    )
+
+
+class _IndexEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    digests: CibDigests
+
+
+class CheckpointIndex:
+    def __init__(self, cib_dir: str, index_file_path: str | None):
+        """
+        cib_dir -- directory with checkpoint files
+        index_file_path -- file to store the index in, no file is used if None
+        """
+        self._cib_dir = cib_dir
+        self._index_file_path = index_file_path
+        self._entries: dict[str, _IndexEntry] | None = None
+
+    def get_checkpoints(self) -> list[Checkpoint]:
+        """
+        Get readable checkpoints ordered from the oldest one, index the ones
+        which have not been indexed yet
+
+        Raises OSError if the checkpoint directory cannot be listed.
+        """
+        if self._entries is None:
+            self._entries = self._load_index_file()
+        index_changed = False
+        checkpoint_list = []
+        present_files = set()
+        for file_name in os.listdir(self._cib_dir):
+            match = _CHECKPOINT_FILE_RE.match(file_name)
+            if not match:
+                continue
+            file_path = os.path.join(self._cib_dir, file_name)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            present_files.add(file_name)
+            entry = self._entries.get(file_name)
+            if (
+                entry is None
+                or entry.mtime_ns != stat.st_mtime_ns
+                or entry.size != stat.st_size
+            ):
+                try:
+                    digests = get_cib_digests(etree.parse(file_path).getroot())
+                except (OSError, etree.XMLSyntaxError):
+                    # unreadable checkpoints are skipped as when listed
+                    continue
+                entry = _IndexEntry(stat.st_mtime_ns, stat.st_size, digests)
+                self._entries[file_name] = entry
+                index_changed = True
+            checkpoint_list.append(
+                Checkpoint(match.group(1), stat.st_mtime, entry.digests)
+            )
+        for file_name in set(self._entries) - present_files:
+            del self._entries[file_name]
+            index_changed = True
+        if index_changed:
+            self._save_index_file()
+        return sorted(
+            checkpoint_list,
+            key=lambda checkpoint: (checkpoint.mtime, int(checkpoint.name)),
+        )
+
+    def _load_index_file(self) -> dict[str, _IndexEntry]:
+        if not self._index_file_path:
+            return {}
+        try:
+            with open(self._index_file_path, encoding="utf-8") as index_file:
+                data = json.load(index_file)
+            return {
+                str(file_name): _IndexEntry(
+                    int(entry["mtime_ns"]),
+                    int(entry["size"]),
+                    _digests_from_dict(entry["digests"]),
+                )
+                for file_name, entry in data["checkpoints"].items()
+            }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # The index is only an optimization. If it cannot be read, it is
+            # built again.
+            return {}
+
+    def _save_index_file(self) -> None:
+        if not self._index_file_path or self._entries is None:
+            return
+        data = {
+            "checkpoints": {
+                file_name: {
+                    "mtime_ns": entry.mtime_ns,
+                    "size": entry.size,
+                    "digests": _digests_to_dict(entry.digests),
+                }
+                for file_name, entry in self._entries.items()
+            }
+        }
+        with contextlib.suppress(OSError):
+            write_file_atomically(self._index_file_path, json.dumps(data))
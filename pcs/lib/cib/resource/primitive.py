@@ -149,6 +149,7 @@ def create(  # noqa: PLR0913
     # TODO remove this arg
     do_not_report_instance_attribute_server_exists: bool = False,
     enable_agent_self_validation: bool = False,
+    agent_self_validation_result: tuple[bool | None, str] | None = None,
 ) -> _Element:
     """
     Prepare all parts of primitive resource and append it into cib.
@@ -171,6 +172,8 @@ def create(  # noqa: PLR0913
         suboptimal architecture, TODO: fix the architecture and remove the param
     enable_agent_self_validation -- if True, use agent self-validation feature
         to validate instance attributes
+    agent_self_validation_result -- result of the agent self-validation of
+        instance_attributes if it has already been run, None to run it
     """
     if raw_operation_list is None:
         raw_operation_list = []
@@ -212,6 +215,7 @@ def create(  # noqa: PLR0913
         resources_section,
         force=allow_invalid_instance_attributes,
         enable_agent_self_validation=enable_agent_self_validation,
+        agent_self_validation_result=agent_self_validation_result,
     )
     # TODO remove this "if", see pcs.lib.cib.remote_node.create for details
     if do_not_report_instance_attribute_server_exists:
@@ -416,6 +420,19 @@ def _is_ocf_or_stonith_agent(resource_agent_name: ResourceAgentName) -> bool:
     return resource_agent_name.standard in ("stonith", "ocf")
 
 
+def is_agent_self_validation_supported(
+    resource_agent: ResourceAgentFacade,
+) -> bool:
+    """
+    Check whether instance attributes can be validated by the agent itself
+    """
+    return (
+        _is_ocf_or_stonith_agent(resource_agent.metadata.name)
+        and resource_agent.metadata.agent_exists
+        and resource_agent.metadata.provides_self_validation
+    )
+
+
 def _get_report_from_agent_self_validation(
     is_valid: bool | None,
     reason: str,
@@ -448,6 +465,7 @@ def validate_resource_instance_attributes_create(
     resources_section: _Element,
     force: bool = False,
     enable_agent_self_validation: bool = False,
+    agent_self_validation_result: tuple[bool | None, str] | None = None,
 ) -> reports.ReportItemList:
     report_items: reports.ReportItemList = []
     report_items += validate.ValidatorAll(
@@ -481,21 +499,20 @@ def validate_resource_instance_attributes_create(
             force=force,
         )
 
-    if (
-        _is_ocf_or_stonith_agent(agent_name)
-        and resource_agent.metadata.agent_exists
-        and resource_agent.metadata.provides_self_validation
-        and not any(
-            report_item.severity.level == reports.ReportItemSeverity.ERROR
-            for report_item in report_items
-        )
+    if is_agent_self_validation_supported(resource_agent) and not any(
+        report_item.severity.level == reports.ReportItemSeverity.ERROR
+        for report_item in report_items
     ):
+        if agent_self_validation_result is None:
+            agent_self_validation_result = (
+                validate_resource_instance_attributes_via_pcmk(
+                    cmd_runner,
+                    agent_name,
+                    instance_attributes,
+                )
+            )
         agent_reports = _get_report_from_agent_self_validation(
-            *validate_resource_instance_attributes_via_pcmk(
-                cmd_runner,
-                agent_name,
-                instance_attributes,
-            ),
+            *agent_self_validation_result,
             reports.get_severity(
                 reports.codes.FORCE,
                 force or not enable_agent_self_validation,
@@ -1,8 +1,12 @@
-from collections.abc import Iterator
+import re
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
 from typing import Any
 
 import pyparsing
 
+from pcs.common.types import StringIterable
+
 from .expression_part import (
     BOOL_AND,
     BOOL_OR,
@@ -89,9 +93,25 @@ def parse_rule(rule_string: str) -> BoolExpr:
         return BoolExpr(BOOL_AND, [])
 
     try:
-        parsed = __get_rule_parser().parse_string(rule_string, parse_all=True)[
-            0
-        ]
+        # Most rules are parsed by the fast parser. It gives up on rules it is
+        # not sure about, including all invalid rules, and leaves them to the
+        # grammar, which also provides proper error messages.
+        parsed = _FastRuleParser(rule_string).parse()
+    except _FastRuleParserGaveUp:
+        parsed = __parse_rule_by_grammar(rule_string)
+
+    if not isinstance(parsed, BoolExpr):
+        # If we only got a representation on an inner rule element instead of a
+        # rule element itself, wrap the result in a default AND-rule. (There is
+        # only one expression so "and" vs. "or" doesn't really matter.)
+        parsed = BoolExpr(BOOL_AND, [parsed])
+
+    return parsed
+
+
+def __parse_rule_by_grammar(rule_string: str) -> RuleExprPart:
+    try:
+        return __get_rule_parser().parse_string(rule_string, parse_all=True)[0]
     except pyparsing.ParseException as e:
         raise RuleParseError(
             rule_string,
@@ -102,17 +122,9 @@ def parse_rule(rule_string: str) -> BoolExpr:
             e.args[2] if e.args[2] is not None else "",
         ) from e
 
-    if not isinstance(parsed, BoolExpr):
-        # If we only got a representation on an inner rule element instead of a
-        # rule element itself, wrap the result in a default AND-rule. (There is
-        # only one expression so "and" vs. "or" doesn't really matter.)
-        parsed = BoolExpr(BOOL_AND, [parsed])
-
-    return parsed
-
 
 def __operator_operands(
-    token_list: pyparsing.ParseResults,
+    token_list: Sequence[Any],
 ) -> Iterator[tuple[Any, Any]]:
     # See pyparsing examples
     # https://github.com/pyparsing/pyparsing/blob/master/examples/eval_arith.py
@@ -125,16 +137,23 @@ def __operator_operands(
 
 
 def __build_bool_tree(token_list: pyparsing.ParseResults) -> RuleExprPart:
+    return _build_bool_tree_from_list(token_list[0])
+
+
+def _build_bool_tree_from_list(token_list: Sequence[Any]) -> RuleExprPart:
+    """
+    token_list -- operands and "and" / "or" operators in between them
+    """
     # See pyparsing examples
     # https://github.com/pyparsing/pyparsing/blob/master/examples/eval_arith.py
     token_to_operator = {
         "and": BOOL_AND,
         "or": BOOL_OR,
     }
-    operand_left = token_list[0][0]
+    operand_left = token_list[0]
     last_operator: str | None = None
     operand_list = []
-    for operator, operand_right in __operator_operands(token_list[0][1:]):
+    for operator, operand_right in __operator_operands(token_list[1:]):
         # In each iteration, we get a bool_op ("and" or "or") and the right
         # operand.
         if last_operator == operator or last_operator is None:
@@ -264,10 +283,15 @@ def __get_date_common_parser_part() -> pyparsing.ParserElement:
     )
 
 
+# Building the grammar takes longer than parsing most rules, so it is only
+# built once.
+@lru_cache(maxsize=1)
 def __get_rule_parser() -> pyparsing.ParserElement:
     # This function defines the rule grammar
 
     # How to add new rule expressions:
+    #   0 Add the expressions to _FastRuleParser as well or make sure it gives
+    #     up on them.
     #   1 Create new grammar rules in a way similar to existing rsc_expr and
     #     op_expr. Use setName for better description of a grammar when printed.
     #     Use setResultsName for an easy access to parsed parts.
@@ -501,3 +525,288 @@ def __get_rule_parser() -> pyparsing.ParserElement:
     )
 
     return pyparsing.Or([bool_expr, simple_expr])
+
+
+class _FastRuleParserGaveUp(Exception):
+    pass
+
+
+# all keywords of the grammar
+_KEYWORD_LIST = (
+    *_token_to_date_expr_unary_op,
+    *_token_to_node_expr_unary_op,
+    *_token_to_node_expr_binary_op,
+    *_token_to_node_expr_type,
+    "and",
+    "date",
+    "date-spec",
+    "duration",
+    "in_range",
+    "interval",
+    "op",
+    "or",
+    "resource",
+    "to",
+)
+_KEYWORD_CHARS = frozenset(pyparsing.Keyword.DEFAULT_KEYWORD_CHARS.upper())
+_TOKEN_RE = re.compile(r"[()]|[^\s()]+")
+# whitespace not skipped by pyparsing
+_UNSUPPORTED_WHITESPACE_RE = re.compile(r"[^\S \t\n\r]")
+_DATE_PART_RE = re.compile(r"(?P<name>[^=]+)=(?P<value>.+)")
+_INTERVAL_VALUE_RE = re.compile(r"[0-9]+[A-Za-z]*")
+_RSC_RE = re.compile(
+    r"(?P<standard>[^:]+)?:(?P<provider>[^:]+)?:(?P<type>[^:]+)?"
+)
+
+# a parsed expression and a position of the token following it
+_ParsedPart = tuple[RuleExprPart, int]
+
+
+class _FastRuleParser:
+    """
+    Recursive descent parser of rules producing the same trees as the grammar
+
+    Parsing with the grammar is slow, as pyparsing tries all the alternatives
+    of each expression and picks the longest match. This parser splits the
+    rule to tokens first and mimics the grammar on them, so that each token is
+    only looked at a few times.
+
+    Tokens which are only partially matched by keywords of the grammar, e.g.
+    'gt-5' being read as 'gt' '-5', and rules which are not valid or which the
+    parser is not sure about, make the parser give up by raising
+    _FastRuleParserGaveUp.
+    """
+
+    def __init__(self, rule_string: str):
+        if _UNSUPPORTED_WHITESPACE_RE.search(rule_string):
+            raise _FastRuleParserGaveUp()
+        self._tokens = _TOKEN_RE.findall(rule_string)
+        self._tokens_upper = [token.upper() for token in self._tokens]
+        for token in self._tokens:
+            self._check_partial_keywords(token)
+
+    @staticmethod
+    def _check_partial_keywords(token: str) -> None:
+        for keyword in _KEYWORD_LIST:
+            if (
+                len(token) > len(keyword)
+                and token[: len(keyword)].upper() == keyword.upper()
+                and token[len(keyword)].upper() not in _KEYWORD_CHARS
+            ):
+                # 'date' is a prefix of the 'date-spec' keyword but never
+                # matches it, as it is followed by 'gt', 'lt' or 'in_range'
+                # in the grammar. 'interval=' is taken care of in _op_expr.
+                if (keyword == "date" and token.upper() == "DATE-SPEC") or (
+                    keyword == "interval" and token[len(keyword)] == "="
+                ):
+                    continue
+                raise _FastRuleParserGaveUp()
+
+    def parse(self) -> RuleExprPart:
+        if not self._tokens:
+            raise _FastRuleParserGaveUp()
+        parsed, pos = self._bool_expr(0)
+        if pos != len(self._tokens):
+            raise _FastRuleParserGaveUp()
+        return parsed
+
+    def _is_keyword(self, pos: int, keyword: str) -> bool:
+        return (
+            pos < len(self._tokens)
+            and self._tokens_upper[pos] == keyword.upper()
+            and len(self._tokens[pos]) == len(keyword)
+        )
+
+    def _get_keyword(
+        self, pos: int, keyword_list: StringIterable
+    ) -> str | None:
+        for keyword in keyword_list:
+            if self._is_keyword(pos, keyword):
+                return keyword
+        return None
+
+    def _get_value(self, pos: int) -> str | None:
+        if pos < len(self._tokens) and self._tokens[pos] not in ("(", ")"):
+            return self._tokens[pos]
+        return None
+
+    def _bool_expr(self, pos: int) -> _ParsedPart:
+        operand, pos = self._operand(pos)
+        token_list: list[Any] = [operand]
+        while True:
+            operator = self._get_keyword(pos, ("and", "or"))
+            if operator is None:
+                break
+            operand, pos = self._operand(pos + 1)
+            token_list.extend([operator, operand])
+        if len(token_list) == 1:
+            return operand, pos
+        return _build_bool_tree_from_list(token_list), pos
+
+    def _operand(self, pos: int) -> _ParsedPart:
+        if pos < len(self._tokens) and self._tokens[pos] == "(":
+            parsed, pos = self._bool_expr(pos + 1)
+            if pos >= len(self._tokens) or self._tokens[pos] != ")":
+                raise _FastRuleParserGaveUp()
+            return parsed, pos + 1
+        return self._simple_expr(pos)
+
+    def _simple_expr(self, pos: int) -> _ParsedPart:
+        # Same as in the grammar, the longest match wins. If more expressions
+        # match the same number of tokens, the first one wins.
+        longest: _ParsedPart | None = None
+        for parse_expr in (
+            self._date_unary_expr,
+            self._date_inrange_expr,
+            self._datespec_expr,
+            self._node_attr_unary_expr,
+            self._node_attr_binary_expr,
+            self._rsc_expr,
+            self._op_expr,
+        ):
+            parsed = parse_expr(pos)
+            if parsed is not None and (
+                longest is None or parsed[1] > longest[1]
+            ):
+                longest = parsed
+        if longest is None:
+            raise _FastRuleParserGaveUp()
+        return longest
+
+    def _date_parts(self, pos: int) -> tuple[list[Any], int]:
+        # [name, value] lists, the same as produced by the grammar
+        part_list = []
+        while pos < len(self._tokens):
+            match = _DATE_PART_RE.fullmatch(self._tokens[pos])
+            if not match:
+                if self._tokens[pos].endswith("="):
+                    # the value is the next token
+                    raise _FastRuleParserGaveUp()
+                break
+            part_list.append([match.group("name"), match.group("value")])
+            pos += 1
+        return part_list, pos
+
+    def _date_unary_expr(self, pos: int) -> _ParsedPart | None:
+        if not self._is_keyword(pos, "date"):
+            return None
+        operator = self._get_keyword(
+            pos + 1, _token_to_date_expr_unary_op.keys()
+        )
+        date = self._get_value(pos + 2)
+        if operator is None or date is None:
+            return None
+        return (
+            DateUnaryExpr(_token_to_date_expr_unary_op[operator], date),
+            pos + 3,
+        )
+
+    def _date_inrange_expr(self, pos: int) -> _ParsedPart | None:
+        if not (
+            self._is_keyword(pos, "date")
+            and self._is_keyword(pos + 1, "in_range")
+        ):
+            return None
+        pos += 2
+        date_start = None
+        if self._get_value(pos) is not None and self._is_keyword(pos + 1, "to"):
+            date_start = self._tokens[pos]
+            pos += 1
+        if not self._is_keyword(pos, "to"):
+            return None
+        pos += 1
+        if self._is_keyword(pos, "duration"):
+            duration_parts, duration_end = self._date_parts(pos + 1)
+            if duration_parts:
+                return (
+                    DateInRangeExpr(date_start, None, duration_parts),
+                    duration_end,
+                )
+        date_end = self._get_value(pos)
+        if date_end is None:
+            return None
+        return DateInRangeExpr(date_start, date_end, None), pos + 1
+
+    def _datespec_expr(self, pos: int) -> _ParsedPart | None:
+        if not self._is_keyword(pos, "date-spec"):
+            return None
+        date_parts, pos = self._date_parts(pos + 1)
+        if not date_parts:
+            return None
+        return DatespecExpr(date_parts), pos
+
+    def _node_attr_unary_expr(self, pos: int) -> _ParsedPart | None:
+        operator = self._get_keyword(pos, _token_to_node_expr_unary_op.keys())
+        attr_name = self._get_value(pos + 1)
+        if operator is None or attr_name is None:
+            return None
+        return (
+            NodeAttrExpr(
+                _token_to_node_expr_unary_op[operator], attr_name, None, None
+            ),
+            pos + 2,
+        )
+
+    def _node_attr_binary_expr(self, pos: int) -> _ParsedPart | None:
+        attr_name = self._get_value(pos)
+        operator = self._get_keyword(
+            pos + 1, _token_to_node_expr_binary_op.keys()
+        )
+        if attr_name is None or operator is None:
+            return None
+        pos += 2
+        # Once a type is matched, the value must follow. The grammar does not
+        # try to use the type as the value.
+        attr_type = self._get_keyword(pos, _token_to_node_expr_type.keys())
+        if attr_type is not None:
+            pos += 1
+        attr_value = self._get_value(pos)
+        if attr_value is None:
+            return None
+        return (
+            NodeAttrExpr(
+                _token_to_node_expr_binary_op[operator],
+                attr_name,
+                attr_value,
+                _token_to_node_expr_type[attr_type] if attr_type else None,
+            ),
+            pos + 1,
+        )
+
+    def _rsc_expr(self, pos: int) -> _ParsedPart | None:
+        if not self._is_keyword(pos, "resource"):
+            return None
+        resource = self._get_value(pos + 1)
+        if resource is None:
+            return None
+        match = _RSC_RE.match(resource)
+        if not match:
+            return None
+        if match.end() != len(resource):
+            # the grammar would match only a part of the token
+            raise _FastRuleParserGaveUp()
+        return (
+            RscExpr(
+                match.group("standard"),
+                match.group("provider"),
+                match.group("type"),
+            ),
+            pos + 2,
+        )
+
+    def _op_expr(self, pos: int) -> _ParsedPart | None:
+        if not self._is_keyword(pos, "op"):
+            return None
+        name = self._get_value(pos + 1)
+        if name is None:
+            return None
+        pos += 2
+        interval = None
+        if pos < len(self._tokens) and self._tokens_upper[pos].startswith(
+            "INTERVAL="
+        ):
+            interval = self._tokens[pos][len("interval=") :]
+            if not _INTERVAL_VALUE_RE.fullmatch(interval):
+                raise _FastRuleParserGaveUp()
+            pos += 1
+        return OpExpr(name, interval), pos
@@ -1,7 +1,9 @@
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
-from pcs.lib.cib import acl
+from pcs.common.pacemaker.acl import CibAclEffectivePermissionsDto
+from pcs.common.types import StringSequence
+from pcs.lib.cib import acl, acl_effective
 from pcs.lib.cib.tools import IdProvider, get_acls
 from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
@@ -299,3 +301,25 @@ def get_config(lib_env):
         "group_list": acl.get_group_list(acl_section),
         "role_list": acl.get_role_list(acl_section),
     }
+
+
+def get_effective_permissions(
+    lib_env: LibraryEnvironment,
+    user_id: str | None,
+    group_id_list: StringSequence,
+) -> CibAclEffectivePermissionsDto:
+    """
+    Get access of a user or groups to elements of the CIB as pacemaker
+    evaluates it from their ACL roles
+
+    lib_env -- LibraryEnvironment
+    user_id -- name of the user, None to evaluate only groups
+    group_id_list -- names of groups the user is a member of
+    """
+    cib = lib_env.get_cib()
+    dto, report_list = acl_effective.get_effective_permissions(
+        cib, get_acls(cib), user_id, group_id_list
+    )
+    if lib_env.report_processor.report_list(report_list).has_errors:
+        raise LibraryError()
+    return dto
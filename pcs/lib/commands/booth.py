@@ -8,7 +8,11 @@ from lxml.etree import _Element
 
 from pcs import settings
 from pcs.common import file_type_codes, reports
-from pcs.common.booth_dto import BoothConfigAndAuthfileDto, BoothConfigFileDto
+from pcs.common.booth_dto import (
+    BoothConfigAndAuthfileDto,
+    BoothConfigFileDto,
+    BoothStatusDto,
+)
 from pcs.common.file import FileAlreadyExists, RawFileError
 from pcs.common.reports import ReportProcessor
 from pcs.common.reports import codes as report_codes
@@ -1200,6 +1204,23 @@ def pull_config(
         raise LibraryError()
 
 
+def _get_status(
+    env: LibraryEnvironment,
+    instance_name: str | None,
+    tolerate_stopped_daemon: bool = False,
+) -> status.BoothStatus:
+    booth_env = env.get_booth_env(instance_name)
+    _ensure_live_env(env, booth_env)
+    report_msg = status.check_authfile_misconfiguration(
+        booth_env, env.report_processor
+    )
+    if report_msg:
+        env.report_processor.report(reports.ReportItem.warning(report_msg))
+    return status.get_status(
+        env.cmd_runner(), booth_env.instance_name, tolerate_stopped_daemon
+    )
+
+
 def get_status(
     env: LibraryEnvironment, instance_name: str | None = None
 ) -> Mapping[str, str]:
@@ -1209,21 +1230,28 @@ def get_status(
     env
     instance_name -- booth instance name
     """
-    booth_env = env.get_booth_env(instance_name)
-    _ensure_live_env(env, booth_env)
-    instance_name = booth_env.instance_name
-    report_msg = status.check_authfile_misconfiguration(
-        booth_env, env.report_processor
-    )
-    if report_msg:
-        env.report_processor.report(reports.ReportItem.warning(report_msg))
+    booth_status = _get_status(env, instance_name)
     return {
-        "status": status.get_daemon_status(env.cmd_runner(), instance_name),
-        "ticket": status.get_tickets_status(env.cmd_runner(), instance_name),
-        "peers": status.get_peers_status(env.cmd_runner(), instance_name),
+        "status": booth_status.daemon_status,
+        "ticket": booth_status.tickets_status,
+        "peers": booth_status.peers_status,
     }
 
 
+def get_status_dto(
+    env: LibraryEnvironment, instance_name: str | None = None
+) -> BoothStatusDto:
+    """
+    get structured booth status info
+
+    env
+    instance_name -- booth instance name
+    """
+    return status.status_to_dto(
+        _get_status(env, instance_name, tolerate_stopped_daemon=True)
+    )
+
+
 def _find_resource_elements_for_operation(
     resources_section: _Element, booth_env: BoothEnv, allow_multiple: bool
 ) -> tuple[list[_Element], reports.ReportItemList]:
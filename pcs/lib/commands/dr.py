@@ -1,6 +1,7 @@
 from collections.abc import Iterable, Mapping
 from typing import Any, cast
 
+from pcs import settings
 from pcs.common import file_type_codes, reports
 from pcs.common.dr import (
     DrConfigDto,
@@ -20,7 +21,7 @@ from pcs.lib.communication.nodes import (
     DistributeFilesWithoutForces,
     RemoveFilesWithoutForces,
 )
-from pcs.lib.communication.status import GetFullClusterStatusPlaintext
+from pcs.lib.communication.status import GetFullClusterStatusPlaintextSites
 from pcs.lib.communication.tools import run as run_com_cmd
 from pcs.lib.communication.tools import run_and_raise
 from pcs.lib.corosync.config_facade import ConfigFacade as CorosyncConfigFacade
@@ -181,6 +182,7 @@ def status_all_sites_plaintext(
     env: LibraryEnvironment,
     hide_inactive_resources: bool = False,
     verbose: bool = False,
+    site_timeout: int | None = None,
 ) -> list[Mapping[str, Any]]:
     """
     Return local site's and all remote sites' status as plaintext
@@ -188,6 +190,9 @@ def status_all_sites_plaintext(
     env -- LibraryEnvironment
     hide_inactive_resources -- if True, do not display non-running resources
     verbose -- if True, display more info
+    site_timeout -- time in seconds to get status of each site in, sites not
+        providing their status in time are reported as unavailable, defaults
+        to the request timeout set by the user or to settings
     """
 
     # The command does not provide an option to skip offline / unreachable /
@@ -206,7 +211,7 @@ def status_all_sites_plaintext(
         ) -> None:
             self.local = local
             self.role = role
-            self.target_list = target_list
+            self.target_list = list(target_list)
             self.status_loaded = False
             self.status_plaintext = ""
 
@@ -252,17 +257,32 @@ def status_all_sites_plaintext(
     if report_processor.has_errors:
         raise LibraryError()
 
-    # get all statuses
-    for site_data in site_data_list:
-        com_cmd = GetFullClusterStatusPlaintext(
-            report_processor,
-            hide_inactive_resources=hide_inactive_resources,
-            verbose=verbose,
-        )
-        com_cmd.set_targets(site_data.target_list)
-        site_data.status_loaded, site_data.status_plaintext = run_com_cmd(
-            env.get_node_communicator(), com_cmd
+    # Get all statuses at once, so that the time spent is the time of the
+    # slowest site, not the sum of times of all sites. No request takes longer
+    # than the site timeout, so a single unresponsive node cannot block
+    # the rest. Users with slow sites raise the request timeout, so it is
+    # used as the site timeout if set.
+    if site_timeout is None:
+        site_timeout = (
+            env.request_timeout
+            if env.request_timeout
+            else settings.dr_site_status_timeout
         )
+    com_cmd = GetFullClusterStatusPlaintextSites(
+        report_processor,
+        [site_data.target_list for site_data in site_data_list],
+        site_timeout,
+        hide_inactive_resources=hide_inactive_resources,
+        verbose=verbose,
+    )
+    site_status_list = run_com_cmd(
+        env.get_node_communicator(request_timeout=site_timeout), com_cmd
+    )
+    for site_data, (status_loaded, status_plaintext) in zip(
+        site_data_list, site_status_list, strict=True
+    ):
+        site_data.status_loaded = status_loaded
+        site_data.status_plaintext = status_plaintext
 
     return [
         dto.to_dict(
@@ -1,16 +1,38 @@
+import time
+from collections.abc import Mapping
 from contextlib import contextmanager
+from copy import deepcopy
+from functools import partial
 
+from lxml.etree import _Element
+
+from pcs import settings
 from pcs.common import reports
 from pcs.common.pacemaker.node import CibNodeListDto
 from pcs.common.reports.item import ReportItem
+from pcs.common.types import StringSequence
 from pcs.lib.cib import node
 from pcs.lib.cib.node import update_node_instance_attrs
 from pcs.lib.cib.rule.in_effect import get_rule_evaluator
 from pcs.lib.cib.tools import IdProvider, get_nodes
 from pcs.lib.env import LibraryEnvironment, WaitType
 from pcs.lib.errors import LibraryError
-from pcs.lib.pacemaker.live import get_local_node_name
+from pcs.lib.external import CommandRunner
+from pcs.lib.pacemaker import simulate as simulate_tools
+from pcs.lib.pacemaker.live import (
+    get_cib,
+    get_cib_xml,
+    get_local_node_name,
+    simulate_cib,
+)
 from pcs.lib.pacemaker.state import ClusterState
+from pcs.lib.parallel import CollectorPool
+from pcs.lib.validate import (
+    NamesIn,
+    ValidatorAll,
+    ValuePositiveInteger,
+    ValueTimeInterval,
+)
 
 
 @contextmanager
@@ -184,6 +206,293 @@ def _set_instance_attrs_all_nodes(
             )
 
 
+def rolling_standby_plan(
+    lib_env: LibraryEnvironment,
+    node_names: StringSequence,
+    options: Mapping[str, str],
+    force_flags: reports.types.ForceFlags = (),
+) -> list[list[str]]:
+    """
+    Split nodes into waves which can be put into standby one after another
+    without leaving any resources stopped
+
+    node_names -- nodes to split, all online nodes not in standby if empty
+    options -- 'max-wave-size': maximal number of nodes in a wave
+    force_flags -- allow nodes which cannot be put into standby without
+        stopping resources, each of them forms a wave of its own
+    """
+    _validate_rolling_standby_options(
+        lib_env.report_processor, options, ["max-wave-size"]
+    )
+    return _plan_standby_waves(lib_env, node_names, options, force_flags)
+
+
+def rolling_standby(
+    lib_env: LibraryEnvironment,
+    node_names: StringSequence,
+    options: Mapping[str, str],
+    force_flags: reports.types.ForceFlags = (),
+) -> None:
+    """
+    Put nodes into standby in waves, wait for resources to move away from the
+    nodes of each wave and for the nodes to come back before the next wave
+
+    Nodes are split into waves by rolling_standby_plan. The nodes of a wave
+    are left in standby for their maintenance. The next wave is started once
+    all the nodes of the previous wave are online and have been taken out of
+    standby. The nodes of the last wave are left in standby.
+
+    node_names -- nodes to put into standby, all online nodes not in standby
+        if empty
+    options -- 'max-wave-size': maximal number of nodes in a wave; 'timeout':
+        how long to wait for the cluster to settle down after putting each
+        wave into standby, wait indefinitely if not specified
+    force_flags -- allow nodes which cannot be put into standby without
+        stopping resources, each of them forms a wave of its own
+    """
+    _validate_rolling_standby_options(
+        lib_env.report_processor, options, ["max-wave-size", "timeout"]
+    )
+    wait_timeout = lib_env.ensure_wait_satisfiable(options.get("timeout"))
+    wave_list = _plan_standby_waves(lib_env, node_names, options, force_flags)
+    for wave_number, wave in enumerate(wave_list, start=1):
+        lib_env.report_processor.report(
+            ReportItem.info(
+                reports.messages.NodeStandbyWaveStarted(
+                    wave_number, len(wave_list), wave
+                )
+            )
+        )
+        _put_node_list_into_standby(lib_env, wave, wait_timeout)
+        lib_env.report_processor.report(
+            ReportItem.info(
+                reports.messages.NodeStandbyWaveFinished(
+                    wave_number,
+                    len(wave_list),
+                    wave,
+                    [
+                        node_name
+                        for next_wave in wave_list[wave_number:]
+                        for node_name in next_wave
+                    ],
+                )
+            )
+        )
+        if wave_number < len(wave_list):
+            lib_env.report_processor.report(
+                ReportItem.info(
+                    reports.messages.NodeStandbyWaveWaitingForNodes(
+                        wave_number, len(wave_list), wave
+                    )
+                )
+            )
+            _wait_for_nodes_out_of_standby(lib_env, wave)
+
+
+def _validate_rolling_standby_options(
+    report_processor: reports.ReportProcessor,
+    options: Mapping[str, str],
+    allowed_options: StringSequence,
+) -> None:
+    report_processor.report_list(
+        ValidatorAll(
+            [
+                NamesIn(allowed_options, option_type="option"),
+                ValuePositiveInteger("max-wave-size"),
+                ValueTimeInterval("timeout"),
+            ]
+        ).validate(options)
+    )
+    if report_processor.has_errors:
+        raise LibraryError()
+
+
+def _put_node_list_into_standby(
+    lib_env: LibraryEnvironment, node_names: StringSequence, wait_timeout: int
+) -> None:
+    cib = lib_env.get_cib()
+    state_nodes = ClusterState(lib_env.get_cluster_state()).node_section.nodes
+    id_provider = IdProvider(cib)
+    for node_name in node_names:
+        update_node_instance_attrs(
+            cib,
+            id_provider,
+            node_name,
+            _create_standby_unstandby_dict(True),
+            state_nodes=state_nodes,
+        )
+    lib_env.push_cib(wait_timeout=wait_timeout)
+
+
+def _wait_for_nodes_out_of_standby(
+    lib_env: LibraryEnvironment, node_names: StringSequence
+) -> None:
+    # Maintenance of the nodes takes an unknown time, wait until it is done.
+    interval = 10
+    while True:
+        state_nodes = ClusterState(
+            lib_env.get_cluster_state()
+        ).node_section.nodes
+        if all(
+            node.attrs.online and not node.attrs.standby
+            for node in state_nodes
+            if node.attrs.name in node_names
+        ):
+            return
+        time.sleep(interval)
+
+
+def _plan_standby_waves(
+    lib_env: LibraryEnvironment,
+    node_names: StringSequence,
+    options: Mapping[str, str],
+    force_flags: reports.types.ForceFlags,
+) -> list[list[str]]:
+    runner = lib_env.cmd_runner()
+    # The CIB is not loaded by the environment, as it would have to be pushed
+    # before loading it again for putting nodes into standby.
+    cib = get_cib(get_cib_xml(runner))
+    state_nodes = ClusterState(lib_env.get_cluster_state()).node_section.nodes
+    if node_names:
+        known_nodes = [node.attrs.name for node in state_nodes]
+        report_list = [
+            ReportItem.error(reports.messages.NodeNotFound(node_name))
+            for node_name in node_names
+            if node_name not in known_nodes
+        ]
+        if report_list:
+            raise LibraryError(*report_list)
+        node_list = list(dict.fromkeys(node_names))
+    else:
+        node_list = [
+            node.attrs.name
+            for node in state_nodes
+            if node.attrs.online and not node.attrs.standby
+        ]
+    max_wave_size = (
+        int(options["max-wave-size"]) if "max-wave-size" in options else None
+    )
+
+    wave_list, unsafe_nodes = _split_into_standby_waves(
+        runner, cib, state_nodes, node_list, max_wave_size
+    )
+    if lib_env.report_processor.report_list(
+        [
+            ReportItem(
+                severity=reports.get_severity_from_flags(
+                    reports.codes.FORCE, force_flags
+                ),
+                message=reports.messages.NodeStandbyLeavesResourcesStopped(
+                    node_name, resource_list
+                ),
+            )
+            for node_name, resource_list in unsafe_nodes.items()
+        ]
+    ).has_errors:
+        raise LibraryError()
+    return wave_list + [[node_name] for node_name in unsafe_nodes]
+
+
+def _split_into_standby_waves(
+    runner: CommandRunner,
+    cib: _Element,
+    state_nodes,
+    node_list: StringSequence,
+    max_wave_size: int | None,
+) -> tuple[list[list[str]], dict[str, list[str]]]:
+    """
+    Return waves of nodes and nodes which cannot be put into standby even on
+    their own together with resources they would leave stopped
+
+    Waves are built greedily. Each candidate for joining a wave is simulated
+    to be put into standby together with the nodes already in the wave.
+    Candidates are simulated concurrently and the first one which leaves no
+    resources stopped joins the wave. Candidates which would leave resources
+    stopped are not tried again for the same wave, as putting more nodes into
+    standby does not make resources able to run.
+    """
+    wave_list: list[list[str]] = []
+    unsafe_nodes: dict[str, list[str]] = {}
+    remaining_nodes = list(node_list)
+    with CollectorPool(settings.pcs_parallel_collectors_max) as pool:
+        while remaining_nodes:
+            wave: list[str] = []
+            candidate_list = list(remaining_nodes)
+            while candidate_list and (
+                max_wave_size is None or len(wave) < max_wave_size
+            ):
+                future_map = {
+                    node_name: pool.submit(
+                        f"wave {len(wave_list) + 1}: {node_name}",
+                        partial(
+                            _simulate_standby,
+                            runner,
+                            # Each simulation gets a CIB of its own, lxml
+                            # documents must not be shared between threads.
+                            _get_standby_cib(
+                                cib, state_nodes, [*wave, node_name]
+                            ),
+                        ),
+                    )
+                    for node_name in candidate_list
+                }
+                left_stopped = {
+                    node_name: future.result()
+                    for node_name, future in future_map.items()
+                }
+                if not wave:
+                    unsafe_nodes.update(
+                        (node_name, resource_list)
+                        for node_name, resource_list in left_stopped.items()
+                        if resource_list
+                    )
+                candidate_list = [
+                    node_name
+                    for node_name in candidate_list
+                    if not left_stopped[node_name]
+                ]
+                if candidate_list:
+                    wave.append(candidate_list.pop(0))
+            if wave:
+                wave_list.append(wave)
+            remaining_nodes = [
+                node_name
+                for node_name in remaining_nodes
+                if node_name not in wave and node_name not in unsafe_nodes
+            ]
+    return wave_list, unsafe_nodes
+
+
+def _get_standby_cib(
+    cib: _Element, state_nodes, node_list: StringSequence
+) -> _Element:
+    standby_cib = deepcopy(cib)
+    id_provider = IdProvider(standby_cib)
+    for node_name in node_list:
+        update_node_instance_attrs(
+            standby_cib,
+            id_provider,
+            node_name,
+            _create_standby_unstandby_dict(True),
+            state_nodes=state_nodes,
+        )
+    return standby_cib
+
+
+def _simulate_standby(
+    runner: CommandRunner, standby_cib: _Element
+) -> list[str]:
+    """
+    Return resources which would be left stopped or demoted by the CIB
+    """
+    dummy_plaintext, transitions, dummy_cib = simulate_cib(runner, standby_cib)
+    operation_list = simulate_tools.get_operations_from_transitions(transitions)
+    return sorted(
+        set(simulate_tools.get_resources_left_stopped(operation_list))
+        | set(simulate_tools.get_resources_left_demoted(operation_list))
+    )
+
+
 def get_config_dto(
     lib_env: LibraryEnvironment, evaluate_expired: bool = False
 ) -> CibNodeListDto:
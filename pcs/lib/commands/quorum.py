@@ -442,18 +442,14 @@ def device_net_certificate_setup_local(
     )[0][1]
     # init certificate storage on local node
     qdevice_net.client_setup(runner, qnetd_ca_cert)
-    # create client certificate request
-    cert_request = qdevice_net.client_generate_certificate_request(
-        runner, cluster_name
+    # get a client certificate signed by qnetd host
+    pk12 = qdevice_net.client_get_signed_pk12_certificate(
+        runner,
+        lib_env.report_processor,
+        lib_env.communicator_factory,
+        qnetd_target,
+        cluster_name,
     )
-    # sign the request on qnetd host
-    com_cmd_2 = qdevice_net_com.SignCertificate(lib_env.report_processor)
-    com_cmd_2.add_request(qnetd_target, cert_request, cluster_name)
-    signed_certificate = run_and_raise(
-        lib_env.communicator_factory.get_communicator(), com_cmd_2
-    )[0][1]
-    # transform the signed certificate to pk12 format which can sent to nodes
-    pk12 = qdevice_net.client_cert_request_to_pk12(runner, signed_certificate)
     # store final certificate
     qdevice_net.client_import_certificate_and_key(runner, pk12)
 
@@ -7,6 +7,7 @@ from typing import Any, cast
 
 from lxml.etree import _Element
 
+from pcs import settings
 from pcs.common import const, file_type_codes, reports
 from pcs.common.interface import dto
 from pcs.common.pacemaker.cibsecret import (
@@ -14,8 +15,12 @@ from pcs.common.pacemaker.cibsecret import (
     CibResourceSecretListDto,
 )
 from pcs.common.pacemaker.resource.list import CibResourcesDto
+from pcs.common.pacemaker.resource.primitive import (
+    CibResourcePrimitiveCreateDto,
+)
 from pcs.common.reports import ReportItemList, ReportProcessor
 from pcs.common.reports.item import ReportItem
+from pcs.common.reports.processor import ReportProcessorInMemory
 from pcs.common.resource_status import ResourcesStatusFacade, ResourceState
 from pcs.common.tools import Version, timeout_to_seconds
 from pcs.common.types import StringCollection, StringSequence
@@ -60,11 +65,14 @@ from pcs.lib.pacemaker.live import (
     remove_node,
     resource_ban,
     resource_move,
+    resource_refresh,
     resource_restart,
     resource_unmove_unban,
     simulate_cib,
+    validate_resource_instance_attributes_via_pcmk,
 )
 from pcs.lib.pacemaker.state import (
+    ClusterState,
     ResourceNotFound,
     ensure_resource_state,
     get_resource_state,
@@ -77,6 +85,7 @@ from pcs.lib.pacemaker.status import (
     cluster_status_parsing_error_to_report,
 )
 from pcs.lib.pacemaker.values import is_true, validate_id
+from pcs.lib.parallel import CollectorPool
 from pcs.lib.resource_agent import (
     CrmResourceAgent,
     ResourceAgentError,
@@ -94,7 +103,13 @@ from pcs.lib.resource_agent import (
 from pcs.lib.resource_agent.const import OCF_1_1, PRIMITIVE_META, STONITH_META
 from pcs.lib.sbd_stonith import ensure_some_stonith_remains
 from pcs.lib.tools import get_tmp_cib
-from pcs.lib.validate import ValueTimeInterval
+from pcs.lib.validate import (
+    NamesIn,
+    ValidatorAll,
+    ValueIn,
+    ValuePositiveInteger,
+    ValueTimeInterval,
+)
 from pcs.lib.xml_tools import etree_to_str, get_root
 
 
@@ -312,13 +327,36 @@ def _check_special_cases(
     instance_attributes: Mapping[str, str],
     allow_not_suitable_command: bool,
 ) -> None:
+    if env.report_processor.report_list(
+        _validate_special_cases(
+            env,
+            resource_agent_name,
+            resources_section,
+            resource_id,
+            meta_attributes,
+            instance_attributes,
+            allow_not_suitable_command,
+        )
+    ).has_errors:
+        raise LibraryError()
+
+
+def _validate_special_cases(
+    env: LibraryEnvironment,
+    resource_agent_name: ResourceAgentName,
+    resources_section: _Element,
+    resource_id: str,
+    meta_attributes: Mapping[str, str],
+    instance_attributes: Mapping[str, str],
+    allow_not_suitable_command: bool,
+) -> reports.ReportItemList:
     if (
         resource_agent_name != resource.remote_node.AGENT_NAME
         and not resource.guest_node.is_node_name_in_options(meta_attributes)
     ):
         # if no special case happens we won't take care about corosync.conf that
         # is needed for getting nodes to validate against
-        return
+        return []
 
     (
         existing_nodes_names,
@@ -344,9 +382,7 @@ def _check_special_cases(
             allow_not_suitable_command,
         )
     )
-
-    if env.report_processor.report_list(report_list).has_errors:
-        raise LibraryError()
+    return report_list
 
 
 def _validate_meta_attributes(
@@ -595,6 +631,189 @@ def create(  # noqa: PLR0913
             resource.common.disable(primitive_element, id_provider)
 
 
+def create_many(  # noqa: PLR0913
+    env: LibraryEnvironment,
+    resource_list: Sequence[CibResourcePrimitiveCreateDto],
+    *,
+    allow_absent_agent: bool = False,
+    allow_invalid_operation: bool = False,
+    allow_invalid_instance_attributes: bool = False,
+    use_default_operations: bool = True,
+    ensure_disabled: bool = False,
+    allow_not_suitable_command: bool = False,
+    enable_agent_self_validation: bool = False,
+) -> None:
+    """
+    Create several primitive resources in a cib, push the cib only once
+
+    Either all the resources are created or none of them is. Errors of all the
+    resources are reported, not only the errors of the first invalid one.
+
+    env -- provides all for communication with externals
+    resource_list -- definitions of the resources to be created
+    allow_absent_agent -- is a flag for allowing agent that is not installed
+        in a system
+    allow_invalid_operation -- is a flag for allowing to use operations that
+        are not listed in a resource agent metadata
+    allow_invalid_instance_attributes -- is a flag for allowing to use
+        instance attributes that are not listed in a resource agent metadata
+        or for allowing to not use the instance_attributes that are required in
+        resource agent metadata
+    use_default_operations -- is a flag for stopping stopping of adding
+        default cib operations (specified in a resource agent)
+    ensure_disabled -- is flag that keeps resources in target-role "Stopped"
+    allow_not_suitable_command -- turn forceable errors into warnings, see
+        the create command for details
+    enable_agent_self_validation -- if True, use agent self-validation feature
+        to validate instance attributes
+    """
+    runner = env.cmd_runner()
+    agent_facades = _get_resource_agent_facade_map(
+        env.report_processor,
+        runner,
+        [resource_dto.agent_name for resource_dto in resource_list],
+        [reports.codes.FORCE] if allow_absent_agent else [],
+    )
+    agent_self_validation_results = _run_agent_self_validations(
+        runner,
+        [
+            (agent_facades[resource_dto.agent_name], resource_dto)
+            for resource_dto in resource_list
+        ],
+    )
+
+    resources_section = get_resources(
+        env.get_cib(
+            get_required_cib_version_for_primitive(
+                [
+                    operation
+                    for resource_dto in resource_list
+                    for operation in resource_dto.operations
+                ]
+            )
+        )
+    )
+    id_provider = IdProvider(resources_section)
+    failed_resource_id_list = []
+    for index, resource_dto in enumerate(resource_list):
+        resource_agent = agent_facades[resource_dto.agent_name]
+        if resource_agent is None:
+            # errors of the agent have already been reported
+            failed_resource_id_list.append(resource_dto.id)
+            continue
+        # Reports are collected for each resource separately, so that errors
+        # of one resource do not affect validation of the others.
+        report_processor = ReportProcessorInMemory()
+        try:
+            report_processor.report_list(
+                _validate_special_cases(
+                    env,
+                    resource_agent.metadata.name,
+                    resources_section,
+                    resource_dto.id,
+                    resource_dto.meta_attributes,
+                    resource_dto.instance_attributes,
+                    allow_not_suitable_command,
+                )
+            )
+            if not report_processor.has_errors:
+                primitive_element = resource.primitive.create(
+                    report_processor,
+                    runner,
+                    resources_section,
+                    id_provider,
+                    resource_dto.id,
+                    resource_agent,
+                    resource_dto.operations,
+                    resource_dto.meta_attributes,
+                    resource_dto.instance_attributes,
+                    allow_invalid_operation,
+                    allow_invalid_instance_attributes,
+                    use_default_operations,
+                    enable_agent_self_validation=enable_agent_self_validation,
+                    agent_self_validation_result=(
+                        agent_self_validation_results.get(index)
+                    ),
+                )
+                if ensure_disabled:
+                    resource.common.disable(primitive_element, id_provider)
+        except LibraryError as e:
+            report_processor.report_list(list(e.args))
+        env.report_processor.report_list(report_processor.reports)
+        if report_processor.has_errors:
+            failed_resource_id_list.append(resource_dto.id)
+
+    if failed_resource_id_list:
+        env.report_processor.report(
+            ReportItem.error(
+                reports.messages.CannotCreateResources(failed_resource_id_list)
+            )
+        )
+    if env.report_processor.has_errors:
+        raise LibraryError()
+    env.push_cib()
+
+
+def _get_resource_agent_facade_map(
+    report_processor: reports.ReportProcessor,
+    runner: CommandRunner,
+    agent_name_list: StringSequence,
+    force_flags: reports.types.ForceFlags,
+) -> dict[str, ResourceAgentFacade | None]:
+    """
+    Load metadata of each of the agents only once, None marks invalid agents
+    """
+    agent_factory = ResourceAgentFacadeFactory(runner, report_processor)
+    agent_facades: dict[str, ResourceAgentFacade | None] = {}
+    for agent_name in dict.fromkeys(agent_name_list):
+        # errors of one agent must not turn warnings of the others to errors
+        agent_report_processor = ReportProcessorInMemory()
+        try:
+            agent_facades[agent_name] = _get_resource_agent_facade(
+                agent_report_processor,
+                agent_factory,
+                _get_resource_agent_name(
+                    runner, agent_report_processor, agent_name
+                ),
+                force_flags,
+            )
+        except LibraryError:
+            agent_facades[agent_name] = None
+        report_processor.report_list(agent_report_processor.reports)
+    return agent_facades
+
+
+def _run_agent_self_validations(
+    runner: CommandRunner,
+    resource_list: Sequence[
+        tuple[ResourceAgentFacade | None, CibResourcePrimitiveCreateDto]
+    ],
+) -> dict[int, tuple[bool | None, str]]:
+    """
+    Run self-validations of agents of all the resources concurrently, return
+    the results keyed by positions of the resources in resource_list
+    """
+    future_map = {}
+    with CollectorPool(settings.pcs_parallel_collectors_max) as pool:
+        for index, (resource_agent, resource_dto) in enumerate(resource_list):
+            if (
+                resource_agent is not None
+                and resource.primitive.is_agent_self_validation_supported(
+                    resource_agent
+                )
+            ):
+                future_map[index] = pool.submit(
+                    str(index),
+                    partial(
+                        validate_resource_instance_attributes_via_pcmk,
+                        runner,
+                        resource_agent.metadata.name,
+                        resource_dto.instance_attributes,
+                    ),
+                )
+    return {index: future.result() for index, future in future_map.items()}
+
+
 def create_as_clone(  # noqa: PLR0913
     env: LibraryEnvironment,
     resource_id: str,
@@ -2932,6 +3151,99 @@ def restart(
     )
 
 
+REFRESH_STAGE_BY_NODE = "node"
+REFRESH_STAGE_BY_RESOURCE = "resource"
+
+
+def refresh_staged(env: LibraryEnvironment, options: Mapping[str, str]) -> None:
+    """
+    Delete history of all resources on all nodes in waves and wait for the
+    cluster to settle down after each wave
+
+    Refreshing all resources at once makes pacemaker probe all resources on
+    all nodes at the same time, which may overload big clusters.
+
+    options -- 'stage-by': 'node' to refresh all resources on several nodes in
+        each wave, 'resource' to refresh several resources on all nodes in each
+        wave; 'concurrency': number of nodes or resources refreshed at the same
+        time in each wave; 'timeout': how long to wait for the cluster to
+        settle down after each wave, wait indefinitely if not specified
+    """
+    env.report_processor.report_list(
+        ValidatorAll(
+            [
+                NamesIn(
+                    ["concurrency", "stage-by", "timeout"],
+                    option_type="option",
+                ),
+                ValueIn(
+                    "stage-by",
+                    [REFRESH_STAGE_BY_NODE, REFRESH_STAGE_BY_RESOURCE],
+                ),
+                ValuePositiveInteger("concurrency"),
+                ValueTimeInterval("timeout"),
+            ]
+        ).validate(options)
+    )
+    if env.report_processor.has_errors:
+        raise LibraryError()
+    wait_timeout = env.ensure_wait_satisfiable(options.get("timeout"))
+    stage_by_node = (
+        options.get("stage-by", REFRESH_STAGE_BY_NODE) == REFRESH_STAGE_BY_NODE
+    )
+    concurrency = int(options.get("concurrency", "1"))
+
+    runner = env.cmd_runner()
+    status_dom = get_cluster_status_dom(runner)
+    if stage_by_node:
+        target_list = [
+            node.attrs.name
+            for node in ClusterState(status_dom).node_section.nodes
+        ]
+    else:
+        target_list = [
+            str(resource_el.attrib["id"])
+            for resource_el in status_dom.iterfind("resources/*[@id]")
+        ]
+    wave_list = [
+        target_list[index : index + concurrency]
+        for index in range(0, len(target_list), concurrency)
+    ]
+
+    for wave_number, wave in enumerate(wave_list, start=1):
+        env.report_processor.report(
+            ReportItem.info(
+                reports.messages.ResourceRefreshWaveStarted(
+                    wave_number,
+                    len(wave_list),
+                    node_list=wave if stage_by_node else [],
+                    resource_list=[] if stage_by_node else wave,
+                )
+            )
+        )
+        with CollectorPool(concurrency) as pool:
+            future_list = [
+                pool.submit(
+                    target,
+                    (
+                        partial(resource_refresh, runner, node=target)
+                        if stage_by_node
+                        else partial(resource_refresh, runner, resource=target)
+                    ),
+                )
+                for target in wave
+            ]
+        error_list: ReportItemList = []
+        for future in future_list:
+            try:
+                future.result()
+            except LibraryError as e:
+                error_list.extend(e.args)
+        if error_list:
+            raise LibraryError(*error_list)
+        env.wait_for_idle(wait_timeout)
+
+
 def update_meta(
     env: LibraryEnvironment,
     resource_id: str,
@@ -16,7 +16,7 @@ from pcs.lib import sbd, validate
 from pcs.lib.cib.tools import get_resources
 from pcs.lib.communication.nodes import GetOnlineTargets
 from pcs.lib.communication.sbd import (
-    CheckSbd,
+    CheckSbdOnOnlineTargets,
     DisableSbdService,
     EnableSbdService,
     GetSbdConfig,
@@ -292,23 +292,21 @@ def enable_sbd(  # noqa: PLR0913
     ).has_errors:
         raise LibraryError()
 
-    com_cmd_1 = GetOnlineTargets(
-        lib_env.report_processor,
-        ignore_offline_targets=ignore_offline_nodes,
-    )
-    com_cmd_1.set_targets(target_list)
-    online_targets = run_and_raise(lib_env.get_node_communicator(), com_cmd_1)
-
-    # check if SBD can be enabled
+    # Check if SBD can be enabled. Each node is checked as soon as it is known
+    # to be online. Nothing is changed in the cluster unless all the checks
+    # pass.
     if no_watchdog_validation:
         lib_env.report_processor.report(
             reports.ReportItem.warning(
                 reports.messages.SbdWatchdogValidationInactive()
             )
         )
-    com_cmd_2 = CheckSbd(lib_env.report_processor)
-    for target in online_targets:
-        com_cmd_2.add_request(
+    com_cmd_check = CheckSbdOnOnlineTargets(
+        lib_env.report_processor,
+        ignore_offline_targets=ignore_offline_nodes,
+    )
+    for target in target_list:
+        com_cmd_check.add_request(
             target,
             (
                 # Do not send watchdog if validation is turned off. Listing of
@@ -320,7 +318,9 @@ def enable_sbd(  # noqa: PLR0913
             ),
             full_device_dict[target.label] if using_devices else [],
         )
-    run_and_raise(lib_env.get_node_communicator(), com_cmd_2)
+    online_targets = run_and_raise(
+        lib_env.get_node_communicator(), com_cmd_check
+    )
 
     # enable ATB if needed
     if not using_devices:
@@ -333,12 +333,13 @@ def enable_sbd(  # noqa: PLR0913
             corosync_conf.set_quorum_options({"auto_tie_breaker": "1"})
             lib_env.push_corosync_conf(corosync_conf, ignore_offline_nodes)
 
-    # distribute SBD configuration
+    # Distribute SBD configuration. Nothing else is changed unless all nodes
+    # accept it, so that SBD does not end up enabled on some nodes only.
     config = sbd.get_default_sbd_config()
     config.update(sbd_options)
-    com_cmd_3 = SetSbdConfig(lib_env.report_processor)
+    com_cmd_config = SetSbdConfig(lib_env.report_processor)
     for target in online_targets:
-        com_cmd_3.add_request(
+        com_cmd_config.add_request(
             target,
             sbd.create_sbd_config(
                 config,
@@ -347,17 +348,17 @@ def enable_sbd(  # noqa: PLR0913
                 full_device_dict[target.label],
             ),
         )
-    run_and_raise(lib_env.get_node_communicator(), com_cmd_3)
+    run_and_raise(lib_env.get_node_communicator(), com_cmd_config)
 
     # remove cluster prop 'stonith_watchdog_timeout'
-    com_cmd_4 = RemoveStonithWatchdogTimeout(lib_env.report_processor)
-    com_cmd_4.set_targets(online_targets)
-    run_and_raise(lib_env.get_node_communicator(), com_cmd_4)
+    com_cmd_remove = RemoveStonithWatchdogTimeout(lib_env.report_processor)
+    com_cmd_remove.set_targets(online_targets)
+    run_and_raise(lib_env.get_node_communicator(), com_cmd_remove)
 
-    # enable SBD service an all nodes
-    com_cmd_5 = EnableSbdService(lib_env.report_processor)
-    com_cmd_5.set_targets(online_targets)
-    run_and_raise(lib_env.get_node_communicator(), com_cmd_5)
+    # enable SBD service on all nodes
+    com_cmd_enable = EnableSbdService(lib_env.report_processor)
+    com_cmd_enable.set_targets(online_targets)
+    run_and_raise(lib_env.get_node_communicator(), com_cmd_enable)
 
     lib_env.report_processor.report(
         reports.ReportItem.warning(
@@ -584,28 +585,12 @@ def get_local_devices_info(
     """
     if not sbd.is_sbd_enabled(lib_env.service_manager):
         return []
-    device_list = sbd.get_local_sbd_device_list()
-    report_item_list: reports.ReportItemList = []
-    output = []
-    for device in device_list:
-        obj = {
-            "device": device,
-            "list": None,
-            "dump": None,
-        }
-        try:
-            obj["list"] = sbd.get_device_messages_info(
-                lib_env.cmd_runner(), device
-            )
-            if dump:
-                obj["dump"] = sbd.get_device_sbd_header_dump(
-                    lib_env.cmd_runner(), device
-                )
-        except LibraryError as e:
-            report_item_list += e.args
-
-        output.append(obj)
-
+    output, report_item_list = sbd.get_devices_info(
+        lib_env.cmd_runner(),
+        sbd.get_local_sbd_device_list(),
+        dump=dump,
+        timeout=settings.sbd_device_read_timeout,
+    )
     for report_item in report_item_list:
         report_item.severity = reports.item.ReportItemSeverity.warning()
     if lib_env.report_processor.report_list(report_item_list).has_errors:
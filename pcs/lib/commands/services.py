@@ -33,22 +33,31 @@ def get_services_info(
     for services not specified in `services`
     """
     service_set = set(services)
+    services_state = (
+        env.service_manager.get_services_state(sorted(service_set))
+        if service_set and (installed or enabled or running)
+        else {}
+    )
     return ServicesInfoResultDto(
         [
             ServiceStatusDto(
                 service,
                 (
-                    env.service_manager.is_installed(service)
+                    (
+                        services_state[service].installed
+                        if service in service_set
+                        else True
+                    )
                     if installed
                     else False
                 ),
                 (
-                    env.service_manager.is_enabled(service)
+                    services_state[service].enabled
                     if enabled and service in service_set
                     else False
                 ),
                 (
-                    env.service_manager.is_running(service)
+                    services_state[service].running
                     if running and service in service_set
                     else False
                 ),
@@ -1,6 +1,7 @@
 import contextlib
 import os.path
 from collections.abc import Iterable, Mapping
+from copy import deepcopy
 from typing import NamedTuple
 
 from lxml.etree import _Element
@@ -10,6 +11,7 @@ from pcs.common import file_type_codes, reports
 from pcs.common.node_communicator import Communicator
 from pcs.common.reports import ReportProcessor
 from pcs.common.reports.item import ReportItem
+from pcs.common.reports.processor import ReportProcessorInMemory
 from pcs.common.services.interfaces import ServiceManagerInterface
 from pcs.common.status_dto import ResourcesStatusDto
 from pcs.common.str_tools import format_list, indent
@@ -35,6 +37,7 @@ from pcs.lib.node import get_existing_nodes_names
 from pcs.lib.node_communication import NodeTargetLibFactory
 from pcs.lib.pacemaker.live import (
     BadApiResultFormat,
+    get_cib_revision,
     get_cib_verification_errors,
     get_cluster_status_text,
     get_cluster_status_xml_raw,
@@ -45,6 +48,7 @@ from pcs.lib.pacemaker.status import (
     ClusterStatusParsingError,
     cluster_status_parsing_error_to_report,
 )
+from pcs.lib.parallel import CollectorPool
 from pcs.lib.resource_agent.const import STONITH_ACTION_REPLACED_BY
 
 
@@ -65,6 +69,17 @@ def pacemaker_status_xml(env: LibraryEnvironment) -> str:
     raise LibraryError(output=stdout)
 
 
+def cluster_status_revision(env: LibraryEnvironment) -> str:
+    """
+    Return a revision of the cluster status which changes whenever the status
+    changes. It is much cheaper to get than the status itself, so it can be
+    used to check if the status needs to be loaded again.
+
+    env -- LibraryEnvironment
+    """
+    return get_cib_revision(env.cmd_runner())
+
+
 def resources_status(env: LibraryEnvironment) -> ResourcesStatusDto:
     """
     Return pacemaker status of configured resources as DTO
@@ -118,66 +133,132 @@ def full_cluster_status_plaintext(  # noqa: PLR0912, PLR0915
         )
 
     # initialization
-    runner = env.cmd_runner()
     report_processor = env.report_processor
     live = env.is_cib_live and env.is_corosync_conf_live
+    node_name_list: StringSequence = []
+
+    # Collect data from independent sources. Collectors run in parallel with
+    # each other, so they must not work with the same objects unless those are
+    # thread-safe. Each collector gets its own runner and report processor,
+    # its reports are processed once it finishes. The environment is only
+    # used in this thread.
+    collector_report_processors: dict[str, ReportProcessorInMemory] = {}
+
+    def get_collector_runner(name: str) -> CommandRunner:
+        collector_report_processors[name] = ReportProcessorInMemory()
+        return env.cmd_runner(
+            report_processor=collector_report_processors[name]
+        )
 
-    # load status, cib, corosync.conf
-    status_text, warning_list = get_cluster_status_text(
-        runner, hide_inactive_resources, verbose
-    )
-    corosync_conf = None
-    # If we are live on a remote node, we have no corosync.conf.
-    # TODO Use the new file framework so the path is not exposed.
-    if not live or os.path.exists(settings.corosync_conf_file):
-        corosync_conf = env.get_corosync_conf()
-    cib = env.get_cib()
-    # get messages from crm_verify
-    crm_verify_messages = []
-    try:
-        crm_verify_messages = get_cib_verification_errors(runner)
-    except BadApiResultFormat as e:
-        # do not fail the whole command just because we cannot load this
-        report_processor.report(
-            reports.ReportItem.debug(
-                reports.messages.BadPcmkApiResponseFormat(
-                    str(e.original_exception), e.pacemaker_response
-                )
-            )
+    with CollectorPool(settings.pcs_parallel_collectors_max) as collectors:
+        crm_mon_runner = get_collector_runner("crm_mon")
+        status_text_future = collectors.submit(
+            "crm_mon",
+            lambda: get_cluster_status_text(
+                crm_mon_runner, hide_inactive_resources, verbose
+            ),
         )
-    # get extra info for verbose output
-    if verbose:
-        (
-            ticket_status_text,
-            ticket_status_stderr,
-            ticket_status_retval,
-        ) = get_ticket_status_text(runner)
-    # get extra info if live
-    if live:
-        local_services_status = _get_local_services_status(env.service_manager)
-        if verbose and corosync_conf:
-            node_name_list, node_names_report_list = get_existing_nodes_names(
-                corosync_conf
+        corosync_conf = None
+        # If we are live on a remote node, we have no corosync.conf.
+        # TODO Use the new file framework so the path is not exposed.
+        if not live or os.path.exists(settings.corosync_conf_file):
+            corosync_conf = env.get_corosync_conf()
+        # The CIB is loaded in this thread, as loading it changes the
+        # environment.
+        cib = env.get_cib()
+        crm_verify_runner = get_collector_runner("crm_verify")
+        crm_verify_future = collectors.submit(
+            "crm_verify", lambda: _get_crm_verify_messages(crm_verify_runner)
+        )
+        # get extra info for verbose output
+        if verbose:
+            crm_ticket_runner = get_collector_runner("crm_ticket")
+            ticket_status_future = collectors.submit(
+                "crm_ticket", lambda: get_ticket_status_text(crm_ticket_runner)
+            )
+        # get extra info if live
+        if live:
+            collector_report_processors["services"] = ReportProcessorInMemory()
+            service_manager = env.create_service_manager(
+                collector_report_processors["services"]
             )
-            report_processor.report_list(node_names_report_list)
-            node_reachability = _get_node_reachability(
-                env.get_node_target_factory(),
-                env.get_node_communicator(),
-                report_processor,
-                node_name_list,
+            local_services_status_future = collectors.submit(
+                "services",
+                lambda: _get_local_services_status(service_manager),
             )
+            if verbose and corosync_conf:
+                node_name_list, node_names_report_list = (
+                    get_existing_nodes_names(corosync_conf)
+                )
+                report_processor.report_list(node_names_report_list)
+                collector_report_processors["pcsd_reachability"] = (
+                    ReportProcessorInMemory()
+                )
+                node_target_factory = env.get_node_target_factory()
+                node_communicator = env.get_node_communicator(
+                    report_processor=collector_report_processors[
+                        "pcsd_reachability"
+                    ]
+                )
+                node_reachability_future = collectors.submit(
+                    "pcsd_reachability",
+                    lambda: _get_node_reachability(
+                        node_target_factory,
+                        node_communicator,
+                        collector_report_processors["pcsd_reachability"],
+                        node_name_list,
+                    ),
+                )
 
-    # check and warn about various issues
-    warning_list = list(warning_list)
-    warning_list.extend(_stonith_warnings(cib))
-    warning_list.extend(
-        _move_constraints_warnings(cib, runner, report_processor)
-    )
-    warning_list.extend(
-        _booth_authfile_warning(env.report_processor, env.get_booth_env(None))
+        # Evaluating rules runs an external tool for each rule. It only needs
+        # the CIB, so it runs while the other collectors are still running. It
+        # gets a copy of the CIB, lxml documents must not be shared between
+        # threads.
+        move_constraints_cib = deepcopy(cib)
+        move_constraints_runner = get_collector_runner("move_constraints")
+        move_constraints_future = collectors.submit(
+            "move_constraints",
+            lambda: _move_constraints_warnings(
+                move_constraints_cib,
+                move_constraints_runner,
+                collector_report_processors["move_constraints"],
+            ),
+        )
+
+        status_text, warning_list = status_text_future.result()
+        crm_verify_messages, crm_verify_report_list = crm_verify_future.result()
+        report_processor.report_list(crm_verify_report_list)
+
+        # check and warn about various issues
+        warning_list = list(warning_list)
+        warning_list.extend(_stonith_warnings(cib))
+        warning_list.extend(move_constraints_future.result())
+        warning_list.extend(
+            _booth_authfile_warning(
+                env.report_processor, env.get_booth_env(None)
+            )
+        )
+        warning_list.extend(_bundle_warnings(cib))
+        warning_list.extend(crm_verify_messages)
+
+        if verbose:
+            (
+                ticket_status_text,
+                ticket_status_stderr,
+                ticket_status_retval,
+            ) = ticket_status_future.result()
+        if live:
+            local_services_status = local_services_status_future.result()
+            if verbose and corosync_conf:
+                node_reachability = node_reachability_future.result()
+
+    for collector_report_processor in collector_report_processors.values():
+        report_processor.report_list(collector_report_processor.reports)
+    report_processor.report(
+        ReportItem.debug(
+            reports.messages.DataCollectionTimings(collectors.timings)
+        )
     )
-    warning_list.extend(_bundle_warnings(cib))
-    warning_list.extend(crm_verify_messages)
 
     # put it all together
     if report_processor.has_errors:
@@ -223,6 +304,22 @@ def full_cluster_status_plaintext(  # noqa: PLR0912, PLR0915
     return "\n".join(parts)
 
 
+def _get_crm_verify_messages(
+    runner: CommandRunner,
+) -> tuple[list[str], reports.ReportItemList]:
+    try:
+        return get_cib_verification_errors(runner), []
+    except BadApiResultFormat as e:
+        # do not fail the whole command just because we cannot load this
+        return [], [
+            reports.ReportItem.debug(
+                reports.messages.BadPcmkApiResponseFormat(
+                    str(e.original_exception), e.pacemaker_response
+                )
+            )
+        ]
+
+
 def _stonith_warnings(cib: _Element) -> StringIterable:
     warning_list = []
 
@@ -335,6 +432,22 @@ def _get_local_services_status(
         ("pcsd", True),
         (settings.sbd_service_name, False),
     ]
+    with contextlib.suppress(LibraryError):
+        services_state = service_manager.get_services_state(
+            [service for service, _ in service_def]
+        )
+        return [
+            _ServiceStatus(
+                service,
+                display_always,
+                services_state[service].enabled,
+                services_state[service].running,
+            )
+            for service, display_always in service_def
+        ]
+    # Getting the state of all services at once has failed. Get the state of
+    # each service separately, so that all services which can be checked are
+    # displayed.
     service_status_list = []
     for service, display_always in service_def:
         with contextlib.suppress(LibraryError):
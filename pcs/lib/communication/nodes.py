@@ -27,6 +27,31 @@ from pcs.lib.communication.tools import (
 from pcs.lib.node_communication import response_to_report_item
 
 
+def get_online_target_request_data():
+    return RequestData("remote/check_auth", [("check_auth_only", 1)])
+
+
+def online_target_response_to_report_item(
+    response: Response, ignore_offline_targets: bool
+) -> ReportItem | None:
+    """
+    Check a response to a request made by get_online_target_request_data,
+    return None if the target is online
+
+    ignore_offline_targets -- only warn about offline targets
+    """
+    report = response_to_report_item(response)
+    if report is None or response.was_connected:
+        return report
+    if ignore_offline_targets:
+        return ReportItem.warning(
+            reports.messages.OmittingNode(response.request.target.label)
+        )
+    return response_to_report_item(
+        response, forceable=report_codes.SKIP_OFFLINE_NODES
+    )
+
+
 class GetOnlineTargets(
     AllSameDataMixin, AllAtOnceStrategyMixin, RunRemotelyBase
 ):
@@ -36,23 +61,15 @@ class GetOnlineTargets(
         self._online_target_list = []
 
     def _get_request_data(self):
-        return RequestData("remote/check_auth", [("check_auth_only", 1)])
+        return get_online_target_request_data()
 
     def _process_response(self, response):
-        report = response_to_report_item(response)
+        report = online_target_response_to_report_item(
+            response, self._ignore_offline_targets
+        )
         if report is None:
             self._online_target_list.append(response.request.target)
             return
-        if not response.was_connected:
-            report = (
-                ReportItem.warning(
-                    reports.messages.OmittingNode(response.request.target.label)
-                )
-                if self._ignore_offline_targets
-                else response_to_report_item(
-                    response, forceable=report_codes.SKIP_OFFLINE_NODES
-                )
-            )
         self._report(report)
 
     def on_complete(self):
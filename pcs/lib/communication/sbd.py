@@ -1,9 +1,19 @@
 import json
 
 from pcs.common import reports
-from pcs.common.node_communicator import Request, RequestData
+from pcs.common.node_communicator import (
+    Request,
+    RequestData,
+    RequestTarget,
+    Response,
+)
 from pcs.common.reports import ReportItemSeverity
 from pcs.common.reports.item import ReportItem
+from pcs.common.types import StringSequence
+from pcs.lib.communication.nodes import (
+    get_online_target_request_data,
+    online_target_response_to_report_item,
+)
 from pcs.lib.communication.tools import (
     AllAtOnceStrategyMixin,
     AllSameDataMixin,
@@ -240,100 +250,162 @@ class GetSbdStatus(AllSameDataMixin, AllAtOnceStrategyMixin, RunRemotelyBase):
         return self._status_list
 
 
-class CheckSbd(AllAtOnceStrategyMixin, RunRemotelyBase):
-    def __init__(self, report_processor):
-        super().__init__(report_processor)
-        self._request_data_list = []
-
-    def _prepare_initial_requests(self):
-        return [
-            Request(
-                target,
-                RequestData(
-                    "remote/check_sbd",
-                    [
-                        ("watchdog", watchdog),
-                        ("device_list", json.dumps(device_list)),
-                    ],
-                ),
-            )
-            for target, watchdog, device_list in self._request_data_list
-        ]
-
-    def _process_response(self, response):
-        report_item = response_to_report_item(response)
-        if report_item:
-            self._report(report_item)
-            return
-        report_list = []
-        node_label = response.request.target.label
-        try:
-            data = json.loads(response.data)
-            if not data["sbd"]["installed"]:
-                report_list.append(
-                    ReportItem.error(
-                        reports.messages.ServiceNotInstalled(
-                            node_label, ["sbd"]
-                        )
-                    )
+def _get_check_sbd_request(
+    target: RequestTarget, watchdog: str, device_list: StringSequence
+) -> Request:
+    return Request(
+        target,
+        RequestData(
+            "remote/check_sbd",
+            [
+                ("watchdog", watchdog),
+                ("device_list", json.dumps(device_list)),
+            ],
+        ),
+    )
+
+
+def _check_sbd_response_to_report_list(
+    response: Response,
+) -> reports.ReportItemList:
+    report_item = response_to_report_item(response)
+    if report_item:
+        return [report_item]
+    report_list: reports.ReportItemList = []
+    node_label = response.request.target.label
+    try:
+        data = json.loads(response.data)
+        if not data["sbd"]["installed"]:
+            report_list.append(
+                ReportItem.error(
+                    reports.messages.ServiceNotInstalled(node_label, ["sbd"])
                 )
-            if "watchdog" in data:
-                if data["watchdog"]["exist"]:
-                    if not data["watchdog"].get("is_supported", True):
-                        report_list.append(
-                            ReportItem.error(
-                                reports.messages.SbdWatchdogNotSupported(
-                                    node_label, data["watchdog"]["path"]
-                                )
-                            )
-                        )
-                else:
+            )
+        if "watchdog" in data:
+            if data["watchdog"]["exist"]:
+                if not data["watchdog"].get("is_supported", True):
                     report_list.append(
                         ReportItem.error(
-                            reports.messages.WatchdogNotFound(
+                            reports.messages.SbdWatchdogNotSupported(
                                 node_label, data["watchdog"]["path"]
                             )
                         )
                     )
-
-            for device in data.get("device_list", []):
-                if not device["exist"]:
-                    report_list.append(
-                        ReportItem.error(
-                            reports.messages.SbdDeviceDoesNotExist(
-                                device["path"], node_label
-                            )
+            else:
+                report_list.append(
+                    ReportItem.error(
+                        reports.messages.WatchdogNotFound(
+                            node_label, data["watchdog"]["path"]
                         )
                     )
-                elif not device["block_device"]:
-                    report_list.append(
-                        ReportItem.error(
-                            reports.messages.SbdDeviceIsNotBlockDevice(
-                                device["path"], node_label
-                            )
+                )
+
+        for device in data.get("device_list", []):
+            if not device["exist"]:
+                report_list.append(
+                    ReportItem.error(
+                        reports.messages.SbdDeviceDoesNotExist(
+                            device["path"], node_label
                         )
                     )
-                # TODO maybe we can check whenever device is initialized by sbd
-                # (by running 'sbd -d <dev> dump;')
-        except (ValueError, KeyError, TypeError):
-            report_list.append(
-                ReportItem.error(
-                    reports.messages.InvalidResponseFormat(node_label)
                 )
-            )
-        if report_list:
-            self._report_list(report_list)
-        else:
-            self._report(
-                ReportItem.info(
-                    reports.messages.SbdCheckSuccess(
-                        response.request.target.label
+            elif not device["block_device"]:
+                report_list.append(
+                    ReportItem.error(
+                        reports.messages.SbdDeviceIsNotBlockDevice(
+                            device["path"], node_label
+                        )
                     )
                 )
-            )
+            # TODO maybe we can check whenever device is initialized by sbd
+            # (by running 'sbd -d <dev> dump;')
+    except (ValueError, KeyError, TypeError):
+        report_list.append(
+            ReportItem.error(reports.messages.InvalidResponseFormat(node_label))
+        )
+    if report_list:
+        return report_list
+    return [ReportItem.info(reports.messages.SbdCheckSuccess(node_label))]
+
+
+class CheckSbd(AllAtOnceStrategyMixin, RunRemotelyBase):
+    def __init__(self, report_processor):
+        super().__init__(report_processor)
+        self._request_data_list = []
+
+    def _prepare_initial_requests(self):
+        return [
+            _get_check_sbd_request(target, watchdog, device_list)
+            for target, watchdog, device_list in self._request_data_list
+        ]
+
+    def _process_response(self, response):
+        self._report_list(_check_sbd_response_to_report_list(response))
 
     def add_request(self, target, watchdog, device_list):
         self._request_data_list.append((target, watchdog, device_list))
 
     def before(self):
         self._report(ReportItem.info(reports.messages.SbdCheckStarted()))
+
+
+class CheckSbdOnOnlineTargets(RunRemotelyBase):
+    """
+    Check that nodes are online and SBD can be enabled on them
+
+    Each node is checked as soon as it is known to be online, independently of
+    other nodes.
+    """
+
+    def __init__(
+        self,
+        report_processor: reports.ReportProcessor,
+        ignore_offline_targets: bool = False,
+    ):
+        super().__init__(report_processor)
+        self._ignore_offline_targets = ignore_offline_targets
+        self._target_list: list[RequestTarget] = []
+        self._check_data: dict[str, tuple[str, StringSequence]] = {}
+        self._online_label_set: set[str] = set()
+
+    def add_request(
+        self,
+        target: RequestTarget,
+        watchdog: str,
+        device_list: StringSequence,
+    ) -> None:
+        self._target_list.append(target)
+        self._check_data[target.label] = (watchdog, device_list)
+
+    def before(self) -> None:
+        self._report(ReportItem.info(reports.messages.SbdCheckStarted()))
+
+    def get_initial_request_list(self) -> list[Request]:
+        return [
+            Request(target, get_online_target_request_data())
+            for target in self._target_list
+        ]
+
+    def _process_response(self, response: Response) -> list[Request]:
+        target = response.request.target
+        if response.request.action == "remote/check_sbd":
+            self._report_list(_check_sbd_response_to_report_list(response))
+            return []
+        report = online_target_response_to_report_item(
+            response, self._ignore_offline_targets
+        )
+        if report is not None:
+            self._report(report)
+            return []
+        self._online_label_set.add(target.label)
+        return [_get_check_sbd_request(target, *self._check_data[target.label])]
+
+    def on_complete(self) -> list[RequestTarget]:
+        """
+        Return online targets
+        """
+        return [
+            target
+            for target in self._target_list
+            if target.label in self._online_label_set
+        ]
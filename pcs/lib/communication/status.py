@@ -1,103 +1,176 @@
 import json
+import time
+from collections.abc import Sequence
 
 from pcs.common import reports
-from pcs.common.node_communicator import RequestData
-from pcs.common.reports import ReportItemSeverity
-from pcs.common.reports.item import ReportItem
-from pcs.lib.communication.tools import (
-    AllSameDataMixin,
-    OneByOneStrategyMixin,
-    RunRemotelyBase,
+from pcs.common.node_communicator import (
+    Request,
+    RequestData,
+    RequestTarget,
+    Response,
 )
+from pcs.common.reports import ReportItemList, ReportItemSeverity
+from pcs.common.reports.item import ReportItem
+from pcs.lib.communication.tools import RunRemotelyBase
 from pcs.lib.node_communication import response_to_report_item
 
 
-class GetFullClusterStatusPlaintext(
-    AllSameDataMixin, OneByOneStrategyMixin, RunRemotelyBase
-):
+def _get_status_plaintext_request_data(
+    hide_inactive_resources: bool, verbose: bool
+) -> RequestData:
+    return RequestData(
+        "remote/cluster_status_plaintext",
+        [
+            (
+                "data_json",
+                json.dumps(
+                    dict(
+                        hide_inactive_resources=hide_inactive_resources,
+                        verbose=verbose,
+                    )
+                ),
+            )
+        ],
+    )
+
+
+def _response_to_cluster_status(
+    response: Response,
+) -> tuple[str | None, ReportItemList]:
+    """
+    Get cluster status from a response, None if the node failed to provide it
+    """
+    report_item = response_to_report_item(
+        response, severity=ReportItemSeverity.WARNING
+    )
+    if report_item is not None:
+        return None, [report_item]
+
+    node = response.request.target.label
+    report_list: ReportItemList = []
+    try:
+        output = json.loads(response.data)
+        if output["status"] == "success":
+            return output["data"], []
+        if output["status_msg"]:
+            report_list.append(
+                ReportItem.error(
+                    reports.messages.NodeCommunicationCommandUnsuccessful(
+                        node,
+                        response.request.action,
+                        output["status_msg"],
+                    )
+                )
+            )
+        # TODO Node name should be added to each received report item and
+        # those modified report itemss should be reported. That, however,
+        # requires reports overhaul which would add possibility to add a
+        # node name to any report item. Also, infos and warnings should not
+        # be ignored.
+        if output["report_list"]:
+            for report_data in output["report_list"]:
+                if (
+                    report_data["severity"] == ReportItemSeverity.ERROR
+                    and report_data["report_text"]
+                ):
+                    report_list.append(
+                        ReportItem.error(
+                            reports.messages.NodeCommunicationCommandUnsuccessful(
+                                node,
+                                response.request.action,
+                                report_data["report_text"],
+                            )
+                        )
+                    )
+    except (ValueError, LookupError, TypeError):
+        report_list.append(
+            ReportItem.warning(reports.messages.InvalidResponseFormat(node))
+        )
+    return None, report_list
+
+
+class GetFullClusterStatusPlaintextSites(RunRemotelyBase):
+    """
+    Get status of several clusters (sites) at once
+
+    Sites are asked in parallel, nodes of each site are asked one by one until
+    one of them provides the status. Once the deadline passes, no more nodes
+    are asked and sites whose status has not been obtained are considered
+    unavailable.
+    """
+
     def __init__(
-        self, report_processor, hide_inactive_resources=False, verbose=False
+        self,
+        report_processor: reports.ReportProcessor,
+        site_target_list: Sequence[Sequence[RequestTarget]],
+        site_timeout: int,
+        hide_inactive_resources: bool = False,
+        verbose: bool = False,
     ):
+        """
+        site_target_list -- nodes of each site
+        site_timeout -- time in seconds to get the status of each site in
+        """
         super().__init__(report_processor)
-        self._hide_inactive_resources = hide_inactive_resources
-        self._verbose = verbose
-        self._cluster_status = ""
-        self._was_successful = False
-
-    def _get_request_data(self):
-        return RequestData(
-            "remote/cluster_status_plaintext",
-            [
-                (
-                    "data_json",
-                    json.dumps(
-                        dict(
-                            hide_inactive_resources=(
-                                self._hide_inactive_resources
-                            ),
-                            verbose=self._verbose,
-                        )
-                    ),
-                )
-            ],
+        self._site_target_list = site_target_list
+        self._site_timeout = site_timeout
+        self._request_data = _get_status_plaintext_request_data(
+            hide_inactive_resources, verbose
+        )
+        self._deadline = 0.0
+        # requests are matched to sites by labels of their targets
+        self._target_site: dict[str, int] = {}
+        self._site_next_target = [0] * len(site_target_list)
+        self._site_status: list[tuple[bool, str]] = [(False, "")] * len(
+            site_target_list
         )
 
-    def _process_response(self, response):
-        report_item = response_to_report_item(
-            response, severity=ReportItemSeverity.WARNING
+    def _get_next_site_request_list(self, site: int) -> list[Request]:
+        target_list = self._site_target_list[site]
+        if self._site_next_target[site] >= len(target_list):
+            return []
+        request = Request(
+            target_list[self._site_next_target[site]], self._request_data
         )
-        if report_item is not None:
-            self._report(report_item)
-            return self._get_next_list()
+        self._site_next_target[site] += 1
+        self._target_site[request.target.label] = site
+        return [request]
 
-        node = response.request.target.label
-        try:
-            output = json.loads(response.data)
-            if output["status"] == "success":
-                self._was_successful = True
-                self._cluster_status = output["data"]
-                return []
-            if output["status_msg"]:
-                self._report(
-                    ReportItem.error(
-                        reports.messages.NodeCommunicationCommandUnsuccessful(
-                            node,
-                            response.request.action,
-                            output["status_msg"],
-                        )
+    def before(self) -> None:
+        self._deadline = time.monotonic() + self._site_timeout
+
+    def get_initial_request_list(self) -> list[Request]:
+        return [
+            request
+            for site in range(len(self._site_target_list))
+            for request in self._get_next_site_request_list(site)
+        ]
+
+    def _process_response(self, response: Response) -> list[Request]:
+        site = self._target_site[response.request.target.label]
+        cluster_status, report_list = _response_to_cluster_status(response)
+        self._report_list(report_list)
+        if cluster_status is not None:
+            self._site_status[site] = (True, cluster_status)
+            return []
+        if time.monotonic() < self._deadline:
+            return self._get_next_site_request_list(site)
+        if self._site_next_target[site] < len(self._site_target_list[site]):
+            self._report(
+                ReportItem.warning(
+                    reports.messages.DrSiteStatusTimedOut(
+                        [
+                            target.label
+                            for target in self._site_target_list[site]
+                        ],
+                        self._site_timeout,
                     )
                 )
-            # TODO Node name should be added to each received report item and
-            # those modified report itemss should be reported. That, however,
-            # requires reports overhaul which would add possibility to add a
-            # node name to any report item. Also, infos and warnings should not
-            # be ignored.
-            if output["report_list"]:
-                for report_data in output["report_list"]:
-                    if (
-                        report_data["severity"] == ReportItemSeverity.ERROR
-                        and report_data["report_text"]
-                    ):
-                        self._report(
-                            ReportItem.error(
-                                reports.messages.NodeCommunicationCommandUnsuccessful(
-                                    node,
-                                    response.request.action,
-                                    report_data["report_text"],
-                                )
-                            )
-                        )
-        except (ValueError, LookupError, TypeError):
-            self._report(
-                ReportItem.warning(reports.messages.InvalidResponseFormat(node))
             )
+        return []
 
-        return self._get_next_list()
-
-    def on_complete(self) -> tuple[bool, str]:
-        # Usually, pcs.common.messages.UnableToPerformOperationOnAnyNode is
-        # reported when the operation was unsuccessful and failed on at least
-        # one node.  The only use case this communication command is used does
-        # not need that report and on top of that the report causes confusing
-        # output for the user. The report may be added in a future if needed.
-        return self._was_successful, self._cluster_status
+    def on_complete(self) -> list[tuple[bool, str]]:
+        """
+        Return whether the status has been obtained and the status of each site
+        """
+        return list(self._site_status)
@@ -0,0 +1,265 @@
+"""
+Concurrent resolution of corosync node addresses
+
+Validators of corosync.conf check that node addresses which are not IP
+addresses can be resolved. With many nodes and links and slow or failing DNS,
+resolving the addresses one after another takes minutes. Therefore, addresses
+are resolved concurrently, each lookup is given a limited time and resolvable
+addresses are remembered by the whole process for a limited time. Lookups
+which have timed out cannot be interrupted, so the number of lookup threads is
+limited to prevent stuck lookups from piling up.
+"""
+
+import queue
+import socket
+import threading
+import time
+from collections.abc import Callable
+
+from pcs import settings
+from pcs.common.types import StringIterable
+
+# function checking if an address can be resolved
+ResolveFunction = Callable[[str], bool]
+
+
+def resolve_by_dns(address: str) -> bool:
+    try:
+        socket.getaddrinfo(address, None)
+    except socket.gaierror:
+        return False
+    return True
+
+
+class _Batch:
+    """
+    State of resolving a set of addresses, shared by lookup workers
+    """
+
+    def __init__(self, address_list: StringIterable):
+        self.condition = threading.Condition()
+        self.queue: queue.SimpleQueue[str] = queue.SimpleQueue()
+        for address in address_list:
+            self.queue.put(address)
+        # address: time when its lookup started
+        self.started: dict[str, float] = {}
+        # address: result of its lookup
+        self.finished: dict[str, bool] = {}
+        # addresses not looked up as no thread could be started for them
+        self.skipped: set[str] = set()
+        # number of workers which have not exited yet, including workers stuck
+        # in timed out lookups
+        self.workers = 0
+        self.error: Exception | None = None
+
+
+class AddressResolver:
+    def __init__(
+        self,
+        resolve_function: ResolveFunction = resolve_by_dns,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        cache_ttl: float | None = None,
+        max_threads: int | None = None,
+    ):
+        """
+        resolve_function -- checks if an address can be resolved
+        max_workers -- maximal number of lookups running at the same time,
+            defaults to settings
+        timeout -- seconds given to each lookup, addresses not resolved in
+            time are considered unresolvable, defaults to settings
+        cache_ttl -- seconds for which resolvable addresses are remembered,
+            defaults to settings
+        max_threads -- maximal number of lookup threads including threads
+            stuck in timed out lookups, addresses which cannot be given
+            a thread are considered unresolvable, defaults to settings
+        """
+        self._resolve_function = resolve_function
+        self._max_workers = max(
+            1,
+            (
+                max_workers
+                if max_workers is not None
+                else settings.corosync_address_resolve_workers_max
+            ),
+        )
+        self._timeout = (
+            timeout
+            if timeout is not None
+            else settings.corosync_address_resolve_timeout
+        )
+        self._cache_ttl = (
+            cache_ttl
+            if cache_ttl is not None
+            else settings.corosync_address_resolve_cache_ttl
+        )
+        self._max_threads = (
+            max_threads
+            if max_threads is not None
+            else settings.corosync_address_resolve_threads_max
+        )
+        # address: time until which it is known to be resolvable
+        self._cache: dict[str, float] = {}
+        self._cache_lock = threading.Lock()
+        # number of lookup threads which have not exited yet, shared by all
+        # resolve calls
+        self._threads = 0
+        self._threads_lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    def resolve(self, address_list: StringIterable) -> dict[str, bool]:
+        """
+        Check which addresses can be resolved
+
+        Return a dict address: True if the address can be resolved. Addresses
+        which cannot be resolved or their lookup has not finished in time are
+        mapped to False.
+
+        address_list -- addresses to resolve
+        """
+        result: dict[str, bool] = {}
+        to_resolve = []
+        now = time.monotonic()
+        with self._cache_lock:
+            for address in dict.fromkeys(address_list):
+                if self._cache.get(address, now) > now:
+                    result[address] = True
+                else:
+                    self._cache.pop(address, None)
+                    to_resolve.append(address)
+        if to_resolve:
+            result.update(self._resolve_concurrently(to_resolve))
+        return result
+
+    def _resolve_concurrently(self, address_list: list[str]) -> dict[str, bool]:
+        batch = _Batch(address_list)
+        timed_out: set[str] = set()
+        with batch.condition:
+            for _ in range(min(self._max_workers, len(address_list))):
+                self._start_worker(batch)
+            while batch.error is None:
+                now = time.monotonic()
+                for address, started in batch.started.items():
+                    if (
+                        address not in batch.finished
+                        and address not in timed_out
+                        and started + self._timeout <= now
+                    ):
+                        # A lookup cannot be interrupted. Leave it running and
+                        # replace its worker, so that it does not hold back
+                        # lookups of other addresses.
+                        timed_out.add(address)
+                        self._start_worker(batch)
+                stuck = len(timed_out - batch.finished.keys())
+                if batch.workers <= stuck:
+                    # No worker is left to look up the remaining addresses
+                    # and no more threads may be started.
+                    self._skip_queued(batch)
+                unfinished_deadlines = [
+                    started + self._timeout
+                    for address, started in batch.started.items()
+                    if address not in batch.finished
+                    and address not in timed_out
+                ]
+                # A timed out lookup may finish later, count each address once.
+                if len(
+                    batch.finished.keys() | timed_out | batch.skipped
+                ) >= len(address_list):
+                    break
+                batch.condition.wait(
+                    max(0, min(unfinished_deadlines) - now)
+                    if unfinished_deadlines
+                    else None
+                )
+            if batch.error is not None:
+                raise batch.error
+            return {
+                address: (
+                    address not in timed_out
+                    and batch.finished.get(address, False)
+                )
+                for address in address_list
+            }
+
+    def _start_worker(self, batch: _Batch) -> None:
+        # called with batch.condition held
+        with self._threads_lock:
+            if self._threads >= self._max_threads:
+                return
+            self._threads += 1
+        batch.workers += 1
+        # Daemon threads do not prevent the process from exiting while they
+        # are stuck in a lookup which has already timed out.
+        threading.Thread(
+            target=self._worker,
+            args=(batch,),
+            name="pcs-address-resolver",
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _skip_queued(batch: _Batch) -> None:
+        while True:
+            try:
+                batch.skipped.add(batch.queue.get_nowait())
+            except queue.Empty:
+                return
+
+    def _worker(self, batch: _Batch) -> None:
+        try:
+            self._resolve_queued(batch)
+        finally:
+            with self._threads_lock:
+                self._threads -= 1
+            with batch.condition:
+                batch.workers -= 1
+                batch.condition.notify_all()
+
+    def _resolve_queued(self, batch: _Batch) -> None:
+        while True:
+            try:
+                address = batch.queue.get_nowait()
+            except queue.Empty:
+                return
+            with batch.condition:
+                batch.started[address] = time.monotonic()
+                # let the waiting thread know about the deadline
+                batch.condition.notify_all()
+            try:
+                resolvable = self._resolve_function(address)
+            except Exception as e:
+                with batch.condition:
+                    batch.error = e
+                    batch.condition.notify_all()
+                return
+            if resolvable:
+                # Unresolvable addresses are not cached. Users are likely to
+                # fix them and run the command again.
+                with self._cache_lock:
+                    self._cache[address] = time.monotonic() + self._cache_ttl
+            with batch.condition:
+                batch.finished[address] = resolvable
+                batch.condition.notify_all()
+
+
+_resolver = AddressResolver()
+
+
+def resolve_addresses(address_list: StringIterable) -> dict[str, bool]:
+    """
+    Check which addresses can be resolved, results are shared by the whole
+    process
+
+    address_list -- addresses to resolve
+    """
+    return _resolver.resolve(address_list)
+
+
+def clear_cache() -> None:
+    """
+    Forget resolved addresses
+    """
+    _resolver.clear_cache()
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,11 +19,28 @@ AttrTuple = tuple[AttrName, AttrValue]
 
 
 class Section:
+    """
+    Section of corosync.conf holding attributes and child sections
+
+    Attributes and child sections are indexed by their names, so that looking
+    them up does not depend on the number of other items in the section. An
+    exported text of each section is kept until the section or any of its
+    descendants is modified. Exporting a configuration therefore only
+    re-creates the text of modified sections and their ancestors.
+    """
+
     def __init__(self, name: str):
         self._parent: Section | None = None
         self._attr_list: list[AttrTuple] = []
-        self._section_list: list[Section] = []
+        self._attr_index: dict[AttrName, list[AttrValue]] = {}
+        # dicts are used as ordered sets allowing fast removal of sections
+        self._section_list: dict[Section, None] = {}
+        self._section_index: dict[str, dict[Section, None]] = {}
         self._name: str = name
+        # exported text of the section and an indentation it was exported with
+        self._export_cache: tuple[str, str] | None = None
+        # exported text of the section indented to be placed in its parent
+        self._block_cache: tuple[str, str] | None = None
 
     @property
     def parent(self) -> "Section | None":
@@ -37,24 +55,54 @@ class Section:
         return not self._attr_list and not self._section_list
 
     def export(self, indent: str = "    ") -> str:
-        lines = ["{0}: {1}".format(*attr) for attr in self._attr_list]
-        if self._attr_list and self._section_list:
-            lines.append("")
-        section_count = len(self._section_list)
-        for index, section in enumerate(self._section_list, 1):
-            lines.extend(str(section).split("\n"))
-            if not lines[-1].strip():
-                del lines[-1]
-            if index < section_count:
-                lines.append("")
+        if self._export_cache is None or self._export_cache[0] != indent:
+            self._export_cache = (indent, self._export(indent))
+        return self._export_cache[1]
+
+    def _export(self, indent: str) -> str:
+        # Child sections are always exported with the default indentation.
+        # The indentation of this section is then added to all their lines.
+        prefix = indent if self.parent else ""
+        block_list = []
+        if self._attr_list:
+            block_list.append(
+                _indent_text(
+                    "".join(
+                        "{0}: {1}\n".format(*attr) for attr in self._attr_list
+                    ),
+                    prefix,
+                )
+            )
+        block_list.extend(
+            # here we are reading a private method of the same class
+            section._get_block(prefix)  # noqa: SLF001
+            for section in self._section_list
+        )
+        # blocks are separated by an empty line
+        body = "\n".join(block_list)
         if self.parent:
-            lines = [indent + x if x else x for x in lines]
-            lines.insert(0, self.name + " {")
-            lines.append("}")
-        final = "\n".join(lines)
-        if final:
-            final += "\n"
-        return final
+            return f"{self.name} {{\n{body}}}\n"
+        return body
+
+    def _get_block(self, prefix: str) -> str:
+        if self._block_cache is None or self._block_cache[0] != prefix:
+            self._block_cache = (prefix, _indent_text(self.export(), prefix))
+        return self._block_cache[1]
+
+    def _invalidate_export(self) -> None:
+        # Exporting a section exports all its descendants. So once a section
+        # without an exported text is found, its ancestors have none either.
+        section: Section | None = self
+        while section is not None and section._has_export():  # noqa: SLF001
+            section._drop_export()  # noqa: SLF001
+            section = section.parent
+
+    def _has_export(self) -> bool:
+        return self._export_cache is not None or self._block_cache is not None
+
+    def _drop_export(self) -> None:
+        self._export_cache = None
+        self._block_cache = None
 
     def get_root(self) -> "Section":
         parent = self
@@ -63,33 +111,44 @@ class Section:
         return parent
 
     def get_attributes(self, name: AttrName | None = None) -> list[AttrTuple]:
-        return [
-            attr for attr in self._attr_list if name is None or attr[0] == name
-        ]
+        if name is None:
+            return list(self._attr_list)
+        return [(name, value) for value in self._attr_index.get(name, [])]
 
     def get_attributes_dict(self) -> AttrDict:
-        return {attr[0]: attr[1] for attr in self._attr_list}
+        return {
+            name: value_list[-1]
+            for name, value_list in self._attr_index.items()
+        }
 
     def get_attribute_value(
         self, name: AttrName, default: AttrValue | None = None
     ) -> AttrValue | None:
-        return self.get_attributes_dict().get(name, default)
+        value_list = self._attr_index.get(name)
+        return value_list[-1] if value_list else default
 
     def add_attribute(self, name: AttrName, value: AttrValue) -> "Section":
         self._attr_list.append((name, value))
+        self._attr_index.setdefault(name, []).append(value)
+        self._invalidate_export()
         return self
 
     def del_attributes_by_name(
         self, name: AttrName, value: AttrValue | None = None
     ) -> "Section":
+        if name not in self._attr_index:
+            return self
         self._attr_list = [
             attr
             for attr in self._attr_list
             if not (attr[0] == name and (value is None or attr[1] == value))
         ]
+        self._reindex_attributes()
         return self
 
     def set_attribute(self, name: AttrName, value: AttrValue) -> "Section":
+        if name not in self._attr_index:
+            return self.add_attribute(name, value)
         found = False
         new_attr_list = []
         for attr in self._attr_list:
@@ -99,16 +158,19 @@ class Section:
                 found = True
                 new_attr_list.append((name, value))
         self._attr_list = new_attr_list
-        if not found:
-            self.add_attribute(name, value)
+        self._reindex_attributes()
         return self
 
+    def _reindex_attributes(self) -> None:
+        self._attr_index = {}
+        for name, value in self._attr_list:
+            self._attr_index.setdefault(name, []).append(value)
+        self._invalidate_export()
+
     def get_sections(self, name: str | None = None) -> list["Section"]:
-        return [
-            section
-            for section in self._section_list
-            if name is None or section.name == name
-        ]
+        if name is None:
+            return list(self._section_list)
+        return list(self._section_index.get(name, {}))
 
     def add_section(self, section: "Section") -> "Section":
         parent: Section | None = self
@@ -120,26 +182,47 @@ class Section:
             section.parent.del_section(section)
         # here we are editing obj's _parent attribute of the same class
         section._parent = self  # noqa: SLF001
-        self._section_list.append(section)
+        self._section_list[section] = None
+        self._section_index.setdefault(section.name, {})[section] = None
+        # the section is exported differently when it has a parent
+        section._drop_export()  # noqa: SLF001
+        self._invalidate_export()
         return self
 
     def del_section(self, section: "Section") -> "Section":
-        self._section_list.remove(section)
-        # don't set parent to None if the section was not found in the list
-        # thanks to remove raising a ValueError in that case
+        if section not in self._section_list:
+            raise ValueError("Section is not a child of this section")
+        del self._section_list[section]
+        same_name_sections = self._section_index[section.name]
+        del same_name_sections[section]
+        if not same_name_sections:
+            del self._section_index[section.name]
+        self._invalidate_export()
         # here we are editing obj's _parent attribute of the same class
         section._parent = None  # noqa: SLF001
+        section._drop_export()  # noqa: SLF001
         return self
 
     def __str__(self) -> str:
         return self.export()
 
 
+def _indent_text(text: str, prefix: str) -> str:
+    # empty lines are not indented
+    if not prefix:
+        return text
+    return "\n".join(
+        prefix + line if line else line for line in text.split("\n")
+    )
+
+
 class Parser(ParserInterface):
     @staticmethod
     def parse(raw_file_data: bytes) -> Section:
         root = Section("")
-        Parser._parse_section(raw_file_data.decode("utf-8").split("\n"), root)
+        Parser._parse_section(
+            iter(raw_file_data.decode("utf-8").split("\n")), root
+        )
         return root
 
     @staticmethod
@@ -160,10 +243,10 @@ class Parser(ParserInterface):
         ]
 
     @staticmethod
-    def _parse_section(lines: list[str], section: Section) -> None:
+    def _parse_section(lines: Iterator[str], section: Section) -> None:
         # parser should work the same way as the original parser in corosync
-        while lines:
-            current_line = lines.pop(0).strip()
+        for line in lines:
+            current_line = line.strip()
             if not current_line or current_line[0] == "#":
                 continue
             if "{" in current_line:
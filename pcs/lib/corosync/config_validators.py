@@ -23,7 +23,7 @@ from pcs.common.reports import (
 from pcs.common.types import StringCollection
 from pcs.lib import validate
 from pcs.lib.cib.node import PacemakerNode
-from pcs.lib.corosync import constants
+from pcs.lib.corosync import address_resolver, constants
 from pcs.lib.corosync.node import CorosyncNode, get_address_type
 
 _QDEVICE_NET_REQUIRED_OPTIONS = (
@@ -115,7 +115,8 @@ def create(  # noqa: PLR0912, PLR0915
     )
 
     # nodelist validation
-    get_addr_type = _addr_type_analyzer()
+    node_list = list(node_list)
+    get_addr_type = _addr_type_analyzer(_node_list_addrs(node_list))
     all_names_usable = True  # can names be used to identifying nodes?
     all_names_count: dict[str, int] = defaultdict(int)
     all_addrs_count: dict[str, int] = defaultdict(int)
@@ -298,17 +299,48 @@ def _get_node_name_validators(
     ]
 
 
-def _addr_type_analyzer() -> Callable[[str], CorosyncNodeAddressType]:
-    cache = {}
+def _addr_type_analyzer(
+    addr_list: Iterable[Any] = (),
+) -> Callable[[str], CorosyncNodeAddressType]:
+    """
+    Return a function which provides a type of an address
+
+    addr_list -- addresses to be resolved concurrently in advance, other
+        addresses are resolved when their type is requested
+    """
+    cache: dict[str, CorosyncNodeAddressType] = {}
+    resolvable = address_resolver.resolve_addresses(
+        addr
+        for addr in addr_list
+        if isinstance(addr, str)
+        and addr
+        and get_address_type(addr) == CorosyncNodeAddressType.FQDN
+    )
 
     def analyzer(addr: str) -> CorosyncNodeAddressType:
         if addr not in cache:
-            cache[addr] = get_address_type(addr, resolve=True)
+            addr_type = get_address_type(addr)
+            if addr_type == CorosyncNodeAddressType.FQDN:
+                if addr not in resolvable:
+                    resolvable.update(
+                        address_resolver.resolve_addresses([addr])
+                    )
+                if not resolvable[addr]:
+                    addr_type = CorosyncNodeAddressType.UNRESOLVABLE
+            cache[addr] = addr_type
         return cache[addr]
 
     return analyzer
 
 
+def _node_list_addrs(node_list: Iterable[Mapping[str, Any]]) -> list[Any]:
+    addr_list = []
+    for node in node_list:
+        if isinstance(node, Mapping) and isinstance(node.get("addrs"), list):
+            addr_list.extend(node["addrs"])
+    return addr_list
+
+
 def _extract_existing_addrs_and_names(
     coro_existing_nodes: Iterable[CorosyncNode],
     pcmk_existing_nodes: Iterable[PacemakerNode],
@@ -434,7 +466,8 @@ def add_nodes(  # noqa: PLR0912, PLR0915
     number_of_existing_links = len(existing_addr_types)
 
     # validation
-    get_addr_type = _addr_type_analyzer()
+    node_list = list(node_list)
+    get_addr_type = _addr_type_analyzer(_node_list_addrs(node_list))
     report_items = []
     new_names_count: dict[str, int] = defaultdict(int)
     new_addrs_count: dict[str, int] = defaultdict(int)
@@ -1002,7 +1035,7 @@ def add_link(
         for node in sorted(set(node_addr_map.keys()) - existing_names)
     ]
 
-    get_addr_type = _addr_type_analyzer()
+    get_addr_type = _addr_type_analyzer(node_addr_map.values())
     unresolvable_addresses: set[str] = set()
     nodes_with_empty_addr: set[str] = set()
     addr_types: list[CorosyncNodeAddressType] = []
@@ -1191,7 +1224,14 @@ def update_link(  # noqa: PLR0912, PLR0913
                 _update_link_options_knet(link_options, current_link_options)
             )
     # validate addresses
-    get_addr_type = _addr_type_analyzer()
+    coro_existing_nodes = list(coro_existing_nodes)
+    get_addr_type = _addr_type_analyzer(
+        list(node_addr_map.values())
+        + [
+            coro_node.addr_plain_for_link(linknumber)
+            for coro_node in coro_existing_nodes
+        ]
+    )
     existing_names = set()
     unchanged_addrs = set()
     link_addr_types = []
@@ -12,6 +12,7 @@ from pcs.common.tools import format_os_error
 from pcs.common.types import StringSequence
 from pcs.lib.communication import qdevice_net as qdevice_net_com
 from pcs.lib.communication.tools import run_and_raise
+from pcs.lib.corosync import qdevice_net_certificates
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
 from pcs.lib.tools import get_tmp_file
@@ -74,22 +75,65 @@ def set_up_client_certificates(
     )
     com_cmd_2.set_targets(cluster_nodes_target_list)
     run_and_raise(communicator_factory.get_communicator(), com_cmd_2)
-    # create client certificate request
-    cert_request = client_generate_certificate_request(runner, cluster_name)
-    # sign the request on qnetd host
-    com_cmd_3 = qdevice_net_com.SignCertificate(reporter)
-    com_cmd_3.add_request(qnetd_target, cert_request, cluster_name)
-    signed_certificate = run_and_raise(
-        communicator_factory.get_communicator(), com_cmd_3
-    )[0][1]
-    # transform the signed certificate to pk12 format which can sent to nodes
-    pk12 = client_cert_request_to_pk12(runner, signed_certificate)
+    # get a client certificate signed by qnetd host
+    pk12 = client_get_signed_pk12_certificate(
+        runner, reporter, communicator_factory, qnetd_target, cluster_name
+    )
     # distribute final certificate to nodes
-    com_cmd_4 = qdevice_net_com.ClientImportCertificateAndKey(
+    com_cmd_3 = qdevice_net_com.ClientImportCertificateAndKey(
         reporter, pk12, skip_offline_nodes, allow_skip_offline
     )
-    com_cmd_4.set_targets(cluster_nodes_target_list)
-    run_and_raise(communicator_factory.get_communicator(), com_cmd_4)
+    com_cmd_3.set_targets(cluster_nodes_target_list)
+    run_and_raise(communicator_factory.get_communicator(), com_cmd_3)
+
+
+def client_get_signed_pk12_certificate(
+    runner: CommandRunner,
+    reporter: reports.ReportProcessor,
+    communicator_factory: NodeCommunicatorFactory,
+    qnetd_target: RequestTarget,
+    cluster_name: str,
+) -> bytes:
+    """
+    create a client certificate signed by qnetd host in pk12 format which can
+    be imported to nodes
+
+    runner -- command runner instance
+    reporter -- report processor instance
+    communicator_factory -- communicator factory instance
+    qnetd_target -- qdevice provider (qnetd host)
+    cluster_name -- name of the cluster to which qdevice is being added
+    """
+
+    def sign(cert_request: bytes) -> bytes:
+        com_cmd = qdevice_net_com.SignCertificate(reporter)
+        com_cmd.add_request(qnetd_target, cert_request, cluster_name)
+        result = run_and_raise(communicator_factory.get_communicator(), com_cmd)
+        return result[0][1]
+
+    if not settings.corosync_qdevice_net_in_process_certificates:
+        # create client certificate request
+        cert_request = client_generate_certificate_request(runner, cluster_name)
+        # sign the request on qnetd host and transform the signed certificate
+        # to pk12 format which can be sent to nodes
+        return client_cert_request_to_pk12(runner, sign(cert_request))
+
+    # The key and the request are created in memory, so there is no need to
+    # run certutil and to store the key in the local certificate database.
+    request = qdevice_net_certificates.generate_certificate_request(
+        cluster_name
+    )
+    signed_certificate = sign(request.request)
+    try:
+        return qdevice_net_certificates.certificate_to_pk12(
+            signed_certificate, request.key
+        )
+    except qdevice_net_certificates.CertificateError as e:
+        raise LibraryError(
+            reports.ReportItem.error(
+                reports.messages.QdeviceCertificateImportError(e.reason)
+            )
+        ) from e
 
 
 def qdevice_setup(runner: CommandRunner) -> None:
@@ -0,0 +1,93 @@
+"""
+In-process operations with qdevice model net certificates
+
+Corosync tools for qdevice model net keep keys in NSS databases and exchange
+certificates through files, each of their operations runs several processes.
+Certificate requests and conversion of signed certificates to pk12 are done
+here in memory instead. Requests are still signed on a qnetd host by its tools,
+as the CA key is stored in the qnetd NSS database.
+"""
+
+from dataclasses import dataclass
+from typing import Final
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.serialization import pkcs12
+from cryptography.x509.oid import NameOID
+
+# corosync-qdevice looks for its certificate by this nickname
+CLUSTER_CERT_NICKNAME: Final = "Cluster Cert"
+# the same value is used by corosync-qdevice-net-certutil
+_KEY_SIZE: Final = 2048
+
+
+class CertificateError(Exception):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class CertificateRequest:
+    # certificate request in DER format
+    request: bytes
+    # private key the request has been created for
+    key: rsa.RSAPrivateKeyWithSerialization
+
+
+def generate_certificate_request(cluster_name: str) -> CertificateRequest:
+    """
+    Create a key and a request for a qdevice client certificate
+
+    cluster_name -- name of the cluster to which qdevice is being added
+    """
+    key = rsa.generate_private_key(public_exponent=65537, key_size=_KEY_SIZE)
+    request = (
+        x509.CertificateSigningRequestBuilder()
+        .subject_name(
+            x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, cluster_name)])
+        )
+        .sign(key, hashes.SHA256())
+    )
+    return CertificateRequest(
+        request.public_bytes(serialization.Encoding.DER),  # type: ignore[arg-type]
+        key,
+    )
+
+
+def certificate_to_pk12(
+    certificate: bytes, key: rsa.RSAPrivateKeyWithSerialization
+) -> bytes:
+    """
+    Pack a signed qdevice client certificate and its key to pk12 format which
+    can be imported to nodes
+
+    certificate -- certificate in DER or PEM format
+    key -- private key the certificate has been signed for
+    """
+    try:
+        cert = (
+            x509.load_pem_x509_certificate(certificate)
+            if _is_pem(certificate)
+            else x509.load_der_x509_certificate(certificate)
+        )
+    except ValueError as e:
+        raise CertificateError(f"Unable to load certificate: {e}") from e
+    if cert.public_key() != key.public_key():
+        raise CertificateError(
+            "Certificate has not been signed for the generated key"
+        )
+    # Corosync tools export pk12 certificates with an empty password.
+    return pkcs12.serialize_key_and_certificates(
+        CLUSTER_CERT_NICKNAME.encode(),
+        key,
+        cert,
+        None,
+        serialization.NoEncryption(),
+    )
+
+
+def _is_pem(data: bytes) -> bool:
+    return data.lstrip().startswith(b"-----BEGIN")
@@ -29,7 +29,7 @@ from pcs.lib.corosync.config_parser import (
 from pcs.lib.corosync.live import get_local_corosync_conf
 from pcs.lib.dr.env import DrEnv
 from pcs.lib.errors import LibraryError
-from pcs.lib.external import CommandRunner
+from pcs.lib.external import CommandRunner, ProcessRunRecord
 from pcs.lib.file.instance import FileInstance
 from pcs.lib.interface.config import ParserErrorException
 from pcs.lib.node import get_existing_nodes_names
@@ -100,6 +100,8 @@ class LibraryEnvironment:
         self._known_hosts: Mapping[str, PcsKnownHost] | None = None
         self._cib_upgrade_reported: bool = False
         self._cib_data_tmp_file: Any | None = None  # TODO proper type hint
+        # shared by all command runners of the environment
+        self._process_run_records: list[ProcessRunRecord] = []
         self.__loaded_cib_diff_source: str | None = None
         self.__loaded_cib_to_modify: _Element | None = None
         self._communicator_factory = NodeCommunicatorFactory(
@@ -130,6 +132,17 @@ class LibraryEnvironment:
     def user_groups(self) -> list[str] | None:
         return self._user_groups
 
+    @property
+    def request_timeout(self) -> int | None:
+        return self._request_timeout
+
+    @property
+    def process_run_records(self) -> list[ProcessRunRecord]:
+        """
+        Return records of all external processes run in the environment
+        """
+        return list(self._process_run_records)
+
     @property
     def ghost_file_codes(self) -> list[file_type_codes.FileTypeCode]:
         codes = set()
@@ -447,7 +460,17 @@ class LibraryEnvironment:
     def is_corosync_conf_live(self) -> bool:
         return self._corosync_conf_data is None
 
-    def cmd_runner(self, env: Mapping[str, str] | None = None) -> CommandRunner:
+    def cmd_runner(
+        self,
+        env: Mapping[str, str] | None = None,
+        report_processor: ReportProcessor | None = None,
+    ) -> CommandRunner:
+        """
+        env -- environment variables added to the runner's ones
+        report_processor -- report processor used by the runner instead of
+            the environment's one, e.g. when the runner is used in another
+            thread
+        """
         runner_env = {
             # make sure to get output of external processes in English and ASCII
             "LC_ALL": "C",
@@ -469,7 +492,12 @@ class LibraryEnvironment:
         if env:
             runner_env.update(env)
 
-        return CommandRunner(self.logger, self.report_processor, runner_env)
+        return CommandRunner(
+            self.logger,
+            report_processor or self.report_processor,
+            runner_env,
+            run_records=self._process_run_records,
+        )
 
     @property
     def communicator_factory(self) -> NodeCommunicatorFactory:
@@ -478,9 +506,22 @@ class LibraryEnvironment:
     def get_node_communicator(
         self,
         request_timeout: int | None = None,
+        report_processor: ReportProcessor | None = None,
     ) -> Communicator:
+        """
+        report_processor -- report processor used by the communicator instead
+            of the environment's one, e.g. when the communicator is used in
+            another thread
+        """
+        if report_processor is None:
+            return self.communicator_factory.get_communicator(
+                request_timeout=request_timeout
+            )
         return self.communicator_factory.get_communicator(
-            request_timeout=request_timeout
+            request_timeout=request_timeout,
+            communicator_logger=CommunicatorLogger(
+                [ReportProcessorToLog(self.logger), report_processor]
+            ),
         )
 
     def get_node_communicator_no_privilege_transition(
@@ -535,3 +576,14 @@ class LibraryEnvironment:
     @property
     def service_manager(self) -> ServiceManagerInterface:
         return self._get_service_manager()
+
+    def create_service_manager(
+        self, report_processor: ReportProcessor
+    ) -> ServiceManagerInterface:
+        """
+        Create a service manager using the specified report processor instead
+        of the environment's one, e.g. when it is used in another thread
+        """
+        return get_service_manager(
+            self.cmd_runner(report_processor=report_processor), report_processor
+        )
@@ -1,6 +1,10 @@
-import signal
+import contextlib
+import logging
 import subprocess
+import threading
+import time
 from collections.abc import Mapping
+from dataclasses import dataclass
 from logging import Logger
 from shlex import quote as shell_quote
 
@@ -13,6 +17,9 @@ from pcs.common.tools import format_os_error
 from pcs.common.types import StringSequence
 from pcs.lib.errors import LibraryError
 
+# seconds given to a killed process to terminate
+_KILLED_PROCESS_WAIT_TIMEOUT = 1
+
 
 class KillServicesError(Exception):
     def __init__(self, service, message=None, instance=None):
@@ -21,13 +28,35 @@ class KillServicesError(Exception):
         self.instance = instance
 
 
+@dataclass(frozen=True)
+class ProcessRunRecord:
+    """
+    Duration and size of data of a finished external process
+
+    Sizes are lengths of the strings passed to and from the process, i.e.
+    characters for text output and bytes for binary output.
+    """
+
+    args: tuple[str, ...]
+    # wall time in seconds
+    duration: float
+    stdin_size: int
+    stdout_size: int
+    stderr_size: int
+
+
 class CommandRunner:
     def __init__(
         self,
         logger: Logger,
         reporter: ReportProcessor,
         env_vars: Mapping[str, str] | None = None,
+        run_records: list[ProcessRunRecord] | None = None,
     ):
+        """
+        run_records -- a list to which a record of each finished process is
+            appended, allows to collect records of more runners in one list
+        """
         self._logger = logger
         self._reporter = reporter
         # Reset environment variables by empty dict is desired here.  We need
@@ -36,18 +65,33 @@ class CommandRunner:
         # executables must be specified with full path unless the PATH variable
         # is set from outside.
         self._env_vars = env_vars if env_vars else {}
+        self._run_records = run_records if run_records is not None else []
 
     @property
     def env_vars(self) -> dict[str, str]:
         return dict(self._env_vars)
 
+    @property
+    def run_records(self) -> list[ProcessRunRecord]:
+        """
+        Return records of finished processes in order of their finishing
+        """
+        return list(self._run_records)
+
     def run(
         self,
         args: StringSequence,
         stdin_string: str | None = None,
         env_extend: Mapping[str, str] | None = None,
         binary_output: bool = False,
+        timeout: int | None = None,
     ) -> tuple[str, str, int]:
+        """
+        Run an external process and return its stdout, stderr and exit code
+
+        timeout -- seconds after which the process is killed, raise
+            LibraryError in that case
+        """
         # Allow overriding default settings. If a piece of code really wants to
         # set own PATH or CIB_file, we must allow it. I.e. it wants to run
         # a pacemaker tool on a CIB in a file but cannot afford the risk of
@@ -55,42 +99,31 @@ class CommandRunner:
         env_vars = dict(self._env_vars)
         env_vars.update(dict(env_extend) if env_extend else {})
 
-        log_args = " ".join([shell_quote(x) for x in args])
-        env = (
-            ""
-            if not env_vars
-            else (
-                "\n"
-                + "\n".join(
-                    [
-                        "  {0}={1}".format(key, val)
-                        for key, val in sorted(env_vars.items())
-                    ]
-                )
+        # Outputs of some tools, e.g. the whole CIB, are huge. Do not build
+        # debug messages nobody is going to read.
+        log_debug = self._logger.isEnabledFor(logging.DEBUG)
+        report_debug = self._reporter.is_debug_enabled
+        log_args = _format_args(args) if log_debug or report_debug else ""
+        if log_debug:
+            self._logger.debug(
+                "Running: %s\nEnvironment:%s%s",
+                log_args,
+                _format_env_vars(env_vars),
+                _format_stdin(stdin_string),
             )
-        )
-        stdin = (
-            ""
-            if not stdin_string
-            else ("\n--Debug Input Start--\n{0}\n--Debug Input End--").format(
-                stdin_string
-            )
-        )
-        self._logger.debug(
-            "Running: %s\nEnvironment:%s%s", log_args, env, stdin
-        )
-        self._reporter.report(
-            ReportItem.debug(
-                reports.messages.RunExternalProcessStarted(
-                    log_args,
-                    stdin_string,
-                    env_vars,
+        if report_debug:
+            self._reporter.report(
+                ReportItem.debug(
+                    reports.messages.RunExternalProcessStarted(
+                        log_args,
+                        stdin_string,
+                        env_vars,
+                    )
                 )
             )
-        )
 
+        start = time.monotonic()
         try:
-            # this is OK as pcs is only single-threaded application
             process = subprocess.Popen(
                 args,
                 # Some commands react differently if they get anything via stdin
@@ -101,50 +134,126 @@ class CommandRunner:
                 ),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                preexec_fn=(  # noqa: PLW1509
-                    lambda: signal.signal(signal.SIGPIPE, signal.SIG_DFL)
-                ),
+                # Reset SIGPIPE handling to default in the child process.
+                # Unlike preexec_fn, this is safe when pcs runs external
+                # processes from more threads.
+                restore_signals=True,
                 close_fds=True,
                 shell=False,
                 env=env_vars,
                 # decodes newlines and in python3 also converts bytes to str
                 universal_newlines=(not binary_output),
             )
-            out_std, out_err = process.communicate(stdin_string)
+            try:
+                out_std, out_err = process.communicate(
+                    stdin_string, timeout=timeout
+                )
+            except subprocess.TimeoutExpired as e:
+                out_std, out_err = _kill_process(process)
+                self._run_records.append(
+                    ProcessRunRecord(
+                        args=tuple(args),
+                        duration=time.monotonic() - start,
+                        stdin_size=len(stdin_string) if stdin_string else 0,
+                        stdout_size=len(out_std),
+                        stderr_size=len(out_err),
+                    )
+                )
+                raise LibraryError(
+                    ReportItem.error(
+                        reports.messages.RunExternalProcessTimedOut(
+                            _format_args(args), int(timeout or 0)
+                        )
+                    )
+                ) from e
             retval = process.returncode
         except OSError as e:
             raise LibraryError(
                 ReportItem.error(
                     reports.messages.RunExternalProcessError(
-                        log_args, format_os_error(e)
+                        _format_args(args), format_os_error(e)
                     )
                 )
             ) from e
-
-        self._logger.debug(
-            (
-                "Finished running: %s\nReturn value: %s"
-                "\n--Debug Stdout Start--\n%s\n--Debug Stdout End--"
-                "\n--Debug Stderr Start--\n%s\n--Debug Stderr End--"
-            ),
-            log_args,
-            retval,
-            out_std,
-            out_err,
+        self._run_records.append(
+            ProcessRunRecord(
+                args=tuple(args),
+                duration=time.monotonic() - start,
+                stdin_size=len(stdin_string) if stdin_string else 0,
+                stdout_size=len(out_std),
+                stderr_size=len(out_err),
+            )
         )
-        self._reporter.report(
-            ReportItem.debug(
-                reports.messages.RunExternalProcessFinished(
-                    log_args,
-                    retval,
-                    out_std,
-                    out_err,
+
+        if log_debug:
+            self._logger.debug(
+                (
+                    "Finished running: %s\nReturn value: %s"
+                    "\n--Debug Stdout Start--\n%s\n--Debug Stdout End--"
+                    "\n--Debug Stderr Start--\n%s\n--Debug Stderr End--"
+                ),
+                log_args,
+                retval,
+                out_std,
+                out_err,
+            )
+        if report_debug:
+            self._reporter.report(
+                ReportItem.debug(
+                    reports.messages.RunExternalProcessFinished(
+                        log_args,
+                        retval,
+                        out_std,
+                        out_err,
+                    )
                 )
             )
-        )
         return out_std, out_err, retval
 
 
+def _kill_process(
+    process: "subprocess.Popen[str] | subprocess.Popen[bytes]",
+) -> tuple[str | bytes, str | bytes]:
+    """
+    Kill a process and return its output produced so far
+
+    A process stuck in uninterruptible I/O does not terminate until the I/O
+    returns, e.g. when reading a dead device. It is only given a short time to
+    terminate, then its pipes are closed and it is reaped in the background.
+    """
+    process.kill()
+    try:
+        return process.communicate(timeout=_KILLED_PROCESS_WAIT_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        pass
+    for pipe in (process.stdin, process.stdout, process.stderr):
+        if pipe is not None:
+            with contextlib.suppress(OSError):
+                pipe.close()
+    threading.Thread(
+        target=process.wait, name="pcs-reap-killed-process", daemon=True
+    ).start()
+    return "", ""
+
+
+def _format_args(args: StringSequence) -> str:
+    return " ".join([shell_quote(x) for x in args])
+
+
+def _format_env_vars(env_vars: Mapping[str, str]) -> str:
+    if not env_vars:
+        return ""
+    return "\n" + "\n".join(
+        [f"  {key}={val}" for key, val in sorted(env_vars.items())]
+    )
+
+
+def _format_stdin(stdin_string: str | None) -> str:
+    if not stdin_string:
+        return ""
+    return f"\n--Debug Input Start--\n{stdin_string}\n--Debug Input End--"
+
+
 def kill_services(runner, services):
     """
     Kill specified services in local system
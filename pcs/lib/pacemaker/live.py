@@ -22,7 +22,6 @@ from pcs.common.tools import (
 )
 from pcs.common.types import (
     CibRuleInEffectStatus,
-    StringCollection,
     StringSequence,
 )
 from pcs.lib import tools
@@ -34,6 +33,7 @@ from pcs.lib.pacemaker.api_result import (
     get_status_from_api_result,
 )
 from pcs.lib.pacemaker.state import ClusterState
+from pcs.lib.pacemaker.tool_features import has_tool_options
 from pcs.lib.resource_agent import ResourceAgentName
 from pcs.lib.xml_tools import etree_to_str
 
@@ -193,6 +193,40 @@ def get_cib_xml(runner: CommandRunner, scope: str | None = None) -> str:
     return stdout
 
 
+def get_cib_revision(runner: CommandRunner) -> str:
+    """
+    Return a revision of the CIB in the form admin_epoch.epoch.num_updates
+
+    The revision changes whenever the CIB configuration or status changes. It
+    is much cheaper to get than the CIB or the cluster status.
+    """
+    stdout, stderr, retval = runner.run(
+        [
+            settings.cibadmin_exec,
+            "--local",
+            "--query",
+            "--xpath=/cib",
+            "--no-children",
+        ]
+    )
+    if retval != 0:
+        raise LibraryError(
+            ReportItem.error(
+                reports.messages.CibLoadError(join_multilines([stderr, stdout]))
+            )
+        )
+    try:
+        cib = xml_fromstring(stdout)
+    except etree.XMLSyntaxError as e:
+        raise LibraryError(
+            ReportItem.error(reports.messages.CibLoadErrorBadFormat(str(e)))
+        ) from e
+    return ".".join(
+        str(cib.get(attribute, "0"))
+        for attribute in ("admin_epoch", "epoch", "num_updates")
+    )
+
+
 def get_cib_file_runner_env() -> dict[str, str]:
     return {"CIB_file": os.path.join(settings.cib_dir, "cib.xml")}
 
@@ -755,9 +789,7 @@ def resource_unmove_unban(
 
 
 def has_resource_unmove_unban_expired_support(runner: CommandRunner) -> bool:
-    return _is_in_pcmk_tool_help(
-        runner, settings.crm_resource_exec, ["--expired"]
-    )
+    return has_tool_options(runner, settings.crm_resource_exec, ["--expired"])
 
 
 def _resource_move_ban_clear(
@@ -791,13 +823,11 @@ def _resource_move_ban_clear(
 
 
 def is_fence_history_supported_status(runner: CommandRunner) -> bool:
-    return _is_in_pcmk_tool_help(
-        runner, settings.crm_mon_exec, ["--fence-history"]
-    )
+    return has_tool_options(runner, settings.crm_mon_exec, ["--fence-history"])
 
 
 def is_fence_history_supported_management(runner: CommandRunner) -> bool:
-    return _is_in_pcmk_tool_help(
+    return has_tool_options(
         runner,
         settings.stonith_admin_exec,
         ["--history", "--broadcast", "--cleanup"],
@@ -929,27 +959,14 @@ def get_rule_in_effect_status(
     return translation_map.get(retval, CibRuleInEffectStatus.UNKNOWN)
 
 
-def _is_in_pcmk_tool_help(
-    runner: CommandRunner, tool: str, text_list: StringCollection
-) -> bool:
-    stdout, stderr, dummy_retval = runner.run([tool, "--help-all"])
-    # Help goes to stderr but we check stdout as well if that gets changed. Use
-    # generators in all to return early.
-    return all(text in stderr for text in text_list) or all(
-        text in stdout for text in text_list
-    )
-
-
 def is_crm_attribute_list_options_supported(runner: CommandRunner) -> bool:
-    return _is_in_pcmk_tool_help(
+    return has_tool_options(
         runner, settings.crm_attribute_exec, ["--list-options"]
     )
 
 
 def is_getting_resource_digest_supported(runner: CommandRunner) -> bool:
-    return _is_in_pcmk_tool_help(
-        runner, settings.crm_resource_exec, ["--digests"]
-    )
+    return has_tool_options(runner, settings.crm_resource_exec, ["--digests"])
 
 
 def get_resource_digests(
@@ -0,0 +1,174 @@
+"""
+Detection of features supported by pacemaker command line tools
+
+Pacemaker tools do not provide a machine readable list of supported features,
+so we check their help for options pcs needs. Running a tool with --help-all
+for every check is expensive, therefore the options found in the help of each
+tool are cached in memory and in a file. The cache of a tool is valid as long
+as the tool binary and the pacemakerd binary stay the same, i.e. until
+pacemaker is upgraded or downgraded.
+"""
+
+import contextlib
+import json
+import os
+import re
+import threading
+from typing import Any
+
+from pcs import settings
+from pcs.common.types import StringCollection, StringSequence
+from pcs.lib.external import CommandRunner
+from pcs.lib.tools import write_file_atomically
+
+# [mtime_ns, size] of a tool followed by [mtime_ns, size] of pacemakerd
+ToolIdentity = list[int]
+
+_OPTION_RE = re.compile(r"--[A-Za-z0-9][A-Za-z0-9_-]*")
+
+
+def get_tool_identity(tool: str) -> ToolIdentity | None:
+    """
+    Return a value which changes when a pacemaker tool or pacemaker itself is
+    replaced, None if it cannot be determined
+
+    tool -- path to the tool binary
+    """
+    try:
+        identity = []
+        for path in (tool, settings.pacemakerd_exec):
+            stat = os.stat(path)
+            identity.extend([stat.st_mtime_ns, stat.st_size])
+        return identity
+    except OSError:
+        return None
+
+
+def _known_tools() -> StringSequence:
+    # tools pcs checks features of, they are all probed at once
+    return (
+        settings.crm_attribute_exec,
+        settings.crm_mon_exec,
+        settings.crm_resource_exec,
+        settings.stonith_admin_exec,
+    )
+
+
+def _get_tool_options(runner: CommandRunner, tool: str) -> set[str]:
+    stdout, stderr, dummy_retval = runner.run([tool, "--help-all"])
+    # Help goes to stderr but we check stdout as well if that gets changed.
+    return set(_OPTION_RE.findall(stderr)) | set(_OPTION_RE.findall(stdout))
+
+
+class _ToolFeatures:
+    def __init__(self, identity: ToolIdentity, option_set: set[str]):
+        self.identity = identity
+        self.option_set = option_set
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"identity": self.identity, "options": sorted(self.option_set)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "_ToolFeatures":
+        return cls(
+            [int(item) for item in data["identity"]],
+            {str(option) for option in data["options"]},
+        )
+
+
+class ToolFeatureRegistry:
+    def __init__(self, cache_file_path: str | None):
+        """
+        cache_file_path -- file to store the detected features in, no file is
+            used if None
+        """
+        self._cache_file_path = cache_file_path
+        self._cache_file_loaded = False
+        self._tools: dict[str, _ToolFeatures] = {}
+        # pcs may run pacemaker tools from more threads
+        self._lock = threading.Lock()
+
+    def has_options(
+        self, runner: CommandRunner, tool: str, option_list: StringCollection
+    ) -> bool:
+        """
+        Check if a pacemaker tool supports all specified options
+
+        runner -- runs the tool if its features are not known yet
+        tool -- path to the tool binary
+        option_list -- command line options to look for, e.g. '--expired'
+        """
+        identity = get_tool_identity(tool)
+        if identity is None:
+            # Cannot tell if cached features are up to date, do not cache.
+            option_set = _get_tool_options(runner, tool)
+        else:
+            with self._lock:
+                option_set = self._get_cached_options(runner, tool, identity)
+        return all(option in option_set for option in option_list)
+
+    def _get_cached_options(
+        self, runner: CommandRunner, tool: str, identity: ToolIdentity
+    ) -> set[str]:
+        if not self._cache_file_loaded:
+            self._tools.update(self._load_cache_file())
+            self._cache_file_loaded = True
+        if tool in self._tools and self._tools[tool].identity == identity:
+            return self._tools[tool].option_set
+
+        # The requested tool is not known yet or it has changed. Pacemaker
+        # tools are usually upgraded all at once, so refresh all of them to
+        # avoid running the other tools later.
+        for known_tool in dict.fromkeys([*_known_tools(), tool]):
+            known_identity = (
+                identity
+                if known_tool == tool
+                else get_tool_identity(known_tool)
+            )
+            if known_identity is None or (
+                known_tool in self._tools
+                and self._tools[known_tool].identity == known_identity
+            ):
+                continue
+            self._tools[known_tool] = _ToolFeatures(
+                known_identity, _get_tool_options(runner, known_tool)
+            )
+        self._save_cache_file()
+        return self._tools[tool].option_set
+
+    def _load_cache_file(self) -> dict[str, _ToolFeatures]:
+        if not self._cache_file_path:
+            return {}
+        try:
+            with open(self._cache_file_path, encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            return {
+                str(tool): _ToolFeatures.from_dict(features)
+                for tool, features in data.items()
+            }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # The cache is only an optimization. If it cannot be read, the
+            # features are detected again.
+            return {}
+
+    def _save_cache_file(self) -> None:
+        if not self._cache_file_path:
+            return
+        data = {
+            tool: features.to_dict() for tool, features in self._tools.items()
+        }
+        with contextlib.suppress(OSError):
+            write_file_atomically(self._cache_file_path, json.dumps(data))
+
+
+_registry = ToolFeatureRegistry(settings.pacemaker_tool_features_cache)
+
+
+def has_tool_options(
+    runner: CommandRunner, tool: str, option_list: StringCollection
+) -> bool:
+    """
+    Check if a pacemaker tool supports all specified options, features of tools
+    are shared by the whole process
+    """
+    return _registry.has_options(runner, tool, option_list)
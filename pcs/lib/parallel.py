@@ -0,0 +1,85 @@
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class CollectorPool:
+    """
+    Run independent data collectors concurrently and measure their duration
+
+    Collectors are functions which gather data from independent sources, e.g.
+    by running external tools or communicating with nodes. They must not
+    share any state which is not thread-safe. Exceptions raised by
+    a collector are re-raised when its result is requested.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        max_workers -- maximal number of collectors running at the same time,
+            if lower than 1, each collector is run immediately when submitted
+            and any exception it raises is propagated right away
+        """
+        self._executor = (
+            ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="pcs-collector"
+            )
+            if max_workers > 0
+            else None
+        )
+        self._timings: dict[str, float] = {}
+
+    def __enter__(self) -> "CollectorPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """
+        Return duration in seconds of each finished collector in order of
+        submitting the collectors
+        """
+        return dict(self._timings)
+
+    def submit(self, name: str, collector: Callable[[], T]) -> "Future[T]":
+        """
+        Start a collector and return a future holding its result
+
+        name -- unique name of the collector used for reporting its duration
+        collector -- function collecting the data
+        """
+        # reserve the position of the collector in the timings
+        self._timings[name] = 0.0
+        timed_collector = self._timed(name, collector)
+        if self._executor is not None:
+            return self._executor.submit(timed_collector)
+        future: Future[T] = Future()
+        future.set_result(timed_collector())
+        return future
+
+    def shutdown(self) -> None:
+        """
+        Wait for all running collectors to finish
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _timed(self, name: str, collector: Callable[[], T]) -> Callable[[], T]:
+        def timed_collector() -> T:
+            start = time.monotonic()
+            try:
+                return collector()
+            finally:
+                self._timings[name] = time.monotonic() - start
+
+        return timed_collector
@@ -0,0 +1,172 @@
+"""
+Cache of metadata provided by pacemaker tools
+
+Metadata of cluster options, resource meta attributes and fencing parameters
+are obtained by running pacemaker tools and validating their output, which is
+repeated in many commands. The metadata only change when pacemaker is updated.
+Therefore they are cached in memory and in a file, valid as long as the tool
+binary and the pacemakerd binary stay the same.
+"""
+
+import contextlib
+import dataclasses
+import json
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from pcs import settings
+from pcs.lib.pacemaker import tool_features
+from pcs.lib.pacemaker.tool_features import ToolIdentity
+from pcs.lib.tools import write_file_atomically
+
+from .types import (
+    OcfVersion,
+    ResourceAgentAction,
+    ResourceAgentMetadata,
+    ResourceAgentName,
+    ResourceAgentParameter,
+)
+
+
+def _metadata_to_dict(metadata: ResourceAgentMetadata) -> dict[str, Any]:
+    return dataclasses.asdict(metadata)
+
+
+def _metadata_from_dict(data: dict[str, Any]) -> ResourceAgentMetadata:
+    return ResourceAgentMetadata(
+        name=ResourceAgentName(**data["name"]),
+        agent_exists=bool(data["agent_exists"]),
+        ocf_version=OcfVersion(data["ocf_version"]),
+        shortdesc=data["shortdesc"],
+        longdesc=data["longdesc"],
+        parameters=[
+            ResourceAgentParameter(**parameter)
+            for parameter in data["parameters"]
+        ],
+        actions=[ResourceAgentAction(**action) for action in data["actions"]],
+    )
+
+
+class _CacheEntry:
+    def __init__(
+        self, identity: ToolIdentity, metadata: ResourceAgentMetadata
+    ) -> None:
+        self.identity = identity
+        self.metadata = metadata
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "identity": self.identity,
+            "metadata": _metadata_to_dict(self.metadata),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "_CacheEntry":
+        return cls(
+            [int(item) for item in data["identity"]],
+            _metadata_from_dict(data["metadata"]),
+        )
+
+
+class PacemakerMetadataCache:
+    def __init__(self, cache_file_path: str | None):
+        """
+        cache_file_path -- file to store the metadata in, no file is used if
+            None
+        """
+        self._cache_file_path = cache_file_path
+        self._cache_file_loaded = False
+        self._entries: dict[str, _CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        agent_name: str,
+        tool: str,
+        loader: Callable[[], ResourceAgentMetadata],
+    ) -> ResourceAgentMetadata:
+        """
+        Get metadata of a pacemaker part from the cache or load them
+
+        agent_name -- name of pacemaker part whose metadata we want to get
+        tool -- path to the tool providing the metadata
+        loader -- loads the metadata by running the tool, errors it raises are
+            propagated and not cached
+        """
+        identity = tool_features.get_tool_identity(tool)
+        if identity is None:
+            # Cannot tell if cached metadata are up to date, do not cache.
+            return loader()
+        with self._lock:
+            self._load_cache_file_if_needed()
+            entry = self._entries.get(agent_name)
+            if entry is not None and entry.identity == identity:
+                return entry.metadata
+        # Do not hold the lock while running the tool. If more threads load
+        # the same metadata, they get the same result anyway.
+        metadata = loader()
+        with self._lock:
+            self._entries[agent_name] = _CacheEntry(identity, metadata)
+            self._save_cache_file()
+        return metadata
+
+    def preload(self) -> None:
+        """
+        Read the cache file, so that the metadata are ready in memory
+        """
+        with self._lock:
+            self._load_cache_file_if_needed()
+
+    def _load_cache_file_if_needed(self) -> None:
+        if self._cache_file_loaded:
+            return
+        self._cache_file_loaded = True
+        if not self._cache_file_path:
+            return
+        try:
+            with open(self._cache_file_path, encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            entries = {
+                str(agent_name): _CacheEntry.from_dict(entry)
+                for agent_name, entry in data.items()
+            }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # The cache is only an optimization. If it cannot be read, the
+            # metadata are loaded from pacemaker again.
+            return
+        self._entries.update(entries)
+
+    def _save_cache_file(self) -> None:
+        if not self._cache_file_path:
+            return
+        data = {
+            agent_name: entry.to_dict()
+            for agent_name, entry in self._entries.items()
+        }
+        with contextlib.suppress(OSError):
+            write_file_atomically(self._cache_file_path, json.dumps(data))
+
+
+_cache = PacemakerMetadataCache(settings.pacemaker_metadata_cache)
+
+
+def get_pacemaker_metadata(
+    agent_name: str, tool: str, loader: Callable[[], ResourceAgentMetadata]
+) -> ResourceAgentMetadata:
+    """
+    Get metadata of a pacemaker part, the metadata are shared by the whole
+    process and stored in a file
+
+    agent_name -- name of pacemaker part whose metadata we want to get
+    tool -- path to the tool providing the metadata
+    loader -- loads the metadata by running the tool
+    """
+    return _cache.get(agent_name, tool, loader)
+
+
+def preload_pacemaker_metadata() -> None:
+    """
+    Read cached pacemaker metadata into memory of the current process
+    """
+    _cache.preload()
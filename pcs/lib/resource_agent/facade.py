@@ -2,12 +2,14 @@ from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import replace as dc_replace
 
+from pcs import settings
 from pcs.common import reports
 from pcs.common.types import StringIterable
 from pcs.lib import validate
 from pcs.lib.external import CommandRunner
 
 from . import const
+from .cache import get_pacemaker_metadata
 from .error import ResourceAgentError, resource_agent_error_to_report_item
 from .name import name_to_void_metadata
 from .ocf_transform import ocf_version_to_ocf_unified
@@ -21,6 +23,7 @@ from .types import (
     ResourceAgentParameter,
 )
 from .xml import (
+    get_fake_agent_executable,
     load_crm_attribute_metadata,
     load_crm_resource_metadata,
     load_fake_agent_metadata,
@@ -256,21 +259,33 @@ class ResourceAgentFacadeFactory:
     def _get_fake_agent_metadata(
         self, agent_name: FakeAgentName
     ) -> ResourceAgentMetadata:
-        return ocf_version_to_ocf_unified(
-            parse_metadata(
-                ResourceAgentName(const.FAKE_AGENT_STANDARD, None, agent_name),
-                load_fake_agent_metadata(self._runner, agent_name),
-            )
+        return get_pacemaker_metadata(
+            agent_name,
+            get_fake_agent_executable(agent_name),
+            lambda: ocf_version_to_ocf_unified(
+                parse_metadata(
+                    ResourceAgentName(
+                        const.FAKE_AGENT_STANDARD, None, agent_name
+                    ),
+                    load_fake_agent_metadata(self._runner, agent_name),
+                )
+            ),
         )
 
     def _get_crm_attribute_metadata(
         self, agent_name: CrmAttrAgent
     ) -> ResourceAgentMetadata:
-        return ocf_version_to_ocf_unified(
-            parse_metadata(
-                ResourceAgentName(const.FAKE_AGENT_STANDARD, None, agent_name),
-                load_crm_attribute_metadata(self._runner, agent_name),
-            )
+        return get_pacemaker_metadata(
+            agent_name,
+            settings.crm_attribute_exec,
+            lambda: ocf_version_to_ocf_unified(
+                parse_metadata(
+                    ResourceAgentName(
+                        const.FAKE_AGENT_STANDARD, None, agent_name
+                    ),
+                    load_crm_attribute_metadata(self._runner, agent_name),
+                )
+            ),
         )
 
     def _get_fenced_parameters(self) -> list[ResourceAgentParameter]:
@@ -332,17 +347,24 @@ def get_crm_resource_metadata(
         agent_name if agent_name != const.STONITH_META else const.PRIMITIVE_META
     )
     parameters_metadata = ocf_unified_to_pcs(
-        ocf_version_to_ocf_unified(
-            parse_metadata(
-                ResourceAgentName(
-                    const.FAKE_AGENT_STANDARD, None, load_agent_name
-                ),
-                load_crm_resource_metadata(runner, load_agent_name),
-            )
+        get_pacemaker_metadata(
+            load_agent_name,
+            settings.crm_resource_exec,
+            lambda: ocf_version_to_ocf_unified(
+                parse_metadata(
+                    ResourceAgentName(
+                        const.FAKE_AGENT_STANDARD, None, load_agent_name
+                    ),
+                    load_crm_resource_metadata(runner, load_agent_name),
+                )
+            ),
         )
     ).parameters
     if agent_name == const.STONITH_META:
-        parameters_metadata += _ADDITIONAL_FENCING_META_ATTRIBUTES
+        # do not modify the list, it may be shared with cached metadata
+        parameters_metadata = (
+            parameters_metadata + _ADDITIONAL_FENCING_META_ATTRIBUTES
+        )
     return parameters_metadata
 
 
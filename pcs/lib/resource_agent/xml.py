@@ -58,13 +58,10 @@ def _load_metadata_xml(
     return stdout.strip()
 
 
-def _load_fake_agent_metadata_xml(
-    runner: CommandRunner, agent_name: FakeAgentName
-) -> str:
+def get_fake_agent_executable(agent_name: FakeAgentName) -> str:
     """
-    Run pacemaker tool to get raw metadata from pacemaker
+    Return path to the pacemaker tool providing metadata of a pacemaker part
 
-    runner -- external processes runner
     agent_name -- name of pacemaker part whose metadata we want to get
     """
     name_to_executable = {
@@ -72,8 +69,20 @@ def _load_fake_agent_metadata_xml(
     }
     if agent_name not in name_to_executable:
         raise UnableToGetAgentMetadata(agent_name, "Unknown agent")
+    return name_to_executable[agent_name]
+
+
+def _load_fake_agent_metadata_xml(
+    runner: CommandRunner, agent_name: FakeAgentName
+) -> str:
+    """
+    Run pacemaker tool to get raw metadata from pacemaker
+
+    runner -- external processes runner
+    agent_name -- name of pacemaker part whose metadata we want to get
+    """
     stdout, stderr, dummy_retval = runner.run(
-        [name_to_executable[agent_name], "metadata"]
+        [get_fake_agent_executable(agent_name), "metadata"]
     )
     metadata = stdout.strip()
     if not metadata:
@@ -3,6 +3,7 @@ import os
 import re
 import stat
 from collections.abc import Mapping
+from functools import partial
 
 from pcs import settings
 from pcs.common import reports
@@ -14,6 +15,7 @@ from pcs.lib import validate
 from pcs.lib.corosync.config_facade import ConfigFacade as CorosyncConfFacade
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
+from pcs.lib.parallel import CollectorPool
 from pcs.lib.tools import dict_to_environment_file, environment_file_to_dict
 
 DEVICE_INITIALIZATION_OPTIONS_MAPPING = {
@@ -26,6 +28,8 @@ DEVICE_INITIALIZATION_OPTIONS_MAPPING = {
 # based on sbd documentation
 _DEFAULT_SBD_WATCHDOG_TIMEOUT = 5
 
+DeviceInfo = dict[str, str | None]
+
 
 class _StonithWatchdogTimeoutValidator(validate.ValuePredicateBase):
     def __init__(
@@ -383,12 +387,16 @@ def _is_device_set_local() -> bool:
     return len(get_local_sbd_device_list()) > 0
 
 
-def get_device_messages_info(cmd_runner: CommandRunner, device: str) -> str:
+def get_device_messages_info(
+    cmd_runner: CommandRunner, device: str, timeout: int | None = None
+) -> str:
     """
     Returns info about messages (string) stored on specified SBD device.
+
+    timeout -- seconds given to reading the device
     """
     std_out, dummy_std_err, ret_val = cmd_runner.run(
-        [settings.sbd_exec, "-d", device, "list"]
+        [settings.sbd_exec, "-d", device, "list"], timeout=timeout
     )
     if ret_val != 0:
         # sbd writes error message into std_out
@@ -400,12 +408,16 @@ def get_device_messages_info(cmd_runner: CommandRunner, device: str) -> str:
     return std_out
 
 
-def get_device_sbd_header_dump(cmd_runner: CommandRunner, device: str) -> str:
+def get_device_sbd_header_dump(
+    cmd_runner: CommandRunner, device: str, timeout: int | None = None
+) -> str:
     """
     Returns header dump (string) of specified SBD device.
+
+    timeout -- seconds given to reading the device
     """
     std_out, dummy_std_err, ret_val = cmd_runner.run(
-        [settings.sbd_exec, "-d", device, "dump"]
+        [settings.sbd_exec, "-d", device, "dump"], timeout=timeout
     )
     if ret_val != 0:
         # sbd writes error message into std_out
@@ -417,6 +429,49 @@ def get_device_sbd_header_dump(cmd_runner: CommandRunner, device: str) -> str:
     return std_out
 
 
+def get_devices_info(
+    cmd_runner: CommandRunner,
+    device_list: StringSequence,
+    dump: bool = False,
+    timeout: int | None = None,
+) -> tuple[list[DeviceInfo], reports.ReportItemList]:
+    """
+    Get messages and optionally header dumps of SBD devices
+
+    Devices are read concurrently, so that slow devices do not wait for each
+    other. Info which cannot be read is None, errors are returned as reports.
+
+    device_list -- paths to the devices
+    dump -- if True, get header dumps as well
+    timeout -- seconds given to each read of a device
+    """
+
+    def read_device(device: str) -> tuple[DeviceInfo, reports.ReportItemList]:
+        info: DeviceInfo = {"device": device, "list": None, "dump": None}
+        try:
+            info["list"] = get_device_messages_info(cmd_runner, device, timeout)
+            if dump:
+                info["dump"] = get_device_sbd_header_dump(
+                    cmd_runner, device, timeout
+                )
+        except LibraryError as e:
+            return info, list(e.args)
+        return info, []
+
+    with CollectorPool(settings.pcs_parallel_collectors_max) as pool:
+        future_list = [
+            pool.submit(str(index), partial(read_device, device))
+            for index, device in enumerate(device_list)
+        ]
+        info_list: list[DeviceInfo] = []
+        report_list: reports.ReportItemList = []
+        for future in future_list:
+            info, device_report_list = future.result()
+            info_list.append(info)
+            report_list.extend(device_report_list)
+    return info_list, report_list
+
+
 def _get_local_sbd_watchdog_timeout() -> int:
     """
     Return the value of SBD_WATCHDOG_TIMEOUT used in local SBD config
@@ -1,8 +1,9 @@
 import os
+import stat
 import tempfile
 import uuid
 from collections.abc import Callable, Generator, Mapping
-from contextlib import AbstractContextManager, contextmanager
+from contextlib import AbstractContextManager, contextmanager, suppress
 from typing import IO, Literal, TypeVar, overload
 
 from pcs.common import reports
@@ -141,3 +142,33 @@ def create_tmp_cib(
         raise LibraryError(
             reports.ReportItem.error(reports.messages.CibSaveTmpError(str(e)))
         ) from e
+
+
+def write_file_atomically(path: str, data: str) -> None:
+    """
+    Write a text file so that other processes never read it partially written
+
+    The data are written to a temporary file in the same directory which then
+    replaces the file. A new file is readable by its owner only, an existing
+    file keeps its mode. Raises OSError.
+
+    Pcs uses this for its caches in pcsd directory. Callers ignore errors, as
+    pcs works without the caches, e.g. when run by a user who cannot write to
+    the directory.
+
+    path -- path to the file
+    data -- content of the file
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(data)
+        # mkstemp creates the file with mode 0600
+        with suppress(FileNotFoundError):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        os.replace(tmp_path, path)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
@@ -14,6 +14,7 @@ from pcs.cli.common.parse_args import (
     InputModifiers,
     KeyValueParser,
 )
+from pcs.common import reports
 
 
 def node_attribute_cmd(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
@@ -104,6 +105,34 @@ def node_standby_cmd(
         lib.node.standby_unstandby_local(enable, wait)
 
 
+def node_rolling_standby_cmd(
+    lib: Any, argv: Argv, modifiers: InputModifiers
+) -> None:
+    """
+    Options:
+      * -f - CIB file, only with --simulate
+      * --force - allow nodes which cannot be put into standby without
+        stopping resources
+      * --simulate - only print planned waves
+    """
+    modifiers.ensure_only_supported("-f", "--force", "--simulate")
+    if modifiers.is_specified("-f") and not modifiers.get("--simulate"):
+        raise CmdLineInputError(
+            "Option -f can only be used together with --simulate"
+        )
+    node_list = [arg for arg in argv if "=" not in arg]
+    options = KeyValueParser([arg for arg in argv if "=" in arg]).get_unique()
+    force_flags = [reports.codes.FORCE] if modifiers.get("--force") else []
+    if not modifiers.get("--simulate"):
+        lib.node.rolling_standby(node_list, options, force_flags=force_flags)
+        return
+    wave_list = lib.node.rolling_standby_plan(
+        node_list, options, force_flags=force_flags
+    )
+    for wave_number, wave in enumerate(wave_list, start=1):
+        print(f"Wave {wave_number}: {' '.join(wave)}")
+
+
 def set_node_utilization(node: str, argv: Argv) -> None:
     """
     Commandline options:
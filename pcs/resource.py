@@ -2552,15 +2552,25 @@ def resource_refresh(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
       * --force - do refresh even though it may be time consuming
+      * --strict - refresh only the specified resource
+      * --staged - refresh all resources on all nodes in waves
     """
-    del lib
     modifiers.ensure_only_supported(
         "--force",
         "--strict",
+        "--staged",
         hint_syntax_changed=(
             "0.11" if modifiers.is_specified("--full") else None
         ),
     )
+    if modifiers.get("--staged"):
+        modifiers.ensure_not_incompatible("--staged", ["--force", "--strict"])
+        if argv and "=" not in argv[0]:
+            raise CmdLineInputError(
+                "Cannot specify a resource when --staged is used"
+            )
+        lib.resource.refresh_staged(KeyValueParser(argv).get_unique())
+        return
     resource = argv.pop(0) if argv and "=" not in argv[0] else None
     parser = KeyValueParser(argv)
     parser.check_allowed_keys({"node"})
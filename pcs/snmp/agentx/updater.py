@@ -43,23 +43,72 @@ class AgentxUpdaterBase(Updater):
           specified str_oid
         """
         oid, oid_cls = _str_oid_to_oid(self.oid_tree, str_oid)
+        if oid_cls.data_type is None:
+            raise AssertionError(
+                "oid '{0}' is not a value, it has no data type".format(str_oid)
+            )
         self.set_typed_value(oid, oid_cls.data_type(value))
 
-    def set_table(self, oid, table):
+    def set_table(self, oid, table, index_size=1):
         """
         oid string -- number form of oid
         table list of list of BaseType -- members of outer list represent rows
           of table and members of inner list are columns.
+        index_size int -- number of leading columns which form the index of
+          a row, they are not set as values
         """
         for row in table:
-            if not row:
-                continue
-            row_id = _str_to_oid(str(row[0].value))
-            for index, col in enumerate(row[1:], start=2):
-                value_oid = "{base_oid}.{index}.{row_id}".format(
-                    base_oid=oid, index=index, row_id=row_id
-                )
-                self._set_val(col.data_type, value_oid, col.value)
+            self.set_raw_values(
+                self.table_row_to_raw_values(oid, row, index_size)
+            )
+
+    @staticmethod
+    def table_row_to_raw_values(oid, row, index_size=1):
+        """
+        Return values of a table row in a form accepted by set_raw_values
+
+        oid string -- number form of oid
+        row list of BaseType -- columns of the row
+        index_size int -- number of leading columns which form the index of
+          the row
+        """
+        if not row:
+            return {}
+        row_id = ".".join(
+            _str_to_oid(str(col.value)) for col in row[:index_size]
+        )
+        raw_values = {}
+        for index, col in enumerate(row[index_size:], start=index_size + 1):
+            value_oid = "{base_oid}.{index}.{row_id}".format(
+                base_oid=oid, index=index, row_id=row_id
+            )
+            raw_values[value_oid] = {
+                "name": value_oid,
+                "type": col.data_type,
+                "value": col.value,
+            }
+        return raw_values
+
+    def get_raw_values(self):
+        """
+        Return all values set so far, they can be set again by set_raw_values
+        """
+        return dict(self._data)
+
+    def set_raw_values(self, raw_values):
+        """
+        raw_values dict -- values obtained by get_raw_values or
+          table_row_to_raw_values
+        """
+        self._data.update(raw_values)
+
+    def get_oid(self, str_oid):
+        """
+        Return number form of oid
+
+        str_oid string -- string form of oid
+        """
+        return _str_oid_to_oid(self.oid_tree, str_oid)[0]
 
 
 def _find_oid_in_sub_tree(sub_tree, section_name):
@@ -72,6 +121,8 @@ def _find_oid_in_sub_tree(sub_tree, section_name):
 
 
 def _str_oid_to_oid(sub_tree, str_oid):
+    # Oids of object identifiers are returned as well as oids of values, e.g.
+    # to be used as base oids of tables. Their Oid has no data_type.
     sections = str_oid.split(".")
     oid_list = []
     for section in sections:
@@ -84,12 +135,9 @@ def _str_oid_to_oid(sub_tree, str_oid):
             )
         oid_list.append(str(sub_tree.oid))
         if sub_tree.data_type:
-            oid = ".".join(oid_list)
-            return (oid, sub_tree)
-    return None
+            break
+    return (".".join(oid_list), sub_tree)
 
 
 def _str_to_oid(data):
-    length = len(data)
-    oid_int = [str(ord(i)) for i in data]
-    return str(length) + "." + ".".join(oid_int)
+    return ".".join([str(len(data))] + [str(ord(i)) for i in data])
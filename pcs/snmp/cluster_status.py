@@ -0,0 +1,267 @@
+"""
+Cluster status provided by the SNMP agent
+
+The status is collected directly from pacemaker and corosync tools, so that
+the agent does not need to run pcsd, which runs the same tools and many more
+to get data the agent does not need.
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from lxml.etree import _Element
+
+from pcs.common import const
+from pcs.common.status_dto import (
+    AnyResourceStatusDto,
+    CloneStatusDto,
+    GroupStatusDto,
+    PrimitiveStatusDto,
+)
+from pcs.lib.corosync import config_parser
+from pcs.lib.corosync.config_facade import ConfigFacade
+from pcs.lib.corosync.live import (
+    QuorumStatusException,
+    QuorumStatusFacade,
+    get_local_corosync_conf,
+    get_quorum_status_text,
+)
+from pcs.lib.errors import LibraryError
+from pcs.lib.external import CommandRunner
+from pcs.lib.pacemaker.live import get_cluster_status_dom
+from pcs.lib.pacemaker.status import (
+    ClusterStatusParser,
+    ClusterStatusParsingError,
+)
+
+RESOURCE_STATUS_RUNNING = "running"
+RESOURCE_STATUS_DISABLED = "disabled"
+RESOURCE_STATUS_FAILED = "failed"
+RESOURCE_STATUS_BLOCKED = "blocked"
+
+# pacemaker score INFINITY, used for INFINITY fail counts
+_INFINITY = 1000000
+
+
+class ClusterStatusError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ResourceInstanceStatus:
+    # status of a resource on one node, node_name is empty for resources not
+    # running anywhere and without failures
+    resource_id: str
+    node_name: str
+    role: str
+    fail_count: int
+
+
+@dataclass(frozen=True)
+class ResourceStatus:
+    resource_id: str
+    # one of RESOURCE_STATUS_* values
+    status: str
+    instance_list: tuple[ResourceInstanceStatus, ...]
+
+
+@dataclass(frozen=True)
+class ClusterStatus:
+    cluster_name: str
+    quorate: bool
+    known_nodes: tuple[str, ...]
+    corosync_nodes_online: tuple[str, ...]
+    corosync_nodes_offline: tuple[str, ...]
+    pacemaker_nodes_online: tuple[str, ...]
+    pacemaker_nodes_standby: tuple[str, ...]
+    pacemaker_nodes_offline: tuple[str, ...]
+    # primitive resources, bundles are not included
+    resource_list: tuple[ResourceStatus, ...]
+
+
+def get_cluster_status(runner: CommandRunner) -> ClusterStatus:
+    """
+    Collect status of the local cluster
+
+    runner -- runs pacemaker and corosync tools
+    """
+    try:
+        status_dom = get_cluster_status_dom(runner)
+        resources_dto = ClusterStatusParser(status_dom).status_xml_to_dto()
+    except (LibraryError, ClusterStatusParsingError) as e:
+        raise ClusterStatusError("Unable to get pacemaker status") from e
+
+    try:
+        corosync_conf = ConfigFacade(
+            config_parser.Parser.parse(get_local_corosync_conf().encode())
+        )
+        cluster_name = corosync_conf.get_cluster_name()
+        corosync_node_list = [
+            node.name for node in corosync_conf.get_nodes() if node.name
+        ]
+    except (LibraryError, config_parser.CorosyncConfParserException) as e:
+        raise ClusterStatusError("Unable to read corosync.conf") from e
+
+    try:
+        corosync_online_set = {
+            node.name
+            for node in QuorumStatusFacade.from_string(
+                get_quorum_status_text(runner)
+            ).node_list
+        }
+    except QuorumStatusException:
+        # corosync is not running
+        corosync_online_set = set()
+
+    corosync_online = [
+        node for node in corosync_node_list if node in corosync_online_set
+    ]
+    corosync_offline = [
+        node for node in corosync_node_list if node not in corosync_online_set
+    ]
+    pcmk_online, pcmk_standby, pcmk_offline = _get_pacemaker_nodes(status_dom)
+    fail_counts = _get_fail_counts(status_dom)
+
+    return ClusterStatus(
+        cluster_name=cluster_name,
+        quorate=_is_quorate(status_dom),
+        known_nodes=tuple(
+            dict.fromkeys(
+                corosync_online
+                + corosync_offline
+                + pcmk_online
+                + pcmk_offline
+                + pcmk_standby
+            )
+        ),
+        corosync_nodes_online=tuple(corosync_online),
+        corosync_nodes_offline=tuple(corosync_offline),
+        pacemaker_nodes_online=tuple(pcmk_online),
+        pacemaker_nodes_standby=tuple(pcmk_standby),
+        pacemaker_nodes_offline=tuple(pcmk_offline),
+        resource_list=tuple(
+            _get_resource_status(resource_id, instance_list, fail_counts)
+            for resource_id, instance_list in _get_primitives(
+                resources_dto.resources
+            ).items()
+        ),
+    )
+
+
+def _is_quorate(status_dom: _Element) -> bool:
+    current_dc = status_dom.find("summary/current_dc")
+    return current_dc is not None and current_dc.get("with_quorum") == "true"
+
+
+def _get_pacemaker_nodes(
+    status_dom: _Element,
+) -> tuple[list[str], list[str], list[str]]:
+    online, standby, offline = [], [], []
+    for node in status_dom.iterfind("nodes/node"):
+        if node.get("type") == "remote":
+            continue
+        name = str(node.get("name", ""))
+        if node.get("online") != "true":
+            offline.append(name)
+        elif node.get("standby") == "true":
+            standby.append(name)
+        else:
+            online.append(name)
+    return online, standby, offline
+
+
+def _get_fail_counts(status_dom: _Element) -> dict[tuple[str, str], int]:
+    fail_counts: dict[tuple[str, str], int] = {}
+    for node in status_dom.iterfind("node_history/node"):
+        for history in node.iterfind("resource_history"):
+            raw_fail_count = str(history.get("fail-count", "0"))
+            if raw_fail_count.upper() == "INFINITY":
+                fail_count = _INFINITY
+            else:
+                try:
+                    fail_count = int(raw_fail_count)
+                except ValueError:
+                    # there are failures, we just do not know how many
+                    fail_count = 1
+            if fail_count <= 0:
+                continue
+            # instances of clones have their instance number in their id
+            key = (
+                str(history.get("id", "")).split(":")[0],
+                str(node.get("name", "")),
+            )
+            fail_counts[key] = min(
+                fail_counts.get(key, 0) + fail_count, _INFINITY
+            )
+    return fail_counts
+
+
+def _get_primitives(
+    resource_list: Iterable[AnyResourceStatusDto], parent_disabled: bool = False
+) -> dict[str, list[tuple[PrimitiveStatusDto, bool]]]:
+    """
+    Return instances of primitive resources and whether their parent resource
+    is disabled, grouped by resource id
+    """
+    primitive_map: dict[str, list[tuple[PrimitiveStatusDto, bool]]] = {}
+    for resource in resource_list:
+        children: Sequence[AnyResourceStatusDto]
+        if isinstance(resource, PrimitiveStatusDto):
+            primitive_map.setdefault(resource.resource_id, []).append(
+                (resource, parent_disabled)
+            )
+            continue
+        if isinstance(resource, GroupStatusDto):
+            children = resource.members
+        elif isinstance(resource, CloneStatusDto):
+            children = resource.instances
+        else:
+            # bundles are not reported by the agent
+            continue
+        for resource_id, instance_list in _get_primitives(
+            children, parent_disabled or resource.disabled
+        ).items():
+            primitive_map.setdefault(resource_id, []).extend(instance_list)
+    return primitive_map
+
+
+def _get_resource_status(
+    resource_id: str,
+    instance_list: Sequence[tuple[PrimitiveStatusDto, bool]],
+    fail_counts: dict[tuple[str, str], int],
+) -> ResourceStatus:
+    if any(
+        parent_disabled or instance.target_role == const.PCMK_ROLE_STOPPED
+        for instance, parent_disabled in instance_list
+    ):
+        status = RESOURCE_STATUS_DISABLED
+    elif any(instance.active for instance, _ in instance_list):
+        status = RESOURCE_STATUS_RUNNING
+    elif any(instance.failed for instance, _ in instance_list):
+        status = RESOURCE_STATUS_FAILED
+    else:
+        status = RESOURCE_STATUS_BLOCKED
+
+    node_role_map: dict[str, str] = {}
+    for instance, _ in instance_list:
+        for node_name in instance.node_names:
+            node_role_map.setdefault(node_name, str(instance.role))
+    for failed_resource_id, node_name in sorted(fail_counts):
+        if failed_resource_id == resource_id:
+            node_role_map.setdefault(node_name, const.PCMK_ROLE_STOPPED)
+    if not node_role_map:
+        node_role_map[""] = const.PCMK_ROLE_STOPPED
+
+    return ResourceStatus(
+        resource_id=resource_id,
+        status=status,
+        instance_list=tuple(
+            ResourceInstanceStatus(
+                resource_id=resource_id,
+                node_name=node_name,
+                role=role,
+                fail_count=fail_counts.get((resource_id, node_name), 0),
+            )
+            for node_name, role in node_role_map.items()
+        ),
+    )
@@ -2,7 +2,13 @@ import logging
 
 from pcs.snmp.agentx.types import IntegerType, Oid, StringType
 from pcs.snmp.agentx.updater import AgentxUpdaterBase
-from pcs.utils import run_pcsdcli
+from pcs.snmp.cluster_status import (
+    RESOURCE_STATUS_DISABLED,
+    RESOURCE_STATUS_RUNNING,
+    ClusterStatusError,
+    get_cluster_status,
+)
+from pcs.utils import cmd_runner
 
 logger = logging.getLogger("pcs.snmp.updaters.v1")
 logger.addHandler(logging.NullHandler())
@@ -36,169 +42,154 @@ _cluster_v1_oid_tree = Oid(
     ],
 )
 
+_resources_v1_oid_tree = Oid(
+    3,
+    "pcmkPcsV1Resources",
+    member_list=[
+        Oid(
+            1,
+            "pcmkPcsV1ResourceTable",
+            member_list=[
+                Oid(
+                    1,
+                    "pcmkPcsV1ResourceEntry",
+                    member_list=[
+                        Oid(1, "pcmkPcsV1ResourceId", StringType),
+                        Oid(2, "pcmkPcsV1ResourceNode", StringType),
+                        Oid(3, "pcmkPcsV1ResourceRole", StringType),
+                        Oid(4, "pcmkPcsV1ResourceStatus", StringType),
+                        Oid(5, "pcmkPcsV1ResourceFailCount", IntegerType),
+                    ],
+                )
+            ],
+        )
+    ],
+)
+
 
 class ClusterPcsV1Updater(AgentxUpdaterBase):
-    _oid_tree = Oid(0, "pcs_v1", member_list=[_cluster_v1_oid_tree])
+    _oid_tree = Oid(
+        0, "pcs_v1", member_list=[_cluster_v1_oid_tree, _resources_v1_oid_tree]
+    )
+
+    def __init__(self):
+        super().__init__()
+        # Status is usually the same in most of the updates. Values are only
+        # computed if the status has changed since the last update, and the
+        # resource table is only computed for resources which have changed.
+        self._last_status = None
+        self._last_raw_values = {}
+        self._resource_raw_values_cache = {}
 
     def update(self):
-        output, ret_val = run_pcsdcli("node_status")
-        if ret_val != 0 or output["status"] != "ok":
-            logger.error(
-                "Unable to obtain cluster status.\nPCSD return code: %s\n"
-                "PCSD output: %s\n",
-                ret_val,
-                output,
-            )
+        try:
+            status = get_cluster_status(cmd_runner())
+        except ClusterStatusError as e:
+            logger.error("Unable to obtain cluster status: %s", e)
+            logger.debug("Cluster status error details: %r", e.__cause__)
             return
-        data = output["data"]
+        if status != self._last_status:
+            self._set_cluster_values(status)
+            self._set_resource_table(status)
+            self._last_status = status
+            self._last_raw_values = self.get_raw_values()
+        else:
+            logger.debug("Cluster status has not changed")
+            self.set_raw_values(self._last_raw_values)
+
+    def _set_cluster_values(self, status):
         self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterName",
-            data.get("cluster_name", ""),
+            "pcmkPcsV1Cluster.pcmkPcsV1ClusterName", status.cluster_name
         )
         self.set_value(
             "pcmkPcsV1Cluster.pcmkPcsV1ClusterQuorate",
-            _bool_to_int(data.get("node", {}).get("quorum")),
+            _bool_to_int(status.quorate),
         )
 
         # nodes
-        known_nodes = data.get("known_nodes", [])
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterNodesNum", len(known_nodes)
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterNodesNames", known_nodes
-        )
-
-        corosync_nodes_online = data.get("corosync_online")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOnlineNum",
-            len(corosync_nodes_online),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOnlineNames",
-            corosync_nodes_online,
-        )
-
-        corosync_nodes_offline = data.get("corosync_offline")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOfflineNum",
-            len(corosync_nodes_offline),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOfflineNames",
-            corosync_nodes_offline,
-        )
-
-        pcmk_nodes_online = data.get("pacemaker_online")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOnlineNum",
-            len(pcmk_nodes_online),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOnlineNames",
-            pcmk_nodes_online,
-        )
-
-        pcmk_nodes_standby = data.get("pacemaker_standby")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesStandbyNum",
-            len(pcmk_nodes_standby),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesStandbyNames",
-            pcmk_nodes_standby,
-        )
-
-        pcmk_nodes_offline = data.get("pacemaker_offline")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOfflineNum",
-            len(pcmk_nodes_offline),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOfflineNames",
-            pcmk_nodes_offline,
-        )
+        for str_oid_part, node_list in (
+            ("Nodes", status.known_nodes),
+            ("CorosyncNodesOnline", status.corosync_nodes_online),
+            ("CorosyncNodesOffline", status.corosync_nodes_offline),
+            ("PcmkNodesOnline", status.pacemaker_nodes_online),
+            ("PcmkNodesStandby", status.pacemaker_nodes_standby),
+            ("PcmkNodesOffline", status.pacemaker_nodes_offline),
+        ):
+            self._set_list(str_oid_part, list(node_list))
 
         # resources
-        primitive_list = []
-        for resource in data.get("resource_list", []):
-            primitive_list.extend(_get_primitives(resource))
-
-        primitive_id_list = _get_resource_id_list(primitive_list)
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterAllResourcesNum",
-            len(primitive_id_list),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterAllResourcesIds",
-            primitive_id_list,
-        )
-        running_primitive_id_list = _get_resource_id_list(
-            primitive_list, _res_in_status(["running"])
-        )
-
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterRunningResourcesNum",
-            len(running_primitive_id_list),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterRunningResourcesIds",
-            running_primitive_id_list,
-        )
-
-        disabled_primitive_id_list = _get_resource_id_list(
-            primitive_list, _res_in_status(["disabled"])
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterStoppedResourcesNum",
-            len(disabled_primitive_id_list),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterStoppedResourcesIds",
-            disabled_primitive_id_list,
-        )
-
-        failed_primitive_id_list = _get_resource_id_list(
-            primitive_list,
-            lambda res: not _res_in_status(["running", "disabled"])(res),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterFailedResourcesNum",
-            len(failed_primitive_id_list),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterFailedResourcesIds",
-            failed_primitive_id_list,
-        )
+        self._set_list(
+            "AllResources",
+            [resource.resource_id for resource in status.resource_list],
+            "Ids",
+        )
+        self._set_list(
+            "RunningResources",
+            [
+                resource.resource_id
+                for resource in status.resource_list
+                if resource.status == RESOURCE_STATUS_RUNNING
+            ],
+            "Ids",
+        )
+        self._set_list(
+            "StoppedResources",
+            [
+                resource.resource_id
+                for resource in status.resource_list
+                if resource.status == RESOURCE_STATUS_DISABLED
+            ],
+            "Ids",
+        )
+        self._set_list(
+            "FailedResources",
+            [
+                resource.resource_id
+                for resource in status.resource_list
+                if resource.status
+                not in (RESOURCE_STATUS_RUNNING, RESOURCE_STATUS_DISABLED)
+            ],
+            "Ids",
+        )
+
+    def _set_list(self, str_oid_part, value_list, names_suffix="Names"):
+        self.set_value(
+            f"pcmkPcsV1Cluster.pcmkPcsV1Cluster{str_oid_part}Num",
+            len(value_list),
+        )
+        self.set_value(
+            f"pcmkPcsV1Cluster.pcmkPcsV1Cluster{str_oid_part}{names_suffix}",
+            value_list,
+        )
+
+    def _set_resource_table(self, status):
+        table_oid = self.get_oid(
+            "pcmkPcsV1Resources.pcmkPcsV1ResourceTable.pcmkPcsV1ResourceEntry"
+        )
+        raw_values_cache = {}
+        for resource in status.resource_list:
+            raw_values = self._resource_raw_values_cache.get(resource)
+            if raw_values is None:
+                raw_values = {}
+                for instance in resource.instance_list:
+                    raw_values.update(
+                        self.table_row_to_raw_values(
+                            table_oid,
+                            [
+                                StringType(instance.resource_id),
+                                StringType(instance.node_name),
+                                StringType(instance.role),
+                                StringType(resource.status),
+                                IntegerType(instance.fail_count),
+                            ],
+                            index_size=2,
+                        )
+                    )
+            raw_values_cache[resource] = raw_values
+            self.set_raw_values(raw_values)
+        # drop resources which are no longer in the cluster
+        self._resource_raw_values_cache = raw_values_cache
 
 
 def _bool_to_int(value):
     return 1 if value else 0
-
-
-def _get_primitives(resource):
-    res_type = resource["class_type"]
-    if res_type == "primitive":
-        return [resource]
-    if res_type == "group":
-        primitive_list = []
-        for primitive in resource["members"]:
-            primitive_list.extend(_get_primitives(primitive))
-        return primitive_list
-    # check master-slave type
-    if res_type in ["clone", "master"]:
-        return _get_primitives(resource["member"])
-    return []
-
-
-def _get_resource_id_list(resource_list, predicate=None):
-    if predicate is None:
-
-        def predicate(_):
-            return True
-
-    return [resource["id"] for resource in resource_list if predicate(resource)]
-
-
-def _res_in_status(status_list):
-    return lambda res: res["status"] in status_list
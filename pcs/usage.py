@@ -403,6 +403,29 @@ _RESOURCE_REFRESH_DESC = (
     """,
 )
 
+_RESOURCE_REFRESH_STAGED_SYNTAX = _unwrap(
+    """
+    --staged [stage-by=node|resource] [concurrency=<number>]
+    [timeout=<time>]
+    """
+)
+_RESOURCE_REFRESH_STAGED_DESC = (
+    """
+    Make the cluster forget the complete operation history of all resources /
+    stonith devices on all nodes in waves instead of all at once, which may
+    overload big clusters. If stage-by is 'node' (the default), all resources /
+    stonith devices are refreshed on 'concurrency' nodes in each wave. If
+    stage-by is 'resource', 'concurrency' resources / stonith devices are
+    refreshed on all nodes in each wave. Concurrency defaults to 1.
+    """,
+    "",
+    """
+    After each wave, wait for the cluster to settle down before starting the
+    next one. If timeout is specified, wait up to the specified time for each
+    wave and stop the refresh if the cluster does not settle down in time.
+    """,
+)
+
 _RESOURCE_FAILCOUNT_CMD = "failcount"
 _RESOURCE_FAILCOUNT_SHOW_SYNTAX = _unwrap(
     """
@@ -1271,6 +1294,9 @@ Commands:
 {refresh_syntax}
 {refresh_desc}
 
+{refresh_staged_syntax}
+{refresh_staged_desc}
+
 {failcount_show_syntax}
 {failcount_show_desc}
 
@@ -1372,6 +1398,10 @@ Notes:
             f"{_RESOURCE_REFRESH_CMD} {_RESOURCE_REFRESH_SYNTAX}"
         ),
         refresh_desc=_format_desc(_RESOURCE_REFRESH_DESC),
+        refresh_staged_syntax=_format_syntax(
+            f"{_RESOURCE_REFRESH_CMD} {_RESOURCE_REFRESH_STAGED_SYNTAX}"
+        ),
+        refresh_staged_desc=_format_desc(_RESOURCE_REFRESH_STAGED_DESC),
         failcount_show_syntax=_format_syntax(
             f"{_RESOURCE_FAILCOUNT_CMD} {_RESOURCE_FAILCOUNT_SHOW_SYNTAX}"
         ),
@@ -2115,6 +2145,9 @@ Commands:
 {refresh_syntax}
 {refresh_desc}
 
+{refresh_staged_syntax}
+{refresh_staged_desc}
+
 {failcount_show_syntax}
 {failcount_show_desc}
 
@@ -2294,6 +2327,13 @@ Commands:
             (_alias_of(f"resource {_RESOURCE_REFRESH_CMD}"),)
             + _RESOURCE_REFRESH_DESC
         ),
+        refresh_staged_syntax=_format_syntax(
+            f"{_RESOURCE_REFRESH_CMD} {_RESOURCE_REFRESH_STAGED_SYNTAX}"
+        ),
+        refresh_staged_desc=_format_desc(
+            (_alias_of(f"resource {_RESOURCE_REFRESH_CMD}"),)
+            + _RESOURCE_REFRESH_STAGED_DESC
+        ),
         failcount_show_syntax=_format_syntax(
             f"{_RESOURCE_FAILCOUNT_CMD} {_RESOURCE_FAILCOUNT_SHOW_SYNTAX}"
         ),
@@ -2676,6 +2716,17 @@ Commands:
     disable
         Disable access control lists.
 
+    effective (user <username> [<group>]...) | (group <group>)
+        Show access of the specified user or group to the CIB as pacemaker
+        evaluates it from their roles. Groups of the user have to be specified,
+        as pcs cannot tell which groups the user is a member of. Listed are CIB
+        elements matched by the permissions together with the resulting access
+        and the permissions deciding it. Elements enclosed in a listed element
+        have the same access unless listed as well. The CIB is denied unless
+        a permission says otherwise. Users root and hacluster, as well as all
+        users when ACLs are disabled, are not restricted by ACLs and can write
+        to the whole CIB.
+
     role create <role id> [description=<description>]
             [((read | write | deny) (xpath <query> | id <id>))...]
         Create a role with the id and (optional) description specified. Each
@@ -2972,6 +3023,35 @@ Commands:
     query resource <resource-id> get-index-in-group
         Get an index of the resource in a group. The first resource in a group
         has an index of 0. Usable only for resources that are in a group.
+
+    query resource <resource-id> wait-until <query> [<query arguments>]
+            [--wait[=n]] [--quiet]
+        Wait until the query evaluates to true. Any query checking a condition
+        of the resource can be used, e.g. 'exists' or 'is-state'. The status of
+        resources is evaluated again only when the cluster status changes. If
+        'n' is specified, wait at most 'n' seconds, otherwise wait until the
+        query evaluates to true.
+        Example: Wait up to 5 minutes for a resource to be started on node1
+            pcs status query resource resource_id wait-until is-state started \\
+                on-node node1 --wait=300
+
+        Print 'True' and exit with 0 if the query evaluates to true. Exit with
+        1 if an error occurs while performing the query. Print 'False' and exit
+        with 2 if the query has not evaluated to true in time.
+        {quiet_flag}
+
+    query batch [<file>]
+        Evaluate several resource queries against a single snapshot of the
+        cluster status. Queries are read from the file or from the standard
+        input if the file is not specified or it is '-'. Each line contains one
+        query in the form 'resource <resource-id> <query> [<query arguments>]'.
+        Empty lines and lines starting with '#' are ignored.
+
+        Print a JSON list containing the query, its result, the value returned
+        by the query and an error message for each of the queries. Exit with 0
+        if all the queries succeeded and none of them evaluated to false. Exit
+        with 1 if an error occurred while performing any of the queries. Exit
+        with 2 otherwise.
 """.format(
         query_return=_QUERY_RETURN_VALUE,
         quiet_flag=_QUERY_QUIET_FLAG,
@@ -2995,6 +3075,10 @@ Commands:
     backup [filename]
         Creates the tarball containing the cluster configuration files.
         If filename is not specified the standard output will be used.
+        The tarball is compressed by gzip if filename ends with .tar.gz or
+        .tgz, by xz if it ends with .tar.xz, and by bzip2 otherwise. The
+        .tar.bz2 extension is appended to filename not ending with any of
+        these extensions.
 
     restore [--local] [filename]
         Restores the cluster configuration files on all nodes from the backup.
@@ -3008,9 +3092,16 @@ Commands:
     checkpoint view <checkpoint_number>
         Show specified configuration checkpoint.
 
-    checkpoint diff <checkpoint_number> <checkpoint_number>
+    checkpoint diff <checkpoint_number> <checkpoint_number> [--brief]
         Show differences between the two specified checkpoints. Use checkpoint
         number 'live' to compare a checkpoint to the current live configuration.
+        If --brief is specified, only list elements which have been created
+        (+), changed (~) or removed (-).
+
+    checkpoint log <element id>
+        List checkpoints in which the specified element has been created,
+        changed or removed. Changes of the element include changes of its
+        descendants.
 
     checkpoint restore <checkpoint_number>
         Restore cluster configuration to specified checkpoint.
@@ -3121,6 +3212,24 @@ Commands:
         the operation not succeeded yet. If 'n' is not specified it defaults
         to 60 minutes.
 
+    rolling-standby [<node>...] [max-wave-size=<number>] [timeout=<time>]
+            [--simulate] [--force]
+        Put specified nodes, or all online nodes not in standby mode if no
+        nodes are specified, into standby mode in waves. After the nodes of
+        a wave are put into standby mode, wait for their resources to move
+        away. The nodes are left in standby mode for their maintenance. Once
+        the maintenance is done, remove the nodes from standby mode. The next
+        wave is started when all the nodes of the previous wave are online and
+        out of standby mode. The nodes of the last wave are left in standby
+        mode. If timeout is specified, wait up to the specified time for the
+        cluster to settle down after putting each wave into standby mode.
+        Waves are planned by simulating the effects of standby mode on the
+        cluster, so that each wave contains as many nodes as possible, up to
+        max-wave-size, while no resources are left stopped. Nodes which cannot
+        be put into standby mode without stopping resources are refused unless
+        --force is specified, in which case each of them forms a wave of its
+        own. If --simulate is specified, only print the planned waves.
+
     utilization [[<node>] [--name <name>] | ({output_format_syntax})
             | <node> <name>=<value> ...]
         Add specified utilization options to specified node.  If node is not
@@ -3524,9 +3633,12 @@ Commands:
     config
         Display disaster-recovery configuration from the local node.
 
-    status [--full] [--hide-inactive]
+    status [--full] [--hide-inactive] [--request-timeout=<seconds>]
         Display status of the local and the remote site cluster (--full
         provides more details, --hide-inactive hides inactive resources).
+        A site which does not provide its status in 30 seconds is reported
+        as unavailable. If sites take longer to respond, consider setting
+        --request-timeout to a suitable value.
 
     set-recovery-site <recovery site node>
         Set up disaster-recovery with the local cluster being the primary site.
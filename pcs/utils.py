@@ -16,7 +16,7 @@ from functools import lru_cache
 from io import BytesIO
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, cast
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 from xml.dom.minidom import Document as DomDocument
 from xml.dom.minidom import parseString
 
@@ -477,13 +477,21 @@ def destroyCluster(node, quiet=False):
     )
 
 
-def restoreConfig(node, tarball_data):
+def restoreConfig(node, tarball_form):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
+
+    tarball_form -- UrlencodedFileForm holding the tarball
     """
-    data = urlencode({"tarball": tarball_data})
-    return sendHTTPRequest(node, "remote/config_restore", data, False, True)
+    return sendHTTPRequest(
+        node,
+        "remote/config_restore",
+        None,
+        False,
+        False,
+        file_form=tarball_form,
+    )
 
 
 def pauseConfigSyncing(node, delay_seconds=300):
@@ -495,6 +503,63 @@ def pauseConfigSyncing(node, delay_seconds=300):
     return sendHTTPRequest(node, "remote/set_sync_options", data, False, False)
 
 
+class UrlencodedFileForm:
+    """
+    Urlencoded form with a single field holding content of a file
+
+    The content is read and encoded in chunks while being sent, so that only
+    a chunk of the file is held in memory at a time regardless of the file
+    size. The form may be sent to several nodes at the same time, each request
+    reads the file at its own position.
+    """
+
+    _CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, field_name, data_file):
+        """
+        field_name -- name of the form field
+        data_file -- binary file backed by a file descriptor, e.g. a regular
+            or a temporary file
+        """
+        self._prefix = f"{quote_plus(field_name)}=".encode("ascii")
+        self._fileno = data_file.fileno()
+        self.size = len(self._prefix) + sum(
+            len(quote_plus(chunk)) for chunk in self._read_chunks()
+        )
+
+    def _read_chunks(self):
+        offset = 0
+        while True:
+            chunk = os.pread(self._fileno, self._CHUNK_SIZE, offset)
+            if not chunk:
+                return
+            offset += len(chunk)
+            yield chunk
+
+    def get_read_function(self):
+        """
+        Return a function providing the encoded form from its beginning
+
+        The function has the signature required by pycurl.READFUNCTION, it
+        returns at most the requested number of bytes and an empty bytes
+        object once the whole form has been read.
+        """
+        offset = 0
+        prefix_sent = False
+
+        def read(size):
+            nonlocal offset, prefix_sent
+            if not prefix_sent:
+                prefix_sent = True
+                return self._prefix
+            # each byte is encoded to at most 3 characters
+            chunk = os.pread(self._fileno, max(1, size // 3), offset)
+            offset += len(chunk)
+            return quote_plus(chunk).encode("ascii")
+
+        return read
+
+
 # Send an HTTP request to a node return a tuple with status, data
 # If status is 0 then data contains server response
 # Otherwise if non-zero then data contains error message
@@ -505,12 +570,21 @@ def pauseConfigSyncing(node, delay_seconds=300):
 # 3 = Auth Error
 # 4 = Permission denied
 def sendHTTPRequest(  # noqa: PLR0912, PLR0915
-    host, request, data=None, printResult=True, printSuccess=True, timeout=None
+    host,
+    request,
+    data=None,
+    printResult=True,
+    printSuccess=True,
+    timeout=None,
+    *,
+    file_form=None,
 ):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
       * --debug
+
+    file_form -- UrlencodedFileForm sent in chunks instead of data
     """
     port = None
     addr = host
@@ -565,7 +639,11 @@ def sendHTTPRequest(  # noqa: PLR0912, PLR0915
     handler.setopt(pycurl.HTTPHEADER, ["Expect: "])
     if cookies:
         handler.setopt(pycurl.COOKIE, ";".join(cookies).encode("utf-8"))
-    if data:
+    if file_form is not None:
+        handler.setopt(pycurl.POST, 1)
+        handler.setopt(pycurl.POSTFIELDSIZE_LARGE, file_form.size)
+        handler.setopt(pycurl.READFUNCTION, file_form.get_read_function())
+    elif data:
         handler.setopt(pycurl.COPYPOSTFIELDS, data.encode("utf-8"))
     try:
         handler.perform()
@@ -1984,27 +2062,30 @@ def stop_service(service):
         raise LibraryError(service_exception_to_report(e)) from e
 
 
-def write_file(path, data, permissions=0o644, binary=False):
+def open_file_for_writing(path, permissions=0o644, binary=False):
     """
     Commandline options:
       * --force - overwrite a file if it already exists
+
+    Return a tuple of an opened file or None and an error message
     """
     if os.path.exists(path):
         if "--force" not in pcs_options:
-            return False, "'%s' already exists, use --force to overwrite" % path
+            return None, "'%s' already exists, use --force to overwrite" % path
         try:
             os.remove(path)
         except OSError as e:
-            return False, "unable to remove '%s': %s" % (path, e)
+            return None, "unable to remove '%s': %s" % (path, e)
     mode = "wb" if binary else "w"
     try:
-        with os.fdopen(
-            os.open(path, os.O_WRONLY | os.O_CREAT, permissions), mode
-        ) as outfile:
-            outfile.write(data)
+        return (
+            os.fdopen(
+                os.open(path, os.O_WRONLY | os.O_CREAT, permissions), mode
+            ),
+            "",
+        )
     except OSError as e:
-        return False, "unable to write to '%s': %s" % (path, e)
-    return True, ""
+        return None, "unable to write to '%s': %s" % (path, e)
 
 
 def tar_add_file_data(  # noqa: PLR0913
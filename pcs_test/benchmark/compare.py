@@ -0,0 +1,59 @@
+"""
+Compare results of benchmarks from two commits
+
+Usage: python3 -m pcs_test.benchmark.compare <old results> <new results>
+
+Both files contain json lines printed by benchmark modules. For each scenario
+present in both files, the ratio of new to old time and peak memory is printed.
+Ratios lower than 1 mean the new commit is faster or needs less memory.
+"""
+
+import json
+import sys
+from collections.abc import Iterator
+
+from pcs_test.benchmark.tools import BenchmarkResult
+
+
+def _load_results(path: str) -> dict[str, BenchmarkResult]:
+    results = {}
+    with open(path, encoding="utf-8") as results_file:
+        for line in results_file:
+            if line.strip():
+                result = BenchmarkResult(**json.loads(line))
+                results[result.name] = result
+    return results
+
+
+def _ratio(old: float, new: float) -> str:
+    return f"{new / old:.2f}" if old else "-"
+
+
+def compare(
+    old_results: dict[str, BenchmarkResult],
+    new_results: dict[str, BenchmarkResult],
+) -> Iterator[str]:
+    yield f"{'scenario':<48} {'old [s]':>12} {'new [s]':>12} {'time':>6} {'memory':>6}"
+    for name, new in new_results.items():
+        old = old_results.get(name)
+        if old is None:
+            continue
+        yield (
+            f"{name:<48} {old.seconds:>12.6f} {new.seconds:>12.6f} "
+            f"{_ratio(old.seconds, new.seconds):>6} "
+            f"{_ratio(old.peak_memory, new.peak_memory):>6}"
+        )
+
+
+def main(argv: list[str]) -> None:
+    try:
+        old_path, new_path = argv
+    except ValueError:
+        print(__doc__.strip(), file=sys.stderr)
+        raise SystemExit(1) from None
+    for line in compare(_load_results(old_path), _load_results(new_path)):
+        print(line)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,61 @@
+"""
+Benchmark of parsing, editing and exporting corosync.conf
+
+A generated corosync.conf of a knet cluster with hundreds of nodes, each of
+them having 8 links, is used.
+"""
+
+import itertools
+from collections.abc import Iterator
+
+from pcs.lib.corosync.config_facade import ConfigFacade
+from pcs.lib.corosync.config_parser import Exporter, Parser
+
+from pcs_test.benchmark.generators import corosync_conf
+from pcs_test.benchmark.tools import BenchmarkResult, measure, print_results
+
+NODE_COUNT_LIST = (100, 500)
+LINK_COUNT = 8
+
+
+def _edit_one_node(nodes: int) -> Iterator[BenchmarkResult]:
+    config = Parser.parse(corosync_conf(nodes, LINK_COUNT).encode())
+    node_section = config.get_sections("nodelist")[0].get_sections("node")[-1]
+    Exporter.export(config)
+    address_cycle = itertools.cycle(["10.255.0.1", "10.255.0.2"])
+
+    def edit_and_export() -> None:
+        node_section.set_attribute("ring0_addr", next(address_cycle))
+        Exporter.export(config)
+
+    yield measure(f"corosync_conf.edit_one_node.{nodes}", edit_and_export)
+
+
+def _measure(nodes: int) -> Iterator[BenchmarkResult]:
+    conf = corosync_conf(nodes, LINK_COUNT).encode()
+    yield measure(f"corosync_conf.parse.{nodes}", lambda: Parser.parse(conf))
+    yield measure(
+        f"corosync_conf.parse_export.{nodes}",
+        lambda: Exporter.export(Parser.parse(conf)),
+    )
+    yield from _edit_one_node(nodes)
+
+    def remove_half_of_nodes() -> None:
+        facade = ConfigFacade(Parser.parse(conf))
+        facade.remove_nodes(
+            {node.name for node in facade.get_nodes()[::2] if node.name}
+        )
+        Exporter.export(facade.config)
+
+    yield measure(
+        f"corosync_conf.remove_half_of_nodes.{nodes}", remove_half_of_nodes
+    )
+
+
+def run() -> Iterator[BenchmarkResult]:
+    for nodes in NODE_COUNT_LIST:
+        yield from _measure(nodes)
+
+
+if __name__ == "__main__":
+    print_results(run())
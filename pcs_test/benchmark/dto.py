@@ -0,0 +1,113 @@
+"""
+Benchmark of converting transfer objects from and to dictionaries
+
+Compiled codecs from pcs.common.interface.dto are compared to dacite and
+dataclasses.asdict on real transfer objects.
+"""
+
+import json
+from collections.abc import Iterator
+from dataclasses import asdict
+from typing import Any
+
+import dacite
+from lxml import etree
+
+from pcs.common.interface.dto import (
+    DTO_TYPE_HOOKS_MAP,
+    DataTransferObject,
+    from_dict,
+    to_dict,
+)
+from pcs.common.reports import ReportItem, ReportItemList, messages
+from pcs.common.resource_agent.dto import (
+    ListResourceAgentNameDto,
+    ResourceAgentNameDto,
+)
+from pcs.lib.pacemaker.status import ClusterStatusParser
+
+from pcs_test.benchmark.tools import BenchmarkResult, measure, print_results
+from pcs_test.tools.misc import read_test_resource
+from pcs_test.tools.resources_dto import ALL_RESOURCES
+
+
+def _fixture_report_list() -> ReportItemList:
+    return [
+        ReportItem.error(messages.IdNotFound(f"resource{i}", ["primitive"]))
+        for i in range(100)
+    ] + [
+        ReportItem.warning(
+            messages.ResourceOperationIntervalDuplication(
+                {"monitor": [["10s", "10"], ["20s", "20"]]}
+            ),
+        )
+        for i in range(100)
+    ]
+
+
+def _fixture_dto_list() -> list[DataTransferObject]:
+    return [
+        ALL_RESOURCES,
+        ClusterStatusParser(
+            etree.fromstring(read_test_resource("crm_mon.all_resources.xml"))
+        ).status_xml_to_dto(),
+        ListResourceAgentNameDto(
+            [
+                ResourceAgentNameDto("ocf", f"provider{i % 10}", f"agent{i}")
+                for i in range(1000)
+            ]
+        ),
+        *[report.to_dto() for report in _fixture_report_list()],
+    ]
+
+
+def _dacite_from_dict(cls: type[Any], payload: dict[str, Any]) -> Any:
+    return dacite.from_dict(
+        cls, payload, dacite.Config(type_hooks=DTO_TYPE_HOOKS_MAP)
+    )
+
+
+def _get_payload(dto: DataTransferObject) -> dict[str, Any]:
+    payload = to_dict(dto)
+    json_payload = json.loads(json.dumps(payload))
+    try:
+        _dacite_from_dict(type(dto), json_payload)
+        return json_payload
+    except (dacite.DaciteError, ValueError):
+        # Some transfer objects, e.g. status of resources, contain enums
+        # which are not converted from their json values.
+        return payload
+
+
+def _measure_class(
+    cls: type[Any], dto_list: list[DataTransferObject]
+) -> Iterator[BenchmarkResult]:
+    payload_list = [_get_payload(dto) for dto in dto_list]
+    yield measure(
+        f"from_dict.{cls.__name__}",
+        lambda: [from_dict(cls, payload) for payload in payload_list],
+    )
+    yield measure(
+        f"from_dict.dacite.{cls.__name__}",
+        lambda: [_dacite_from_dict(cls, payload) for payload in payload_list],
+    )
+    yield measure(
+        f"to_dict.{cls.__name__}",
+        lambda: [to_dict(dto) for dto in dto_list],
+    )
+    yield measure(
+        f"to_dict.asdict.{cls.__name__}",
+        lambda: [asdict(dto) for dto in dto_list],
+    )
+
+
+def run() -> Iterator[BenchmarkResult]:
+    dto_map: dict[type[Any], list[DataTransferObject]] = {}
+    for dto in _fixture_dto_list():
+        dto_map.setdefault(type(dto), []).append(dto)
+    for cls, dto_list in dto_map.items():
+        yield from _measure_class(cls, dto_list)
+
+
+if __name__ == "__main__":
+    print_results(run())
@@ -0,0 +1,98 @@
+"""
+Benchmark of pcsd web UI sessions and async tasks under load
+
+Cost of a single request is measured with 10000 sessions and 10000 tasks
+already present in pcsd.
+"""
+
+import asyncio
+import itertools
+import os
+import queue
+import random
+from collections.abc import Iterator
+from unittest import mock
+
+from pcs.common.async_tasks.dto import CommandDto, CommandOptionsDto
+from pcs.common.async_tasks.types import TaskFinishType
+from pcs.daemon.app.webui.session import Storage
+from pcs.daemon.async_tasks import scheduler
+from pcs.daemon.async_tasks.types import Command
+from pcs.daemon.async_tasks.worker.types import (
+    Message,
+    TaskExecuted,
+    TaskFinished,
+)
+from pcs.lib.auth.types import AuthUser
+
+from pcs_test.benchmark.tools import BenchmarkResult, measure, print_results
+
+SESSION_COUNT = 10000
+TASK_COUNT = 10000
+AUTH_USER = AuthUser("hacluster", ("haclient",))
+
+
+def _measure_sessions() -> Iterator[BenchmarkResult]:
+    storage = Storage(lifetime_seconds=3600)
+    sid_list = [storage.login(f"user{i}").sid for i in range(SESSION_COUNT)]
+    sid_cycle = itertools.cycle(random.sample(sid_list, len(sid_list)))
+    yield measure("session.get", lambda: storage.get(next(sid_cycle)))
+
+    def login_logout() -> None:
+        storage.destroy(storage.login("user").sid)
+
+    yield measure("session.login", login_logout)
+
+
+def _new_task(task_scheduler: scheduler.Scheduler) -> str:
+    return task_scheduler.new_task(
+        Command(CommandDto("command", {}, CommandOptionsDto())), AUTH_USER
+    )
+
+
+def _measure_tasks() -> Iterator[BenchmarkResult]:
+    worker_message_q: queue.Queue[Message] = queue.Queue()
+    # do not start any processes, tasks are not executed
+    with (
+        mock.patch("multiprocessing.Manager") as mock_manager,
+        mock.patch("multiprocessing.Pool"),
+    ):
+        mock_manager.return_value.Queue.side_effect = [
+            worker_message_q,
+            queue.Queue(),
+        ]
+        task_scheduler = scheduler.Scheduler(
+            scheduler.SchedulerConfig(worker_count=1)
+        )
+    loop = asyncio.new_event_loop()
+    try:
+        task_ident_list = [_new_task(task_scheduler) for _ in range(TASK_COUNT)]
+        # half of the tasks have finished and wait for their results to be
+        # fetched, the other half waits for a free worker
+        for task_ident in task_ident_list[::2]:
+            worker_message_q.put(
+                Message(task_ident, TaskExecuted(worker_pid=os.getpid()))
+            )
+            worker_message_q.put(
+                Message(task_ident, TaskFinished(TaskFinishType.SUCCESS, None))
+            )
+        loop.run_until_complete(task_scheduler.perform_actions())
+        loop.run_until_complete(task_scheduler.perform_actions())
+
+        yield measure(
+            "task.perform_actions",
+            lambda: loop.run_until_complete(task_scheduler.perform_actions()),
+        )
+        yield measure("task.new_task", lambda: _new_task(task_scheduler))
+    finally:
+        loop.close()
+        task_scheduler.terminate_nowait()
+
+
+def run() -> Iterator[BenchmarkResult]:
+    yield from _measure_sessions()
+    yield from _measure_tasks()
+
+
+if __name__ == "__main__":
+    print_results(run())
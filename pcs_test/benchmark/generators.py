@@ -0,0 +1,392 @@
+"""
+Generators of cluster configuration and status for benchmarks
+
+Fixtures shipped in pcs_test/resources have a fixed size. The generators build
+a CIB, a matching crm_mon status and a corosync.conf of any size, so that it
+can be measured how pcs scales with the size of a cluster.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ClusterLayout:
+    nodes: int = 3
+    # standalone primitive resources
+    primitives: int = 10
+    groups: int = 0
+    # number of primitives in each group
+    group_size: int = 3
+    clones: int = 0
+    bundles: int = 0
+    # location, colocation and order constraints of standalone primitives, in
+    # turns
+    constraints: int = 0
+    # location constraints with rules
+    rules: int = 0
+    tags: int = 0
+    # number of primitives referenced by each tag
+    tag_size: int = 5
+    # one stonith device per node is created if there are any levels
+    fencing_levels: int = 0
+
+
+_STATUS_RESOURCE_ATTRS = (
+    'orphaned="false" removed="false" blocked="false" maintenance="false" '
+    'managed="true" failed="false" failure_ignored="false"'
+)
+_STATUS_COLLECTION_ATTRS = (
+    'unique="false" maintenance="false" managed="true" disabled="false" '
+    'failed="false" failure_ignored="false"'
+)
+
+
+def _node_name(index: int) -> str:
+    return f"node{index + 1}"
+
+
+def _primitive_ids(layout: ClusterLayout) -> list[str]:
+    return [f"R{i}" for i in range(layout.primitives)]
+
+
+def _fence_ids(layout: ClusterLayout) -> list[str]:
+    if not layout.fencing_levels:
+        return []
+    return [f"fence-{_node_name(i)}" for i in range(layout.nodes)]
+
+
+def _cib_primitive(resource_id: str, agent: str = "ocf:pcsmock:params") -> str:
+    standard, *provider, agent_type = agent.split(":")
+    provider_attr = f'provider="{provider[0]}"' if provider else ""
+    return f"""
+        <primitive id="{resource_id}" class="{standard}" {provider_attr}
+            type="{agent_type}"
+        >
+            <instance_attributes id="{resource_id}-instance_attributes">
+                <nvpair id="{resource_id}-instance_attributes-mandatory"
+                    name="mandatory" value="{resource_id}"
+                />
+            </instance_attributes>
+            <meta_attributes id="{resource_id}-meta_attributes">
+                <nvpair id="{resource_id}-meta_attributes-target-role"
+                    name="target-role" value="Started"
+                />
+            </meta_attributes>
+            <operations>
+                <op id="{resource_id}-monitor-interval-10s" name="monitor"
+                    interval="10s" timeout="20s"
+                />
+                <op id="{resource_id}-start-interval-0s" name="start"
+                    interval="0s" timeout="20s"
+                />
+                <op id="{resource_id}-stop-interval-0s" name="stop"
+                    interval="0s" timeout="20s"
+                />
+            </operations>
+        </primitive>
+    """
+
+
+def _cib_resources(layout: ClusterLayout) -> Iterator[str]:
+    for resource_id in _primitive_ids(layout):
+        yield _cib_primitive(resource_id)
+    for resource_id in _fence_ids(layout):
+        yield _cib_primitive(resource_id, "stonith:fence_pcsmock_minimal")
+    for i in range(layout.groups):
+        members = "".join(
+            _cib_primitive(f"G{i}-R{j}") for j in range(layout.group_size)
+        )
+        yield f'<group id="G{i}">{members}</group>'
+    for i in range(layout.clones):
+        yield f'<clone id="C{i}-clone">{_cib_primitive(f"C{i}")}</clone>'
+    for i in range(layout.bundles):
+        yield f"""
+            <bundle id="B{i}">
+                <docker image="pcs:test" replicas="1"/>
+                <network control-port="{9000 + i}"/>
+                {_cib_primitive(f"B{i}-R")}
+            </bundle>
+        """
+
+
+def _cib_constraints(layout: ClusterLayout) -> Iterator[str]:
+    primitive_ids = _primitive_ids(layout)
+    if not primitive_ids:
+        return
+    for i in range(layout.constraints):
+        resource = primitive_ids[i % len(primitive_ids)]
+        other = primitive_ids[(i + 1) % len(primitive_ids)]
+        kind = i % 3
+        if kind == 0:
+            yield f"""
+                <rsc_location id="location-{i}" rsc="{resource}"
+                    node="{_node_name(i % layout.nodes)}" score="INFINITY"
+                />
+            """
+        elif kind == 1:
+            yield f"""
+                <rsc_colocation id="colocation-{i}" rsc="{resource}"
+                    with-rsc="{other}" score="INFINITY"
+                />
+            """
+        else:
+            yield f"""
+                <rsc_order id="order-{i}" first="{resource}"
+                    first-action="start" then="{other}" then-action="start"
+                />
+            """
+    for i in range(layout.rules):
+        resource = primitive_ids[i % len(primitive_ids)]
+        yield f"""
+            <rsc_location id="location-rule-{i}" rsc="{resource}">
+                <rule id="location-rule-{i}-rule" boolean-op="and"
+                    score="INFINITY"
+                >
+                    <expression id="location-rule-{i}-rule-expr"
+                        attribute="#uname" operation="eq"
+                        value="{_node_name(i % layout.nodes)}"
+                    />
+                    <date_expression id="location-rule-{i}-rule-expr-1"
+                        operation="gt" start="2020-01-01"
+                    />
+                </rule>
+            </rsc_location>
+        """
+
+
+def _cib_tags(layout: ClusterLayout) -> Iterator[str]:
+    primitive_ids = _primitive_ids(layout)
+    if not primitive_ids:
+        return
+    for i in range(layout.tags):
+        refs = "".join(
+            f'<obj_ref id="{primitive_ids[(i + j) % len(primitive_ids)]}"/>'
+            for j in range(min(layout.tag_size, len(primitive_ids)))
+        )
+        yield f'<tag id="T{i}">{refs}</tag>'
+
+
+def _cib_fencing_levels(layout: ClusterLayout) -> Iterator[str]:
+    for i in range(layout.fencing_levels):
+        node = _node_name(i % layout.nodes)
+        index = i // layout.nodes + 1
+        yield f"""
+            <fencing-level id="fl-{node}-{index}" target="{node}"
+                index="{index}" devices="fence-{node}"
+            />
+        """
+
+
+def cib_xml(layout: ClusterLayout) -> str:
+    """
+    Get a CIB containing resources, constraints, tags and fencing levels as
+    specified by the layout
+    """
+    nodes = "".join(
+        f'<node id="{i + 1}" uname="{_node_name(i)}"/>'
+        for i in range(layout.nodes)
+    )
+    return f"""
+        <cib epoch="1" num_updates="0" admin_epoch="0"
+            validate-with="pacemaker-3.9" crm_feature_set="3.17.4"
+            update-origin="node1" update-client="cibadmin" have-quorum="1"
+            dc-uuid="1"
+        >
+            <configuration>
+                <crm_config>
+                    <cluster_property_set id="cib-bootstrap-options">
+                        <nvpair id="cib-bootstrap-options-cluster-name"
+                            name="cluster-name" value="benchmark"
+                        />
+                    </cluster_property_set>
+                </crm_config>
+                <nodes>{nodes}</nodes>
+                <resources>{"".join(_cib_resources(layout))}</resources>
+                <constraints>{"".join(_cib_constraints(layout))}</constraints>
+                <fencing-topology>
+                    {"".join(_cib_fencing_levels(layout))}
+                </fencing-topology>
+                <tags>{"".join(_cib_tags(layout))}</tags>
+            </configuration>
+            <status/>
+        </cib>
+    """
+
+
+def _status_primitive(
+    resource_id: str, node_index: int, agent: str = "ocf:pcsmock:params"
+) -> str:
+    node = _node_name(node_index)
+    return f"""
+        <resource id="{resource_id}" resource_agent="{agent}" role="Started"
+            target_role="Started" active="true" {_STATUS_RESOURCE_ATTRS}
+            nodes_running_on="1"
+        >
+            <node name="{node}" id="{node_index + 1}" cached="true"/>
+        </resource>
+    """
+
+
+def _status_resources(layout: ClusterLayout) -> Iterator[str]:
+    # resources are spread over the nodes in turns
+    node_index = 0
+
+    def next_node() -> int:
+        nonlocal node_index
+        node_index = (node_index + 1) % layout.nodes
+        return node_index
+
+    for resource_id in _primitive_ids(layout):
+        yield _status_primitive(resource_id, next_node())
+    for i, resource_id in enumerate(_fence_ids(layout)):
+        yield _status_primitive(
+            resource_id,
+            (i + 1) % layout.nodes,
+            "stonith:fence_pcsmock_minimal",
+        )
+    for i in range(layout.groups):
+        group_node = next_node()
+        members = "".join(
+            _status_primitive(f"G{i}-R{j}", group_node)
+            for j in range(layout.group_size)
+        )
+        yield f"""
+            <group id="G{i}" number_resources="{layout.group_size}"
+                maintenance="false" managed="true" disabled="false"
+            >{members}</group>
+        """
+    for i in range(layout.clones):
+        instances = "".join(
+            _status_primitive(f"C{i}", node) for node in range(layout.nodes)
+        )
+        yield f"""
+            <clone id="C{i}-clone" multi_state="false"
+                {_STATUS_COLLECTION_ATTRS}
+            >{instances}</clone>
+        """
+    for i in range(layout.bundles):
+        bundle_node = next_node()
+        replica = "".join(
+            [
+                _status_primitive(f"B{i}-R", bundle_node),
+                _status_primitive(
+                    f"B{i}-docker-0", bundle_node, "ocf:heartbeat:docker"
+                ),
+                _status_primitive(
+                    f"B{i}-0", bundle_node, "ocf:pacemaker:remote"
+                ),
+            ]
+        )
+        yield f"""
+            <bundle id="B{i}" type="docker" image="pcs:test" unique="false"
+                maintenance="false" managed="true" failed="false"
+            >
+                <replica id="0">{replica}</replica>
+            </bundle>
+        """
+
+
+def _resource_count(layout: ClusterLayout) -> int:
+    return (
+        layout.primitives
+        + len(_fence_ids(layout))
+        + layout.groups * layout.group_size
+        + layout.clones * layout.nodes
+        + layout.bundles * 3
+    )
+
+
+def crm_mon_xml(layout: ClusterLayout) -> str:
+    """
+    Get crm_mon status of a cluster with all resources from cib_xml started
+    """
+    nodes = "".join(
+        f"""
+            <node name="{_node_name(i)}" id="{i + 1}" online="true"
+                standby="false" standby_onfail="false" maintenance="false"
+                pending="false" unclean="false" shutdown="false"
+                expected_up="true" is_dc="{str(i == 0).lower()}"
+                resources_running="0" type="member"
+            />
+        """
+        for i in range(layout.nodes)
+    )
+    return f"""
+        <pacemaker-result api-version="2.30"
+            request="crm_mon --one-shot --inactive --output-as xml"
+        >
+            <summary>
+                <stack type="corosync"/>
+                <current_dc present="true" version="2.1.7" name="node1" id="1"
+                    with_quorum="true" mixed_version="false"
+                />
+                <last_update time="Wed Jan 31 12:03:35 2024"/>
+                <last_change time="Wed Jan 31 12:03:35 2024" user=""
+                    client="cibadmin" origin="node1"
+                />
+                <nodes_configured number="{layout.nodes}"/>
+                <resources_configured number="{_resource_count(layout)}"
+                    disabled="0" blocked="0"
+                />
+                <cluster_options stonith-enabled="true"
+                    symmetric-cluster="true" no-quorum-policy="stop"
+                    maintenance-mode="false" stop-all-resources="false"
+                    stonith-timeout-ms="60000" priority-fencing-delay-ms="0"
+                />
+            </summary>
+            <nodes>{nodes}</nodes>
+            <resources>{"".join(_status_resources(layout))}</resources>
+            <status code="0" message="OK"/>
+        </pacemaker-result>
+    """
+
+
+def corosync_conf(nodes: int, links: int = 1) -> str:
+    """
+    Get a corosync.conf of a knet cluster
+
+    nodes -- number of nodes
+    links -- number of addresses of each node
+    """
+    interfaces = "".join(
+        f"""
+    interface {{
+        linknumber: {link}
+        knet_link_priority: {link}
+    }}
+"""
+        for link in range(links)
+    )
+    node_sections = "".join(
+        "\n    node {\n"
+        + "".join(
+            f"        ring{link}_addr: 10.{link}.{(i + 1) // 256}.{(i + 1) % 256}\n"
+            for link in range(links)
+        )
+        + f"        name: {_node_name(i)}\n"
+        + f"        nodeid: {i + 1}\n"
+        + "    }\n"
+        for i in range(nodes)
+    )
+    return f"""totem {{
+    version: 2
+    cluster_name: benchmark
+    transport: knet
+    crypto_cipher: aes256
+    crypto_hash: sha256
+{interfaces}}}
+
+nodelist {{{node_sections}}}
+
+quorum {{
+    provider: corosync_votequorum
+}}
+
+logging {{
+    to_logfile: yes
+    logfile: /var/log/cluster/corosync.log
+    to_syslog: yes
+    timestamp: on
+}}
+"""
@@ -0,0 +1,164 @@
+"""
+Benchmark of library commands on clusters of different sizes
+
+Commands are run in a live environment. The CIB and crm_mon status are
+generated by pcs_test.benchmark.generators and served from memory instead of
+running cibadmin and crm_mon, so that the time of pcs itself is measured.
+Metadata of resource agents are loaded from pacemaker bin mocks, if they have
+been built by configure.
+"""
+
+import logging
+import os
+from collections.abc import Iterator, Mapping
+from typing import Any
+from unittest import mock
+
+from pcs import settings
+from pcs.common import reports
+from pcs.common.types import StringSequence
+from pcs.lib.commands import fencing_topology, resource, status, tag
+from pcs.lib.commands.constraint import common as constraint
+from pcs.lib.corosync.config_facade import ConfigFacade
+from pcs.lib.corosync.config_parser import Exporter, Parser
+from pcs.lib.env import LibraryEnvironment
+from pcs.lib.external import CommandRunner
+from pcs.lib.resource_agent import ResourceAgentFacadeFactory, ResourceAgentName
+
+from pcs_test.benchmark.generators import (
+    ClusterLayout,
+    cib_xml,
+    corosync_conf,
+    crm_mon_xml,
+)
+from pcs_test.benchmark.tools import BenchmarkResult, measure, print_results
+from pcs_test.tools.bin_mock import CRM_RESOURCE_BIN, get_mock_settings
+from pcs_test.tools.misc import get_test_resource as rc
+
+LAYOUTS = {
+    "small": ClusterLayout(
+        nodes=3,
+        primitives=10,
+        groups=2,
+        clones=2,
+        bundles=1,
+        constraints=10,
+        rules=2,
+        tags=2,
+        fencing_levels=3,
+    ),
+    "large": ClusterLayout(
+        nodes=32,
+        primitives=1000,
+        groups=100,
+        clones=50,
+        bundles=20,
+        constraints=1000,
+        rules=200,
+        tags=100,
+        fencing_levels=64,
+    ),
+}
+# number of nodes and links of each node
+COROSYNC_SIZES = {"small": (3, 1), "large": (128, 8)}
+
+
+class _ReportProcessorDiscard(reports.ReportProcessor):
+    def _do_report(self, report_item: reports.ReportItem) -> None:
+        pass
+
+
+class _GeneratedDataRunner(CommandRunner):
+    """
+    Provide the generated CIB and status instead of running cibadmin and
+    crm_mon, run other commands
+    """
+
+    outputs: Mapping[str, str] = {}
+
+    def run(
+        self,
+        args: StringSequence,
+        stdin_string: str | None = None,
+        env_extend: Mapping[str, str] | None = None,
+        binary_output: bool = False,
+    ) -> tuple[str, str, int]:
+        if args[0] in self.outputs:
+            return self.outputs[args[0]], "", 0
+        return super().run(args, stdin_string, env_extend, binary_output)
+
+
+def _get_env() -> LibraryEnvironment:
+    return LibraryEnvironment(
+        logging.getLogger("pcs_test.benchmark"), _ReportProcessorDiscard()
+    )
+
+
+def _measure_cib_commands(size: str) -> Iterator[BenchmarkResult]:
+    layout = LAYOUTS[size]
+    _GeneratedDataRunner.outputs = {
+        settings.cibadmin_exec: cib_xml(layout),
+        settings.crm_mon_exec: crm_mon_xml(layout),
+    }
+    scenarios: dict[str, Any] = {
+        "resource.get_configured_resources": resource.get_configured_resources,
+        "constraint.get_config": constraint.get_config,
+        "tag.get_config_dto": lambda env: tag.get_config_dto(env, []),
+        "fencing_topology.get_config_dto": fencing_topology.get_config_dto,
+        "status.resources_status": status.resources_status,
+    }
+    for name, command in scenarios.items():
+        yield measure(
+            f"{name}.{size}",
+            lambda command=command: command(_get_env()),
+        )
+
+
+def _measure_corosync_conf(size: str) -> Iterator[BenchmarkResult]:
+    nodes, links = COROSYNC_SIZES[size]
+    conf = corosync_conf(nodes, links).encode()
+    yield measure(
+        f"corosync_conf.get_nodes.{size}",
+        lambda: ConfigFacade(Parser.parse(conf)).get_nodes(),
+    )
+    # Sections cache their exported text until they change, so exporting
+    # the same parsed config again would only measure the cache. Commands
+    # parse the file every time they export it.
+    yield measure(
+        f"corosync_conf.parse_export.{size}",
+        lambda: Exporter.export(Parser.parse(conf)),
+    )
+
+
+def _measure_agent_metadata() -> Iterator[BenchmarkResult]:
+    if not os.access(CRM_RESOURCE_BIN, os.X_OK):
+        # the mocks are generated by configure
+        return
+    env = _get_env()
+    agent_name = ResourceAgentName("ocf", "pcsmock", "params")
+    yield measure(
+        "resource_agent.facade_from_parsed_name",
+        lambda: ResourceAgentFacadeFactory(
+            env.cmd_runner(), env.report_processor
+        ).facade_from_parsed_name(agent_name),
+    )
+
+
+def run() -> Iterator[BenchmarkResult]:
+    with (
+        mock.patch.multiple(
+            settings,
+            pacemaker_api_result_schema=rc("pcmk_rng/api/api-result.rng"),
+            **get_mock_settings(),
+        ),
+        mock.patch("pcs.lib.env.CommandRunner", _GeneratedDataRunner),
+    ):
+        for size in LAYOUTS:
+            yield from _measure_cib_commands(size)
+        for size in COROSYNC_SIZES:
+            yield from _measure_corosync_conf(size)
+        yield from _measure_agent_metadata()
+
+
+if __name__ == "__main__":
+    print_results(run())
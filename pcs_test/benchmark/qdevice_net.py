@@ -0,0 +1,40 @@
+"""
+Benchmark of in-process qdevice model net certificate operations
+
+These are the steps done on the node adding a qdevice: a key and a client
+certificate request are generated and the certificate signed by a qnetd host
+is packed with the key to pk12 format. Signing itself is done by
+corosync-qnetd-certutil on the qnetd host, so it is not measured here.
+"""
+
+from collections.abc import Iterator
+
+from cryptography.hazmat.primitives import serialization
+
+from pcs.common.ssl import generate_cert
+from pcs.lib.corosync import qdevice_net_certificates as certificates
+
+from pcs_test.benchmark.tools import BenchmarkResult, measure, print_results
+
+
+def run() -> Iterator[BenchmarkResult]:
+    # key generation dominates creating a request, it is measured separately
+    # from converting a certificate
+    yield measure(
+        "qdevice_net.generate_request",
+        lambda: certificates.generate_certificate_request("cluster"),
+        repeat=3,
+    )
+    cert_request = certificates.generate_certificate_request("cluster")
+    # the key in pk12 must match the certificate, the issuer does not matter
+    signed = generate_cert(cert_request.key, "cluster").public_bytes(
+        serialization.Encoding.DER
+    )
+    yield measure(
+        "qdevice_net.to_pk12",
+        lambda: certificates.certificate_to_pk12(signed, cert_request.key),
+    )
+
+
+if __name__ == "__main__":
+    print_results(run())
@@ -0,0 +1,67 @@
+"""
+Benchmark of parsing rules
+
+The fast rule parser is compared to the pyparsing grammar on simple, long and
+deeply nested rules.
+"""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from pcs.lib.cib.rule import parser
+
+from pcs_test.benchmark.tools import BenchmarkResult, measure, print_results
+
+_SIMPLE_EXPRESSIONS = (
+    "#uname eq node1",
+    "date gt 2020-01-01",
+    "date in_range 2020-01-01 to duration months=2",
+    "date-spec hours=9-16 weekdays=1-5",
+    "defined pingd",
+    "pingd gte integer 1",
+    "resource ocf:pacemaker:Dummy",
+    "op monitor interval=10s",
+)
+
+
+def _long_rule(length: int) -> str:
+    return " or ".join(
+        _SIMPLE_EXPRESSIONS[i % len(_SIMPLE_EXPRESSIONS)] for i in range(length)
+    )
+
+
+def _nested_rule(depth: int) -> str:
+    rule = _SIMPLE_EXPRESSIONS[0]
+    for i in range(depth):
+        operator = "and" if i % 2 else "or"
+        rule = f"({rule} {operator} {_SIMPLE_EXPRESSIONS[i % 8]})"
+    return rule
+
+
+def _fixture_rules() -> dict[str, str]:
+    return {
+        "simple": _SIMPLE_EXPRESSIONS[0],
+        "long_8": _long_rule(8),
+        "long_64": _long_rule(64),
+        "nested_8": _nested_rule(8),
+        "nested_32": _nested_rule(32),
+    }
+
+
+def run() -> Iterator[BenchmarkResult]:
+    get_rule_parser: Callable[[], Any] = getattr(parser, "__get_rule_parser")
+    # building the grammar used to be a part of parsing each rule
+    yield measure("grammar.build", get_rule_parser.__wrapped__)  # type: ignore[attr-defined]
+    grammar = get_rule_parser()
+    for name, rule in _fixture_rules().items():
+        yield measure(
+            f"parse_rule.{name}", lambda rule=rule: parser.parse_rule(rule)
+        )
+        yield measure(
+            f"grammar.{name}",
+            lambda rule=rule: grammar.parse_string(rule, parse_all=True),
+        )
+
+
+if __name__ == "__main__":
+    print_results(run())
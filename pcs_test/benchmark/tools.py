@@ -0,0 +1,68 @@
+"""
+Tools for benchmarks
+
+Benchmarks are not a part of the test suite. They are run by 'make benchmark'
+or each benchmark module is run directly, e.g. 'python3 -m
+pcs_test.benchmark.dto'. Results of scenarios are printed as json lines, so that
+results from different commits can be compared using 'python3 -m
+pcs_test.benchmark.compare'.
+"""
+
+import json
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from typing import Any, TextIO
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    # number of runs of the scenario in one measurement
+    loops: int
+    # the best time of one run in seconds
+    seconds: float
+    # memory allocated by python at peak during one run in bytes
+    peak_memory: int
+
+
+def measure(
+    name: str, scenario: Callable[[], Any], repeat: int = 5
+) -> BenchmarkResult:
+    """
+    Measure the best time of one run of a scenario
+
+    name -- name of the scenario reported in the result
+    scenario -- function to be measured
+    repeat -- number of measurements, the best one is reported
+    """
+    timer = timeit.Timer(scenario)
+    # run the scenario as many times as needed to take at least 0.2 seconds
+    loops, dummy_time = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=loops)) / loops
+    return BenchmarkResult(name, loops, seconds, measure_peak_memory(scenario))
+
+
+def measure_peak_memory(scenario: Callable[[], Any]) -> int:
+    """
+    Measure memory allocated by python at peak during one run of a scenario
+
+    Tracing memory allocations slows the scenario down, so it is run once more
+    separately from measuring its time.
+    """
+    tracemalloc.start()
+    try:
+        scenario()
+        dummy_current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def print_results(
+    result_list: Iterable[BenchmarkResult], output: TextIO = sys.stdout
+) -> None:
+    for result in result_list:
+        print(json.dumps(asdict(result)), file=output, flush=True)
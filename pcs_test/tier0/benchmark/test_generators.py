@@ -0,0 +1,124 @@
+from unittest import TestCase, mock
+
+from lxml import etree
+
+from pcs import settings
+from pcs.common.types import CorosyncNodeAddressType
+from pcs.lib.corosync.config_facade import ConfigFacade
+from pcs.lib.corosync.config_parser import Exporter, Parser
+from pcs.lib.pacemaker.api_result import get_api_result_dom
+from pcs.lib.pacemaker.status import ClusterStatusParser
+
+from pcs_test.benchmark import generators
+from pcs_test.tools.misc import get_test_resource as rc
+
+LAYOUT = generators.ClusterLayout(
+    nodes=3,
+    primitives=10,
+    groups=2,
+    clones=2,
+    bundles=2,
+    constraints=9,
+    rules=2,
+    tags=2,
+    fencing_levels=4,
+)
+
+
+class CibXml(TestCase):
+    def setUp(self):
+        self.cib = etree.fromstring(generators.cib_xml(LAYOUT))
+
+    def get_ids(self, xpath):
+        return [str(element_id) for element_id in self.cib.xpath(xpath)]
+
+    def test_ids_unique(self):
+        # obj_ref elements refer to other elements by their id
+        id_list = self.get_ids("//*[not(self::obj_ref)]/@id")
+        self.assertEqual(len(id_list), len(set(id_list)))
+
+    def test_constraints_valid(self):
+        etree.RelaxNG(file=rc("pcmk_rng/constraints-3.9.rng")).assertValid(
+            self.cib.find("configuration/constraints")
+        )
+        self.assertEqual(
+            len(self.cib.findall("configuration/constraints/*")),
+            LAYOUT.constraints + LAYOUT.rules,
+        )
+
+    def test_references_exist(self):
+        primitive_ids = set(self.get_ids("//primitive/@id"))
+        referenced_ids = set(
+            self.get_ids(
+                "//rsc_location/@rsc | //rsc_colocation/@rsc"
+                " | //rsc_colocation/@with-rsc | //rsc_order/@first"
+                " | //rsc_order/@then | //obj_ref/@id"
+                " | //fencing-level/@devices"
+            )
+        )
+        self.assertTrue(referenced_ids)
+        self.assertEqual(referenced_ids - primitive_ids, set())
+        self.assertEqual(
+            set(self.get_ids("//fencing-level/@target"))
+            - set(self.get_ids("configuration/nodes/node/@uname")),
+            set(),
+        )
+
+    def test_layout(self):
+        self.assertEqual(
+            len(self.cib.findall("configuration/nodes/node")), LAYOUT.nodes
+        )
+        self.assertEqual(
+            len(self.cib.findall("configuration/resources/primitive")),
+            LAYOUT.primitives + LAYOUT.nodes,
+        )
+        self.assertEqual(
+            len(self.cib.findall("configuration/tags/tag")), LAYOUT.tags
+        )
+        self.assertEqual(
+            len(self.cib.findall("configuration/fencing-topology/*")),
+            LAYOUT.fencing_levels,
+        )
+
+
+@mock.patch.object(
+    settings, "pacemaker_api_result_schema", rc("pcmk_rng/api/api-result.rng")
+)
+class CrmMonXml(TestCase):
+    def test_valid(self):
+        dom = get_api_result_dom(generators.crm_mon_xml(LAYOUT))
+        parser = ClusterStatusParser(dom)
+        resources = parser.status_xml_to_dto().resources
+        self.assertEqual(parser.get_warnings(), [])
+        self.assertEqual(
+            len(dom.findall(".//resource")),
+            int(dom.find("summary/resources_configured").get("number")),
+        )
+        # the status matches the generated CIB
+        cib = etree.fromstring(generators.cib_xml(LAYOUT))
+        self.assertEqual(
+            sorted(resource.resource_id for resource in resources),
+            sorted(cib.xpath("configuration/resources/*/@id")),
+        )
+
+
+class CorosyncConf(TestCase):
+    def test_valid(self):
+        conf = generators.corosync_conf(300, 8)
+        config = Parser.parse(conf.encode())
+        self.assertEqual(Exporter.export(config).decode(), conf)
+        facade = ConfigFacade(config)
+        self.assertEqual(facade.get_cluster_name(), "benchmark")
+        self.assertEqual(facade.get_transport(), "knet")
+        self.assertEqual(facade.get_used_linknumber_list(), list(range(8)))
+        node_list = facade.get_nodes()
+        self.assertEqual(
+            [node.name for node in node_list],
+            [f"node{i}" for i in range(1, 301)],
+        )
+        addr_list = [addr for node in node_list for addr in node.addrs]
+        self.assertEqual(len(addr_list), 300 * 8)
+        self.assertEqual(len({addr.addr for addr in addr_list}), len(addr_list))
+        self.assertEqual(
+            {addr.type for addr in addr_list}, {CorosyncNodeAddressType.IPV4}
+        )
@@ -0,0 +1,217 @@
+import json
+from textwrap import dedent
+from unittest import TestCase, mock
+
+from pcs.cli.common.errors import CmdLineInputError
+from pcs.cli.query import batch
+from pcs.common.status_dto import ResourcesStatusDto
+
+from pcs_test.tier0.cli.query.test_resource import (
+    fixture_group_dto,
+    fixture_primitive_dto,
+)
+from pcs_test.tools.misc import (
+    dict_to_modifiers,
+    get_tmp_file,
+    write_data_to_tmpfile,
+)
+
+QUERIES = dedent(
+    """\
+    # resources needed by the application
+    resource R1 exists
+    resource R1 is-state started on-node node1
+    resource R2 is-in-group
+
+    resource G get-members
+    resource R1 get-nodes  # comment
+    """
+)
+
+
+@mock.patch("pcs.cli.query.batch.print")
+class Batch(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["status"])
+        self.lib.status = mock.Mock(spec_set=["resources_status"])
+        self.lib.status.resources_status.return_value = ResourcesStatusDto(
+            [
+                fixture_primitive_dto("R1", None),
+                fixture_group_dto(
+                    "G",
+                    None,
+                    [
+                        fixture_primitive_dto("R2", None),
+                        fixture_primitive_dto("R3", None, node_names=[]),
+                    ],
+                ),
+            ]
+        )
+
+    def _call_cmd(self, queries, argv=None, modifiers=None):
+        with mock.patch("sys.stdin") as mock_stdin:
+            mock_stdin.read.return_value = queries
+            batch.batch(
+                self.lib, argv or [], dict_to_modifiers(modifiers or {})
+            )
+
+    @staticmethod
+    def _get_output(mock_print):
+        mock_print.assert_called_once()
+        return json.loads(mock_print.call_args[0][0])
+
+    def test_success(self, mock_print):
+        self._call_cmd(QUERIES)
+        self.assertEqual(
+            self._get_output(mock_print),
+            [
+                {
+                    "query": "resource R1 exists",
+                    "result": True,
+                    "value": None,
+                    "error": None,
+                },
+                {
+                    "query": "resource R1 is-state started on-node node1",
+                    "result": True,
+                    "value": None,
+                    "error": None,
+                },
+                {
+                    "query": "resource R2 is-in-group",
+                    "result": True,
+                    "value": "G",
+                    "error": None,
+                },
+                {
+                    "query": "resource G get-members",
+                    "result": None,
+                    "value": ["R2", "R3"],
+                    "error": None,
+                },
+                {
+                    "query": "resource R1 get-nodes  # comment",
+                    "result": None,
+                    "value": ["node1"],
+                    "error": None,
+                },
+            ],
+        )
+        self.lib.status.resources_status.assert_called_once_with()
+
+    def test_false_result(self, mock_print):
+        with self.assertRaises(SystemExit) as cm:
+            self._call_cmd("resource R1 exists\nresource R4 exists\n")
+        self.assertEqual(cm.exception.code, 2)
+        self.assertEqual(
+            [item["result"] for item in self._get_output(mock_print)],
+            [True, False],
+        )
+
+    def test_errors(self, mock_print):
+        with self.assertRaises(SystemExit) as cm:
+            self._call_cmd(
+                dedent(
+                    """\
+                    resource R4 exists
+                    resource R4 get-nodes
+                    resource R1 is-type
+                    node node1 is-online
+                    resource R1 'exists
+                    resource R1 get-nodes
+                    """
+                )
+            )
+        self.assertEqual(cm.exception.code, 1)
+        self.assertEqual(
+            self._get_output(mock_print),
+            [
+                {
+                    "query": "resource R4 exists",
+                    "result": False,
+                    "value": None,
+                    "error": None,
+                },
+                {
+                    "query": "resource R4 get-nodes",
+                    "result": None,
+                    "value": None,
+                    "error": "Resource 'R4' does not exist",
+                },
+                {
+                    "query": "resource R1 is-type",
+                    "result": None,
+                    "value": None,
+                    "error": "Invalid query",
+                },
+                {
+                    "query": "node node1 is-online",
+                    "result": None,
+                    "value": None,
+                    "error": (
+                        "Unknown query type 'node', only 'resource' is "
+                        "supported"
+                    ),
+                },
+                {
+                    "query": "resource R1 'exists",
+                    "result": None,
+                    "value": None,
+                    "error": "Unable to parse the query: No closing quotation",
+                },
+                {
+                    "query": "resource R1 get-nodes",
+                    "result": None,
+                    "value": ["node1"],
+                    "error": None,
+                },
+            ],
+        )
+        self.lib.status.resources_status.assert_called_once_with()
+
+    def test_no_status_needed(self, mock_print):
+        self._call_cmd("\n# nothing to do\n")
+        self.assertEqual(self._get_output(mock_print), [])
+        self.lib.status.resources_status.assert_not_called()
+
+    def test_file(self, mock_print):
+        query_file = get_tmp_file("pcs_test_query_batch")
+        self.addCleanup(query_file.close)
+        write_data_to_tmpfile("resource R1 exists\n", query_file)
+        self._call_cmd("", [query_file.name])
+        self.assertEqual(
+            self._get_output(mock_print),
+            [
+                {
+                    "query": "resource R1 exists",
+                    "result": True,
+                    "value": None,
+                    "error": None,
+                }
+            ],
+        )
+
+    def test_file_not_readable(self, mock_print):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd("", ["/nonexistent/queries"])
+        self.assertEqual(
+            cm.exception.message,
+            "Unable to read file '/nonexistent/queries': No such file or "
+            "directory: '/nonexistent/queries'",
+        )
+        mock_print.assert_not_called()
+
+    def test_too_many_args(self, mock_print):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd("", ["file1", "file2"])
+        self.assertIsNone(cm.exception.message)
+        mock_print.assert_not_called()
+
+    def test_unsupported_option(self, mock_print):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd("", modifiers={"quiet": True})
+        self.assertEqual(
+            cm.exception.message,
+            "Specified option '--quiet' is not supported in this command",
+        )
+        mock_print.assert_not_called()
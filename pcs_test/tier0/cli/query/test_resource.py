@@ -1133,3 +1133,136 @@ class TestQueryGetIndexInGroup(QueryBaseMixin, TestCase):
         )
         self.lib_command.assert_called_once_with()
         mock_print.assert_not_called()
+
+
+@mock.patch("pcs.cli.query.resource.time.sleep")
+@mock.patch("pcs.cli.query.resource.print")
+class TestQueryWaitUntil(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["status"])
+        self.lib.status = mock.Mock(
+            spec_set=["resources_status", "cluster_status_revision"]
+        )
+        self.stopped = ResourcesStatusDto(
+            [fixture_primitive_dto("resource", None, node_names=[])]
+        )
+        self.started = ResourcesStatusDto(
+            [fixture_primitive_dto("resource", None)]
+        )
+
+    def _call_cmd(self, argv, modifiers=None) -> None:
+        modifiers = modifiers or {}
+        resource.wait_until(self.lib, argv, dict_to_modifiers(modifiers))
+
+    def test_no_query(self, mock_print, mock_sleep):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(["resource"])
+        self.assertIsNone(cm.exception.message)
+        self.lib.status.cluster_status_revision.assert_not_called()
+        mock_print.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    def test_unknown_query(self, mock_print, mock_sleep):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(["resource", "is-fine"])
+        self.assertEqual(
+            cm.exception.message,
+            (
+                "'is-fine' is not a valid query value, use 'exists', "
+                "'get-index-in-group', 'get-members', 'get-nodes', "
+                "'get-type', 'is-in-bundle', 'is-in-clone', 'is-in-group', "
+                "'is-state', 'is-stonith', 'is-type'"
+            ),
+        )
+        mock_print.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    def test_not_a_predicate(self, mock_print, mock_sleep):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(["resource", "get-nodes"])
+        self.assertEqual(
+            cm.exception.message,
+            "Query 'get-nodes' does not check a condition and cannot be "
+            "waited for",
+        )
+        self.lib.status.cluster_status_revision.assert_not_called()
+        mock_print.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    def test_bad_timeout(self, mock_print, mock_sleep):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(
+                ["resource", "is-state", "started"], {"wait": "a while"}
+            )
+        self.assertEqual(
+            cm.exception.message, "'a while' is not a valid interval value"
+        )
+        self.lib.status.cluster_status_revision.assert_not_called()
+        mock_print.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    def test_true_immediately(self, mock_print, mock_sleep):
+        self.lib.status.cluster_status_revision.return_value = "0.1.1"
+        self.lib.status.resources_status.return_value = self.started
+        with self.assertRaises(SystemExit) as cm:
+            self._call_cmd(["resource", "is-state", "started"])
+        self.assertEqual(cm.exception.code, 0)
+        self.lib.status.resources_status.assert_called_once_with()
+        mock_print.assert_called_once_with(True)
+        mock_sleep.assert_not_called()
+
+    def test_status_loaded_only_when_changed(self, mock_print, mock_sleep):
+        self.lib.status.cluster_status_revision.side_effect = [
+            "0.1.1",
+            "0.1.1",
+            "0.1.1",
+            "0.1.2",
+            "0.1.3",
+        ]
+        self.lib.status.resources_status.side_effect = [
+            self.stopped,
+            self.stopped,
+            self.started,
+        ]
+        with self.assertRaises(SystemExit) as cm:
+            self._call_cmd(
+                ["resource", "is-state", "started", "on-node", "node1"],
+                {"quiet": True},
+            )
+        self.assertEqual(cm.exception.code, 0)
+        self.assertEqual(self.lib.status.cluster_status_revision.call_count, 5)
+        self.assertEqual(self.lib.status.resources_status.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 4)
+        mock_print.assert_not_called()
+
+    @mock.patch("pcs.cli.query.resource.time.monotonic")
+    def test_timeout(self, mock_monotonic, mock_print, mock_sleep):
+        mock_monotonic.side_effect = [100, 100, 100.5, 101, 101.5, 103]
+        self.lib.status.cluster_status_revision.side_effect = [
+            "0.1.1",
+            "0.1.2",
+            "0.1.2",
+        ]
+        self.lib.status.resources_status.return_value = self.stopped
+        with self.assertRaises(SystemExit) as cm:
+            self._call_cmd(
+                ["resource", "is-state", "started", "on-node", "node1"],
+                {"wait": "2"},
+            )
+        self.assertEqual(cm.exception.code, 2)
+        self.assertEqual(self.lib.status.resources_status.call_count, 2)
+        self.assertEqual(
+            mock_sleep.call_args_list, [mock.call(1), mock.call(0.5)]
+        )
+        mock_print.assert_called_once_with(False)
+
+    def test_error(self, mock_print, mock_sleep):
+        self.lib.status.cluster_status_revision.return_value = "0.1.1"
+        self.lib.status.resources_status.return_value = self.started
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(["nonexistent", "is-state", "started"])
+        self.assertEqual(
+            cm.exception.message, "Resource 'nonexistent' does not exist"
+        )
+        mock_print.assert_not_called()
+        mock_sleep.assert_not_called()
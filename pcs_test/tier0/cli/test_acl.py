@@ -0,0 +1,168 @@
+from textwrap import dedent
+from unittest import TestCase, mock
+
+from pcs import acl
+from pcs.cli.common.errors import CmdLineInputError
+from pcs.cli.common.parse_args import InputModifiers
+from pcs.common.pacemaker.acl import (
+    CibAclEffectiveAccessDto,
+    CibAclEffectivePermissionsDto,
+)
+
+from pcs_test.tools.misc import dict_to_modifiers
+
+
+def fixture_dto(
+    user_id="user1",
+    group_id_list=(),
+    acl_enabled=True,
+    restricted=True,
+    access_list=None,
+):
+    return CibAclEffectivePermissionsDto(
+        user_id=user_id,
+        group_id_list=list(group_id_list),
+        role_id_list=["role1", "role2"],
+        acl_enabled=acl_enabled,
+        restricted=restricted,
+        access_list=(
+            access_list
+            if access_list is not None
+            else [CibAclEffectiveAccessDto("/cib", None, "cib", "write", [])]
+        ),
+    )
+
+
+@mock.patch("pcs.acl.print")
+class AclEffective(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["acl"])
+        self.lib.acl = mock.Mock(spec_set=["get_effective_permissions"])
+        self.lib.acl.get_effective_permissions.return_value = fixture_dto()
+
+    def _call_cmd(self, argv, modifiers=None):
+        acl.acl_effective(self.lib, argv, modifiers or dict_to_modifiers({}))
+
+    def assert_bad_syntax(self, argv, mock_print):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(argv)
+        self.assertIsNone(cm.exception.message)
+        self.lib.acl.get_effective_permissions.assert_not_called()
+        mock_print.assert_not_called()
+
+    def test_no_args(self, mock_print):
+        self.assert_bad_syntax([], mock_print)
+
+    def test_missing_id(self, mock_print):
+        self.assert_bad_syntax(["user"], mock_print)
+
+    def test_bad_target_type(self, mock_print):
+        self.assert_bad_syntax(["role", "role1"], mock_print)
+
+    def test_group_with_more_groups(self, mock_print):
+        self.assert_bad_syntax(["group", "group1", "group2"], mock_print)
+
+    def test_unsupported_option(self, mock_print):
+        with self.assertRaises(CmdLineInputError):
+            self._call_cmd(
+                ["user", "user1"], dict_to_modifiers({"force": True})
+            )
+        self.lib.acl.get_effective_permissions.assert_not_called()
+        mock_print.assert_not_called()
+
+    def test_user(self, mock_print):
+        self._call_cmd(["user", "user1", "group1", "group2"])
+        self.lib.acl.get_effective_permissions.assert_called_once_with(
+            "user1", ["group1", "group2"]
+        )
+        mock_print.assert_called_once_with(
+            dedent(
+                """\
+                User: user1
+                  Roles: role1 role2
+                  Access:
+                    write /cib (default)"""
+            )
+        )
+
+    def test_group(self, mock_print):
+        self._call_cmd(["group", "group1"], InputModifiers({"-f": "cib.xml"}))
+        self.lib.acl.get_effective_permissions.assert_called_once_with(
+            None, ["group1"]
+        )
+        mock_print.assert_called_once()
+
+
+class EffectivePermissionsToStr(TestCase):
+    def test_user_with_groups(self):
+        self.assertEqual(
+            acl.effective_permissions_to_str(
+                fixture_dto(
+                    group_id_list=["group1", "group2"],
+                    access_list=[
+                        CibAclEffectiveAccessDto(
+                            "/cib", None, "cib", "read", ["role1-read"]
+                        ),
+                        CibAclEffectiveAccessDto(
+                            "/cib/configuration/resources/primitive[@id='R1']",
+                            "R1",
+                            "primitive",
+                            "deny",
+                            ["role1-deny", "role2-deny"],
+                        ),
+                        CibAclEffectiveAccessDto(
+                            "/cib/status", None, "status", "deny", []
+                        ),
+                    ],
+                )
+            ),
+            [
+                "User: user1",
+                "  Groups: group1 group2",
+                "  Roles: role1 role2",
+                "  Access:",
+                "    read /cib (role1-read)",
+                "    deny /cib/configuration/resources/primitive[@id='R1'] "
+                "(role1-deny, role2-deny)",
+                "    deny /cib/status (default)",
+            ],
+        )
+
+    def test_groups_only(self):
+        self.assertEqual(
+            acl.effective_permissions_to_str(
+                fixture_dto(user_id=None, group_id_list=["group1"])
+            ),
+            [
+                "Group: group1",
+                "  Roles: role1 role2",
+                "  Access:",
+                "    write /cib (default)",
+            ],
+        )
+
+    def test_acl_disabled(self):
+        self.assertEqual(
+            acl.effective_permissions_to_str(
+                fixture_dto(acl_enabled=False, restricted=False)
+            ),
+            [
+                "User: user1",
+                "  Roles: role1 role2",
+                "  Access:",
+                "    write /cib (ACLs are disabled)",
+            ],
+        )
+
+    def test_user_not_restricted(self):
+        self.assertEqual(
+            acl.effective_permissions_to_str(
+                fixture_dto(user_id="root", restricted=False)
+            ),
+            [
+                "User: root",
+                "  Roles: role1 role2",
+                "  Access:",
+                "    write /cib (user is not restricted by ACLs)",
+            ],
+        )
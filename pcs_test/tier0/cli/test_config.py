@@ -0,0 +1,259 @@
+import io
+import json
+import os
+import tarfile
+import threading
+import tracemalloc
+from unittest import TestCase, mock
+from urllib.parse import urlencode
+
+from pcs import config, settings, utils
+
+from pcs_test.tools.misc import dict_to_modifiers, get_tmp_dir
+
+COROSYNC_CONF = """\
+totem {
+    version: 2
+    cluster_name: test99
+    transport: knet
+}
+
+nodelist {
+    node {
+        ring0_addr: node1
+        name: node1
+        nodeid: 1
+    }
+
+    node {
+        ring0_addr: node2
+        name: node2
+        nodeid: 2
+    }
+
+    node {
+        ring0_addr: node3
+        name: node3
+        nodeid: 3
+    }
+}
+"""
+
+NODE_STATUS = json.dumps(
+    {
+        "node": {
+            "services": {
+                "corosync": {"running": False},
+                "pacemaker": {"running": False},
+                "pacemaker_remote": {"running": False},
+            }
+        }
+    }
+)
+
+
+def write_synthetic_cib(path, resource_count):
+    with open(path, "w") as cib_file:
+        cib_file.write(
+            '<cib epoch="1" num_updates="0" admin_epoch="0" '
+            'validate-with="pacemaker-3.9"><configuration><crm_config/>'
+            "<nodes/><resources>"
+        )
+        for i in range(resource_count):
+            cib_file.write(
+                f'<primitive id="R{i}" class="ocf" provider="pacemaker" '
+                f'type="Dummy"><instance_attributes id="R{i}-attrs">'
+                f'<nvpair id="R{i}-attrs-state" name="state" '
+                f'value="/var/run/R{i}.state"/></instance_attributes>'
+                f'<operations><op id="R{i}-monitor" name="monitor" '
+                f'interval="10s" timeout="20s"/></operations></primitive>'
+            )
+        cib_file.write("</resources><constraints/></configuration></cib>")
+
+
+class ConfigFilesMixin:
+    def setUp(self):
+        # pylint: disable=invalid-name
+        self.tmp_dir = get_tmp_dir("tier0_cli_config")
+        self.addCleanup(self.tmp_dir.cleanup)
+        path = self.tmp_dir.name
+        for name, value in (
+            ("cib_dir", path),
+            ("corosync_conf_file", os.path.join(path, "corosync.conf")),
+            ("corosync_authkey_file", os.path.join(path, "authkey")),
+            ("pacemaker_authkey_file", os.path.join(path, "pcmk_authkey")),
+            ("corosync_uidgid_dir", os.path.join(path, "uidgid.d")),
+            (
+                "pcsd_settings_conf_location",
+                os.path.join(path, "pcs_settings.conf"),
+            ),
+        ):
+            patcher = mock.patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(utils, "pcs_options", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        with open(settings.corosync_conf_file, "w") as conf_file:
+            conf_file.write(COROSYNC_CONF)
+        self.cib_path = os.path.join(path, "cib.xml")
+        write_synthetic_cib(self.cib_path, 10)
+
+    def backup(self, name):
+        config.config_backup(
+            None, [os.path.join(self.tmp_dir.name, name)], dict_to_modifiers({})
+        )
+
+
+class ConfigBackup(ConfigFilesMixin, TestCase):
+    def assert_tarball(self, name, compression):
+        with tarfile.open(
+            os.path.join(self.tmp_dir.name, name), f"r:{compression}"
+        ) as tarball:
+            self.assertEqual(
+                tarball.getnames(), ["version.txt", "cib.xml", "corosync.conf"]
+            )
+            with open(self.cib_path, "rb") as cib_file:
+                self.assertEqual(
+                    tarball.extractfile("cib.xml").read(), cib_file.read()
+                )
+
+    def test_default_compression(self):
+        self.backup("backup")
+        self.assert_tarball("backup.tar.bz2", "bz2")
+
+    def test_compression_by_extension(self):
+        for name, compression in (
+            ("backup.tar.bz2", "bz2"),
+            ("backup.tar.gz", "gz"),
+            ("backup.tgz", "gz"),
+            ("backup.tar.xz", "xz"),
+        ):
+            with self.subTest(name=name):
+                self.backup(name)
+                self.assert_tarball(name, compression)
+
+    def test_stdout(self):
+        stdout = mock.Mock(spec_set=["buffer"])
+        stdout.buffer = io.BytesIO()
+        with mock.patch("sys.stdout", stdout):
+            config.config_backup(None, [], dict_to_modifiers({}))
+        with tarfile.open(fileobj=io.BytesIO(stdout.buffer.getvalue())) as tar:
+            self.assertEqual(
+                tar.getnames(), ["version.txt", "cib.xml", "corosync.conf"]
+            )
+
+    @mock.patch("pcs.cli.reports.output.print_to_stderr")
+    def test_file_exists(self, mock_print):
+        path = os.path.join(self.tmp_dir.name, "backup.tar.bz2")
+        with open(path, "w") as backup_file:
+            backup_file.write("original")
+        with self.assertRaises(SystemExit):
+            self.backup("backup.tar.bz2")
+        mock_print.assert_called_once_with(
+            f"Error: '{path}' already exists, use --force to overwrite"
+        )
+        with open(path) as backup_file:
+            self.assertEqual(backup_file.read(), "original")
+
+    @mock.patch("pcs.cli.reports.output.print_to_stderr")
+    def test_incomplete_tarball_removed(self, mock_print):
+        os.remove(settings.corosync_conf_file)
+        with self.assertRaises(SystemExit):
+            self.backup("backup.tar.gz")
+        mock_print.assert_called_once()
+        self.assertFalse(
+            os.path.exists(os.path.join(self.tmp_dir.name, "backup.tar.gz"))
+        )
+
+    def test_large_cib(self):
+        # about 30 MB of CIB
+        write_synthetic_cib(self.cib_path, 100000)
+        tracemalloc.start()
+        try:
+            self.backup("backup.tar.gz")
+            dummy_current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assert_tarball("backup.tar.gz", "gz")
+        # The tarball has about 1.5 MB. It is streamed to the file, so memory
+        # does not depend on its size.
+        self.assertLess(peak, 1024 * 1024)
+
+
+class ConfigRestoreRemote(ConfigFilesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.backup("backup.tar.gz")
+        self.backup_path = os.path.join(self.tmp_dir.name, "backup.tar.gz")
+        with open(self.backup_path, "rb") as backup_file:
+            self.expected_form = urlencode(
+                {"tarball": backup_file.read()}
+            ).encode("ascii")
+        self.received = {}
+        # all three nodes must be contacted at the same time to pass it
+        self.all_nodes_contacted = threading.Barrier(3, timeout=5)
+
+    def restore_config(self, node, tarball_form):
+        self.all_nodes_contacted.wait()
+        read = tarball_form.get_read_function()
+        received = b""
+        while True:
+            chunk = read(16384)
+            self.assertLessEqual(len(chunk), 16384)
+            if not chunk:
+                break
+            received += chunk
+        self.assertEqual(len(received), tarball_form.size)
+        self.received[node] = received
+        return (0, "Succeeded") if node != "node3" else (1, "Failed")
+
+    @mock.patch("pcs.cli.reports.output.print_to_stderr")
+    @mock.patch("pcs.utils.print_to_stderr")
+    @mock.patch("pcs.config.utils.pauseConfigSyncing", return_value=(0, ""))
+    @mock.patch("pcs.config.utils.checkStatus", return_value=(0, NODE_STATUS))
+    def test_tarball_sent_to_nodes_concurrently(
+        self, mock_status, mock_pause, mock_print_node, mock_print_error
+    ):
+        del mock_status, mock_pause
+        with (
+            mock.patch(
+                "pcs.config.utils.restoreConfig",
+                side_effect=self.restore_config,
+            ),
+            self.assertRaises(SystemExit),
+        ):
+            config.config_restore_remote(self.backup_path, None)
+        self.assertEqual(
+            self.received,
+            dict.fromkeys(("node1", "node2", "node3"), self.expected_form),
+        )
+        mock_print_node.assert_any_call("node1: Succeeded")
+        mock_print_node.assert_any_call("node3: Failed")
+        mock_print_error.assert_called_once_with(
+            "Error: unable to restore all nodes\nnode3: Failed"
+        )
+
+    @mock.patch("pcs.cli.reports.output.print_to_stderr")
+    @mock.patch("pcs.utils.print_to_stderr")
+    @mock.patch("pcs.config.utils.pauseConfigSyncing", return_value=(0, ""))
+    @mock.patch("pcs.config.utils.checkStatus", return_value=(0, NODE_STATUS))
+    def test_tarball_from_stdin(self, *mocks):
+        del mocks
+        with open(self.backup_path, "rb") as backup_file:
+            stdin = mock.Mock(spec_set=["buffer"])
+            stdin.buffer = backup_file
+            with (
+                mock.patch("sys.stdin", stdin),
+                mock.patch("os.getuid", return_value=0),
+                mock.patch(
+                    "pcs.config.utils.restoreConfig",
+                    side_effect=self.restore_config,
+                ),
+                self.assertRaises(SystemExit),
+            ):
+                config.config_restore(None, [], dict_to_modifiers({}))
+        self.assertEqual(
+            self.received,
+            dict.fromkeys(("node1", "node2", "node3"), self.expected_form),
+        )
@@ -1,14 +1,22 @@
 import importlib
 import pkgutil
-from collections.abc import Sequence
-from dataclasses import dataclass, is_dataclass
-from typing import Any
+import random
+import re
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass, fields, is_dataclass
+from enum import Enum
+from types import UnionType
+from typing import Any, Union, get_args, get_origin, get_type_hints
 from unittest import TestCase
 
+import dacite
 from dacite.exceptions import WrongTypeError
 
 import pcs
+import pcs.common
 from pcs.common.interface.dto import (
+    DTO_TYPE_HOOKS_MAP,
     DataTransferObject,
     PayloadConversionError,
     from_dict,
@@ -238,3 +246,170 @@ class UnexpectedTypes(TestCase):
         self.assertEqual(
             dict(field_a="a", field_b={1: "1", 2: "2"}), to_dict(dto)
         )
+
+
+_MAX_DEPTH = 3
+_NONE_PROBABILITY = 0.3
+_NESTED_MUTATION_PROBABILITY = 0.7
+
+
+def _fixture_payload(type_, rng, depth=0):  # noqa: PLR0911
+    if type_ is Any:
+        return rng.choice([None, "any", [1, {"a": "b"}]])
+    if hasattr(type_, "__supertype__"):
+        return _fixture_payload(type_.__supertype__, rng, depth)
+    origin = get_origin(type_)
+    type_args = get_args(type_)
+    if origin in (Union, UnionType):
+        if type(None) in type_args and (
+            depth > _MAX_DEPTH or rng.random() < _NONE_PROBABILITY
+        ):
+            return None
+        return _fixture_payload(
+            rng.choice([arg for arg in type_args if arg is not type(None)]),
+            rng,
+            depth,
+        )
+    if origin is tuple:
+        item_list = [_fixture_payload(arg, rng, depth) for arg in type_args]
+        return item_list if type_ in DTO_TYPE_HOOKS_MAP else tuple(item_list)
+    if origin in (dict, Mapping):
+        # dacite does not convert keys, so enum keys must be enum members
+        key_type = type_args[0]
+        return {
+            (
+                rng.choice(list(key_type))
+                if isinstance(key_type, type) and issubclass(key_type, Enum)
+                else _fixture_payload(key_type, rng, depth)
+            ): _fixture_payload(type_args[1], rng, depth + 1)
+            for _ in range(rng.randint(0, 2))
+        }
+    if origin in (list, Sequence):
+        return [
+            _fixture_payload(type_args[0], rng, depth + 1)
+            for _ in range(0 if depth > _MAX_DEPTH else rng.randint(0, 2))
+        ]
+    if is_dataclass(type_):
+        type_hints = get_type_hints(type_)
+        return {
+            field.name: _fixture_payload(type_hints[field.name], rng, depth + 1)
+            for field in fields(type_)
+        }
+    if isinstance(type_, type) and issubclass(type_, Enum):
+        member = rng.choice(list(type_))
+        return member.value if type_ in DTO_TYPE_HOOKS_MAP else member
+    if type_ is int:
+        return rng.choice([0, 1, True])
+    if type_ is float:
+        return rng.choice([1, 0.5])
+    if type_ is bool:
+        return rng.choice([True, False])
+    # str and its subclasses used as enums
+    return type_("value")
+
+
+def _mutate_payload(payload, rng):
+    # replace, remove or add a random item somewhere in the payload
+    if (
+        isinstance(payload, dict)
+        and payload
+        and rng.random() < _NESTED_MUTATION_PROBABILITY
+    ):
+        key = rng.choice(list(payload))
+        mutated = dict(payload)
+        action = rng.choice(["mutate", "remove", "add", "replace"])
+        if action == "mutate":
+            mutated[key] = _mutate_payload(payload[key], rng)
+        elif action == "remove":
+            del mutated[key]
+        elif action == "add":
+            mutated["unexpected_key"] = "value"
+        else:
+            mutated[key] = rng.choice([None, "value", 1, 0.5, [], {}, ["a"]])
+        return mutated
+    if (
+        isinstance(payload, (list, tuple))
+        and payload
+        and rng.random() < _NESTED_MUTATION_PROBABILITY
+    ):
+        mutated = list(payload)
+        index = rng.randrange(len(mutated))
+        mutated[index] = _mutate_payload(mutated[index], rng)
+        return type(payload)(mutated)
+    return rng.choice([None, "bad value", 1, 0.5, [], {}, ["a"], ("a", "b")])
+
+
+def _run_decoder(decoder):
+    try:
+        return repr(decoder())
+    except Exception as e:
+        # dacite puts reprs of generators into some error messages
+        return re.sub(" at 0x[0-9a-f]+", "", f"{type(e).__name__}: {e}")
+
+
+class CompiledCodecs(TestCase):
+    """
+    Compare compiled codecs to dacite and dataclasses.asdict on generated
+    payloads of all transfer objects
+    """
+
+    @staticmethod
+    def _get_dto_classes():
+        for module_info in pkgutil.walk_packages(
+            pcs.common.__path__, prefix="pcs.common."
+        ):
+            importlib.import_module(module_info.name)
+        return sorted(
+            _all_subclasses(DataTransferObject),
+            key=lambda cls: f"{cls.__module__}.{cls.__qualname__}",
+        )
+
+    def _assert_same_as_dacite(self, cls, payload, strict):
+        result = _run_decoder(lambda: from_dict(cls, payload, strict=strict))
+        self.assertEqual(
+            result,
+            _run_decoder(
+                lambda: dacite.from_dict(
+                    cls,
+                    payload,
+                    dacite.Config(type_hooks=DTO_TYPE_HOOKS_MAP, strict=strict),
+                )
+            ),
+        )
+        return result
+
+    def test_differential(self):
+        rng = random.Random(20241019)
+        for cls in self._get_dto_classes():
+            with self.subTest(dto=cls.__qualname__):
+                for _ in range(20):
+                    payload = _fixture_payload(cls, rng)
+                    for strict in (False, True):
+                        self._assert_same_as_dacite(cls, payload, strict)
+                        self._assert_same_as_dacite(
+                            cls, _mutate_payload(payload, rng), strict
+                        )
+                    dto = from_dict(cls, payload)
+                    self.assertEqual(repr(to_dict(dto)), repr(asdict(dto)))
+
+    def test_unusual_values_to_dict(self):
+        dto = DtoWithAny(
+            "a",
+            {
+                "tuple": (1, [MyDto1(1, 2)]),
+                "set": {1},
+                "defaultdict": defaultdict(list, {"a": [1]}),
+                "dto": MyDto1(3, 4),
+            },
+        )
+        self.assertEqual(repr(to_dict(dto)), repr(asdict(dto)))
+        self.assertIsNot(to_dict(dto)["field_b"]["set"], dto.field_b["set"])
+
+    def test_already_built_nested_dto(self):
+        self.assertEqual(
+            MyDto2(0, MyDto1(1, 2), CorosyncNodeAddressType.IPV4),
+            from_dict(
+                MyDto2,
+                {"field_d": 0, "field_e": MyDto1(1, 2), "field_f": "IPv4"},
+            ),
+        )
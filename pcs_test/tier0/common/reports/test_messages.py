@@ -605,6 +605,14 @@ class RunExternalProcessFinished(NameBuildTest):
         )
 
 
+class DataCollectionTimings(NameBuildTest):
+    def test_all(self):
+        self.assert_message_from_report(
+            ("Data collection timings:\n  crm_mon: 0.123 s\n  cib: 1.000 s"),
+            reports.DataCollectionTimings({"crm_mon": 0.12345, "cib": 1}),
+        )
+
+
 class RunExternalProcessError(NameBuildTest):
     def test_all(self):
         self.assert_message_from_report(
@@ -613,6 +621,22 @@ class RunExternalProcessError(NameBuildTest):
         )
 
 
+class RunExternalProcessTimedOut(NameBuildTest):
+    def test_one_second(self):
+        self.assert_message_from_report(
+            "Command com-mand has not finished in 1 second, it has been "
+            "terminated",
+            reports.RunExternalProcessTimedOut("com-mand", 1),
+        )
+
+    def test_more_seconds(self):
+        self.assert_message_from_report(
+            "Command com-mand has not finished in 30 seconds, it has been "
+            "terminated",
+            reports.RunExternalProcessTimedOut("com-mand", 30),
+        )
+
+
 class NoActionNecessary(NameBuildTest):
     def test_all(self):
         self.assert_message_from_report(
@@ -2432,6 +2456,23 @@ class ResourceRefreshTooTimeConsuming(NameBuildTest):
         )
 
 
+class ResourceRefreshWaveStarted(NameBuildTest):
+    def test_nodes(self):
+        self.assert_message_from_report(
+            "Deleting history of all resources on nodes 'node1', 'node2' "
+            "(wave 1 of 3)",
+            reports.ResourceRefreshWaveStarted(
+                1, 3, node_list=["node2", "node1"]
+            ),
+        )
+
+    def test_resources(self):
+        self.assert_message_from_report(
+            "Deleting history of resource 'R1' on all nodes (wave 3 of 3)",
+            reports.ResourceRefreshWaveStarted(3, 3, resource_list=["R1"]),
+        )
+
+
 class ResourceOperationIntervalDuplication(NameBuildTest):
     def test_build_message_with_data(self):
         self.assert_message_from_report(
@@ -2526,6 +2567,78 @@ class NodeRemoveInPacemakerFailed(NameBuildTest):
         )
 
 
+class NodeStandbyLeavesResourcesStopped(NameBuildTest):
+    def test_one_resource(self):
+        self.assert_message_from_report(
+            "Putting node 'node1' into standby would leave resource 'R1' "
+            "stopped or demoted",
+            reports.NodeStandbyLeavesResourcesStopped("node1", ["R1"]),
+        )
+
+    def test_multiple_resources(self):
+        self.assert_message_from_report(
+            "Putting node 'node1' into standby would leave resources 'R1', "
+            "'R2' stopped or demoted",
+            reports.NodeStandbyLeavesResourcesStopped("node1", ["R2", "R1"]),
+        )
+
+
+class NodeStandbyWaveStarted(NameBuildTest):
+    def test_one_node(self):
+        self.assert_message_from_report(
+            "Putting node 'node1' into standby (wave 1 of 3)",
+            reports.NodeStandbyWaveStarted(1, 3, ["node1"]),
+        )
+
+    def test_multiple_nodes(self):
+        self.assert_message_from_report(
+            "Putting nodes 'node1', 'node2' into standby (wave 2 of 3)",
+            reports.NodeStandbyWaveStarted(2, 3, ["node2", "node1"]),
+        )
+
+
+class NodeStandbyWaveFinished(NameBuildTest):
+    def test_one_node(self):
+        self.assert_message_from_report(
+            (
+                "Node 'node1' is in standby and ready for maintenance (wave 1 "
+                "of 3), nodes of the next waves: 'node2', 'node3'"
+            ),
+            reports.NodeStandbyWaveFinished(
+                1, 3, ["node1"], ["node3", "node2"]
+            ),
+        )
+
+    def test_multiple_nodes(self):
+        self.assert_message_from_report(
+            (
+                "Nodes 'node1', 'node2' are in standby and ready for "
+                "maintenance (wave 1 of 1)"
+            ),
+            reports.NodeStandbyWaveFinished(1, 1, ["node2", "node1"], []),
+        )
+
+
+class NodeStandbyWaveWaitingForNodes(NameBuildTest):
+    def test_one_node(self):
+        self.assert_message_from_report(
+            (
+                "Waiting for node 'node1' to be online and taken out of "
+                "standby before starting wave 2 of 3"
+            ),
+            reports.NodeStandbyWaveWaitingForNodes(1, 3, ["node1"]),
+        )
+
+    def test_multiple_nodes(self):
+        self.assert_message_from_report(
+            (
+                "Waiting for nodes 'node1', 'node2' to be online and taken out "
+                "of standby before starting wave 3 of 3"
+            ),
+            reports.NodeStandbyWaveWaitingForNodes(2, 3, ["node2", "node1"]),
+        )
+
+
 class NodeRemoveInPacemakerSkipped(NameBuildTest):
     def test_one_node(self):
         self.assert_message_from_report(
@@ -3845,6 +3958,15 @@ class CibAclRoleIsNotAssignedToTarget(NameBuildTest):
         )
 
 
+class CibAclPermissionXpathInvalid(NameBuildTest):
+    def test_all(self):
+        self.assert_message_from_report(
+            "Permission 'perm1' is ignored, its xpath '//primitive[' is not "
+            "valid",
+            reports.CibAclPermissionXpathInvalid("perm1", "//primitive["),
+        )
+
+
 class CibAclTargetAlreadyExists(NameBuildTest):
     def test_all(self):
         self.assert_message_from_report(
@@ -5151,6 +5273,23 @@ class DrConfigDoesNotExist(NameBuildTest):
         )
 
 
+class DrSiteStatusTimedOut(NameBuildTest):
+    def test_one_node(self):
+        self.assert_message_from_report(
+            "Unable to get status of the site with node 'node1' in 1 second",
+            reports.DrSiteStatusTimedOut(["node1"], 1),
+        )
+
+    def test_more_nodes(self):
+        self.assert_message_from_report(
+            (
+                "Unable to get status of the site with nodes 'node1', 'node2' "
+                "in 30 seconds"
+            ),
+            reports.DrSiteStatusTimedOut(["node2", "node1"], 30),
+        )
+
+
 class NodeInLocalCluster(NameBuildTest):
     def test_success(self):
         self.assert_message_from_report(
@@ -6363,6 +6502,23 @@ class CannotRemoveResourcesNotStopped(NameBuildTest):
         )
 
 
+class CannotCreateResources(NameBuildTest):
+    def test_one_resource(self):
+        self.assert_message_from_report(
+            "Unable to create resource 'R1', no resources have been created",
+            reports.CannotCreateResources(["R1"]),
+        )
+
+    def test_multiple_resources(self):
+        self.assert_message_from_report(
+            (
+                "Unable to create resources 'R1', 'R2', no resources have "
+                "been created"
+            ),
+            reports.CannotCreateResources(["R2", "R1"]),
+        )
+
+
 class DlmClusterRenameNeeded(NameBuildTest):
     def test_success(self):
         self.assert_message_from_report(
@@ -59,6 +59,15 @@ class ReportProcessorToLog(TestCase):
         self.mock_logger.warning.assert_not_called()
         self.mock_logger.info.assert_not_called()
 
+    def test_debug_enabled(self):
+        self.mock_logger.isEnabledFor.return_value = True
+        self.assertTrue(self.report_processor.is_debug_enabled)
+        self.mock_logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+
+    def test_debug_disabled(self):
+        self.mock_logger.isEnabledFor.return_value = False
+        self.assertFalse(self.report_processor.is_debug_enabled)
+
     def test_log_with_context(self):
         self.report_processor.report(
             reports.ReportItem.error(
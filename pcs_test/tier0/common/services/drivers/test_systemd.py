@@ -3,7 +3,7 @@ from unittest import TestCase, mock
 from pcs.common.services import errors
 from pcs.common.services.drivers import SystemdDriver
 from pcs.common.services.interfaces import ExecutorInterface
-from pcs.common.services.types import ExecutorResult
+from pcs.common.services.types import ExecutorResult, ServiceState
 
 
 def service_name(service, instance=None):
@@ -246,3 +246,130 @@ class GetAvailableServicesTest(Base):
         self.mock_executor.run.assert_called_once_with(
             [self.binary, "list-unit-files", "--full"]
         )
+
+
+class GetServicesStateTest(Base):
+    show_args = ["show", "--property=Id,ActiveState,UnitFileState", "--"]
+
+    def setUp(self):
+        super().setUp()
+        self.show_output = (
+            "Id=running.service\n"
+            "ActiveState=active\n"
+            "UnitFileState=enabled\n"
+            "\n"
+            "Id=stopped.service\n"
+            "ActiveState=inactive\n"
+            "UnitFileState=disabled\n"
+            "\n"
+            "Id=missing.service\n"
+            "ActiveState=inactive\n"
+            "UnitFileState=\n"
+        )
+        self.expected_state = {
+            "running": ServiceState(installed=True, enabled=True, running=True),
+            "stopped": ServiceState(
+                installed=True, enabled=False, running=False
+            ),
+            "missing": ServiceState(
+                installed=False, enabled=False, running=False
+            ),
+        }
+
+    def test_success(self):
+        self.mock_executor.run.return_value = ExecutorResult(
+            0, self.show_output, ""
+        )
+        self.assertEqual(
+            self.driver.get_services_state(["running", "stopped", "missing"]),
+            self.expected_state,
+        )
+        self.mock_executor.run.assert_called_once_with(
+            [self.binary]
+            + self.show_args
+            + ["running.service", "stopped.service", "missing.service"]
+        )
+
+    def test_snapshot_reused(self):
+        self.mock_executor.run.return_value = ExecutorResult(
+            0, self.show_output, ""
+        )
+        self.driver.get_services_state(["running", "stopped", "missing"])
+        self.assertEqual(
+            self.driver.get_services_state(["missing", "running"]),
+            {
+                "missing": self.expected_state["missing"],
+                "running": self.expected_state["running"],
+            },
+        )
+        self.mock_executor.run.assert_called_once()
+
+    def test_snapshot_queries_missing_services_only(self):
+        self.mock_executor.run.side_effect = [
+            ExecutorResult(
+                0,
+                "Id=running.service\nActiveState=active\n"
+                "UnitFileState=static\n",
+                "",
+            ),
+            ExecutorResult(
+                0,
+                "Id=stopped.service\nActiveState=failed\n"
+                "UnitFileState=disabled\n",
+                "",
+            ),
+        ]
+        self.driver.get_services_state(["running"])
+        self.assertEqual(
+            self.driver.get_services_state(["running", "stopped"]),
+            {
+                "running": self.expected_state["running"],
+                "stopped": self.expected_state["stopped"],
+            },
+        )
+        self.assertEqual(
+            self.mock_executor.run.mock_calls,
+            [
+                mock.call([self.binary] + self.show_args + ["running.service"]),
+                mock.call([self.binary] + self.show_args + ["stopped.service"]),
+            ],
+        )
+
+    @mock.patch("pcs.common.services.drivers.systemd.time.monotonic")
+    def test_snapshot_expired(self, mock_monotonic):
+        mock_monotonic.side_effect = [100.0, 110.0]
+        self.mock_executor.run.return_value = ExecutorResult(
+            0, self.show_output, ""
+        )
+        self.driver.get_services_state(["running", "stopped", "missing"])
+        self.driver.get_services_state(["running", "stopped", "missing"])
+        self.assertEqual(self.mock_executor.run.call_count, 2)
+
+    def test_snapshot_dropped_on_service_change(self):
+        self.mock_executor.run.return_value = ExecutorResult(
+            0, self.show_output, ""
+        )
+        self.driver.get_services_state(["running", "stopped", "missing"])
+        self.driver.start("stopped")
+        self.driver.get_services_state(["running", "stopped", "missing"])
+        self.assertEqual(self.mock_executor.run.call_count, 3)
+
+    def test_failure_fallback(self):
+        self.driver._available_services = ["running"]
+        self.mock_executor.run.side_effect = [
+            ExecutorResult(1, "", "error"),
+            ExecutorResult(0, "enabled", ""),
+            ExecutorResult(0, "active", ""),
+        ]
+        self.assertEqual(
+            self.driver.get_services_state(["running"]),
+            {"running": self.expected_state["running"]},
+        )
+        self.assertEqual(
+            self.mock_executor.run.mock_calls,
+            [
+                mock.call([self.binary] + self.show_args + ["running.service"]),
+                mock.call([self.binary, "is-enabled", "running.service"]),
+                mock.call([self.binary, "is-active", "running.service"]),
+            ],
+        )
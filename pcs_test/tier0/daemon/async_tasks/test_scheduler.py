@@ -219,6 +219,20 @@ class ProcessTasksTest(SchedulerBaseAsyncTestCase):
             ]
         )
 
+    async def test_unchanged_tasks_not_processed(self):
+        self._create_tasks(3)
+        await self.scheduler._process_tasks()
+        with mock.patch.object(
+            self.scheduler, "_process_task", wraps=self.scheduler._process_task
+        ) as mock_process_task:
+            await self.scheduler._process_tasks()
+            mock_process_task.assert_not_called()
+            self.scheduler.kill_task("id1", AUTH_USER)
+            await self.scheduler._process_tasks()
+            mock_process_task.assert_called_once_with(
+                self.scheduler._task_register["id1"]
+            )
+
 
 def get_generator(return_values):
     def generator():
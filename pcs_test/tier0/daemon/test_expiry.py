@@ -0,0 +1,58 @@
+from unittest import TestCase
+
+from pcs.daemon.expiry import ExpiryQueue
+
+
+class ExpiryQueueTest(TestCase):
+    def setUp(self):
+        self.queue = ExpiryQueue()
+
+    def test_empty(self):
+        self.assertEqual(len(self.queue), 0)
+        self.assertEqual(self.queue.pop_expired(100), [])
+
+    def test_pop_expired_in_order(self):
+        self.queue.set("c", 30)
+        self.queue.set("a", 10)
+        self.queue.set("b", 20)
+        self.queue.set("d", 40)
+        self.assertEqual(self.queue.pop_expired(5), [])
+        self.assertEqual(self.queue.pop_expired(30), ["a", "b", "c"])
+        self.assertEqual(list(self.queue), ["d"])
+        self.assertNotIn("a", self.queue)
+        self.assertEqual(self.queue.pop_expired(50), ["d"])
+        self.assertEqual(len(self.queue), 0)
+
+    def test_change_expiration(self):
+        self.queue.set("a", 10)
+        self.queue.set("b", 20)
+        self.queue.set("a", 30)
+        self.queue.set("b", 5)
+        self.assertEqual(self.queue.get("a"), 30)
+        self.assertEqual(self.queue.pop_expired(20), ["b"])
+        self.assertEqual(self.queue.pop_expired(30), ["a"])
+
+    def test_discard(self):
+        self.queue.set("a", 10)
+        self.queue.set("b", 20)
+        self.queue.discard("a")
+        self.queue.discard("nonexistent")
+        self.assertIsNone(self.queue.get("a"))
+        self.assertEqual(self.queue.pop_expired(30), ["b"])
+
+    def test_set_again_after_expired(self):
+        self.queue.set("a", 10)
+        self.assertEqual(self.queue.pop_expired(10), ["a"])
+        self.queue.set("a", 10)
+        self.assertEqual(self.queue.pop_expired(10), ["a"])
+
+    def test_replaced_entries_are_compacted(self):
+        for i in range(1000):
+            self.queue.set("a", i)
+            self.queue.set(f"key{i}", i)
+            self.queue.discard(f"key{i}")
+        self.assertEqual(len(self.queue), 1)
+        self.assertLessEqual(
+            len(self.queue._heap), ExpiryQueue._COMPACT_MIN_SIZE
+        )
+        self.assertEqual(self.queue.pop_expired(2000), ["a"])
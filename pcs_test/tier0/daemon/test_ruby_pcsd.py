@@ -1,17 +1,21 @@
+import asyncio
 import json
 import logging
+import os
 from base64 import b64encode
 from unittest import TestCase, mock
 from urllib.parse import urlencode
 
+from tornado.httpserver import HTTPServer
 from tornado.httputil import HTTPHeaders, HTTPServerRequest
+from tornado.netutil import bind_unix_socket
 from tornado.testing import AsyncTestCase, gen_test
-from tornado.web import HTTPError
+from tornado.web import Application, HTTPError, RequestHandler
 
-from pcs.daemon import ruby_pcsd
+from pcs.daemon import log, ruby_pcsd
 from pcs.lib.auth.types import AuthUser
 
-from pcs_test.tools.misc import create_patcher
+from pcs_test.tools.misc import create_patcher, get_tmp_dir, get_tmp_file
 from pcs_test.tools.misc import get_test_resource as rc
 
 # Don't write errors to test output.
@@ -109,13 +113,165 @@ class ProcessResponseLog(TestCase):
                     "level": "FATAL",
                     "timestamp_usec": 1234567890,
                     "message": "ruby_message",
-                }
+                },
+                {
+                    "level": "INFO",
+                    "timestamp_usec": 1234567891,
+                    "message": "another_message",
+                },
             ]
         )
         from_external_source.assert_called_once_with(
-            level=logging.CRITICAL,
-            created=1234.56789,
-            usecs=567890,
-            message="ruby_message",
-            group_id=1,
+            [
+                log.ExternalLogEntry(
+                    level=logging.CRITICAL,
+                    created=1234.56789,
+                    usecs=567890,
+                    message="ruby_message",
+                ),
+                log.ExternalLogEntry(
+                    level=logging.INFO,
+                    created=1234.567891,
+                    usecs=567891,
+                    message="another_message",
+                ),
+            ],
+            1,
+        )
+
+    @patch_ruby_pcsd("log.from_external_source")
+    def test_no_logs(self, from_external_source):
+        ruby_pcsd.process_response_logs([])
+        from_external_source.assert_not_called()
+
+    def test_logs_written_in_batch(self):
+        tmp_file = get_tmp_file("tier0_daemon_ruby_log")
+        self.addCleanup(tmp_file.close)
+        handler = log.BatchFileHandler(tmp_file.name, encoding="utf8")
+        handler.setFormatter(log.Formatter())
+        self.addCleanup(handler.close)
+        log.pcsd.addHandler(handler)
+        self.addCleanup(log.pcsd.removeHandler, handler)
+        log.pcsd.setLevel(logging.INFO)
+        self.addCleanup(log.pcsd.setLevel, logging.CRITICAL)
+
+        with mock.patch.object(
+            handler, "reopenIfNeeded", wraps=handler.reopenIfNeeded
+        ) as mock_reopen:
+            ruby_pcsd.process_response_logs(
+                [
+                    {
+                        "level": level,
+                        "timestamp_usec": 1234567890 + i,
+                        "message": f"message {i}",
+                    }
+                    for i, level in enumerate(["INFO", "DEBUG", "ERROR"] * 10)
+                ]
+            )
+        # the log file is checked once for the whole batch
+        mock_reopen.assert_called_once_with()
+        lines = tmp_file.read().splitlines()
+        self.assertEqual(len(lines), 20)
+        self.assertTrue(lines[0].endswith("INFO -- : message 0"))
+        self.assertTrue(lines[1].endswith("ERROR -- : message 2"))
+
+
+class FakeRubyDaemonHandler(RequestHandler):
+    # pylint: disable=abstract-method
+    def initialize(self, backend):
+        # pylint: disable=arguments-differ
+        self.backend = backend
+
+    async def get(self):
+        backend = self.backend
+        backend.connections.add(self.request.connection.stream)
+        backend.running += 1
+        backend.max_running = max(backend.max_running, backend.running)
+        try:
+            if backend.barrier:
+                await asyncio.wait_for(backend.barrier.wait(), timeout=5)
+            else:
+                await asyncio.sleep(backend.delay)
+        finally:
+            backend.running -= 1
+        self.write(json.dumps({"path": self.request.path, "logs": []}))
+
+
+class FakeRubyDaemon:
+    def __init__(self, socket_path, delay=0, parties=None):
+        self.delay = delay
+        # requests wait for each other in groups of 'parties' if specified
+        self.barrier = asyncio.Barrier(parties) if parties else None
+        self.connections = set()
+        self.running = 0
+        self.max_running = 0
+        self.server = HTTPServer(
+            Application([(r"/.*", FakeRubyDaemonHandler, dict(backend=self))])
+        )
+        self.server.add_socket(bind_unix_socket(socket_path))
+
+
+class SendToRubyPool(AsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = get_tmp_dir("tier0_daemon_ruby_pool")
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.socket_path = os.path.join(self.tmp_dir.name, "ruby.socket")
+        self.daemon = None
+
+    def tearDown(self):
+        # the server must be stopped before the IOLoop is closed
+        if self.daemon:
+            self.daemon.server.stop()
+        super().tearDown()
+
+    def start_daemon(self, delay=0, parties=None):
+        self.daemon = FakeRubyDaemon(self.socket_path, delay, parties)
+        return self.daemon
+
+    def send(self, wrapper, path):
+        return wrapper.send_to_ruby(
+            ruby_pcsd.RubyDaemonRequest(
+                ruby_pcsd.SINATRA,
+                HTTPServerRequest(method="GET", uri=path),
+            )
+        )
+
+    @gen_test
+    async def test_connections_reused(self):
+        # requests are answered only when 4 of them run at the same time
+        daemon = self.start_daemon(parties=4)
+        wrapper = ruby_pcsd.Wrapper(
+            self.socket_path, max_connections=4, max_queued_requests=100
+        )
+        response_list = await asyncio.gather(
+            *[self.send(wrapper, f"request{i}") for i in range(32)]
+        )
+        self.assertEqual(
+            [json.loads(response)["path"] for response in response_list],
+            [f"/request{i}" for i in range(32)],
+        )
+        self.assertEqual(daemon.max_running, 4)
+        # each connection is kept open and serves many requests
+        self.assertLessEqual(len(daemon.connections), 4)
+
+    @gen_test
+    async def test_requests_over_limit_rejected(self):
+        daemon = self.start_daemon(0.2)
+        wrapper = ruby_pcsd.Wrapper(
+            self.socket_path, max_connections=1, max_queued_requests=1
+        )
+        result_list = await asyncio.gather(
+            *[self.send(wrapper, f"request{i}") for i in range(3)],
+            return_exceptions=True,
+        )
+        self.assertEqual(json.loads(result_list[0])["path"], "/request0")
+        self.assertEqual(json.loads(result_list[1])["path"], "/request1")
+        self.assertIsInstance(result_list[2], HTTPError)
+        self.assertEqual(result_list[2].status_code, 503)
+        self.assertEqual(daemon.max_running, 1)
+        # the limit is applied to pending requests only
+        self.assertEqual(
+            json.loads(await self.send(wrapper, "request3"))["path"],
+            "/request3",
         )
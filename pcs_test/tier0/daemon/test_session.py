@@ -83,6 +83,17 @@ class StorageTest(TestCase, PatchSessionMixin):
         self.storage.login(USER)
         self.assertIsNone(self.storage.get(session1.sid))
 
+    def test_does_not_drop_refreshed_session(self):
+        session1 = self.storage.login(USER)
+        self.now.return_value = 8
+        self.assertIs(self.storage.get(session1.sid), session1)
+        self.now.return_value = 12
+        self.storage.drop_expired()
+        self.assertIs(self.storage.get(session1.sid), session1)
+        self.now.return_value = 23
+        self.storage.drop_expired()
+        self.assertIsNone(self.storage.get(session1.sid))
+
     def test_can_login_new_session(self):
         session1 = self.storage.login(USER)
         self.assertIsNotNone(session1)
@@ -1,3 +1,4 @@
+import logging
 import os
 from textwrap import dedent
 from unittest import TestCase, mock
@@ -5,6 +6,11 @@ from unittest import TestCase, mock
 import pcs.lib.booth.status as lib
 from pcs import settings
 from pcs.common import file_type_codes, reports
+from pcs.common.booth_dto import (
+    BoothPeerStatusDto,
+    BoothStatusDto,
+    BoothTicketStatusDto,
+)
 from pcs.common.reports import ReportItemSeverity as Severities
 from pcs.common.reports import codes as report_codes
 from pcs.lib.booth import constants
@@ -13,6 +19,8 @@ from pcs.lib.external import CommandRunner
 from pcs_test.tools import fixture
 from pcs_test.tools.assertions import assert_raise_library_error
 from pcs_test.tools.command_env import get_env_tools
+from pcs_test.tools.custom_mock import MockLibraryReportProcessor
+from pcs_test.tools.misc import get_test_resource
 
 
 class GetDaemonStatusTest(TestCase):
@@ -119,6 +127,190 @@ class GetPeersStatusTest(TestCase):
         )
 
 
+class GetStatusTest(TestCase):
+    def setUp(self):
+        self.mock_run = mock.MagicMock(spec_set=CommandRunner)
+
+    @staticmethod
+    def fixture_run(output_map):
+        def run(cmd):
+            return output_map[cmd[1]]
+
+        return run
+
+    def test_success(self):
+        self.mock_run.run.side_effect = self.fixture_run(
+            {
+                "status": ("daemon", "", 0),
+                "list": ("tickets", "", 0),
+                "peers": ("peers", "", 0),
+            }
+        )
+        self.assertEqual(
+            lib.get_status(self.mock_run, "name"),
+            lib.BoothStatus(True, "daemon", "tickets", "peers"),
+        )
+        self.assertEqual(
+            sorted(call.args[0] for call in self.mock_run.run.call_args_list),
+            [
+                [settings.booth_exec, "list", "-c", "name"],
+                [settings.booth_exec, "peers", "-c", "name"],
+                [settings.booth_exec, "status", "-c", "name"],
+            ],
+        )
+
+    def test_daemon_not_running(self):
+        self.mock_run.run.side_effect = self.fixture_run(
+            {
+                "status": ("", "error", 7),
+                "list": ("tickets", "", 0),
+                "peers": ("peers", "", 0),
+            }
+        )
+        self.assertEqual(
+            lib.get_status(self.mock_run),
+            lib.BoothStatus(False, "", "tickets", "peers"),
+        )
+
+    def test_daemon_not_running_tolerated(self):
+        self.mock_run.run.side_effect = self.fixture_run(
+            {
+                "status": ("", "error", 7),
+                "list": ("", "error", 7),
+                "peers": ("", "error", 7),
+            }
+        )
+        self.assertEqual(
+            lib.get_status(self.mock_run, tolerate_stopped_daemon=True),
+            lib.BoothStatus(False, "", "", ""),
+        )
+
+    def test_daemon_not_running_not_tolerated(self):
+        self.mock_run.run.side_effect = self.fixture_run(
+            {
+                "status": ("", "error", 7),
+                "list": ("", "error", 7),
+                "peers": ("peers", "", 0),
+            }
+        )
+        assert_raise_library_error(
+            lambda: lib.get_status(self.mock_run),
+            (
+                Severities.ERROR,
+                report_codes.BOOTH_TICKET_STATUS_ERROR,
+                {"reason": "error"},
+            ),
+        )
+
+    def test_failure(self):
+        self.mock_run.run.side_effect = self.fixture_run(
+            {
+                "status": ("daemon", "", 0),
+                "list": ("out", "error", 1),
+                "peers": ("peers", "", 0),
+            }
+        )
+        assert_raise_library_error(
+            lambda: lib.get_status(self.mock_run),
+            (
+                Severities.ERROR,
+                report_codes.BOOTH_TICKET_STATUS_ERROR,
+                {"reason": "error\nout"},
+            ),
+        )
+
+    def test_stub_booth(self):
+        run_records = []
+        runner = CommandRunner(
+            mock.MagicMock(logging.Logger),
+            MockLibraryReportProcessor(),
+            run_records=run_records,
+        )
+        with mock.patch.object(
+            settings, "booth_exec", get_test_resource("booth_stub")
+        ):
+            booth_status = lib.get_status(runner)
+        # each of the booth commands is run exactly once
+        self.assertEqual(
+            sorted(record.args[1] for record in run_records),
+            ["list", "peers", "status"],
+        )
+        self.assertEqual(
+            lib.status_to_dto(booth_status),
+            BoothStatusDto(
+                daemon_running=True,
+                daemon_attributes={
+                    "booth_lockpid": "2271",
+                    "booth_state": "started",
+                    "booth_type": "site",
+                    "booth_cfg_name": "booth",
+                    "booth_id": "1977614404",
+                    "booth_addr_port": "192.168.122.81:9929",
+                },
+                ticket_list=[
+                    BoothTicketStatusDto(
+                        "ticketA", "192.168.122.81", "2024-05-29 13:41:48"
+                    ),
+                    BoothTicketStatusDto("ticketB", None, None),
+                ],
+                peer_list=[
+                    BoothPeerStatusDto(
+                        "site", "192.168.122.82", "2024-05-29 13:41:40"
+                    ),
+                    BoothPeerStatusDto("arbitrator", "192.168.122.83", None),
+                ],
+            ),
+        )
+
+
+class StatusToDtoTest(TestCase):
+    def test_daemon_not_running(self):
+        self.assertEqual(
+            lib.status_to_dto(lib.BoothStatus(False, "some error", "", "")),
+            BoothStatusDto(
+                daemon_running=False,
+                daemon_attributes={},
+                ticket_list=[],
+                peer_list=[],
+            ),
+        )
+
+    def test_unknown_lines_ignored(self):
+        self.assertEqual(
+            lib.status_to_dto(
+                lib.BoothStatus(
+                    True,
+                    "booth_state=started some text booth_addr_port='a b",
+                    dedent(
+                        """\
+                        something else
+                        ticket: T1, leader: NONE, expires: INF, commit: 0
+                        """
+                    ),
+                    dedent(
+                        """\
+                        peers:
+                        site: 192.168.1.1, last recv: 2024-05-29 13:41:40
+                        """
+                    ),
+                )
+            ),
+            BoothStatusDto(
+                daemon_running=True,
+                daemon_attributes={
+                    "booth_state": "started",
+                    "booth_addr_port": "'a",
+                },
+                ticket_list=[BoothTicketStatusDto("T1", None, "INF")],
+                peer_list=[
+                    BoothPeerStatusDto(
+                        "site", "192.168.1.1", "2024-05-29 13:41:40"
+                    )
+                ],
+            ),
+        )
+
+
 class CheckAuthfileMisconfiguration(TestCase):
     def setUp(self):
         self.instance_name = "instance_name"
@@ -1,9 +1,11 @@
 import dataclasses
+import random
 from textwrap import dedent
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from pcs.common.str_tools import indent
 from pcs.lib.cib import rule
+from pcs.lib.cib.rule import parser as rule_parser
 from pcs.lib.cib.rule.expression_part import BoolExpr
 
 
@@ -958,3 +960,184 @@ class Parser(TestCase):
                         exception_data, (e.lineno, e.colno, e.pos, e.msg)
                     )
                 self.assertEqual(rule_string, e.rule_string)
+
+
+class FastParserDifferential(TestCase):
+    """
+    Compare the fast parser to the grammar on random rules
+    """
+
+    # fixed seed, so that failures are reproducible
+    SEED = 20261019
+    RULE_COUNT = 600
+
+    KEYWORDS = (
+        "and",
+        "or",
+        "date",
+        "gt",
+        "lt",
+        "in_range",
+        "to",
+        "duration",
+        "date-spec",
+        "defined",
+        "not_defined",
+        "eq",
+        "ne",
+        "gte",
+        "lte",
+        "integer",
+        "number",
+        "string",
+        "version",
+        "resource",
+        "op",
+        "interval=10s",
+    )
+    VALUES = (
+        "#uname",
+        "node1",
+        "pingd",
+        "10",
+        "-5",
+        "2020-01-01",
+        "hours=1",
+        "weekdays=1-5",
+        "years=2",
+        "ocf:pacemaker:Dummy",
+        "::dummy",
+        "a:b:c:d",
+        "monitor",
+        "interval=abc",
+        "gt-5",
+        "integer-5",
+        "a=",
+        "ınteger",
+        "x y",
+    )
+
+    def setUp(self):
+        self.random = random.Random(self.SEED)
+
+    def _chance(self, probability):
+        return self.random.random() < probability
+
+    def _word(self):
+        # values are more common than keywords in valid rules
+        word = self.random.choice(
+            self.KEYWORDS if self._chance(0.15) else self.VALUES
+        )
+        if self._chance(0.2):
+            word = word.upper()
+        return word
+
+    def _value(self, valid_values):
+        # mostly valid values, so that many of the rules are valid
+        if self._chance(0.85):
+            return self.random.choice(valid_values)
+        return self._word()
+
+    def _simple_expr(self):
+        value = self._value
+        choice = self.random.choice
+        node_values = ["#uname", "node1", "pingd", "10", "-5", "ınteger"]
+        dates = ["2020-01-01", "2021-12-31"]
+        date_parts = ["hours=1", "weekdays=1-5", "years=2"]
+        return choice(
+            [
+                lambda: f"date {choice(['gt', 'lt', 'GT'])} {value(dates)}",
+                lambda: f"date in_range {value(dates)} to {value(dates)}",
+                lambda: f"date in_range to {value(dates)}",
+                lambda: (
+                    f"date in_range to duration {value(date_parts)} "
+                    f"{value(date_parts)}"
+                ),
+                lambda: f"date-spec {value(date_parts)} {value(date_parts)}",
+                lambda: (
+                    f"{choice(['defined', 'not_defined'])} {value(node_values)}"
+                ),
+                lambda: (
+                    f"{value(node_values)} {choice(['eq', 'ne', 'lt'])} "
+                    f"{value(node_values)}"
+                ),
+                lambda: (
+                    f"{value(node_values)} gte "
+                    f"{choice(['integer', 'string', 'Version'])} "
+                    f"{value(node_values)}"
+                ),
+                lambda: f"resource {value(['ocf:pacemaker:Dummy', '::dummy'])}",
+                lambda: f"op {value(['monitor', 'start'])}",
+                lambda: (
+                    f"op {value(['monitor'])} "
+                    f"{value(['interval=10s', 'INTERVAL=5'])}"
+                ),
+                lambda: " ".join(
+                    self._word() for _ in range(self.random.randint(1, 4))
+                ),
+            ]
+        )()
+
+    def _expr(self, depth):
+        if depth <= 0 or self._chance(0.3):
+            return self._simple_expr()
+        parts = [self._operand(depth)]
+        for _ in range(self.random.randint(0, 3)):
+            parts.append(self.random.choice(["and", "or", "AND", "Or"]))
+            parts.append(self._operand(depth))
+        return " ".join(parts)
+
+    def _operand(self, depth):
+        if self._chance(0.4):
+            return f"({self._expr(depth - 1)})"
+        return self._expr(depth - 1)
+
+    def _mutate(self, rule_string):
+        tokens = rule_string.split(" ")
+        for _ in range(self.random.randint(1, 2)):
+            pos = self.random.randrange(len(tokens))
+            mutation = self.random.choice(["drop", "insert", "paren"])
+            if mutation == "drop" and len(tokens) > 1:
+                del tokens[pos]
+            elif mutation == "insert":
+                tokens.insert(pos, self._word())
+            else:
+                tokens.insert(pos, self.random.choice(["(", ")"]))
+        return self.random.choice([" ", "  ", "\t"]).join(tokens)
+
+    @staticmethod
+    def _parse_by_grammar(rule_string):
+        with mock.patch.object(
+            rule_parser,
+            "_FastRuleParser",
+            side_effect=rule_parser._FastRuleParserGaveUp,
+        ):
+            return rule.parse_rule(rule_string)
+
+    def test_same_result(self):
+        fast_parsed_count = 0
+        for _ in range(self.RULE_COUNT):
+            rule_string = self._expr(self.random.randint(0, 4))
+            if self._chance(0.3):
+                rule_string = self._mutate(rule_string)
+            with self.subTest(rule_string=rule_string):
+                try:
+                    expected = self._parse_by_grammar(rule_string)
+                except rule.RuleParseError:
+                    expected = None
+                try:
+                    fast_parsed = rule_parser._FastRuleParser(
+                        rule_string
+                    ).parse()
+                except rule_parser._FastRuleParserGaveUp:
+                    fast_parsed = None
+                if fast_parsed is None:
+                    continue
+                fast_parsed_count += 1
+                self.assertIsNotNone(expected)
+                self.assertEqual(expected, rule.parse_rule(rule_string))
+                if not isinstance(fast_parsed, BoolExpr):
+                    fast_parsed = BoolExpr("AND", [fast_parsed])
+                self.assertEqual(expected, fast_parsed)
+        # make sure the fast parser is actually tested
+        self.assertGreater(fast_parsed_count, self.RULE_COUNT // 3)
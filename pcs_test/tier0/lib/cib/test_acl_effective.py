@@ -0,0 +1,360 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.common import reports
+from pcs.lib.cib import acl_effective as lib
+
+from pcs_test.tools import fixture
+from pcs_test.tools.assertions import assert_report_item_list_equal
+
+FIXTURE_CIB = """
+    <cib>
+        <configuration>
+            <crm_config>
+                <cluster_property_set id="cib-bootstrap-options">
+                    <nvpair id="cib-bootstrap-options-enable-acl"
+                        name="enable-acl" value="{acl_enabled}"
+                    />
+                </cluster_property_set>
+            </crm_config>
+            <resources>
+                <primitive id="R1" class="ocf" provider="pacemaker"
+                    type="Dummy" description="first"
+                />
+                <primitive id="R2" class="ocf" provider="pacemaker"
+                    type="Dummy"
+                >
+                    <meta_attributes id="R2-meta_attributes"/>
+                </primitive>
+                <group id="G1">
+                    <primitive id="R3" class="ocf" provider="pacemaker"
+                        type="Dummy"
+                    />
+                </group>
+            </resources>
+            <constraints/>
+            <acls>{acls}</acls>
+        </configuration>
+        <status/>
+    </cib>
+"""
+
+
+def fixture_role(role_id, *permissions):
+    permission_list = "".join(
+        f'<acl_permission id="{role_id}-{i}" kind="{kind}" {scope}/>'
+        for i, (kind, scope) in enumerate(permissions)
+    )
+    return f'<acl_role id="{role_id}">{permission_list}</acl_role>'
+
+
+def fixture_target(tag, target_id, *role_ids, name=None):
+    name_attr = f'name="{name}"' if name else ""
+    roles = "".join(f'<role id="{role_id}"/>' for role_id in role_ids)
+    return f'<{tag} id="{target_id}" {name_attr}>{roles}</{tag}>'
+
+
+class GetEffectivePermissions(TestCase):
+    def evaluate(
+        self, acls, user_id="user1", group_id_list=(), acl_enabled="true"
+    ):
+        cib = etree.fromstring(
+            FIXTURE_CIB.format(acls=acls, acl_enabled=acl_enabled)
+        )
+        return lib.get_effective_permissions(
+            cib, cib.find("configuration/acls"), user_id, group_id_list
+        )
+
+    def assert_access(
+        self, acls, expected, user_id="user1", group_ids=(), acl_enabled="true"
+    ):
+        dto, report_list = self.evaluate(acls, user_id, group_ids, acl_enabled)
+        self.assertEqual(report_list, [])
+        self.assertEqual(
+            [
+                (access.path, access.access, access.permission_id_list)
+                for access in dto.access_list
+            ],
+            expected,
+        )
+        return dto
+
+    def test_no_roles(self):
+        dto = self.assert_access(
+            fixture_target("acl_target", "user1"),
+            [("/cib", "deny", [])],
+        )
+        self.assertTrue(dto.acl_enabled)
+        self.assertTrue(dto.restricted)
+
+    def test_acl_disabled(self):
+        dto = self.assert_access(
+            fixture_role("role1", ("deny", 'xpath="/"'))
+            + fixture_target("acl_target", "user1", "role1"),
+            [("/cib", "write", [])],
+            acl_enabled="false",
+        )
+        self.assertFalse(dto.acl_enabled)
+        self.assertFalse(dto.restricted)
+        self.assertEqual(dto.role_id_list, ["role1"])
+
+    def test_privileged_users_not_restricted(self):
+        acls = fixture_role("role1", ("deny", 'xpath="/"')) + fixture_target(
+            "acl_group", "group1", "role1"
+        )
+        for user_id in ("root", "hacluster"):
+            with self.subTest(user_id=user_id):
+                dto = self.assert_access(
+                    acls,
+                    [("/cib", "write", [])],
+                    user_id=user_id,
+                    group_ids=["group1"],
+                )
+                self.assertTrue(dto.acl_enabled)
+                self.assertFalse(dto.restricted)
+                self.assertEqual(dto.role_id_list, ["role1"])
+
+    def test_acl_disabled_missing_user(self):
+        dto, report_list = self.evaluate("", acl_enabled="false")
+        self.assertFalse(dto.restricted)
+        assert_report_item_list_equal(
+            report_list,
+            [
+                fixture.error(
+                    reports.codes.ID_NOT_FOUND,
+                    id="user1",
+                    expected_types=["acl_target"],
+                    context_type="",
+                    context_id="",
+                ),
+            ],
+        )
+
+    def test_read_all_write_reference(self):
+        self.assert_access(
+            fixture_role(
+                "role1", ("read", 'xpath="/"'), ("write", 'reference="R2"')
+            )
+            + fixture_target("acl_target", "user1", "role1"),
+            [
+                ("/cib", "read", ["role1-0"]),
+                (
+                    "/cib/configuration/resources/primitive[@id='R2']",
+                    "write",
+                    ["role1-1"],
+                ),
+            ],
+        )
+
+    def test_nearest_element_wins(self):
+        self.assert_access(
+            fixture_role(
+                "role1",
+                ("write", 'reference="G1"'),
+                ("deny", 'xpath="//resources"'),
+                ("read", 'reference="R3"'),
+            )
+            + fixture_target("acl_target", "user1", "role1"),
+            [
+                ("/cib", "deny", []),
+                ("/cib/configuration/resources", "deny", ["role1-1"]),
+                (
+                    "/cib/configuration/resources/group[@id='G1']",
+                    "write",
+                    ["role1-0"],
+                ),
+                (
+                    "/cib/configuration/resources/group[@id='G1']"
+                    "/primitive[@id='R3']",
+                    "read",
+                    ["role1-2"],
+                ),
+            ],
+        )
+
+    def test_deny_takes_precedence_over_roles(self):
+        self.assert_access(
+            fixture_role("role1", ("write", 'reference="R1"'))
+            + fixture_role("role2", ("deny", "xpath=\"//primitive[@id='R1']\""))
+            + fixture_role("role3", ("read", 'reference="R1"'))
+            + fixture_target("acl_target", "user1", "role1", "role3")
+            + fixture_target("acl_group", "group1", "role2"),
+            [
+                ("/cib", "deny", []),
+                (
+                    "/cib/configuration/resources/primitive[@id='R1']",
+                    "deny",
+                    ["role2-0"],
+                ),
+            ],
+            group_ids=["group1"],
+        )
+
+    def test_write_takes_precedence_over_read(self):
+        self.assert_access(
+            fixture_role(
+                "role1",
+                ("read", 'object-type="primitive"'),
+                ("write", 'reference="R1"'),
+            )
+            + fixture_target("acl_target", "user1", "role1"),
+            [
+                ("/cib", "deny", []),
+                (
+                    "/cib/configuration/resources/primitive[@id='R1']",
+                    "write",
+                    ["role1-1"],
+                ),
+                (
+                    "/cib/configuration/resources/primitive[@id='R2']",
+                    "read",
+                    ["role1-0"],
+                ),
+                (
+                    "/cib/configuration/resources/group[@id='G1']"
+                    "/primitive[@id='R3']",
+                    "read",
+                    ["role1-0"],
+                ),
+            ],
+        )
+
+    def test_object_type_and_attribute(self):
+        self.assert_access(
+            fixture_role(
+                "role1",
+                ("write", 'object-type="primitive" attribute="description"'),
+                ("read", 'object-type="meta_attributes" reference="R1"'),
+                ("read", 'object-type="meta_attributes" reference="R2"'),
+                ("read", 'reference="R2-meta_attributes"'),
+            )
+            + fixture_target("acl_target", "user1", "role1"),
+            [
+                ("/cib", "deny", []),
+                (
+                    "/cib/configuration/resources/primitive[@id='R1']",
+                    "write",
+                    ["role1-0"],
+                ),
+                (
+                    "/cib/configuration/resources/primitive[@id='R2']"
+                    "/meta_attributes[@id='R2-meta_attributes']",
+                    "read",
+                    ["role1-3"],
+                ),
+            ],
+        )
+
+    def test_xpath_matching_attributes_and_positions(self):
+        self.assert_access(
+            fixture_role(
+                "role1",
+                ("read", 'xpath="//primitive/@description"'),
+                ("write", 'xpath="/cib/*[2]"'),
+            )
+            + fixture_target("acl_target", "user1", "role1"),
+            [
+                ("/cib", "deny", []),
+                (
+                    "/cib/configuration/resources/primitive[@id='R1']",
+                    "read",
+                    ["role1-0"],
+                ),
+                ("/cib/status", "write", ["role1-1"]),
+            ],
+        )
+
+    def test_user_and_group_by_name(self):
+        self.assert_access(
+            fixture_role("role1", ("read", 'reference="R1"'))
+            + fixture_role("role2", ("write", 'reference="R1"'))
+            + fixture_target("acl_target", "target1", "role1", name="user1")
+            + fixture_target("acl_group", "g1", "role2", name="group1"),
+            [
+                ("/cib", "deny", []),
+                (
+                    "/cib/configuration/resources/primitive[@id='R1']",
+                    "write",
+                    ["role2-0"],
+                ),
+            ],
+            group_ids=["group1"],
+        )
+
+    def test_group_only(self):
+        dto, report_list = self.evaluate(
+            fixture_role("role1", ("read", 'xpath="/"'))
+            + fixture_target("acl_group", "group1", "role1"),
+            user_id=None,
+            group_id_list=["group1"],
+        )
+        self.assertEqual(report_list, [])
+        self.assertEqual(dto.user_id, None)
+        self.assertEqual(dto.group_id_list, ["group1"])
+        self.assertEqual(dto.role_id_list, ["role1"])
+        self.assertEqual(
+            [(access.path, access.access) for access in dto.access_list],
+            [("/cib", "read")],
+        )
+
+    def test_missing_user_and_group(self):
+        dto, report_list = self.evaluate(
+            fixture_target("acl_group", "user1"), group_id_list=["group1"]
+        )
+        assert_report_item_list_equal(
+            report_list,
+            [
+                fixture.error(
+                    reports.codes.ID_NOT_FOUND,
+                    id="user1",
+                    expected_types=["acl_target"],
+                    context_type="",
+                    context_id="",
+                ),
+                fixture.error(
+                    reports.codes.ID_NOT_FOUND,
+                    id="group1",
+                    expected_types=["acl_group"],
+                    context_type="",
+                    context_id="",
+                ),
+            ],
+        )
+
+    def test_invalid_xpath(self):
+        dto, report_list = self.evaluate(
+            fixture_role(
+                "role1",
+                ("write", 'xpath="//primitive["'),
+                ("read", 'xpath="/"'),
+            )
+            + fixture_target("acl_target", "user1", "role1"),
+        )
+        assert_report_item_list_equal(
+            report_list,
+            [
+                fixture.warn(
+                    reports.codes.CIB_ACL_PERMISSION_XPATH_INVALID,
+                    permission_id="role1-0",
+                    xpath="//primitive[",
+                )
+            ],
+        )
+        self.assertEqual(
+            [(access.path, access.access) for access in dto.access_list],
+            [("/cib", "read")],
+        )
+
+
+class CompileRole(TestCase):
+    def test_compiled_roles_reused(self):
+        role_xml = fixture_role("role1", ("read", 'xpath="/"'))
+        role = lib.compile_role(etree.fromstring(role_xml))
+        self.assertIs(role, lib.compile_role(etree.fromstring(role_xml)))
+        self.assertIsNot(
+            role,
+            lib.compile_role(
+                etree.fromstring(fixture_role("role1", ("write", 'xpath="/"')))
+            ),
+        )
@@ -0,0 +1,274 @@
+import json
+import os
+from unittest import TestCase, mock
+
+from lxml import etree
+
+from pcs.lib.cib import checkpoint_index as lib
+
+from pcs_test.tools.misc import get_tmp_dir
+
+FIXTURE_CIB = """
+    <cib epoch="1">
+        <configuration>
+            <resources>
+                <group id="G">
+                    <primitive id="R1" class="ocf" provider="pacemaker"
+                        type="Dummy"
+                    >
+                        <operations>
+                            <op id="R1-monitor" name="monitor" interval="10s"/>
+                        </operations>
+                    </primitive>
+                </group>
+                <primitive id="R2" class="ocf" provider="pacemaker"
+                    type="Dummy"
+                />
+            </resources>
+            <tags>
+                <tag id="T">
+                    <obj_ref id="R1"/>
+                </tag>
+            </tags>
+        </configuration>
+    </cib>
+"""
+
+
+def fixture_digests(cib=FIXTURE_CIB, replace=()):
+    for old, new in replace:
+        cib = cib.replace(old, new)
+    return lib.get_cib_digests(etree.fromstring(cib))
+
+
+class GetCibDigests(TestCase):
+    def test_elements(self):
+        digests = fixture_digests()
+        self.assertEqual(digests.roots, ["G", "R2", "T"])
+        self.assertEqual(
+            {
+                element_id: (element.tag, element.children)
+                for element_id, element in digests.elements.items()
+            },
+            {
+                "G": ("group", ["R1"]),
+                "R1": ("primitive", ["R1-monitor"]),
+                "R1-monitor": ("op", []),
+                "R2": ("primitive", []),
+                "T": ("tag", []),
+            },
+        )
+
+    def test_nested_change_changes_ancestors(self):
+        digests = fixture_digests()
+        changed = fixture_digests(replace=[('"10s"', '"20s"')])
+        self.assertNotEqual(digests.digest, changed.digest)
+        for element_id in ("G", "R1", "R1-monitor"):
+            self.assertNotEqual(
+                digests.elements[element_id].digest,
+                changed.elements[element_id].digest,
+            )
+        for element_id in ("R2", "T"):
+            self.assertEqual(
+                digests.elements[element_id].digest,
+                changed.elements[element_id].digest,
+            )
+
+    def test_formatting_and_status_ignored(self):
+        digests = fixture_digests()
+        changed = fixture_digests(
+            replace=[
+                ("\n", ""),
+                ('epoch="1"', 'epoch="2"'),
+                ("</configuration>", "</configuration><status/>"),
+            ]
+        )
+        self.assertEqual(digests, changed)
+
+    def test_no_configuration(self):
+        digests = lib.get_cib_digests(etree.fromstring("<cib/>"))
+        self.assertEqual(digests.roots, [])
+        self.assertEqual(digests.elements, {})
+
+
+class DiffCibDigests(TestCase):
+    def assert_changes(self, old, new, expected):
+        self.assertEqual(
+            [
+                (change.element_id, change.tag, change.change, change.depth)
+                for change in lib.diff_cib_digests(old, new)
+            ],
+            expected,
+        )
+
+    def test_no_change(self):
+        self.assert_changes(fixture_digests(), fixture_digests(), [])
+
+    def test_nested_change(self):
+        self.assert_changes(
+            fixture_digests(),
+            fixture_digests(replace=[('"10s"', '"20s"')]),
+            [
+                ("G", "group", lib.CHANGE_CHANGED, 0),
+                ("R1", "primitive", lib.CHANGE_CHANGED, 1),
+                ("R1-monitor", "op", lib.CHANGE_CHANGED, 2),
+            ],
+        )
+
+    def test_created_and_removed(self):
+        self.assert_changes(
+            fixture_digests(),
+            fixture_digests(
+                replace=[
+                    ('<group id="G">', '<group id="G2">'),
+                    ('<tag id="T">', '<tag id="T"><obj_ref id="R2"/>'),
+                ]
+            ),
+            [
+                ("G2", "group", lib.CHANGE_CREATED, 0),
+                ("T", "tag", lib.CHANGE_CHANGED, 0),
+                ("G", "group", lib.CHANGE_REMOVED, 0),
+            ],
+        )
+
+    def test_attribute_changed(self):
+        self.assert_changes(
+            fixture_digests(),
+            fixture_digests(replace=[('<tag id="T">', '<tag id="T" a="b">')]),
+            [("T", "tag", lib.CHANGE_CHANGED, 0)],
+        )
+
+    def test_element_type_changed(self):
+        self.assert_changes(
+            fixture_digests(),
+            fixture_digests(
+                replace=[('<tag id="T">', '<tag id="R3">'), ('"G"', '"T"')]
+            ),
+            [
+                ("T", "tag", lib.CHANGE_REMOVED, 0),
+                ("T", "group", lib.CHANGE_CREATED, 0),
+                ("R3", "tag", lib.CHANGE_CREATED, 0),
+                ("G", "group", lib.CHANGE_REMOVED, 0),
+            ],
+        )
+
+
+def fixture_checkpoint(name, digests):
+    return lib.Checkpoint(name, float(name), digests)
+
+
+class GetElementHistory(TestCase):
+    def test_history(self):
+        without_r2 = fixture_digests(replace=[('id="R2"', 'id="R3"')])
+        checkpoint_list = [
+            fixture_checkpoint("1", without_r2),
+            fixture_checkpoint("2", fixture_digests()),
+            fixture_checkpoint("3", fixture_digests()),
+            fixture_checkpoint(
+                "4", fixture_digests(replace=[('id="R2"', 'id="R2" a="b"')])
+            ),
+            fixture_checkpoint("5", without_r2),
+        ]
+        self.assertEqual(
+            [
+                (checkpoint.name, change.change)
+                for checkpoint, change in lib.get_element_history(
+                    checkpoint_list, "R2"
+                )
+            ],
+            [
+                ("2", lib.CHANGE_CREATED),
+                ("4", lib.CHANGE_CHANGED),
+                ("5", lib.CHANGE_REMOVED),
+            ],
+        )
+
+    def test_unknown_element(self):
+        self.assertEqual(
+            lib.get_element_history(
+                [fixture_checkpoint("1", fixture_digests())], "X"
+            ),
+            [],
+        )
+
+
+class CheckpointIndex(TestCase):
+    def setUp(self):
+        tmp_dir = get_tmp_dir("tier0_lib_cib_checkpoint_index")
+        self.addCleanup(tmp_dir.cleanup)
+        self.cib_dir = os.path.join(tmp_dir.name, "cib")
+        os.mkdir(self.cib_dir)
+        self.index_file = os.path.join(tmp_dir.name, "index.json")
+
+    def write_checkpoint(self, number, cib=FIXTURE_CIB, mtime=None):
+        path = os.path.join(self.cib_dir, f"cib-{number}.raw")
+        with open(path, "w") as cib_file:
+            cib_file.write(cib)
+        mtime = number if mtime is None else mtime
+        os.utime(path, (mtime, mtime))
+
+    def get_checkpoints(self):
+        return lib.CheckpointIndex(
+            self.cib_dir, self.index_file
+        ).get_checkpoints()
+
+    def test_checkpoints(self):
+        self.write_checkpoint(2)
+        self.write_checkpoint(10, mtime=1)
+        self.write_checkpoint(3, "not xml")
+        with open(os.path.join(self.cib_dir, "cib.xml"), "w") as cib_file:
+            cib_file.write(FIXTURE_CIB)
+        self.assertEqual(
+            [
+                (checkpoint.name, checkpoint.mtime, checkpoint.digests)
+                for checkpoint in self.get_checkpoints()
+            ],
+            [("10", 1, fixture_digests()), ("2", 2, fixture_digests())],
+        )
+
+    def test_index_updated_incrementally(self):
+        self.write_checkpoint(1)
+        self.write_checkpoint(2)
+        self.get_checkpoints()
+
+        os.unlink(os.path.join(self.cib_dir, "cib-1.raw"))
+        self.write_checkpoint(3, FIXTURE_CIB.replace("R2", "R3"))
+        with mock.patch.object(
+            lib, "get_cib_digests", side_effect=lib.get_cib_digests
+        ) as mock_digests:
+            checkpoint_list = self.get_checkpoints()
+        mock_digests.assert_called_once()
+        self.assertEqual(
+            [checkpoint.name for checkpoint in checkpoint_list], ["2", "3"]
+        )
+        self.assertIn("R3", checkpoint_list[1].digests.elements)
+        with open(self.index_file) as index_file:
+            self.assertEqual(
+                sorted(json.load(index_file)["checkpoints"]),
+                ["cib-2.raw", "cib-3.raw"],
+            )
+
+    def test_changed_checkpoint_reindexed(self):
+        self.write_checkpoint(1)
+        self.get_checkpoints()
+        self.write_checkpoint(1, FIXTURE_CIB.replace("R2", "R3"), mtime=2)
+        self.assertIn("R3", self.get_checkpoints()[0].digests.elements)
+
+    def test_broken_index_file(self):
+        self.write_checkpoint(1)
+        with open(self.index_file, "w") as index_file:
+            index_file.write('{"checkpoints": {"cib-1.raw": []}}')
+        self.assertEqual(self.get_checkpoints()[0].digests, fixture_digests())
+
+    def test_index_file_not_writable(self):
+        self.write_checkpoint(1)
+        checkpoint_list = lib.CheckpointIndex(
+            self.cib_dir, os.path.join(self.cib_dir, "missing", "index.json")
+        ).get_checkpoints()
+        self.assertEqual(checkpoint_list[0].digests, fixture_digests())
+
+    def test_no_cib_dir(self):
+        with self.assertRaises(OSError):
+            lib.CheckpointIndex(
+                os.path.join(self.cib_dir, "missing"), None
+            ).get_checkpoints()
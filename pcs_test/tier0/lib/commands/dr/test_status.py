@@ -1,6 +1,6 @@
 import json
 import re
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from pcs import settings
 from pcs.common import file_type_codes
@@ -50,6 +50,33 @@ class CheckLive(TestCase):
         )
 
 
+def fixture_output(status_plaintext="", cmd_status="success", report_list=None):
+    return json.dumps(
+        dict(
+            status=cmd_status,
+            status_msg="",
+            data=status_plaintext,
+            report_list=report_list or [],
+        )
+    )
+
+
+FIXTURE_OUTPUT_NOT_RUNNING = fixture_output(
+    cmd_status="error",
+    report_list=[
+        {
+            "severity": "ERROR",
+            "code": "CRM_MON_ERROR",
+            "info": {
+                "reason": REASON,
+            },
+            "forceable": None,
+            "report_text": "translated report",
+        }
+    ],
+)
+
+
 class FixtureMixin:
     def _set_up(self, local_node_count=2):
         self.local_node_name_list = [
@@ -92,6 +119,22 @@ class FixtureMixin:
             .corosync_conf.load(node_name_list=self.local_node_name_list)
         )
 
+    def _fixture_local(self, index=0, **kwargs):
+        kwargs.setdefault("output", fixture_output(self.local_status))
+        return dict(label=self.local_node_name_list[index], **kwargs)
+
+    def _fixture_remote(self, **kwargs):
+        kwargs.setdefault("output", fixture_output(self.remote_status))
+        return dict(label=self.remote_node_name_list[0], **kwargs)
+
+    def _fixture_communication(self, communication_list, **kwargs):
+        # All sites are asked at once, the first list contains requests to
+        # the first node of each site. Each next list contains a request to
+        # the next node of a site which has failed to provide its status.
+        self.config.http.status.get_full_cluster_status_plaintext(
+            communication_list=communication_list, **kwargs
+        )
+
     def _fixture_result(self, local_success=True, remote_success=True):
         return [
             {
@@ -118,20 +161,10 @@ class Success(FixtureMixin, TestCase):
 
     def _assert_success(self, hide_inactive_resources, verbose):
         self._fixture_load_configs()
-        (
-            self.config.http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.local",
-                node_labels=self.local_node_name_list[:1],
-                hide_inactive_resources=hide_inactive_resources,
-                verbose=verbose,
-                cluster_status_plaintext=self.local_status,
-            ).http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.remote",
-                node_labels=self.remote_node_name_list[:1],
-                hide_inactive_resources=hide_inactive_resources,
-                verbose=verbose,
-                cluster_status_plaintext=self.remote_status,
-            )
+        self._fixture_communication(
+            [[self._fixture_local(), self._fixture_remote()]],
+            hide_inactive_resources=hide_inactive_resources,
+            verbose=verbose,
         )
         result = dr.status_all_sites_plaintext(
             self.env_assist.get_env(),
@@ -152,47 +185,37 @@ class Success(FixtureMixin, TestCase):
     def test_success_all_flags(self):
         self._assert_success(True, True)
 
+    def _assert_request_timeout(self, expected_timeout, **kwargs):
+        self._fixture_load_configs()
+        self._fixture_communication(
+            [[self._fixture_local(), self._fixture_remote()]]
+        )
+        env = self.env_assist.get_env(**kwargs)
+        with mock.patch.object(
+            env, "get_node_communicator", wraps=env.get_node_communicator
+        ) as mock_get_communicator:
+            result = dr.status_all_sites_plaintext(env)
+        self.assertEqual(result, self._fixture_result())
+        mock_get_communicator.assert_called_once_with(
+            request_timeout=expected_timeout
+        )
+
+    def test_default_request_timeout(self):
+        self._assert_request_timeout(settings.dr_site_status_timeout)
+
+    def test_request_timeout_set_by_user(self):
+        self._assert_request_timeout(120, request_timeout=120)
+
     def test_local_not_running_first_node(self):
         self._fixture_load_configs()
-        (
-            self.config.http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.local",
-                cluster_status_plaintext=self.local_status,
-                communication_list=[
-                    [
-                        dict(
-                            label=self.local_node_name_list[0],
-                            output=json.dumps(
-                                dict(
-                                    status="error",
-                                    status_msg="",
-                                    data=None,
-                                    report_list=[
-                                        {
-                                            "severity": "ERROR",
-                                            "code": "CRM_MON_ERROR",
-                                            "info": {
-                                                "reason": REASON,
-                                            },
-                                            "forceable": None,
-                                            "report_text": "translated report",
-                                        }
-                                    ],
-                                )
-                            ),
-                        )
-                    ],
-                    [
-                        dict(
-                            label=self.local_node_name_list[1],
-                        )
-                    ],
+        self._fixture_communication(
+            [
+                [
+                    self._fixture_local(output=FIXTURE_OUTPUT_NOT_RUNNING),
+                    self._fixture_remote(),
                 ],
-            ).http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.remote",
-                node_labels=self.remote_node_name_list[:1],
-                cluster_status_plaintext=self.remote_status,
-            )
+                [self._fixture_local(1)],
+            ]
         )
         result = dr.status_all_sites_plaintext(self.env_assist.get_env())
         self.assertEqual(result, self._fixture_result())
@@ -209,40 +232,14 @@ class Success(FixtureMixin, TestCase):
 
     def test_local_not_running(self):
         self._fixture_load_configs()
-        (
-            self.config.http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.local",
-                cmd_status="error",
-                cmd_status_msg="",
-                cluster_status_plaintext="",
-                report_list=[
-                    {
-                        "severity": "ERROR",
-                        "code": "CRM_MON_ERROR",
-                        "info": {
-                            "reason": REASON,
-                        },
-                        "forceable": None,
-                        "report_text": "translated report",
-                    }
-                ],
-                communication_list=[
-                    [
-                        dict(
-                            label=self.local_node_name_list[0],
-                        )
-                    ],
-                    [
-                        dict(
-                            label=self.local_node_name_list[1],
-                        )
-                    ],
+        self._fixture_communication(
+            [
+                [
+                    self._fixture_local(output=FIXTURE_OUTPUT_NOT_RUNNING),
+                    self._fixture_remote(),
                 ],
-            ).http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.remote",
-                node_labels=self.remote_node_name_list[:1],
-                cluster_status_plaintext=self.remote_status,
-            )
+                [self._fixture_local(1, output=FIXTURE_OUTPUT_NOT_RUNNING)],
+            ]
         )
         result = dr.status_all_sites_plaintext(self.env_assist.get_env())
         self.assertEqual(result, self._fixture_result(local_success=False))
@@ -260,29 +257,13 @@ class Success(FixtureMixin, TestCase):
 
     def test_remote_not_running(self):
         self._fixture_load_configs()
-        (
-            self.config.http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.local",
-                node_labels=self.local_node_name_list[:1],
-                cluster_status_plaintext=self.local_status,
-            ).http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.remote",
-                node_labels=self.remote_node_name_list[:1],
-                cmd_status="error",
-                cmd_status_msg="",
-                cluster_status_plaintext="",
-                report_list=[
-                    {
-                        "severity": "ERROR",
-                        "code": "CRM_MON_ERROR",
-                        "info": {
-                            "reason": REASON,
-                        },
-                        "forceable": None,
-                        "report_text": "translated report",
-                    }
+        self._fixture_communication(
+            [
+                [
+                    self._fixture_local(),
+                    self._fixture_remote(output=FIXTURE_OUTPUT_NOT_RUNNING),
                 ],
-            )
+            ]
         )
         result = dr.status_all_sites_plaintext(self.env_assist.get_env())
         self.assertEqual(result, self._fixture_result(remote_success=False))
@@ -300,53 +281,14 @@ class Success(FixtureMixin, TestCase):
 
     def test_both_not_running(self):
         self._fixture_load_configs()
-        (
-            self.config.http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.local",
-                cmd_status="error",
-                cmd_status_msg="",
-                cluster_status_plaintext="",
-                report_list=[
-                    {
-                        "severity": "ERROR",
-                        "code": "CRM_MON_ERROR",
-                        "info": {
-                            "reason": REASON,
-                        },
-                        "forceable": None,
-                        "report_text": "translated report",
-                    }
-                ],
-                communication_list=[
-                    [
-                        dict(
-                            label=self.local_node_name_list[0],
-                        )
-                    ],
-                    [
-                        dict(
-                            label=self.local_node_name_list[1],
-                        )
-                    ],
-                ],
-            ).http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.remote",
-                node_labels=self.remote_node_name_list[:1],
-                cmd_status="error",
-                cmd_status_msg="",
-                cluster_status_plaintext="",
-                report_list=[
-                    {
-                        "severity": "ERROR",
-                        "code": "CRM_MON_ERROR",
-                        "info": {
-                            "reason": REASON,
-                        },
-                        "forceable": None,
-                        "report_text": "translated report",
-                    }
+        self._fixture_communication(
+            [
+                [
+                    self._fixture_local(output=FIXTURE_OUTPUT_NOT_RUNNING),
+                    self._fixture_remote(output=FIXTURE_OUTPUT_NOT_RUNNING),
                 ],
-            )
+                [self._fixture_local(1, output=FIXTURE_OUTPUT_NOT_RUNNING)],
+            ]
         )
         result = dr.status_all_sites_plaintext(self.env_assist.get_env())
         self.assertEqual(
@@ -378,16 +320,8 @@ class CommunicationIssue(FixtureMixin, TestCase):
             self.local_node_name_list[1:] + self.remote_node_name_list
         )
         self._fixture_load_configs()
-        (
-            self.config.http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.local",
-                node_labels=self.local_node_name_list[1:],
-                cluster_status_plaintext=self.local_status,
-            ).http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.remote",
-                node_labels=self.remote_node_name_list[:1],
-                cluster_status_plaintext=self.remote_status,
-            )
+        self._fixture_communication(
+            [[self._fixture_local(1), self._fixture_remote()]]
         )
         result = dr.status_all_sites_plaintext(self.env_assist.get_env())
         self.assertEqual(result, self._fixture_result())
@@ -421,16 +355,7 @@ class CommunicationIssue(FixtureMixin, TestCase):
     def test_missing_node_names(self):
         self._fixture_load_configs()
         coro_call = self.config.calls.get("corosync_conf.load")
-        (
-            self.config.http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.local",
-                node_labels=[],
-            ).http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.remote",
-                node_labels=self.remote_node_name_list[:1],
-                cluster_status_plaintext=self.remote_status,
-            )
-        )
+        self._fixture_communication([[self._fixture_remote()]])
         coro_call.content = re.sub(r"name: node\d", "", coro_call.content)
         result = dr.status_all_sites_plaintext(self.env_assist.get_env())
         self.assertEqual(result, self._fixture_result(local_success=False))
@@ -446,58 +371,23 @@ class CommunicationIssue(FixtureMixin, TestCase):
     def test_node_issues(self):
         self._set_up(local_node_count=7)
         self._fixture_load_configs()
-        (
-            self.config.http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.local",
-                cluster_status_plaintext=self.local_status,
-                communication_list=[
-                    [
-                        dict(
-                            label=self.local_node_name_list[0],
-                            was_connected=False,
-                        )
-                    ],
-                    [
-                        dict(
-                            label=self.local_node_name_list[1],
-                            response_code=401,
-                        )
-                    ],
-                    [
-                        dict(
-                            label=self.local_node_name_list[2],
-                            response_code=500,
-                        )
-                    ],
-                    [
-                        dict(
-                            label=self.local_node_name_list[3],
-                            response_code=404,
-                        )
-                    ],
-                    [
-                        dict(
-                            label=self.local_node_name_list[4],
-                            output="invalid data",
-                        )
-                    ],
-                    [
-                        dict(
-                            label=self.local_node_name_list[5],
-                            output=json.dumps(dict(status="success")),
-                        )
-                    ],
-                    [
-                        dict(
-                            label=self.local_node_name_list[6],
-                        )
-                    ],
+        self._fixture_communication(
+            [
+                [
+                    self._fixture_local(0, was_connected=False),
+                    self._fixture_remote(),
                 ],
-            ).http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.remote",
-                node_labels=self.remote_node_name_list[:1],
-                cluster_status_plaintext=self.remote_status,
-            )
+                [self._fixture_local(1, response_code=401)],
+                [self._fixture_local(2, response_code=500)],
+                [self._fixture_local(3, response_code=404)],
+                [self._fixture_local(4, output="invalid data")],
+                [
+                    self._fixture_local(
+                        5, output=json.dumps(dict(status="success"))
+                    )
+                ],
+                [self._fixture_local(6)],
+            ]
         )
         result = dr.status_all_sites_plaintext(self.env_assist.get_env())
         self.assertEqual(result, self._fixture_result())
@@ -540,29 +430,14 @@ class CommunicationIssue(FixtureMixin, TestCase):
 
     def test_local_site_down(self):
         self._fixture_load_configs()
-        (
-            self.config.http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.local",
-                cluster_status_plaintext=self.local_status,
-                communication_list=[
-                    [
-                        dict(
-                            label=self.local_node_name_list[0],
-                            was_connected=False,
-                        )
-                    ],
-                    [
-                        dict(
-                            label=self.local_node_name_list[1],
-                            was_connected=False,
-                        )
-                    ],
+        self._fixture_communication(
+            [
+                [
+                    self._fixture_local(0, was_connected=False),
+                    self._fixture_remote(),
                 ],
-            ).http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.remote",
-                node_labels=self.remote_node_name_list[:1],
-                cluster_status_plaintext=self.remote_status,
-            )
+                [self._fixture_local(1, was_connected=False)],
+            ]
         )
         result = dr.status_all_sites_plaintext(self.env_assist.get_env())
         self.assertEqual(result, self._fixture_result(local_success=False))
@@ -585,23 +460,8 @@ class CommunicationIssue(FixtureMixin, TestCase):
 
     def test_remote_site_down(self):
         self._fixture_load_configs()
-        (
-            self.config.http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.local",
-                node_labels=self.local_node_name_list[:1],
-                cluster_status_plaintext=self.local_status,
-            ).http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.remote",
-                cluster_status_plaintext=self.remote_status,
-                communication_list=[
-                    [
-                        dict(
-                            label=self.remote_node_name_list[0],
-                            was_connected=False,
-                        )
-                    ],
-                ],
-            )
+        self._fixture_communication(
+            [[self._fixture_local(), self._fixture_remote(was_connected=False)]]
         )
         result = dr.status_all_sites_plaintext(self.env_assist.get_env())
         self.assertEqual(result, self._fixture_result(remote_success=False))
@@ -618,36 +478,14 @@ class CommunicationIssue(FixtureMixin, TestCase):
 
     def test_both_sites_down(self):
         self._fixture_load_configs()
-        (
-            self.config.http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.local",
-                cluster_status_plaintext=self.local_status,
-                communication_list=[
-                    [
-                        dict(
-                            label=self.local_node_name_list[0],
-                            was_connected=False,
-                        )
-                    ],
-                    [
-                        dict(
-                            label=self.local_node_name_list[1],
-                            was_connected=False,
-                        )
-                    ],
-                ],
-            ).http.status.get_full_cluster_status_plaintext(
-                name="http.status.get_full_cluster_status_plaintext.remote",
-                cluster_status_plaintext=self.remote_status,
-                communication_list=[
-                    [
-                        dict(
-                            label=self.remote_node_name_list[0],
-                            was_connected=False,
-                        )
-                    ],
+        self._fixture_communication(
+            [
+                [
+                    self._fixture_local(0, was_connected=False),
+                    self._fixture_remote(was_connected=False),
                 ],
-            )
+                [self._fixture_local(1, was_connected=False)],
+            ]
         )
         result = dr.status_all_sites_plaintext(self.env_assist.get_env())
         self.assertEqual(
@@ -659,20 +497,42 @@ class CommunicationIssue(FixtureMixin, TestCase):
                 fixture.warn(
                     report_codes.NODE_COMMUNICATION_ERROR_UNABLE_TO_CONNECT,
                     command="remote/cluster_status_plaintext",
-                    node="node1",
+                    node=node,
                     reason=None,
-                ),
+                )
+                for node in ["node1", "recovery-node", "node2"]
+            ]
+        )
+
+    @mock.patch("pcs.lib.communication.status.time.monotonic")
+    def test_site_timed_out(self, mock_monotonic):
+        # the deadline is computed at the start, the local site fails after it
+        mock_monotonic.side_effect = [100.0, 131.0, 131.0]
+        self._fixture_load_configs()
+        self._fixture_communication(
+            [
+                [
+                    self._fixture_local(0, was_connected=False),
+                    self._fixture_remote(),
+                ],
+            ]
+        )
+        result = dr.status_all_sites_plaintext(
+            self.env_assist.get_env(), site_timeout=30
+        )
+        self.assertEqual(result, self._fixture_result(local_success=False))
+        self.env_assist.assert_reports(
+            [
                 fixture.warn(
                     report_codes.NODE_COMMUNICATION_ERROR_UNABLE_TO_CONNECT,
                     command="remote/cluster_status_plaintext",
-                    node="node2",
+                    node="node1",
                     reason=None,
                 ),
                 fixture.warn(
-                    report_codes.NODE_COMMUNICATION_ERROR_UNABLE_TO_CONNECT,
-                    command="remote/cluster_status_plaintext",
-                    node="recovery-node",
-                    reason=None,
+                    report_codes.DR_SITE_STATUS_TIMED_OUT,
+                    node_list=self.local_node_name_list,
+                    timeout=30,
                 ),
             ]
         )
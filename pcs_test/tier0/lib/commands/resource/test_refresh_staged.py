@@ -0,0 +1,229 @@
+from unittest import TestCase, mock
+
+from pcs.common import reports
+from pcs.lib.commands import resource
+from pcs.lib.parallel import CollectorPool
+
+from pcs_test.tools import fixture
+from pcs_test.tools.command_env import get_env_tools
+
+NODES_XML = """
+    <nodes>
+        <node name="node1" id="1" />
+        <node name="node2" id="2" />
+        <node name="node3" id="3" />
+    </nodes>
+"""
+RESOURCES_XML = """
+    <resources>
+        <resource id="R1" />
+        <group id="G1" number_resources="1">
+            <resource id="R2" />
+        </group>
+        <clone id="C1">
+            <resource id="R3" />
+        </clone>
+    </resources>
+"""
+
+
+def fixture_wave_report(wave, wave_count, node_list=(), resource_list=()):
+    return fixture.info(
+        reports.codes.RESOURCE_REFRESH_WAVE_STARTED,
+        wave=wave,
+        wave_count=wave_count,
+        node_list=list(node_list),
+        resource_list=list(resource_list),
+    )
+
+
+def fixture_wait_report(timeout=0):
+    return fixture.info(reports.codes.WAIT_FOR_IDLE_STARTED, timeout=timeout)
+
+
+# run commands of each wave one by one, so that they are run in a predictable
+# order
+@mock.patch(
+    "pcs.lib.commands.resource.CollectorPool",
+    lambda max_workers: CollectorPool(0),
+)
+class RefreshStaged(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        self.config.runner.pcmk.load_state(
+            nodes=NODES_XML, resources=RESOURCES_XML
+        )
+
+    def test_by_node_defaults(self):
+        for node in ("node1", "node2", "node3"):
+            self.config.runner.pcmk.resource_refresh(
+                name=f"refresh.{node}", node=node
+            )
+            self.config.runner.pcmk.wait(name=f"wait.{node}", timeout=0)
+
+        resource.refresh_staged(self.env_assist.get_env(), {})
+        self.env_assist.assert_reports(
+            [
+                fixture_wave_report(1, 3, node_list=["node1"]),
+                fixture_wait_report(),
+                fixture_wave_report(2, 3, node_list=["node2"]),
+                fixture_wait_report(),
+                fixture_wave_report(3, 3, node_list=["node3"]),
+                fixture_wait_report(),
+            ]
+        )
+
+    def test_by_node_concurrency(self):
+        self.config.runner.pcmk.resource_refresh(name="refresh.1", node="node1")
+        self.config.runner.pcmk.resource_refresh(name="refresh.2", node="node2")
+        self.config.runner.pcmk.wait(name="wait.1", timeout=60)
+        self.config.runner.pcmk.resource_refresh(name="refresh.3", node="node3")
+        self.config.runner.pcmk.wait(name="wait.2", timeout=60)
+
+        resource.refresh_staged(
+            self.env_assist.get_env(),
+            {"stage-by": "node", "concurrency": "2", "timeout": "1m"},
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture_wave_report(1, 2, node_list=["node1", "node2"]),
+                fixture_wait_report(60),
+                fixture_wave_report(2, 2, node_list=["node3"]),
+                fixture_wait_report(60),
+            ]
+        )
+
+    def test_by_resource(self):
+        self.config.runner.pcmk.resource_refresh(
+            name="refresh.1", resource="R1"
+        )
+        self.config.runner.pcmk.resource_refresh(
+            name="refresh.2", resource="G1"
+        )
+        self.config.runner.pcmk.wait(name="wait.1", timeout=0)
+        self.config.runner.pcmk.resource_refresh(
+            name="refresh.3", resource="C1"
+        )
+        self.config.runner.pcmk.wait(name="wait.2", timeout=0)
+
+        resource.refresh_staged(
+            self.env_assist.get_env(),
+            {"stage-by": "resource", "concurrency": "2"},
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture_wave_report(1, 2, resource_list=["R1", "G1"]),
+                fixture_wait_report(),
+                fixture_wave_report(2, 2, resource_list=["C1"]),
+                fixture_wait_report(),
+            ]
+        )
+
+    def test_refresh_error_stops_waves(self):
+        self.config.runner.pcmk.resource_refresh(name="refresh.1", node="node1")
+        self.config.runner.pcmk.resource_refresh(
+            name="refresh.2", node="node2", stderr="error", returncode=1
+        )
+
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.refresh_staged(
+                self.env_assist.get_env(), {"concurrency": "2"}
+            ),
+            [
+                fixture.error(
+                    reports.codes.RESOURCE_REFRESH_ERROR,
+                    reason="error",
+                    resource=None,
+                    node="node2",
+                )
+            ],
+            expected_in_processor=False,
+        )
+        self.env_assist.assert_reports(
+            [fixture_wave_report(1, 2, node_list=["node1", "node2"])]
+        )
+
+    def test_wait_timeout_stops_waves(self):
+        self.config.runner.pcmk.resource_refresh(name="refresh.1", node="node1")
+        self.config.runner.pcmk.wait(
+            name="wait.1", timeout=10, stderr="timed out"
+        )
+
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.refresh_staged(
+                self.env_assist.get_env(), {"timeout": "10"}
+            ),
+            [
+                fixture.error(
+                    reports.codes.WAIT_FOR_IDLE_TIMED_OUT, reason="timed out"
+                )
+            ],
+            expected_in_processor=False,
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture_wave_report(1, 3, node_list=["node1"]),
+                fixture_wait_report(10),
+            ]
+        )
+
+
+class RefreshStagedValidation(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+
+    def test_invalid_options(self):
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.refresh_staged(
+                self.env_assist.get_env(),
+                {
+                    "stage-by": "group",
+                    "concurrency": "0",
+                    "timeout": "soon",
+                    "node": "node1",
+                },
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.INVALID_OPTIONS,
+                    option_names=["node"],
+                    allowed=["concurrency", "stage-by", "timeout"],
+                    option_type="option",
+                    allowed_patterns=[],
+                ),
+                fixture.error(
+                    reports.codes.INVALID_OPTION_VALUE,
+                    option_name="stage-by",
+                    option_value="group",
+                    allowed_values=["node", "resource"],
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                ),
+                fixture.error(
+                    reports.codes.INVALID_OPTION_VALUE,
+                    option_name="concurrency",
+                    option_value="0",
+                    allowed_values="a positive integer",
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                ),
+                fixture.error(
+                    reports.codes.INVALID_OPTION_VALUE,
+                    option_name="timeout",
+                    option_value="soon",
+                    allowed_values="time interval (e.g. 1, 2s, 3m, 4h, ...)",
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                ),
+            ]
+        )
+
+    def test_cib_file(self):
+        self.config.env.set_cib_data("<cib />")
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.refresh_staged(self.env_assist.get_env(), {}),
+            [fixture.error(reports.codes.WAIT_FOR_IDLE_NOT_LIVE_CLUSTER)],
+            expected_in_processor=False,
+        )
@@ -0,0 +1,177 @@
+from unittest import TestCase, mock
+
+from pcs import settings
+from pcs.common import reports
+from pcs.common.pacemaker.resource.primitive import (
+    CibResourcePrimitiveCreateDto,
+)
+from pcs.lib.commands import resource
+
+from pcs_test.tools import fixture
+from pcs_test.tools.command_env import get_env_tools
+
+
+def fixture_primitive(resource_id, meta_attributes=""):
+    return f"""
+        <primitive class="ocf" id="{resource_id}" provider="heartbeat"
+            type="Dummy"
+        >
+            {meta_attributes}
+            <operations>
+                <op id="{resource_id}-migrate_from-interval-0s" interval="0s"
+                    name="migrate_from" timeout="20"
+                />
+                <op id="{resource_id}-migrate_to-interval-0s" interval="0s"
+                    name="migrate_to" timeout="20"
+                />
+                <op id="{resource_id}-monitor-interval-10" interval="10"
+                    name="monitor" timeout="20"
+                />
+                <op id="{resource_id}-reload-interval-0s" interval="0s"
+                    name="reload" timeout="20"
+                />
+                <op id="{resource_id}-start-interval-0s" interval="0s"
+                    name="start" timeout="20"
+                />
+                <op id="{resource_id}-stop-interval-0s" interval="0s"
+                    name="stop" timeout="20"
+                />
+            </operations>
+        </primitive>
+    """
+
+
+def fixture_disabled_meta(resource_id):
+    return f"""
+        <meta_attributes id="{resource_id}-meta_attributes">
+            <nvpair id="{resource_id}-meta_attributes-target-role"
+                name="target-role" value="Stopped"
+            />
+        </meta_attributes>
+    """
+
+
+class CreateMany(TestCase):
+    def setUp(self):
+        # run agent self-validations one by one to get a predictable order of
+        # calls
+        collectors_patcher = mock.patch.object(
+            settings, "pcs_parallel_collectors_max", 0
+        )
+        collectors_patcher.start()
+        self.addCleanup(collectors_patcher.stop)
+        self.env_assist, self.config = get_env_tools(self)
+
+    def config_self_validation(self, count):
+        for index in range(count):
+            self.config.runner.pcmk.resource_agent_self_validation(
+                {}, name=f"runner.pcmk.resource_agent_self_validation.{index}"
+            )
+
+    def test_success(self):
+        self.config.runner.pcmk.load_agent()
+        self.config_self_validation(2)
+        self.config.runner.cib.load()
+        self.config.env.push_cib(
+            resources=(
+                "<resources>"
+                + fixture_primitive("A")
+                + fixture_primitive("B")
+                + "</resources>"
+            )
+        )
+        resource.create_many(
+            self.env_assist.get_env(),
+            [
+                CibResourcePrimitiveCreateDto("A", "ocf:heartbeat:Dummy"),
+                CibResourcePrimitiveCreateDto("B", "ocf:heartbeat:Dummy"),
+            ],
+        )
+
+    def test_ensure_disabled(self):
+        self.config.runner.pcmk.load_agent()
+        self.config_self_validation(2)
+        self.config.runner.cib.load()
+        self.config.env.push_cib(
+            resources=(
+                "<resources>"
+                + fixture_primitive("A", fixture_disabled_meta("A"))
+                + fixture_primitive("B", fixture_disabled_meta("B"))
+                + "</resources>"
+            )
+        )
+        resource.create_many(
+            self.env_assist.get_env(),
+            [
+                CibResourcePrimitiveCreateDto("A", "ocf:heartbeat:Dummy"),
+                CibResourcePrimitiveCreateDto("B", "ocf:heartbeat:Dummy"),
+            ],
+            ensure_disabled=True,
+        )
+
+    def test_errors_of_all_resources_reported(self):
+        self.config.runner.pcmk.load_agent()
+        # self-validations run before the other validations are done
+        self.config_self_validation(3)
+        self.config.runner.cib.load(
+            resources="<resources>" + fixture_primitive("A") + "</resources>"
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.create_many(
+                self.env_assist.get_env(),
+                [
+                    CibResourcePrimitiveCreateDto("A", "ocf:heartbeat:Dummy"),
+                    CibResourcePrimitiveCreateDto("B", "ocf:heartbeat:Dummy"),
+                    CibResourcePrimitiveCreateDto("B", "ocf:heartbeat:Dummy"),
+                ],
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(reports.codes.ID_ALREADY_EXISTS, id="A"),
+                fixture.error(reports.codes.ID_ALREADY_EXISTS, id="B"),
+                fixture.error(
+                    reports.codes.CANNOT_CREATE_RESOURCES,
+                    resource_id_list=["A", "B"],
+                ),
+            ]
+        )
+
+    def test_agent_load_failure(self):
+        self.config.runner.pcmk.load_agent(
+            agent_name="ocf:heartbeat:Missing",
+            agent_is_missing=True,
+            env={"PATH": "/usr/sbin:/bin:/usr/bin"},
+        )
+        self.config.runner.pcmk.load_agent(name="runner.pcmk.load_agent.B")
+        self.config_self_validation(1)
+        self.config.runner.cib.load()
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.create_many(
+                self.env_assist.get_env(),
+                [
+                    CibResourcePrimitiveCreateDto("A", "ocf:heartbeat:Missing"),
+                    CibResourcePrimitiveCreateDto("B", "ocf:heartbeat:Dummy"),
+                    CibResourcePrimitiveCreateDto("C", "ocf:heartbeat:Missing"),
+                ],
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.UNABLE_TO_GET_AGENT_METADATA,
+                    force_code=reports.codes.FORCE,
+                    agent="ocf:heartbeat:Missing",
+                    reason=(
+                        "Agent ocf:heartbeat:Missing not found or does not "
+                        "support meta-data: Invalid argument (22)\nMetadata "
+                        "query for ocf:heartbeat:Missing failed: Input/output "
+                        "error"
+                    ),
+                ),
+                fixture.error(
+                    reports.codes.CANNOT_CREATE_RESOURCES,
+                    resource_id_list=["A", "C"],
+                ),
+            ]
+        )
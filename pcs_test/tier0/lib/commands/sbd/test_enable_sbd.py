@@ -101,7 +101,6 @@ class OddNumOfNodesSuccess(TestCase):
         }
         self.config.env.set_known_nodes(self.node_list)
         self.config.corosync_conf.load(filename=self.corosync_conf_name)
-        self.config.http.host.check_auth(node_labels=self.node_list)
 
     def test_with_devices(self):
         def config_generator(node):
@@ -117,7 +116,7 @@ class OddNumOfNodesSuccess(TestCase):
             node: ["/dev/{0}-sbd{1}".format(node, j) for j in range(i)]
             for i, node in enumerate(self.node_list, start=1)
         }
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(
                     node, self.watchdog_dict[node], device_dict[node]
@@ -125,14 +124,10 @@ class OddNumOfNodesSuccess(TestCase):
                 for node in self.node_list
             ]
         )
-        self.config.http.sbd.set_sbd_config(
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=config_generator,
             node_labels=self.node_list,
         )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[[dict(label=node)] for node in self.node_list],
-        )
-        self.config.http.sbd.enable_sbd(node_labels=self.node_list)
         enable_sbd(
             self.env_assist.get_env(),
             default_watchdog=None,
@@ -153,7 +148,7 @@ class OddNumOfNodesSuccess(TestCase):
                 devices="",
             )
 
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(
                     node, self.watchdog_dict[node], []
@@ -161,14 +156,10 @@ class OddNumOfNodesSuccess(TestCase):
                 for node in self.node_list
             ]
         )
-        self.config.http.sbd.set_sbd_config(
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=config_generator,
             node_labels=self.node_list,
         )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[[dict(label=node)] for node in self.node_list],
-        )
-        self.config.http.sbd.enable_sbd(node_labels=self.node_list)
         enable_sbd(
             self.env_assist.get_env(),
             default_watchdog=None,
@@ -199,7 +190,6 @@ class OddNumOfNodesDefaultsSuccess(TestCase):
         self.watchdog = "/dev/watchdog"
         self.config.env.set_known_nodes(self.node_list)
         self.config.corosync_conf.load(filename=self.corosync_conf_name)
-        self.config.http.host.check_auth(node_labels=self.node_list)
 
     def test_with_device(self):
         def config_generator(node):
@@ -210,7 +200,7 @@ class OddNumOfNodesDefaultsSuccess(TestCase):
 
         device_list = ["/dev/sdb"]
 
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(
                     node, self.watchdog, device_list
@@ -218,14 +208,10 @@ class OddNumOfNodesDefaultsSuccess(TestCase):
                 for node in self.node_list
             ]
         )
-        self.config.http.sbd.set_sbd_config(
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=config_generator,
             node_labels=self.node_list,
         )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[[dict(label=node)] for node in self.node_list],
-        )
-        self.config.http.sbd.enable_sbd(node_labels=self.node_list)
         enable_sbd(
             self.env_assist.get_env(),
             default_watchdog=self.watchdog,
@@ -241,20 +227,16 @@ class OddNumOfNodesDefaultsSuccess(TestCase):
         def config_generator(node):
             return self.sbd_config_template.format(node_name=node, devices="")
 
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(node, self.watchdog, [])
                 for node in self.node_list
             ]
         )
-        self.config.http.sbd.set_sbd_config(
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=config_generator,
             node_labels=self.node_list,
         )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[[dict(label=node)] for node in self.node_list],
-        )
-        self.config.http.sbd.enable_sbd(node_labels=self.node_list)
         enable_sbd(
             self.env_assist.get_env(),
             default_watchdog=self.watchdog,
@@ -285,10 +267,9 @@ class WatchdogValidations(TestCase):
         self.watchdog = "/dev/watchdog"
         self.config.env.set_known_nodes(self.node_list)
         self.config.corosync_conf.load(filename=self.corosync_conf_name)
-        self.config.http.host.check_auth(node_labels=self.node_list)
 
     def test_watchdog_not_supported(self):
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(node, self.watchdog, [])
                 for node in self.node_list[:2]
@@ -344,20 +325,16 @@ class WatchdogValidations(TestCase):
         def config_generator(node):
             return self.sbd_config_template.format(node_name=node)
 
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(node, "", [])
                 for node in self.node_list
             ]
         )
-        self.config.http.sbd.set_sbd_config(
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=config_generator,
             node_labels=self.node_list,
         )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[[dict(label=node)] for node in self.node_list],
-        )
-        self.config.http.sbd.enable_sbd(node_labels=self.node_list)
         enable_sbd(
             self.env_assist.get_env(),
             default_watchdog=self.watchdog,
@@ -390,7 +367,6 @@ class EvenNumOfNodes(TestCase):
         self.watchdog = "/dev/watchdog"
         self.config.env.set_known_nodes(self.node_list)
         self.config.corosync_conf.load(filename=self.corosync_conf_name)
-        self.config.http.host.check_auth(node_labels=self.node_list)
 
     def test_with_device(self):
         def config_generator(node):
@@ -400,7 +376,7 @@ class EvenNumOfNodes(TestCase):
             )
 
         device_list = ["/dev/sdb"]
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(
                     node, self.watchdog, device_list
@@ -408,14 +384,10 @@ class EvenNumOfNodes(TestCase):
                 for node in self.node_list
             ]
         )
-        self.config.http.sbd.set_sbd_config(
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=config_generator,
             node_labels=self.node_list,
         )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[[dict(label=node)] for node in self.node_list],
-        )
-        self.config.http.sbd.enable_sbd(node_labels=self.node_list)
         enable_sbd(
             self.env_assist.get_env(),
             default_watchdog=self.watchdog,
@@ -431,7 +403,7 @@ class EvenNumOfNodes(TestCase):
         def config_generator(node):
             return self.sbd_config_template.format(node_name=node, devices="")
 
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(node, self.watchdog, [])
                 for node in self.node_list
@@ -443,14 +415,10 @@ class EvenNumOfNodes(TestCase):
             ),
             need_stopped_cluster=True,
         )
-        self.config.http.sbd.set_sbd_config(
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=config_generator,
             node_labels=self.node_list,
         )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[[dict(label=node)] for node in self.node_list],
-        )
-        self.config.http.sbd.enable_sbd(node_labels=self.node_list)
         enable_sbd(
             self.env_assist.get_env(),
             default_watchdog=self.watchdog,
@@ -473,20 +441,16 @@ class EvenNumOfNodes(TestCase):
             auto_tie_breaker=True,
             instead="corosync_conf.load",
         )
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(node, self.watchdog, [])
                 for node in self.node_list
             ]
         )
-        self.config.http.sbd.set_sbd_config(
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=config_generator,
             node_labels=self.node_list,
         )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[[dict(label=node)] for node in self.node_list],
-        )
-        self.config.http.sbd.enable_sbd(node_labels=self.node_list)
         enable_sbd(
             self.env_assist.get_env(),
             default_watchdog=self.watchdog,
@@ -505,20 +469,16 @@ class EvenNumOfNodes(TestCase):
             filename="corosync-qdevice.conf",
             instead="corosync_conf.load",
         )
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(node, self.watchdog, [])
                 for node in self.node_list
             ]
         )
-        self.config.http.sbd.set_sbd_config(
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=config_generator,
             node_labels=self.node_list,
         )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[[dict(label=node)] for node in self.node_list],
-        )
-        self.config.http.sbd.enable_sbd(node_labels=self.node_list)
         enable_sbd(
             self.env_assist.get_env(),
             default_watchdog=self.watchdog,
@@ -563,11 +523,18 @@ class OfflineNodes(TestCase):
         ]
         self.config.env.set_known_nodes(node_list)
         self.config.corosync_conf.load(filename=self.corosync_conf_name)
-        self.config.http.host.check_auth(
-            communication_list=self.offline_communication_list
+
+    def _config_check_sbd(self):
+        self.config.http.sbd.check_sbd_on_online_nodes(
+            communication_list=[
+                fixture.check_sbd_comm_success_fixture(node, self.watchdog, [])
+                for node in self.online_node_list
+            ],
+            check_auth_communication_list=self.offline_communication_list,
         )
 
     def test_no_ignore_offline_nodes(self):
+        self._config_check_sbd()
         self.env_assist.assert_raise_library_error(
             lambda: enable_sbd(
                 self.env_assist.get_env(),
@@ -588,6 +555,11 @@ class OfflineNodes(TestCase):
                 )
                 for node in self.offline_node_list
             ]
+            + [fixture.info(report_codes.SBD_CHECK_STARTED)]
+            + [
+                fixture.info(report_codes.SBD_CHECK_SUCCESS, node=node)
+                for node in self.online_node_list
+            ]
         )
 
     def test_ignore_offline_nodes(self):
@@ -595,22 +567,11 @@ class OfflineNodes(TestCase):
             filename="corosync-qdevice.conf",
             instead="corosync_conf.load",
         )
-        self.config.http.sbd.check_sbd(
-            communication_list=[
-                fixture.check_sbd_comm_success_fixture(node, self.watchdog, [])
-                for node in self.online_node_list
-            ]
-        )
-        self.config.http.sbd.set_sbd_config(
+        self._config_check_sbd()
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=self.sbd_config_generator,
             node_labels=self.online_node_list,
         )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[
-                [dict(label=node)] for node in self.online_node_list
-            ],
-        )
-        self.config.http.sbd.enable_sbd(node_labels=self.online_node_list)
         enable_sbd(
             self.env_assist.get_env(),
             default_watchdog=None,
@@ -630,12 +591,7 @@ class OfflineNodes(TestCase):
         )
 
     def test_ignore_offline_nodes_atb_needed(self):
-        self.config.http.sbd.check_sbd(
-            communication_list=[
-                fixture.check_sbd_comm_success_fixture(node, self.watchdog, [])
-                for node in self.online_node_list
-            ]
-        )
+        self._config_check_sbd()
         self.config.env.push_corosync_conf(
             corosync_conf_text=_get_corosync_conf_text_with_atb(
                 self.corosync_conf_name
@@ -643,16 +599,10 @@ class OfflineNodes(TestCase):
             skip_offline_targets=True,
             need_stopped_cluster=True,
         )
-        self.config.http.sbd.set_sbd_config(
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=self.sbd_config_generator,
             node_labels=self.online_node_list,
         )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[
-                [dict(label=node)] for node in self.online_node_list
-            ],
-        )
-        self.config.http.sbd.enable_sbd(node_labels=self.online_node_list)
         enable_sbd(
             self.env_assist.get_env(),
             default_watchdog=None,
@@ -989,8 +939,7 @@ class Validations(TestCase):
 
     def test_sbd_not_installed(self):
         watchdog = "/dev/watchdog"
-        self.config.http.host.check_auth(node_labels=self.node_list)
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(
                     self.node_list[0], watchdog, []
@@ -1043,8 +992,7 @@ class Validations(TestCase):
 
     def test_watchdog_not_found(self):
         watchdog = "/dev/watchdog"
-        self.config.http.host.check_auth(node_labels=self.node_list)
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(
                     self.node_list[0], watchdog, []
@@ -1098,8 +1046,7 @@ class Validations(TestCase):
     def test_device_not_exists_not_block_device(self):
         watchdog = "/dev/watchdog"
         device_list = ["/dev/dev0", "/dev/dev1"]
-        self.config.http.host.check_auth(node_labels=self.node_list)
-        self.config.http.sbd.check_sbd(
+        self.config.http.sbd.check_sbd_on_online_nodes(
             communication_list=[
                 fixture.check_sbd_comm_success_fixture(
                     self.node_list[0], watchdog, device_list
@@ -1279,44 +1226,52 @@ class FailureHandling(TestCase):
         ]
         self.config.env.set_known_nodes(self.node_list)
         self.config.corosync_conf.load(filename=self.corosync_conf_name)
-        self.config.http.host.check_auth(node_labels=self.node_list)
-        self.config.http.sbd.check_sbd(
-            communication_list=[
-                fixture.check_sbd_comm_success_fixture(node, self.watchdog, [])
-                for node in self.node_list
-            ]
+
+    def _config_check_sbd(self, communication_list=None):
+        self.config.http.sbd.check_sbd_on_online_nodes(
+            communication_list=(
+                communication_list
+                if communication_list is not None
+                else [
+                    fixture.check_sbd_comm_success_fixture(
+                        node, self.watchdog, []
+                    )
+                    for node in self.node_list
+                ]
+            )
         )
+
+    def _config_push_corosync_conf(self, raises=False):
         self.config.env.push_corosync_conf(
             corosync_conf_text=_get_corosync_conf_text_with_atb(
                 self.corosync_conf_name
             ),
+            raises=raises,
             need_stopped_cluster=True,
         )
-        self.config.http.sbd.set_sbd_config(
+
+    def _config_enable_sbd_on_nodes(self, **kwargs):
+        self._config_check_sbd()
+        self._config_push_corosync_conf()
+        self.config.http.sbd.enable_sbd_on_nodes(
             config_generator=self.sbd_config_generator,
             node_labels=self.node_list,
-        )
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[[dict(label=node)] for node in self.node_list],
+            **kwargs,
         )
 
-    def _remove_calls(self, count):
-        for name in self.config.calls.names[-count:]:
-            self.config.calls.remove(name)
+    def _enable_sbd(self):
+        enable_sbd(
+            self.env_assist.get_env(),
+            default_watchdog=self.watchdog,
+            watchdog_dict={},
+            sbd_options={},
+        )
 
     def test_enable_failed(self):
-        self.config.http.sbd.enable_sbd(
-            communication_list=self.communication_list_failure
-        )
-        self.env_assist.assert_raise_library_error(
-            lambda: enable_sbd(
-                self.env_assist.get_env(),
-                default_watchdog=self.watchdog,
-                watchdog_dict={},
-                sbd_options={},
-            ),
-            [],
+        self._config_enable_sbd_on_nodes(
+            enable_communication_list=self.communication_list_failure
         )
+        self.env_assist.assert_raise_library_error(self._enable_sbd, [])
         self.env_assist.assert_reports(
             _sbd_enable_successful_report_list_fixture(
                 self.node_list, atb_set=True
@@ -1339,18 +1294,10 @@ class FailureHandling(TestCase):
         )
 
     def test_enable_not_connected(self):
-        self.config.http.sbd.enable_sbd(
-            communication_list=self.communication_list_not_connected
-        )
-        self.env_assist.assert_raise_library_error(
-            lambda: enable_sbd(
-                self.env_assist.get_env(),
-                default_watchdog=self.watchdog,
-                watchdog_dict={},
-                sbd_options={},
-            ),
-            [],
+        self._config_enable_sbd_on_nodes(
+            enable_communication_list=self.communication_list_not_connected
         )
+        self.env_assist.assert_raise_library_error(self._enable_sbd, [])
         self.env_assist.assert_reports(
             _sbd_enable_successful_report_list_fixture(
                 self.node_list, atb_set=True
@@ -1373,21 +1320,13 @@ class FailureHandling(TestCase):
         )
 
     def test_removing_stonith_wd_timeout_failure(self):
-        self._remove_calls(len(self.node_list) + 1)
-
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[
+        self._config_enable_sbd_on_nodes(
+            remove_communication_list=[
                 self.communication_list_failure[:1],
                 [dict(label=self.node_list[1])],
             ]
         )
-        self.config.http.sbd.enable_sbd(node_labels=self.node_list)
-        enable_sbd(
-            self.env_assist.get_env(),
-            default_watchdog=self.watchdog,
-            watchdog_dict={},
-            sbd_options={},
-        )
+        self._enable_sbd()
         self.env_assist.assert_reports(
             _sbd_enable_successful_report_list_fixture(
                 self.node_list, atb_set=True
@@ -1403,20 +1342,13 @@ class FailureHandling(TestCase):
         )
 
     def test_removing_stonith_wd_timeout_not_connected(self):
-        self._remove_calls(len(self.node_list) + 1)
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[
+        self._config_enable_sbd_on_nodes(
+            remove_communication_list=[
                 self.communication_list_not_connected[:1],
                 [dict(label=self.node_list[1])],
             ]
         )
-        self.config.http.sbd.enable_sbd(node_labels=self.node_list)
-        enable_sbd(
-            self.env_assist.get_env(),
-            default_watchdog=self.watchdog,
-            watchdog_dict={},
-            sbd_options={},
-        )
+        self._enable_sbd()
         self.env_assist.assert_reports(
             _sbd_enable_successful_report_list_fixture(
                 self.node_list, atb_set=True
@@ -1432,9 +1364,9 @@ class FailureHandling(TestCase):
         )
 
     def test_removing_stonith_wd_timeout_complete_failure(self):
-        self._remove_calls(len(self.node_list) + 1)
-        self.config.http.pcmk.remove_stonith_watchdog_timeout(
-            communication_list=[
+        # no sbd_enable request is sent when the property cannot be removed
+        self._config_enable_sbd_on_nodes(
+            remove_communication_list=[
                 self.communication_list_not_connected[:1],
                 [
                     dict(
@@ -1443,17 +1375,10 @@ class FailureHandling(TestCase):
                         output=self.reason,
                     )
                 ],
-            ]
-        )
-        self.env_assist.assert_raise_library_error(
-            lambda: enable_sbd(
-                self.env_assist.get_env(),
-                default_watchdog=self.watchdog,
-                watchdog_dict={},
-                sbd_options={},
-            ),
-            [],
+            ],
+            enable_communication_list=False,
         )
+        self.env_assist.assert_raise_library_error(self._enable_sbd, [])
         self.env_assist.assert_reports(
             _sbd_enable_successful_report_list_fixture(
                 self.node_list, atb_set=True
@@ -1478,7 +1403,8 @@ class FailureHandling(TestCase):
         )
 
     def test_set_sbd_config_failure(self):
-        self._remove_calls(len(self.node_list) + 1 + 2)
+        self._config_check_sbd()
+        self._config_push_corosync_conf()
         self.config.http.sbd.set_sbd_config(
             communication_list=[
                 dict(
@@ -1495,17 +1421,10 @@ class FailureHandling(TestCase):
                         ("config", self.sbd_config_generator(self.node_list[1]))
                     ],
                 ),
-            ]
-        )
-        self.env_assist.assert_raise_library_error(
-            lambda: enable_sbd(
-                self.env_assist.get_env(),
-                default_watchdog=self.watchdog,
-                watchdog_dict={},
-                sbd_options={},
-            ),
-            [],
+            ],
         )
+        # nothing else is done on the node which accepted the config
+        self.env_assist.assert_raise_library_error(self._enable_sbd, [])
         self.env_assist.assert_reports(
             _sbd_enable_successful_report_list_fixture(
                 self.node_list, atb_set=True
@@ -1525,23 +1444,9 @@ class FailureHandling(TestCase):
         )
 
     def test_set_corosync_conf_failed(self):
-        self._remove_calls(len(self.node_list) + 1 + 3)
-        self.config.env.push_corosync_conf(
-            corosync_conf_text=_get_corosync_conf_text_with_atb(
-                self.corosync_conf_name
-            ),
-            raises=True,
-            need_stopped_cluster=True,
-        )
-        self.env_assist.assert_raise_library_error(
-            lambda: enable_sbd(
-                self.env_assist.get_env(),
-                default_watchdog=self.watchdog,
-                watchdog_dict={},
-                sbd_options={},
-            ),
-            [],
-        )
+        self._config_check_sbd()
+        self._config_push_corosync_conf(raises=True)
+        self.env_assist.assert_raise_library_error(self._enable_sbd, [])
         self.env_assist.assert_reports(
             _sbd_enable_successful_report_list_fixture(
                 self.node_list, atb_set=True
@@ -1549,9 +1454,8 @@ class FailureHandling(TestCase):
         )
 
     def test_check_sbd_invalid_data_format(self):
-        self._remove_calls(len(self.node_list) + 1 + 5)
-        self.config.http.sbd.check_sbd(
-            communication_list=[
+        self._config_check_sbd(
+            [
                 dict(
                     label=self.node_list[0],
                     param_list=[
@@ -1570,15 +1474,7 @@ class FailureHandling(TestCase):
                 ),
             ]
         )
-        self.env_assist.assert_raise_library_error(
-            lambda: enable_sbd(
-                self.env_assist.get_env(),
-                default_watchdog=self.watchdog,
-                watchdog_dict={},
-                sbd_options={},
-            ),
-            [],
-        )
+        self.env_assist.assert_raise_library_error(self._enable_sbd, [])
         self.env_assist.assert_reports(
             [fixture.info(report_codes.SBD_CHECK_STARTED)]
             + [
@@ -1588,9 +1484,8 @@ class FailureHandling(TestCase):
         )
 
     def test_check_sbd_failure(self):
-        self._remove_calls(len(self.node_list) + 1 + 5)
-        self.config.http.sbd.check_sbd(
-            communication_list=[
+        self._config_check_sbd(
+            [
                 dict(
                     label=self.node_list[0],
                     param_list=[
@@ -1605,15 +1500,7 @@ class FailureHandling(TestCase):
                 ),
             ]
         )
-        self.env_assist.assert_raise_library_error(
-            lambda: enable_sbd(
-                self.env_assist.get_env(),
-                default_watchdog=self.watchdog,
-                watchdog_dict={},
-                sbd_options={},
-            ),
-            [],
-        )
+        self.env_assist.assert_raise_library_error(self._enable_sbd, [])
         self.env_assist.assert_reports(
             [
                 fixture.info(report_codes.SBD_CHECK_STARTED),
@@ -1630,9 +1517,8 @@ class FailureHandling(TestCase):
         )
 
     def test_check_sbd_not_connected(self):
-        self._remove_calls(len(self.node_list) + 1 + 5)
-        self.config.http.sbd.check_sbd(
-            communication_list=[
+        self._config_check_sbd(
+            [
                 dict(
                     label=self.node_list[0],
                     param_list=[
@@ -1648,15 +1534,7 @@ class FailureHandling(TestCase):
                 ),
             ]
         )
-        self.env_assist.assert_raise_library_error(
-            lambda: enable_sbd(
-                self.env_assist.get_env(),
-                default_watchdog=self.watchdog,
-                watchdog_dict={},
-                sbd_options={},
-            ),
-            [],
-        )
+        self.env_assist.assert_raise_library_error(self._enable_sbd, [])
         self.env_assist.assert_reports(
             [
                 fixture.info(report_codes.SBD_CHECK_STARTED),
@@ -1673,53 +1551,55 @@ class FailureHandling(TestCase):
         )
 
     def test_get_online_targets_failed(self):
-        self._remove_calls(len(self.node_list) + 1 + 7)
-        self.config.http.host.check_auth(
-            communication_list=self.communication_list_failure
-        )
-        self.env_assist.assert_raise_library_error(
-            lambda: enable_sbd(
-                self.env_assist.get_env(),
-                default_watchdog=self.watchdog,
-                watchdog_dict={},
-                sbd_options={},
-            ),
-            [],
+        self.config.http.sbd.check_sbd_on_online_nodes(
+            communication_list=[
+                fixture.check_sbd_comm_success_fixture(
+                    self.node_list[1], self.watchdog, []
+                )
+            ],
+            check_auth_communication_list=self.communication_list_failure,
         )
+        self.env_assist.assert_raise_library_error(self._enable_sbd, [])
         self.env_assist.assert_reports(
             [
+                fixture.info(report_codes.SBD_CHECK_STARTED),
                 fixture.error(
                     report_codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
                     node=self.node_list[0],
                     reason=self.reason,
                     command="remote/check_auth",
-                )
+                ),
+                fixture.info(
+                    report_codes.SBD_CHECK_SUCCESS, node=self.node_list[1]
+                ),
             ]
         )
 
     def test_get_online_targets_not_connected(self):
-        self._remove_calls(len(self.node_list) + 1 + 7)
-        self.config.http.host.check_auth(
-            communication_list=self.communication_list_not_connected
-        )
-        self.env_assist.assert_raise_library_error(
-            lambda: enable_sbd(
-                self.env_assist.get_env(),
-                default_watchdog=self.watchdog,
-                watchdog_dict={},
-                sbd_options={},
+        self.config.http.sbd.check_sbd_on_online_nodes(
+            communication_list=[
+                fixture.check_sbd_comm_success_fixture(
+                    self.node_list[1], self.watchdog, []
+                )
+            ],
+            check_auth_communication_list=(
+                self.communication_list_not_connected
             ),
-            [],
         )
+        self.env_assist.assert_raise_library_error(self._enable_sbd, [])
         self.env_assist.assert_reports(
             [
+                fixture.info(report_codes.SBD_CHECK_STARTED),
                 fixture.error(
                     report_codes.NODE_COMMUNICATION_ERROR_UNABLE_TO_CONNECT,
                     node=self.node_list[0],
                     reason=self.reason,
                     command="remote/check_auth",
                     force_code=report_codes.SKIP_OFFLINE_NODES,
-                )
+                ),
+                fixture.info(
+                    report_codes.SBD_CHECK_SUCCESS, node=self.node_list[1]
+                ),
             ]
         )
 
@@ -1768,8 +1648,7 @@ class UnknownHosts(TestCase):
                 filename="corosync-qdevice.conf", instead="corosync_conf.load"
             )
             .env.set_known_nodes(self.known_hosts)
-            .http.host.check_auth(self.known_hosts)
-            .http.sbd.check_sbd(
+            .http.sbd.check_sbd_on_online_nodes(
                 communication_list=[
                     fixture.check_sbd_comm_success_fixture(
                         node, "/dev/watchdog", []
@@ -1777,14 +1656,10 @@ class UnknownHosts(TestCase):
                     for node in self.known_hosts
                 ]
             )
-            .http.sbd.set_sbd_config(
+            .http.sbd.enable_sbd_on_nodes(
                 config_generator=sbd_config_generator,
                 node_labels=self.known_hosts,
             )
-            .http.pcmk.remove_stonith_watchdog_timeout(
-                node_labels=[self.known_hosts[0]]
-            )
-            .http.sbd.enable_sbd(node_labels=self.known_hosts)
         )
 
         enable_sbd(
@@ -1875,8 +1750,7 @@ class MissingNodeNamesInCorosync(TestCase):
                 # fixture: set ATB=enabled in original corosync conf
                 auto_tie_breaker=True,
             )
-            .http.host.check_auth(node_labels=node_list)
-            .http.sbd.check_sbd(
+            .http.sbd.check_sbd_on_online_nodes(
                 communication_list=[
                     fixture.check_sbd_comm_success_fixture(
                         node, self.watchdog, []
@@ -1884,12 +1758,10 @@ class MissingNodeNamesInCorosync(TestCase):
                     for node in node_list
                 ]
             )
-            .http.sbd.set_sbd_config(
+            .http.sbd.enable_sbd_on_nodes(
                 config_generator=config_generator,
                 node_labels=node_list,
             )
-            .http.pcmk.remove_stonith_watchdog_timeout(node_labels=node_list)
-            .http.sbd.enable_sbd(node_labels=node_list)
         )
 
         enable_sbd(
@@ -1916,9 +1788,9 @@ class MissingNodeNamesInCorosync(TestCase):
         node_list = ["rh7-2"]
 
         (
-            self.config.corosync_conf.load(filename=corosync_conf_name)
-            .http.host.check_auth(node_labels=node_list)
-            .http.sbd.check_sbd(
+            self.config.corosync_conf.load(
+                filename=corosync_conf_name
+            ).http.sbd.check_sbd_on_online_nodes(
                 communication_list=[
                     fixture.check_sbd_comm_success_fixture(
                         node, self.watchdog, []
@@ -438,3 +438,107 @@ class GetConfigTest(AclCommandsTest):
             },
             cmd_acl.get_config(self.mock_env),
         )
+
+
+class GetEffectivePermissions(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+
+    def load_cib(self, acl_xml, acl_enabled="true"):
+        self.config.runner.cib.load(
+            crm_config=f"""
+            <crm_config>
+                <cluster_property_set id="cib-bootstrap-options">
+                    <nvpair id="cib-bootstrap-options-enable-acl"
+                        name="enable-acl" value="{acl_enabled}"
+                    />
+                </cluster_property_set>
+            </crm_config>
+            """,
+            resources="""
+            <resources>
+                <primitive id="R1" class="ocf" provider="pacemaker" type="Dummy"/>
+            </resources>
+            """,
+            optional_in_conf=acl_xml,
+        )
+
+    def test_success(self):
+        self.load_cib(
+            """
+            <acls>
+                <acl_role id="role1">
+                    <acl_permission id="role1-read" kind="read" xpath="/"/>
+                </acl_role>
+                <acl_role id="role2">
+                    <acl_permission id="role2-deny" kind="deny" reference="R1"/>
+                </acl_role>
+                <acl_target id="user1"><role id="role1"/></acl_target>
+                <acl_group id="group1"><role id="role2"/></acl_group>
+            </acls>
+            """
+        )
+        dto = cmd_acl.get_effective_permissions(
+            self.env_assist.get_env(), "user1", ["group1"]
+        )
+        self.assertEqual(dto.role_id_list, ["role1", "role2"])
+        self.assertTrue(dto.restricted)
+        self.assertEqual(
+            [
+                (access.path, access.access, access.permission_id_list)
+                for access in dto.access_list
+            ],
+            [
+                ("/cib", "read", ["role1-read"]),
+                (
+                    "/cib/configuration/resources/primitive[@id='R1']",
+                    "deny",
+                    ["role2-deny"],
+                ),
+            ],
+        )
+
+    def test_acl_disabled(self):
+        self.load_cib(
+            """
+            <acls>
+                <acl_role id="role1">
+                    <acl_permission id="role1-deny" kind="deny" reference="R1"/>
+                </acl_role>
+                <acl_target id="user1"><role id="role1"/></acl_target>
+            </acls>
+            """,
+            acl_enabled="false",
+        )
+        dto = cmd_acl.get_effective_permissions(
+            self.env_assist.get_env(), "user1", []
+        )
+        self.assertFalse(dto.acl_enabled)
+        self.assertFalse(dto.restricted)
+        self.assertEqual(dto.role_id_list, ["role1"])
+        self.assertEqual(
+            [
+                (access.path, access.access, access.permission_id_list)
+                for access in dto.access_list
+            ],
+            [("/cib", "write", [])],
+        )
+
+    def test_target_not_found(self):
+        self.load_cib("<acls/>")
+        self.env_assist.assert_raise_library_error(
+            lambda: cmd_acl.get_effective_permissions(
+                self.env_assist.get_env(), "user1", []
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.ID_NOT_FOUND,
+                    id="user1",
+                    expected_types=["acl_target"],
+                    context_type="",
+                    context_id="",
+                ),
+            ]
+        )
@@ -5,7 +5,13 @@ from unittest import TestCase, mock
 
 from pcs import settings
 from pcs.common import file_type_codes, reports
-from pcs.common.booth_dto import BoothConfigAndAuthfileDto, BoothConfigFileDto
+from pcs.common.booth_dto import (
+    BoothConfigAndAuthfileDto,
+    BoothConfigFileDto,
+    BoothPeerStatusDto,
+    BoothStatusDto,
+    BoothTicketStatusDto,
+)
 from pcs.common.file import RawFileError
 from pcs.lib.booth import constants
 from pcs.lib.commands import booth as commands
@@ -3954,6 +3960,8 @@ class PullConfigWithAuthfileFailure(PullConfigWithAuthfile):
         )
 
 
+# run booth commands one by one to get a predictable order of calls
+@mock.patch("pcs.settings.pcs_parallel_collectors_max", 0)
 class GetStatus(TestCase):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(self)
@@ -4081,6 +4089,7 @@ class GetStatus(TestCase):
 
 @mock.patch("pcs.settings.booth_enable_authfile_set_enabled", True)
 @mock.patch("pcs.settings.booth_enable_authfile_unset_enabled", True)
+@mock.patch("pcs.settings.pcs_parallel_collectors_max", 0)
 class GetStatusWarnings(TestCase, FixtureMixin):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(self)
@@ -4150,6 +4159,80 @@ class GetStatusWarnings(TestCase, FixtureMixin):
         )
 
 
+@mock.patch("pcs.settings.pcs_parallel_collectors_max", 0)
+class GetStatusDto(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        mock_check_patcher = mock.patch(
+            "pcs.lib.booth.status.check_authfile_misconfiguration"
+        )
+        self.mock_check = mock_check_patcher.start()
+        self.mock_check.return_value = None
+        self.addCleanup(mock_check_patcher.stop)
+
+    def test_success(self):
+        self.config.runner.booth.status_daemon(
+            "booth",
+            stdout="booth_state=started booth_type=site booth_cfg_name='booth'",
+        )
+        self.config.runner.booth.status_tickets(
+            "booth",
+            stdout=(
+                "ticket: T1, leader: 192.168.1.1, expires: 2024-05-29 13:41:48\n"
+                "ticket: T2, leader: NONE\n"
+            ),
+        )
+        self.config.runner.booth.status_peers(
+            "booth",
+            stdout=dedent(
+                """\
+                site:        192.168.1.2, last recv: never
+                \tSent pkts:0 error:0 resends:0
+                \tRecv pkts:0 error:0 authfail:0 invalid:0 tick:0 rej:0
+                """
+            ),
+        )
+        self.assertEqual(
+            commands.get_status_dto(self.env_assist.get_env()),
+            BoothStatusDto(
+                daemon_running=True,
+                daemon_attributes={
+                    "booth_state": "started",
+                    "booth_type": "site",
+                    "booth_cfg_name": "booth",
+                },
+                ticket_list=[
+                    BoothTicketStatusDto(
+                        "T1", "192.168.1.1", "2024-05-29 13:41:48"
+                    ),
+                    BoothTicketStatusDto("T2", None, None),
+                ],
+                peer_list=[BoothPeerStatusDto("site", "192.168.1.2", None)],
+            ),
+        )
+
+    def test_daemon_not_running(self):
+        self.config.runner.booth.status_daemon(
+            "booth", stderr="not running", returncode=7
+        )
+        # booth cannot provide tickets and peers without a running daemon
+        self.config.runner.booth.status_tickets(
+            "booth", stderr="not running", returncode=7
+        )
+        self.config.runner.booth.status_peers(
+            "booth", stderr="not running", returncode=7
+        )
+        self.assertEqual(
+            commands.get_status_dto(self.env_assist.get_env()),
+            BoothStatusDto(
+                daemon_running=False,
+                daemon_attributes={},
+                ticket_list=[],
+                peer_list=[],
+            ),
+        )
+
+
 class CrmTicketOperationTest:
     CIB_STATUS = """
         <status>
@@ -381,3 +381,313 @@ class GetConfigDto(TestCase):
             expected_in_processor=False,
         )
         self.env_assist.assert_reports([])
+
+
+ROLLING_STANDBY_STATE_NODES = """
+    <nodes>
+        <node name="node1" id="1" />
+        <node name="node2" id="2" />
+        <node name="node3" id="3" />
+        <node name="node4" id="4" />
+        <node name="node5" id="5" standby="true" />
+    </nodes>
+"""
+# nodes allowed to run resources in the fake simulation
+ROLLING_STANDBY_PLACEMENT = {
+    "A": {"node1", "node2"},
+    "B": {"node3"},
+}
+
+
+def fake_simulate_standby(runner, cib):
+    del runner
+    standby_nodes = {
+        str(node_el.attrib["uname"])
+        for node_el in cib.xpath(
+            "configuration/nodes/node"
+            "[instance_attributes/nvpair[@name='standby'][@value='on']]"
+        )
+    }
+    rsc_op_list = "".join(
+        f"""
+        <synapse id="{index}"><action_set>
+            <rsc_op id="{index}" operation="stop" on_node="{sorted(nodes)[0]}">
+                <primitive id="{resource_id}"/>
+            </rsc_op>
+        </action_set></synapse>
+        """
+        for index, (resource_id, nodes) in enumerate(
+            ROLLING_STANDBY_PLACEMENT.items()
+        )
+        if nodes <= standby_nodes
+    )
+    return (
+        "",
+        etree.fromstring(f"<transition_graph>{rsc_op_list}</transition_graph>"),
+        etree.fromstring("<cib/>"),
+    )
+
+
+def fixture_standby_nodes(node_list, standby):
+    nvpair = '<nvpair id="nodes-{0}-standby" name="standby" value="on"/>'
+    return "<nodes>{}</nodes>".format(
+        "".join(
+            f'<node id="{node[-1]}" uname="{node}" type="member">'
+            f'<instance_attributes id="nodes-{node[-1]}">'
+            f"{nvpair.format(node[-1]) if standby else ''}"
+            "</instance_attributes></node>"
+            for node in node_list
+        )
+    )
+
+
+def fixture_state_nodes(standby=(), offline=()):
+    return "<nodes>{}</nodes>".format(
+        "".join(
+            f'<node name="node{i}" id="{i}" '
+            f'standby="{str(f"node{i}" in standby).lower()}" '
+            f'online="{str(f"node{i}" not in offline).lower()}" />'
+            for i in range(1, 6)
+        )
+    )
+
+
+def fixture_standby_wave_reports(
+    wave, wave_count, node_list, remaining_node_list
+):
+    report_list = [
+        fixture.info(
+            reports.codes.NODE_STANDBY_WAVE_STARTED,
+            wave=wave,
+            wave_count=wave_count,
+            node_list=node_list,
+        ),
+        fixture.info(
+            reports.codes.NODE_STANDBY_WAVE_FINISHED,
+            wave=wave,
+            wave_count=wave_count,
+            node_list=node_list,
+            remaining_node_list=remaining_node_list,
+        ),
+    ]
+    if wave < wave_count:
+        report_list.append(
+            fixture.info(
+                reports.codes.NODE_STANDBY_WAVE_WAITING_FOR_NODES,
+                wave=wave,
+                wave_count=wave_count,
+                node_list=node_list,
+            )
+        )
+    return report_list
+
+
+@mock.patch(
+    "pcs.lib.commands.node.simulate_cib",
+    mock.Mock(side_effect=fake_simulate_standby),
+)
+class RollingStandbyPlan(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+
+    def fixture_load(self):
+        self.config.runner.cib.load()
+        self.config.runner.pcmk.load_state(nodes=ROLLING_STANDBY_STATE_NODES)
+
+    def test_unsafe_node(self):
+        self.fixture_load()
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.rolling_standby_plan(self.env_assist.get_env(), [], {})
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.NODE_STANDBY_LEAVES_RESOURCES_STOPPED,
+                    force_code=reports.codes.FORCE,
+                    node="node3",
+                    resource_list=["B"],
+                )
+            ]
+        )
+
+    def test_unsafe_node_forced(self):
+        self.fixture_load()
+        self.assertEqual(
+            lib.rolling_standby_plan(
+                self.env_assist.get_env(),
+                [],
+                {},
+                force_flags=[reports.codes.FORCE],
+            ),
+            [["node1", "node4"], ["node2"], ["node3"]],
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.warn(
+                    reports.codes.NODE_STANDBY_LEAVES_RESOURCES_STOPPED,
+                    node="node3",
+                    resource_list=["B"],
+                )
+            ]
+        )
+
+    def test_specified_nodes(self):
+        self.fixture_load()
+        self.assertEqual(
+            lib.rolling_standby_plan(
+                self.env_assist.get_env(), ["node4", "node2", "node1"], {}
+            ),
+            [["node4", "node2"], ["node1"]],
+        )
+
+    def test_max_wave_size(self):
+        self.fixture_load()
+        self.assertEqual(
+            lib.rolling_standby_plan(
+                self.env_assist.get_env(),
+                ["node1", "node2", "node4"],
+                {"max-wave-size": "1"},
+            ),
+            [["node1"], ["node2"], ["node4"]],
+        )
+
+    def test_node_not_found(self):
+        self.fixture_load()
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.rolling_standby_plan(
+                self.env_assist.get_env(), ["node1", "nodeX"], {}
+            ),
+            [
+                fixture.error(
+                    reports.codes.NODE_NOT_FOUND,
+                    node="nodeX",
+                    searched_types=[],
+                )
+            ],
+            expected_in_processor=False,
+        )
+
+    def test_invalid_options(self):
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.rolling_standby_plan(
+                self.env_assist.get_env(),
+                [],
+                {"max-wave-size": "0", "timeout": "10"},
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.INVALID_OPTIONS,
+                    option_names=["timeout"],
+                    allowed=["max-wave-size"],
+                    option_type="option",
+                    allowed_patterns=[],
+                ),
+                fixture.error(
+                    reports.codes.INVALID_OPTION_VALUE,
+                    option_name="max-wave-size",
+                    option_value="0",
+                    allowed_values="a positive integer",
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                ),
+            ]
+        )
+
+
+@mock.patch(
+    "pcs.lib.commands.node.simulate_cib",
+    mock.Mock(side_effect=fake_simulate_standby),
+)
+@mock.patch("pcs.lib.commands.node.time.sleep")
+class RollingStandby(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.config.runner.cib.load(name="plan.cib")
+        self.config.runner.pcmk.load_state(
+            name="plan.state", nodes=ROLLING_STANDBY_STATE_NODES
+        )
+
+    def fixture_wave(self, node_list, wait=0, exception=None):
+        name = "-".join(node_list)
+        self.config.runner.cib.load(name=f"{name}.cib", nodes="<nodes/>")
+        self.config.runner.pcmk.load_state(
+            name=f"{name}.state", nodes=ROLLING_STANDBY_STATE_NODES
+        )
+        self.config.env.push_cib(
+            name=f"{name}.push",
+            load_key=f"{name}.cib",
+            replace={
+                "./configuration/nodes": fixture_standby_nodes(node_list, True)
+            },
+            wait=wait,
+            exception=exception,
+        )
+
+    def fixture_wait_for_nodes(self, state_nodes_list):
+        for index, state_nodes in enumerate(state_nodes_list):
+            self.config.runner.pcmk.load_state(
+                name=f"wait.state.{index}", nodes=state_nodes
+            )
+
+    def test_success(self, mock_sleep):
+        self.fixture_wave(["node1", "node4"], wait=60)
+        self.fixture_wait_for_nodes(
+            [
+                # the nodes are being maintained
+                fixture_state_nodes(
+                    standby=["node1", "node4", "node5"], offline=["node1"]
+                ),
+                # a node is back but still in standby
+                fixture_state_nodes(standby=["node1", "node5"]),
+                fixture_state_nodes(standby=["node5"]),
+            ]
+        )
+        self.fixture_wave(["node2"], wait=60)
+        lib.rolling_standby(
+            self.env_assist.get_env(),
+            ["node1", "node2", "node4"],
+            {"timeout": "60"},
+        )
+        self.assertEqual(mock_sleep.call_count, 2)
+        # the nodes of the last wave stay in standby
+        self.env_assist.assert_reports(
+            fixture_standby_wave_reports(1, 2, ["node1", "node4"], ["node2"])
+            + fixture_standby_wave_reports(2, 2, ["node2"], [])
+        )
+
+    def test_one_wave(self, mock_sleep):
+        self.fixture_wave(["node2"])
+        lib.rolling_standby(self.env_assist.get_env(), ["node2"], {})
+        mock_sleep.assert_not_called()
+        self.env_assist.assert_reports(
+            fixture_standby_wave_reports(1, 1, ["node2"], [])
+        )
+
+    def test_push_failed(self, mock_sleep):
+        self.fixture_wave(
+            ["node1", "node4"],
+            exception=LibraryError(
+                reports.item.ReportItem.error(
+                    reports.messages.WaitForIdleTimedOut("timeout")
+                )
+            ),
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.rolling_standby(
+                self.env_assist.get_env(), ["node1", "node2", "node4"], {}
+            ),
+            [
+                fixture.error(
+                    reports.codes.WAIT_FOR_IDLE_TIMED_OUT, reason="timeout"
+                )
+            ],
+            expected_in_processor=False,
+        )
+        mock_sleep.assert_not_called()
+        self.env_assist.assert_reports(
+            fixture_standby_wave_reports(1, 2, ["node1", "node4"], ["node2"])[
+                :1
+            ]
+        )
@@ -11,6 +11,10 @@ from pcs import settings
 from pcs.common import file_type_codes, reports
 from pcs.lib.commands import quorum as lib
 from pcs.lib.corosync.config_facade import ConfigFacade
+from pcs.lib.corosync.qdevice_net_certificates import (
+    CertificateError,
+    CertificateRequest,
+)
 from pcs.lib.env import LibraryEnvironment
 
 from pcs_test.tools import fixture
@@ -2451,6 +2455,108 @@ class DeviceNetCertificateSetupLocal(DeviceNetCertsMixin, TestCase):
         mock_open_ca_file.write.assert_called_once_with(self.certs.ca_cert.data)
 
 
+@mock.patch.object(
+    settings, "corosync_qdevice_net_in_process_certificates", True
+)
+class DeviceNetCertificateSetupLocalInProcess(DeviceNetCertsMixin, TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        self.qnetd_host = "qnetd-host"
+        self.cluster_name = "my-cluster"
+        self.pk12_cert_tmp_file_name = "pk12_cert.tmp"
+
+        self.tmp_file_patcher = mock.patch(
+            "pcs.lib.corosync.qdevice_net.get_tmp_file"
+        )
+        self.addCleanup(self.tmp_file_patcher.stop)
+        self.tmp_file_mock_obj = TmpFileMock()
+        self.addCleanup(self.tmp_file_mock_obj.assert_all_done)
+        self.tmp_file_mock = self.tmp_file_patcher.start()
+        self.tmp_file_mock.side_effect = (
+            self.tmp_file_mock_obj.get_mock_side_effect()
+        )
+
+        self.fixture_certificates()
+        self.key = mock.Mock(spec_set=[])
+        certificates_patcher = mock.patch.multiple(
+            "pcs.lib.corosync.qdevice_net.qdevice_net_certificates",
+            generate_certificate_request=mock.DEFAULT,
+            certificate_to_pk12=mock.DEFAULT,
+        )
+        self.addCleanup(certificates_patcher.stop)
+        certificates_mocks = certificates_patcher.start()
+        self.mock_generate_request = certificates_mocks[
+            "generate_certificate_request"
+        ]
+        self.mock_generate_request.return_value = CertificateRequest(
+            self.certs.cert_request.data, self.key
+        )
+        self.mock_to_pk12 = certificates_mocks["certificate_to_pk12"]
+        self.mock_to_pk12.return_value = self.certs.pk12_cert.data
+
+    def fixture_config_client_setup(self):
+        mock_open_ca_file = mock.mock_open()()
+        self.fixture_config_http_get_ca_cert()
+        self.fixture_config_fs_client_initialized(False)
+        self.config.fs.exists(
+            settings.corosync_qdevice_net_client_certs_dir,
+            return_value=False,
+            name="fs.exists.certs-dir",
+        )
+        self.config.fs.makedirs(
+            settings.corosync_qdevice_net_client_certs_dir, 0o700
+        )
+        self.config.fs.open(
+            self.ca_file_path, mock_open_ca_file, mode="wb", name="fs.open.ca"
+        )
+        self.config.runner.corosync.qdevice_init_cert_storage(self.ca_file_path)
+        # no certutil is run for generating the request and converting the
+        # signed certificate to pk12
+        self.fixture_config_http_sign_cert_request()
+
+    def test_success(self):
+        self.fixture_config_client_setup()
+        self.fixture_config_fs_client_initialized()
+        self.tmp_file_mock_obj.set_calls(
+            [
+                TmpFileCall(
+                    self.pk12_cert_tmp_file_name,
+                    is_binary=True,
+                    orig_content=self.certs.pk12_cert.data,
+                )
+            ]
+        )
+        self.config.runner.corosync.qdevice_import_pk12(
+            self.pk12_cert_tmp_file_name
+        )
+
+        lib.device_net_certificate_setup_local(
+            self.env_assist.get_env(), self.qnetd_host, self.cluster_name
+        )
+
+        self.mock_generate_request.assert_called_once_with(self.cluster_name)
+        self.mock_to_pk12.assert_called_once_with(
+            self.certs.signed_request.data, self.key
+        )
+
+    def test_fail_convert_to_pk12(self):
+        self.fixture_config_client_setup()
+        self.mock_to_pk12.side_effect = CertificateError("an error")
+
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.device_net_certificate_setup_local(
+                self.env_assist.get_env(), self.qnetd_host, self.cluster_name
+            ),
+            [
+                fixture.error(
+                    reports.codes.QDEVICE_CERTIFICATE_IMPORT_ERROR,
+                    reason="an error",
+                ),
+            ],
+            expected_in_processor=False,
+        )
+
+
 class DeviceNetCertificateCheckLocal(DeviceNetCertsMixin, TestCase):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(test_case=self)
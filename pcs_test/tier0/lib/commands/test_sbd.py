@@ -1,5 +1,5 @@
 import fcntl
-from unittest import TestCase
+from unittest import TestCase, mock
 
 import pcs.lib.commands.sbd as cmd_sbd
 from pcs import settings
@@ -640,6 +640,8 @@ class InitializeBlockDevicesTest(TestCase):
         )
 
 
+# read devices one by one to get a predictable order of calls
+@mock.patch("pcs.settings.pcs_parallel_collectors_max", 0)
 class GetLocalDevicesInfoTest(TestCase):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(self)
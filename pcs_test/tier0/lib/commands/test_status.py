@@ -1,15 +1,19 @@
 import os
+import threading
 from textwrap import dedent
 from unittest import TestCase, mock
 
+from lxml import etree
+
 from pcs import settings
-from pcs.common import file_type_codes
+from pcs.common import file_type_codes, reports
 from pcs.common.const import (
     PCMK_ROLE_STOPPED,
     PCMK_STATUS_ROLE_STOPPED,
     PcmkRoleType,
 )
 from pcs.common.reports import codes as report_codes
+from pcs.common.services.types import ServiceState
 from pcs.common.status_dto import (
     BundleReplicaStatusDto,
     BundleStatusDto,
@@ -20,15 +24,20 @@ from pcs.common.status_dto import (
 )
 from pcs.lib.booth import constants
 from pcs.lib.commands import status
+from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
 
 from pcs_test.tools import fixture, fixture_crm_mon
-from pcs_test.tools.assertions import assert_xml_equal
+from pcs_test.tools.assertions import (
+    assert_report_item_list_equal,
+    assert_xml_equal,
+)
 from pcs_test.tools.command_env import get_env_tools
 from pcs_test.tools.command_env.config_runner_pcmk import (
     RULE_EXPIRED_RETURNCODE,
     RULE_IN_EFFECT_RETURNCODE,
 )
+from pcs_test.tools.custom_mock import MockLibraryReportProcessor
 from pcs_test.tools.misc import get_test_resource as rc
 from pcs_test.tools.misc import read_test_resource as rc_read
 
@@ -82,6 +91,12 @@ class PacemakerStatusXml(TestCase):
 
 class FullClusterStatusPlaintextBase(TestCase):
     def setUp(self):
+        # run data collectors one by one to get a predictable order of calls
+        collectors_patcher = mock.patch.object(
+            settings, "pcs_parallel_collectors_max", 0
+        )
+        collectors_patcher.start()
+        self.addCleanup(collectors_patcher.stop)
         self.env_assist, self.config = get_env_tools(self)
         self.node_name_list = ["node1", "node2", "node3"]
         self.maxDiff = None
@@ -183,55 +198,20 @@ class FullClusterStatusPlaintextBase(TestCase):
         sbd_enabled=False,
         sbd_active=False,
     ):
-        self.config.services.is_enabled(
-            "corosync",
-            name="services.is_enabled.corosync",
-            return_value=corosync_enabled,
-        )
-        self.config.services.is_running(
-            "corosync",
-            name="services.is_running.corosync",
-            return_value=corosync_active,
-        )
-        self.config.services.is_enabled(
-            "pacemaker",
-            name="services.is_enabled.pacemaker",
-            return_value=pacemaker_enabled,
-        )
-        self.config.services.is_running(
-            "pacemaker",
-            name="services.is_running.pacemaker",
-            return_value=pacemaker_active,
-        )
-        self.config.services.is_enabled(
-            "pacemaker_remote",
-            name="services.is_enabled.pacemaker_remote",
-            return_value=pacemaker_remote_enabled,
-        )
-        self.config.services.is_running(
-            "pacemaker_remote",
-            name="services.is_running.pacemaker_remote",
-            return_value=pacemaker_remote_active,
-        )
-        self.config.services.is_enabled(
-            "pcsd",
-            name="services.is_enabled.pcsd",
-            return_value=pcsd_enabled,
-        )
-        self.config.services.is_running(
-            "pcsd",
-            name="services.is_running.pcsd",
-            return_value=pcsd_active,
-        )
-        self.config.services.is_enabled(
-            "sbd",
-            name="services.is_enabled.sbd_2",
-            return_value=sbd_enabled,
-        )
-        self.config.services.is_running(
-            "sbd",
-            name="services.is_running.sbd_2",
-            return_value=sbd_active,
+        self.config.services.get_services_state(
+            {
+                "corosync": ServiceState(
+                    True, corosync_enabled, corosync_active
+                ),
+                "pacemaker": ServiceState(
+                    True, pacemaker_enabled, pacemaker_active
+                ),
+                "pacemaker_remote": ServiceState(
+                    True, pacemaker_remote_enabled, pacemaker_remote_active
+                ),
+                "pcsd": ServiceState(True, pcsd_enabled, pcsd_active),
+                "sbd": ServiceState(True, sbd_enabled, sbd_active),
+            }
         )
 
 
@@ -355,6 +335,87 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
             ),
         )
 
+    def test_services_state_fallback(self):
+        self._fixture_config_live_minimal()
+        error = LibraryError()
+        self.config.services.get_services_state(
+            {
+                service: ServiceState(True, True, True)
+                for service in (
+                    "corosync",
+                    "pacemaker",
+                    "pacemaker_remote",
+                    "pcsd",
+                    "sbd",
+                )
+            },
+            exception=error,
+        )
+        self.config.services.is_enabled("corosync", return_value=True)
+        self.config.services.is_running("corosync", return_value=False)
+        self.config.services.is_enabled(
+            "pacemaker", exception=error, name="is_enabled.pacemaker"
+        )
+        self.config.services.is_enabled(
+            "pacemaker_remote",
+            return_value=False,
+            name="is_enabled.pacemaker_remote",
+        )
+        self.config.services.is_running(
+            "pacemaker_remote",
+            return_value=False,
+            name="is_running.pacemaker_remote",
+        )
+        self.config.services.is_enabled(
+            "pcsd", return_value=True, name="is_enabled.pcsd"
+        )
+        self.config.services.is_running(
+            "pcsd", return_value=True, name="is_running.pcsd"
+        )
+        self.config.services.is_enabled(
+            "sbd", return_value=False, name="is_enabled.sbd"
+        )
+        self.config.services.is_running(
+            "sbd", exception=error, name="is_running.sbd"
+        )
+        self.config.fs.isfile(settings.crm_rule_exec, return_value=True)
+
+        # services which cannot be checked are not displayed
+        self.assertEqual(
+            status.full_cluster_status_plaintext(self.env_assist.get_env()),
+            dedent(
+                """\
+                Cluster name: test99
+                crm_mon cluster status
+
+                Daemon Status:
+                  corosync: inactive/enabled
+                  pcsd: active/enabled"""
+            ),
+        )
+
+    @mock.patch("pcs.lib.parallel.time.monotonic", lambda: 0.0)
+    def test_data_collection_timings(self):
+        self._fixture_config_live_minimal()
+        self._fixture_config_local_daemons()
+        self.config.fs.isfile(settings.crm_rule_exec, return_value=True)
+
+        status.full_cluster_status_plaintext(self.env_assist.get_env())
+
+        self.env_assist.assert_reports(
+            [
+                fixture.debug(
+                    report_codes.DATA_COLLECTION_TIMINGS,
+                    timings={
+                        "crm_mon": 0.0,
+                        "crm_verify": 0.0,
+                        "services": 0.0,
+                        "move_constraints": 0.0,
+                    },
+                ),
+            ]
+        )
+
     def test_success_live_verbose(self):
         self.config.env.set_known_nodes(self.node_name_list)
         self.config.runner.pcmk.can_fence_history_status(stderr="not supported")
@@ -1170,6 +1231,106 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         )
 
 
+def at_barrier(barrier, result, report=None):
+    # Each collector waits for the others. If they did not run concurrently,
+    # the barrier would break once its timeout expires.
+    def collector(*args):
+        barrier.wait()
+        if report:
+            # the last argument of _move_constraints_warnings
+            args[-1].report(report)
+        return result
+
+    return collector
+
+
+@mock.patch.object(settings, "pcs_parallel_collectors_max", 4)
+@mock.patch(
+    "pcs.lib.commands.status._booth_authfile_warning",
+    mock.Mock(return_value=[]),
+)
+class FullClusterStatusPlaintextConcurrent(TestCase):
+    def setUp(self):
+        self.env = mock.Mock(spec=LibraryEnvironment)
+        self.env.is_cib_live = False
+        self.env.is_corosync_conf_live = False
+        self.env.report_processor = MockLibraryReportProcessor()
+        self.env.get_corosync_conf.return_value.get_cluster_name.return_value = "test99"
+        with open(rc("cib-empty.xml")) as cib_file:
+            self.env.get_cib.return_value = etree.fromstring(cib_file.read())
+        barrier = threading.Barrier(3, timeout=5)
+        patcher_list = [
+            mock.patch(
+                "pcs.lib.commands.status.get_cluster_status_text",
+                at_barrier(
+                    barrier, ("crm_mon cluster status", ["crm_mon warning"])
+                ),
+            ),
+            mock.patch(
+                "pcs.lib.commands.status._get_crm_verify_messages",
+                at_barrier(barrier, (["crm_verify warning"], [])),
+            ),
+            # Move constraints are checked while crm_mon and crm_verify are
+            # still running.
+            mock.patch(
+                "pcs.lib.commands.status._move_constraints_warnings",
+                at_barrier(
+                    barrier,
+                    ["move constraints warning"],
+                    report=reports.ReportItem.warning(
+                        reports.messages.RuleInEffectStatusDetectionNotSupported()
+                    ),
+                ),
+            ),
+        ]
+        for patcher in patcher_list:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_collectors_run_concurrently(self):
+        result = status.full_cluster_status_plaintext(self.env)
+        self.assertEqual(
+            result,
+            dedent(
+                """\
+                Cluster name: test99
+
+                WARNINGS:
+                crm_mon warning
+                move constraints warning
+                crm_verify warning
+
+                crm_mon cluster status"""
+            ),
+        )
+        # each collector gets its own runner and report processor
+        collector_report_processors = {
+            id(call.kwargs["report_processor"])
+            for call in self.env.cmd_runner.call_args_list
+        }
+        self.assertEqual(len(collector_report_processors), 3)
+        self.assertNotIn(
+            id(self.env.report_processor), collector_report_processors
+        )
+        # reports of the collectors are processed by the environment
+        assert_report_item_list_equal(
+            self.env.report_processor.report_item_list,
+            [
+                fixture.warn(
+                    report_codes.RULE_IN_EFFECT_STATUS_DETECTION_NOT_SUPPORTED
+                ),
+                fixture.debug(
+                    report_codes.DATA_COLLECTION_TIMINGS,
+                    timings={
+                        "crm_mon": mock.ANY,
+                        "crm_verify": mock.ANY,
+                        "move_constraints": mock.ANY,
+                    },
+                ),
+            ],
+        )
+
+
 class FullClusterStatusPlaintextBoothWarning(FullClusterStatusPlaintextBase):
     def setUp(self):
         super().setUp()
@@ -1365,6 +1526,69 @@ def _fixture_primitive_resource_dto(
     )
 
 
+class ClusterStatusRevision(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.cmd = [
+            settings.cibadmin_exec,
+            "--local",
+            "--query",
+            "--xpath=/cib",
+            "--no-children",
+        ]
+
+    def test_success(self):
+        self.config.runner.place(
+            self.cmd,
+            stdout=(
+                '<cib admin_epoch="1" epoch="42" num_updates="7" '
+                'validate-with="pacemaker-3.9"/>'
+            ),
+        )
+        self.assertEqual(
+            status.cluster_status_revision(self.env_assist.get_env()),
+            "1.42.7",
+        )
+
+    def test_missing_attributes(self):
+        self.config.runner.place(self.cmd, stdout='<cib epoch="42"/>')
+        self.assertEqual(
+            status.cluster_status_revision(self.env_assist.get_env()),
+            "0.42.0",
+        )
+
+    def test_error(self):
+        self.config.runner.place(
+            self.cmd, stdout="some output", stderr="an error", returncode=1
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: status.cluster_status_revision(self.env_assist.get_env()),
+            [
+                fixture.error(
+                    report_codes.CIB_LOAD_ERROR,
+                    reason="an error\nsome output",
+                ),
+            ],
+            expected_in_processor=False,
+        )
+
+    def test_not_xml(self):
+        self.config.runner.place(self.cmd, stdout="not an xml")
+        self.env_assist.assert_raise_library_error(
+            lambda: status.cluster_status_revision(self.env_assist.get_env()),
+            [
+                fixture.error(
+                    report_codes.CIB_LOAD_ERROR_BAD_FORMAT,
+                    reason=(
+                        "Start tag expected, '<' not found, line 1, column 1 "
+                        "(<string>, line 1)"
+                    ),
+                ),
+            ],
+            expected_in_processor=False,
+        )
+
+
 @mock.patch.object(
     settings,
     "pacemaker_api_result_schema",
@@ -1,10 +1,40 @@
 from unittest import TestCase
 
+import pcs.common.pcs_pycurl as pycurl
+from pcs.common.node_communicator import RequestTarget, Response
+from pcs.lib.communication import sbd
+from pcs.lib.communication.tools import run_and_raise
+
+from pcs_test.tools import fixture
+from pcs_test.tools.custom_mock import (
+    GatedNodeCommunicator,
+    MockCurlSimple,
+    MockLibraryReportProcessor,
+)
+
+
+def get_response_getter(gate_dict, output_dict):
+    # (action, label) -> gate, action -> response output
+    def get_response(request):
+        return (
+            gate_dict.get((request.action, request.target.label)),
+            Response(
+                MockCurlSimple(
+                    info={pycurl.RESPONSE_CODE: 200},
+                    output=output_dict.get(request.action, ""),
+                    request=request,
+                ),
+                was_connected=True,
+            ),
+        )
+
+    return get_response
+
 
 class EnableSbdService(TestCase):
     """
     tested in:
-        pcs_test.tier0.lib.commands.sbd.test_enable_sbd
+        pcs_test.tier0.lib.commands.cluster.test_add_nodes
     """
 
 
@@ -32,7 +62,7 @@ class SetStonithWatchdogTimeoutToZero(TestCase):
 class SetSbdConfig(TestCase):
     """
     tested in:
-        pcs_test.tier0.lib.commands.sbd.test_enable_sbd
+        pcs_test.tier0.lib.commands.cluster.test_add_nodes
     """
 
 
@@ -53,7 +83,42 @@ class GetSbdStatus(TestCase):
 
 
 class CheckSbd(TestCase):
+    """
+    tested in:
+        pcs_test.tier0.lib.commands.cluster.test_add_nodes
+    """
+
+
+class CheckSbdOnOnlineTargets(TestCase):
     """
     tested in:
         pcs_test.tier0.lib.commands.sbd.test_enable_sbd
     """
+
+    def test_nodes_do_not_wait_for_each_other(self):
+        report_processor = MockLibraryReportProcessor()
+        cmd = sbd.CheckSbdOnOnlineTargets(report_processor)
+        for label in ("node1", "node2"):
+            cmd.add_request(RequestTarget(label), "/dev/watchdog", [])
+        # node1 is not online until node2 proceeds to checking sbd
+        communicator = GatedNodeCommunicator(
+            get_response_getter(
+                {
+                    ("remote/check_auth", "node1"): (
+                        "remote/check_sbd",
+                        "node2",
+                    ),
+                },
+                {
+                    "remote/check_auth": '{"success":true}',
+                    "remote/check_sbd": fixture.check_sbd_comm_success_fixture(
+                        "node", "/dev/watchdog", []
+                    )["output"],
+                },
+            )
+        )
+        online_targets = run_and_raise(communicator, cmd)
+        self.assertEqual(
+            [target.label for target in online_targets], ["node1", "node2"]
+        )
+        self.assertEqual(communicator.unmet_gate_list, [])
@@ -1,8 +1,128 @@
+import json
 from unittest import TestCase
 
+import pycurl
 
-class GetFullClusterStatusPlaintext(TestCase):
+from pcs.common import reports
+from pcs.common.node_communicator import RequestTarget, Response
+from pcs.lib.communication import status
+from pcs.lib.communication.tools import run
+
+from pcs_test.tools import fixture
+from pcs_test.tools.assertions import assert_report_item_list_equal
+from pcs_test.tools.custom_mock import (
+    GatedNodeCommunicator,
+    MockCurlSimple,
+    MockLibraryReportProcessor,
+)
+
+STATUS_ACTION = "remote/cluster_status_plaintext"
+
+
+def get_response_getter(target_config):
+    # label -> (gate, cluster status or None if not connected)
+    def get_response(request):
+        gate, cluster_status = target_config[request.target.label]
+        return (
+            gate,
+            Response(
+                MockCurlSimple(
+                    info={pycurl.RESPONSE_CODE: 200},
+                    output=json.dumps(
+                        dict(
+                            status="success",
+                            status_msg="",
+                            data=cluster_status,
+                            report_list=[],
+                        )
+                    ),
+                    request=request,
+                ),
+                was_connected=cluster_status is not None,
+            ),
+        )
+
+    return get_response
+
+
+class GetFullClusterStatusPlaintextSites(TestCase):
     """
     tested in:
         pcs_test.tier0.lib.commands.dr.test_status
     """
+
+    def setUp(self):
+        self.report_processor = MockLibraryReportProcessor()
+
+    def run_cmd(self, communicator, site_label_list, site_timeout):
+        return run(
+            communicator,
+            status.GetFullClusterStatusPlaintextSites(
+                self.report_processor,
+                [
+                    [RequestTarget(label) for label in label_list]
+                    for label_list in site_label_list
+                ],
+                site_timeout,
+            ),
+        )
+
+    def test_sites_fetched_concurrently(self):
+        # sites do not respond until all of them are asked
+        last_request = (STATUS_ACTION, "site3-node")
+        communicator = GatedNodeCommunicator(
+            get_response_getter(
+                {
+                    "site1-node": (last_request, "status1"),
+                    "site2-node": (last_request, "status2"),
+                    "site3-node": (None, "status3"),
+                }
+            )
+        )
+        result = self.run_cmd(
+            communicator,
+            [["site1-node"], ["site2-node"], ["site3-node"]],
+            30,
+        )
+        self.assertEqual(
+            result, [(True, "status1"), (True, "status2"), (True, "status3")]
+        )
+        self.assertEqual(communicator.unmet_gate_list, [])
+        assert_report_item_list_equal(
+            self.report_processor.report_item_list, []
+        )
+
+    def test_next_node_not_asked_after_deadline(self):
+        # site1-node1 does not respond until the deadline of its site passes
+        communicator = GatedNodeCommunicator(
+            get_response_getter(
+                {
+                    "site1-node1": (("never", "sent"), None),
+                    "site1-node2": (None, "status1"),
+                    "site2-node": (None, "status2"),
+                }
+            ),
+            timeout=0.3,
+        )
+        result = self.run_cmd(
+            communicator,
+            [["site1-node1", "site1-node2"], ["site2-node"]],
+            0.1,
+        )
+        self.assertEqual(result, [(False, ""), (True, "status2")])
+        assert_report_item_list_equal(
+            self.report_processor.report_item_list,
+            [
+                fixture.warn(
+                    reports.codes.NODE_COMMUNICATION_ERROR_UNABLE_TO_CONNECT,
+                    node="site1-node1",
+                    command="remote/cluster_status_plaintext",
+                    reason=None,
+                ),
+                fixture.warn(
+                    reports.codes.DR_SITE_STATUS_TIMED_OUT,
+                    node_list=["site1-node1", "site1-node2"],
+                    timeout=0.1,
+                ),
+            ],
+        )
@@ -0,0 +1,203 @@
+import threading
+import time
+from unittest import TestCase, mock
+
+from pcs.lib.corosync import address_resolver
+
+# long enough for any lookup stand-in which is not blocked on purpose
+_TIMEOUT = 5
+
+
+def join_resolver_threads():
+    for thread in threading.enumerate():
+        if thread.name == "pcs-address-resolver":
+            thread.join(_TIMEOUT)
+
+
+class ResolveStandIn:
+    """
+    Resolves addresses from a known list and records lookups, lookups of
+    addresses in the blocked list wait until they are released
+    """
+
+    def __init__(self, resolvable=(), blocked=()):
+        self.resolvable = set(resolvable)
+        self.blocked = set(blocked)
+        self.release = threading.Event()
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, address):
+        with self._lock:
+            self.calls.append(address)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            if address in self.blocked:
+                self.release.wait(_TIMEOUT)
+            else:
+                # give other lookups a chance to run at the same time
+                time.sleep(0.01)
+            return address in self.resolvable
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+class AddressResolverTest(TestCase):
+    def setUp(self):
+        self.stand_in = ResolveStandIn(resolvable=["node1", "node2", "node3"])
+        self.addCleanup(self.stand_in.release.set)
+
+    def _resolver(
+        self, max_workers=4, timeout=_TIMEOUT, cache_ttl=60, max_threads=64
+    ):
+        return address_resolver.AddressResolver(
+            self.stand_in,
+            max_workers=max_workers,
+            timeout=timeout,
+            cache_ttl=cache_ttl,
+            max_threads=max_threads,
+        )
+
+    def test_empty(self):
+        self.assertEqual(self._resolver().resolve([]), {})
+        self.assertEqual(self.stand_in.calls, [])
+
+    def test_resolve(self):
+        self.assertEqual(
+            self._resolver().resolve(["node1", "nodeX", "node2", "node1"]),
+            {"node1": True, "nodeX": False, "node2": True},
+        )
+        self.assertEqual(
+            sorted(self.stand_in.calls), ["node1", "node2", "nodeX"]
+        )
+
+    def test_workers_limit(self):
+        address_list = [f"node{i}" for i in range(20)]
+        result = self._resolver(max_workers=3).resolve(address_list)
+        self.assertEqual(list(result), address_list)
+        self.assertEqual(sorted(self.stand_in.calls), sorted(address_list))
+        self.assertLessEqual(self.stand_in.max_running, 3)
+        self.assertGreater(self.stand_in.max_running, 1)
+
+    def test_resolvable_addresses_are_cached(self):
+        resolver = self._resolver()
+        resolver.resolve(["node1", "nodeX"])
+        self.stand_in.calls.clear()
+        self.assertEqual(
+            resolver.resolve(["node1", "node2", "nodeX"]),
+            {"node1": True, "node2": True, "nodeX": False},
+        )
+        self.assertEqual(sorted(self.stand_in.calls), ["node2", "nodeX"])
+
+    def test_cache_expires(self):
+        resolver = self._resolver()
+        with mock.patch("time.monotonic", return_value=100.0):
+            resolver.resolve(["node1"])
+        with mock.patch("time.monotonic", return_value=159.0):
+            resolver.resolve(["node1"])
+        self.assertEqual(self.stand_in.calls, ["node1"])
+        with mock.patch("time.monotonic", return_value=161.0):
+            resolver.resolve(["node1"])
+        self.assertEqual(self.stand_in.calls, ["node1", "node1"])
+
+    def test_clear_cache(self):
+        resolver = self._resolver()
+        resolver.resolve(["node1"])
+        resolver.clear_cache()
+        resolver.resolve(["node1"])
+        self.assertEqual(self.stand_in.calls, ["node1", "node1"])
+
+    def test_timeout(self):
+        self.stand_in.blocked = {"node1", "slow1", "slow2"}
+        resolver = self._resolver(max_workers=2, timeout=0.1)
+        result = resolver.resolve(["node1", "slow1", "slow2", "node2", "node3"])
+        # the result is returned while the blocked lookups are still running
+        self.assertEqual(self.stand_in.running, 3)
+        self.assertEqual(
+            result,
+            {
+                "node1": False,
+                "slow1": False,
+                "slow2": False,
+                "node2": True,
+                "node3": True,
+            },
+        )
+
+    def test_timed_out_lookup_is_cached_when_finished(self):
+        self.stand_in.blocked = {"node1"}
+        resolver = self._resolver(timeout=0.05)
+        self.assertEqual(resolver.resolve(["node1"]), {"node1": False})
+        self.stand_in.release.set()
+        join_resolver_threads()
+        self.assertEqual(resolver.resolve(["node1"]), {"node1": True})
+        self.assertEqual(self.stand_in.calls, ["node1"])
+
+    def test_threads_limit(self):
+        self.stand_in.blocked = {"slow1", "slow2"}
+        resolver = self._resolver(max_workers=2, timeout=0.1, max_threads=2)
+        self.assertEqual(
+            resolver.resolve(["slow1", "slow2", "node1", "node2"]),
+            {"slow1": False, "slow2": False, "node1": False, "node2": False},
+        )
+        # no more threads are started while all of them are stuck
+        self.assertEqual(sorted(self.stand_in.calls), ["slow1", "slow2"])
+        self.assertEqual(resolver.resolve(["node3"]), {"node3": False})
+        self.assertEqual(sorted(self.stand_in.calls), ["slow1", "slow2"])
+
+        self.stand_in.release.set()
+        join_resolver_threads()
+        self.assertEqual(resolver.resolve(["node3"]), {"node3": True})
+
+    def test_threads_limit_stuck_worker_replaced(self):
+        self.stand_in.blocked = {"slow1"}
+        resolver = self._resolver(max_workers=1, timeout=0.1, max_threads=2)
+        # the stuck lookup is replaced by one more thread, which looks up all
+        # other addresses
+        self.assertEqual(
+            resolver.resolve(["slow1", "node1", "node2"]),
+            {"slow1": False, "node1": True, "node2": True},
+        )
+
+    def test_timed_out_lookup_finished_before_other_lookups(self):
+        def resolve(address):
+            # node1 times out at 0.4s and finishes at 0.6s, its replacement
+            # worker looks up node2 from 0.4s to 0.7s
+            time.sleep({"node1": 0.6, "node2": 0.3}[address])
+            return True
+
+        resolver = address_resolver.AddressResolver(
+            resolve, max_workers=1, timeout=0.4, cache_ttl=60
+        )
+        self.assertEqual(
+            resolver.resolve(["node1", "node2"]),
+            {"node1": False, "node2": True},
+        )
+
+    def test_error(self):
+        def resolve(address):
+            if address == "bad":
+                raise UnicodeError("label empty or too long")
+            return True
+
+        resolver = address_resolver.AddressResolver(
+            resolve, max_workers=2, timeout=_TIMEOUT, cache_ttl=60
+        )
+        with self.assertRaises(UnicodeError):
+            resolver.resolve(["node1", "bad", "node2"])
+
+
+@mock.patch("pcs.lib.corosync.address_resolver.socket.getaddrinfo")
+class ResolveByDns(TestCase):
+    def test_resolvable(self, mock_getaddrinfo):
+        mock_getaddrinfo.return_value = []
+        self.assertTrue(address_resolver.resolve_by_dns("node1"))
+        mock_getaddrinfo.assert_called_once_with("node1", None)
+
+    def test_unresolvable(self, mock_getaddrinfo):
+        mock_getaddrinfo.side_effect = address_resolver.socket.gaierror()
+        self.assertFalse(address_resolver.resolve_by_dns("node1"))
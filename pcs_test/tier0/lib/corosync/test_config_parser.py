@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from pcs.lib.corosync import config_parser
 
@@ -797,6 +797,105 @@ class SectionTest(TestCase):
             ),
         )
 
+    def test_str_after_changes(self):
+        root = config_parser.Section("root")
+        nodelist = config_parser.Section("nodelist")
+        root.add_section(nodelist)
+        node1 = config_parser.Section("node")
+        node1.add_attribute("name", "node1")
+        node2 = config_parser.Section("node")
+        node2.add_attribute("name", "node2")
+        nodelist.add_section(node1)
+        nodelist.add_section(node2)
+        totem = config_parser.Section("totem")
+        root.add_section(totem)
+        self.assertEqual(
+            str(root),
+            outdent(
+                """\
+            nodelist {
+                node {
+                    name: node1
+                }
+
+                node {
+                    name: node2
+                }
+            }
+
+            totem {
+            }
+            """
+            ),
+        )
+
+        node2.set_attribute("nodeid", "2")
+        nodelist.del_section(node1)
+        totem.add_section(node1)
+        self.assertEqual(
+            str(root),
+            outdent(
+                """\
+            nodelist {
+                node {
+                    name: node2
+                    nodeid: 2
+                }
+            }
+
+            totem {
+                node {
+                    name: node1
+                }
+            }
+            """
+            ),
+        )
+
+        totem.del_section(node1)
+        self.assertEqual(str(node1), "name: node1\n")
+        self.assertEqual(
+            str(root),
+            outdent(
+                """\
+            nodelist {
+                node {
+                    name: node2
+                    nodeid: 2
+                }
+            }
+
+            totem {
+            }
+            """
+            ),
+        )
+
+    def test_export_reuses_unchanged_sections(self):
+        root = config_parser.Section("root")
+        nodelist = config_parser.Section("nodelist")
+        root.add_section(nodelist)
+        node_list = []
+        for i in range(3):
+            node = config_parser.Section("node")
+            node.add_attribute("name", f"node{i}")
+            nodelist.add_section(node)
+            node_list.append(node)
+        root.export()
+
+        with mock.patch.object(
+            config_parser.Section,
+            "_export",
+            autospec=True,
+            side_effect=config_parser.Section._export,
+        ) as mock_export:
+            node_list[1].set_attribute("nodeid", "1")
+            root.export()
+        self.assertEqual(
+            [call.args[0] for call in mock_export.call_args_list],
+            [root, nodelist, node_list[1]],
+        )
+
 
 class ParserTest(TestCase):
     def test_empty(self):
@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.serialization import pkcs12
+from cryptography.x509.oid import NameOID
+
+from pcs.common.ssl import generate_cert
+from pcs.lib.corosync import qdevice_net_certificates as lib
+
+
+def fixture_signed_certificate(cert_request):
+    # Certificates are signed on a qnetd host. Only the key of the certificate
+    # matters when converting it to pk12.
+    return generate_cert(cert_request.key, "my-cluster")
+
+
+class QdeviceNetCertificates(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.request = lib.generate_certificate_request("my-cluster")
+        cls.certificate = fixture_signed_certificate(cls.request)
+
+    def test_generate_certificate_request(self):
+        request = x509.load_der_x509_csr(self.request.request)
+        self.assertTrue(request.is_signature_valid)
+        self.assertEqual(
+            request.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[
+                0
+            ].value,
+            "my-cluster",
+        )
+        self.assertEqual(request.public_key(), self.request.key.public_key())
+
+    def test_certificate_to_pk12(self):
+        signed = self.certificate.public_bytes(serialization.Encoding.DER)
+        pk12 = pkcs12.load_pkcs12(
+            lib.certificate_to_pk12(signed, self.request.key), None
+        )
+        self.assertEqual(
+            pk12.cert.certificate.public_bytes(serialization.Encoding.DER),
+            signed,
+        )
+        self.assertEqual(pk12.cert.friendly_name, b"Cluster Cert")
+        self.assertEqual(pk12.key.public_key(), self.request.key.public_key())
+
+    def test_pem_certificate_to_pk12(self):
+        pk12 = pkcs12.load_pkcs12(
+            lib.certificate_to_pk12(
+                self.certificate.public_bytes(serialization.Encoding.PEM),
+                self.request.key,
+            ),
+            None,
+        )
+        self.assertEqual(pk12.cert.certificate, self.certificate)
+
+    def test_certificate_for_another_key_to_pk12(self):
+        other_request = lib.generate_certificate_request("my-cluster")
+        signed = fixture_signed_certificate(other_request).public_bytes(
+            serialization.Encoding.DER
+        )
+        with self.assertRaises(lib.CertificateError) as cm:
+            lib.certificate_to_pk12(signed, self.request.key)
+        self.assertEqual(
+            cm.exception.reason,
+            "Certificate has not been signed for the generated key",
+        )
+
+    def test_invalid_certificate_to_pk12(self):
+        with self.assertRaises(lib.CertificateError):
+            lib.certificate_to_pk12(b"not a certificate", self.request.key)
@@ -1587,32 +1587,6 @@ class ResourcesWaitingTest(TestCase):
         )
 
 
-class IsInPcmkToolHelp(TestCase):
-    def test_all_in_stderr(self):
-        mock_runner = get_runner("", "ABCDE", 0)
-        self.assertTrue(
-            lib._is_in_pcmk_tool_help(mock_runner, "", ["A", "C", "E"])
-        )
-
-    def test_all_in_stdout(self):
-        mock_runner = get_runner("ABCDE", "", 0)
-        self.assertTrue(
-            lib._is_in_pcmk_tool_help(mock_runner, "", ["A", "C", "E"])
-        )
-
-    def test_some_in_stderr_all_in_stdout(self):
-        mock_runner = get_runner("ABCDE", "ABC", 0)
-        self.assertTrue(
-            lib._is_in_pcmk_tool_help(mock_runner, "", ["A", "C", "E"])
-        )
-
-    def test_some_in_stderr_some_in_stdout(self):
-        mock_runner = get_runner("CDE", "ABC", 0)
-        self.assertFalse(
-            lib._is_in_pcmk_tool_help(mock_runner, "", ["A", "C", "E"])
-        )
-
-
 class GetRulesInEffectStatus(TestCase):
     def test_success(self):
         test_data = [
@@ -0,0 +1,183 @@
+import json
+import os
+from unittest import TestCase, mock
+
+from pcs import settings
+from pcs.lib.external import CommandRunner
+from pcs.lib.pacemaker import tool_features
+
+from pcs_test.tools.misc import get_tmp_dir
+
+HELP = {
+    settings.crm_attribute_exec: "  --list-options=TYPE  list options\n",
+    settings.crm_mon_exec: "  --fence-history=LEVEL  show history\n",
+    settings.crm_resource_exec: "  --expired  clear expired\n  --digests\n",
+    settings.stonith_admin_exec: "  --history=NODE --broadcast --cleanup\n",
+}
+
+
+def fixture_runner():
+    runner = mock.MagicMock(spec_set=CommandRunner)
+    runner.run.side_effect = lambda args: ("", HELP[args[0]], 0)
+    return runner
+
+
+class HasOptionsNoCache(TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            tool_features, "get_tool_identity", lambda tool: None
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.registry = tool_features.ToolFeatureRegistry(None)
+
+    def _assert_options(self, stdout, stderr, option_list, expected):
+        runner = mock.MagicMock(spec_set=CommandRunner)
+        runner.run.return_value = (stdout, stderr, 0)
+        self.assertEqual(
+            self.registry.has_options(runner, "tool", option_list), expected
+        )
+        runner.run.assert_called_once_with(["tool", "--help-all"])
+
+    def test_all_in_stderr(self):
+        self._assert_options("", "--aa --cc=X --ee", ["--aa", "--ee"], True)
+
+    def test_all_in_stdout(self):
+        self._assert_options("--aa --cc=X --ee", "", ["--aa", "--ee"], True)
+
+    def test_some_in_stderr_some_in_stdout(self):
+        self._assert_options("--cc --ee", "--aa", ["--aa", "--ee"], True)
+
+    def test_missing(self):
+        self._assert_options("--ab --cc-ee", "--a", ["--aa", "--cc"], False)
+
+    def test_tool_run_every_time(self):
+        runner = fixture_runner()
+        for _ in range(2):
+            self.assertTrue(
+                self.registry.has_options(
+                    runner, settings.crm_mon_exec, ["--fence-history"]
+                )
+            )
+        self.assertEqual(
+            runner.run.mock_calls,
+            [mock.call([settings.crm_mon_exec, "--help-all"])] * 2,
+        )
+
+
+class HasOptionsCache(TestCase):
+    def setUp(self):
+        self.identity = {tool: [1, 2, 3, 4] for tool in HELP}
+        patcher = mock.patch.object(
+            tool_features, "get_tool_identity", self.identity.get
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tmp_dir = get_tmp_dir("tier0_lib_pacemaker_tool_features")
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache_path = os.path.join(self.tmp_dir.name, "cache.json")
+
+    def _assert_all_tools_probed(self, runner):
+        self.assertEqual(
+            sorted(call.args[0][0] for call in runner.run.mock_calls),
+            sorted(HELP),
+        )
+
+    def test_all_tools_probed_once(self):
+        registry = tool_features.ToolFeatureRegistry(self.cache_path)
+        runner = fixture_runner()
+        self.assertTrue(
+            registry.has_options(
+                runner, settings.crm_mon_exec, ["--fence-history"]
+            )
+        )
+        self._assert_all_tools_probed(runner)
+
+        runner.run.reset_mock()
+        self.assertTrue(
+            registry.has_options(
+                runner, settings.crm_resource_exec, ["--expired", "--digests"]
+            )
+        )
+        self.assertFalse(
+            registry.has_options(
+                runner, settings.crm_attribute_exec, ["--digests"]
+            )
+        )
+        self.assertTrue(
+            registry.has_options(
+                runner,
+                settings.stonith_admin_exec,
+                ["--history", "--broadcast", "--cleanup"],
+            )
+        )
+        runner.run.assert_not_called()
+
+    def test_features_loaded_from_file(self):
+        runner = fixture_runner()
+        tool_features.ToolFeatureRegistry(self.cache_path).has_options(
+            runner, settings.crm_mon_exec, ["--fence-history"]
+        )
+        with open(self.cache_path) as cache_file:
+            self.assertEqual(
+                json.load(cache_file)[settings.crm_resource_exec],
+                {
+                    "identity": [1, 2, 3, 4],
+                    "options": ["--digests", "--expired"],
+                },
+            )
+
+        runner.run.reset_mock()
+        registry = tool_features.ToolFeatureRegistry(self.cache_path)
+        self.assertTrue(
+            registry.has_options(
+                runner, settings.crm_resource_exec, ["--expired"]
+            )
+        )
+        runner.run.assert_not_called()
+
+    def test_changed_tool_probed_again(self):
+        registry = tool_features.ToolFeatureRegistry(self.cache_path)
+        runner = fixture_runner()
+        registry.has_options(runner, settings.crm_mon_exec, ["--fence-history"])
+
+        runner.run.reset_mock()
+        self.identity[settings.crm_mon_exec] = [5, 6, 3, 4]
+        self.assertTrue(
+            registry.has_options(
+                runner, settings.crm_mon_exec, ["--fence-history"]
+            )
+        )
+        runner.run.assert_called_once_with(
+            [settings.crm_mon_exec, "--help-all"]
+        )
+
+    def test_bad_cache_file(self):
+        with open(self.cache_path, "w") as cache_file:
+            cache_file.write("not a json")
+        registry = tool_features.ToolFeatureRegistry(self.cache_path)
+        runner = fixture_runner()
+        self.assertTrue(
+            registry.has_options(
+                runner, settings.crm_mon_exec, ["--fence-history"]
+            )
+        )
+        self._assert_all_tools_probed(runner)
+
+    def test_cache_file_not_writable(self):
+        registry = tool_features.ToolFeatureRegistry(
+            os.path.join(self.tmp_dir.name, "missing_dir", "cache.json")
+        )
+        runner = fixture_runner()
+        self.assertTrue(
+            registry.has_options(
+                runner, settings.crm_mon_exec, ["--fence-history"]
+            )
+        )
+        runner.run.reset_mock()
+        self.assertTrue(
+            registry.has_options(
+                runner, settings.crm_mon_exec, ["--fence-history"]
+            )
+        )
+        runner.run.assert_not_called()
@@ -0,0 +1,133 @@
+import json
+import os
+from unittest import TestCase, mock
+
+from pcs.lib.resource_agent import cache as lib
+from pcs.lib.resource_agent.types import (
+    OcfVersion,
+    ResourceAgentAction,
+    ResourceAgentMetadata,
+    ResourceAgentName,
+    ResourceAgentParameter,
+)
+
+from pcs_test.tools.misc import get_tmp_dir
+
+TOOL = "/usr/sbin/crm_attribute"
+
+
+def fixture_metadata(shortdesc="short"):
+    return ResourceAgentMetadata(
+        name=ResourceAgentName("__pcmk_internal", None, "cluster-options"),
+        agent_exists=True,
+        ocf_version=OcfVersion("1.1"),
+        shortdesc=shortdesc,
+        longdesc="long",
+        parameters=[
+            ResourceAgentParameter(
+                name="param",
+                shortdesc="param short",
+                longdesc=None,
+                type="select",
+                default="a",
+                enum_values=["a", "b"],
+                required=False,
+                advanced=True,
+                deprecated=False,
+                deprecated_by=["new-param"],
+                deprecated_desc=None,
+                unique_group=None,
+                reloadable=False,
+            )
+        ],
+        actions=[
+            ResourceAgentAction(
+                name="meta-data",
+                timeout="5s",
+                interval=None,
+                role=None,
+                start_delay=None,
+                depth=None,
+                automatic=False,
+                on_target=False,
+            )
+        ],
+    )
+
+
+class PacemakerMetadataCache(TestCase):
+    def setUp(self):
+        tmp_dir = get_tmp_dir("tier0_lib_resource_agent_cache")
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache_file = os.path.join(tmp_dir.name, "cache.json")
+        self.identity = [1, 2, 3, 4]
+        patcher = mock.patch(
+            "pcs.lib.pacemaker.tool_features.get_tool_identity",
+            lambda tool: self.identity,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.loader = mock.Mock(return_value=fixture_metadata())
+
+    def get(self, cache=None):
+        if cache is None:
+            cache = lib.PacemakerMetadataCache(self.cache_file)
+        return cache.get("cluster-options", TOOL, self.loader)
+
+    def test_cached_in_memory_and_file(self):
+        cache = lib.PacemakerMetadataCache(self.cache_file)
+        self.assertEqual(self.get(cache), fixture_metadata())
+        self.assertEqual(self.get(cache), fixture_metadata())
+        self.assertEqual(self.get(), fixture_metadata())
+        self.loader.assert_called_once_with()
+
+    def test_preload(self):
+        self.get()
+        cache = lib.PacemakerMetadataCache(self.cache_file)
+        cache.preload()
+        os.unlink(self.cache_file)
+        self.assertEqual(self.get(cache), fixture_metadata())
+        self.loader.assert_called_once_with()
+
+    def test_identity_changed(self):
+        self.get()
+        self.identity = [1, 2, 3, 5]
+        self.loader.return_value = fixture_metadata("new")
+        self.assertEqual(self.get(), fixture_metadata("new"))
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_unknown_identity(self):
+        self.identity = None
+        cache = lib.PacemakerMetadataCache(self.cache_file)
+        self.get(cache)
+        self.get(cache)
+        self.assertEqual(self.loader.call_count, 2)
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_broken_cache_file(self):
+        with open(self.cache_file, "w") as cache_file:
+            json.dump(
+                {"cluster-options": {"identity": [1, 2, 3, 4]}}, cache_file
+            )
+        self.assertEqual(self.get(), fixture_metadata())
+        self.loader.assert_called_once_with()
+        self.assertEqual(
+            self.get(lib.PacemakerMetadataCache(self.cache_file)),
+            fixture_metadata(),
+        )
+        self.loader.assert_called_once_with()
+
+    def test_cache_file_not_writable(self):
+        cache = lib.PacemakerMetadataCache(
+            os.path.join(self.cache_file, "missing", "cache.json")
+        )
+        self.assertEqual(self.get(cache), fixture_metadata())
+        self.assertEqual(self.get(cache), fixture_metadata())
+        self.loader.assert_called_once_with()
+
+    def test_loader_error_not_cached(self):
+        self.loader.side_effect = [RuntimeError("error"), fixture_metadata()]
+        with self.assertRaises(RuntimeError):
+            self.get()
+        self.assertEqual(self.get(), fixture_metadata())
+        self.assertEqual(self.loader.call_count, 2)
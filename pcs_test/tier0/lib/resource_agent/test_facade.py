@@ -1,5 +1,6 @@
 from unittest import TestCase, mock
 
+from pcs import settings
 from pcs.common import reports
 from pcs.lib import resource_agent as ra
 
@@ -196,6 +197,26 @@ class ResourceAgentFacadeFactory(TestCase):
             ["fenced-param"],
         )
 
+    def test_fenced_metadata_cached_for_fenced_binary(self):
+        name = ra.ResourceAgentName("stonith", None, "fence_xvm")
+        self.config.runner.pcmk.load_fake_agent_metadata(
+            stdout=self._fixture_fenced_xml
+        )
+
+        env = self.env_assist.get_env()
+        with mock.patch(
+            "pcs.lib.resource_agent.facade.get_pacemaker_metadata",
+            wraps=ra.facade.get_pacemaker_metadata,
+        ) as mock_get_metadata:
+            ra.ResourceAgentFacadeFactory(
+                env.cmd_runner(), env.report_processor
+            ).void_facade_from_parsed_name(name)
+        mock_get_metadata.assert_called_once_with(
+            ra.const.PACEMAKER_FENCED,
+            settings.pacemaker_fenced_exec,
+            mock.ANY,
+        )
+
     def test_facade_load_and_cache_fenced_for_stonith(self):
         name1 = ra.ResourceAgentName("stonith", None, "fence_xvm")
         name2 = ra.ResourceAgentName("stonith", None, "fence_virt")
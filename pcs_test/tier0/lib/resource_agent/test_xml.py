@@ -56,6 +56,20 @@ class LoadMetadataXml(TestCase):
         self.assertEqual(cm.exception.message, "error message")
 
 
+class GetFakeAgentExecutable(TestCase):
+    def test_success(self):
+        self.assertEqual(
+            ra.xml.get_fake_agent_executable(ra.const.PACEMAKER_FENCED),
+            settings.pacemaker_fenced_exec,
+        )
+
+    def test_unknown_agent(self):
+        with self.assertRaises(ra.UnableToGetAgentMetadata) as cm:
+            ra.xml.get_fake_agent_executable("unknown")
+        self.assertEqual(cm.exception.agent_name, "unknown")
+        self.assertEqual(cm.exception.message, "Unknown agent")
+
+
 class LoadFakeAgentMetadataXml(TestCase):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(test_case=self)
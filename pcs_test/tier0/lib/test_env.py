@@ -107,6 +107,23 @@ class CmdRunner(TestCase):
             {
                 "LC_ALL": "C",
             },
+            run_records=[],
+        )
+
+    def test_report_processor(self, mock_runner):
+        expected_runner = mock.MagicMock()
+        mock_runner.return_value = expected_runner
+        report_processor = MockLibraryReportProcessor()
+        env = LibraryEnvironment(self.mock_logger, self.mock_reporter)
+        runner = env.cmd_runner(report_processor=report_processor)
+        self.assertEqual(expected_runner, runner)
+        mock_runner.assert_called_once_with(
+            self.mock_logger,
+            report_processor,
+            {
+                "LC_ALL": "C",
+            },
+            run_records=[],
         )
 
     def test_user(self, mock_runner):
@@ -125,6 +142,7 @@ class CmdRunner(TestCase):
                 "CIB_user": user,
                 "LC_ALL": "C",
             },
+            run_records=[],
         )
 
     @patch_env("create_tmp_cib")
@@ -147,6 +165,7 @@ class CmdRunner(TestCase):
                 "LC_ALL": "C",
                 "CIB_file": tmp_file_name,
             },
+            run_records=[],
         )
         mock_tmpfile.assert_called_once_with(self.mock_reporter, "<cib />")
 
@@ -1,5 +1,5 @@
 import logging
-from subprocess import DEVNULL
+from subprocess import DEVNULL, TimeoutExpired
 from unittest import TestCase, mock
 
 import pcs.lib.external as lib
@@ -50,7 +50,7 @@ class CommandRunnerTest(TestCase):
         self.assertEqual(real_stdout, expected_stdout)
         self.assertEqual(real_stderr, expected_stderr)
         self.assertEqual(real_retval, expected_retval)
-        mock_process.communicate.assert_called_once_with(None)
+        mock_process.communicate.assert_called_once_with(None, timeout=None)
         self.assert_popen_called_with(
             mock_popen,
             command,
@@ -134,7 +134,7 @@ class CommandRunnerTest(TestCase):
         self.assertEqual(real_stdout, expected_stdout)
         self.assertEqual(real_stderr, expected_stderr)
         self.assertEqual(real_retval, expected_retval)
-        mock_process.communicate.assert_called_once_with(None)
+        mock_process.communicate.assert_called_once_with(None, timeout=None)
         self.assert_popen_called_with(
             mock_popen,
             command,
@@ -222,7 +222,7 @@ class CommandRunnerTest(TestCase):
         self.assertEqual(real_stdout, expected_stdout)
         self.assertEqual(real_stderr, expected_stderr)
         self.assertEqual(real_retval, expected_retval)
-        mock_process.communicate.assert_called_once_with(stdin)
+        mock_process.communicate.assert_called_once_with(stdin, timeout=None)
         self.assert_popen_called_with(
             mock_popen, command, {"env": {}, "stdin": -1}
         )
@@ -361,7 +361,7 @@ class CommandRunnerTest(TestCase):
             ),
         )
 
-        mock_process.communicate.assert_called_once_with(None)
+        mock_process.communicate.assert_called_once_with(None, timeout=None)
         self.assert_popen_called_with(
             mock_popen,
             command,
@@ -390,6 +390,173 @@ class CommandRunnerTest(TestCase):
             ],
         )
 
+    @mock.patch("pcs.lib.external.shell_quote")
+    def test_debug_disabled(self, mock_quote, mock_popen):
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = ("stdout", "stderr")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+        self.mock_logger.isEnabledFor.return_value = False
+        reporter = MockLibraryReportProcessor(debug=False)
+
+        runner = lib.CommandRunner(self.mock_logger, reporter, {"a": "b"})
+        self.assertEqual(
+            runner.run(["a_command"], stdin_string="stdin"),
+            ("stdout", "stderr", 0),
+        )
+
+        self.mock_logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        self.mock_logger.debug.assert_not_called()
+        mock_quote.assert_not_called()
+        self.assertEqual(reporter.report_item_list, [])
+
+    @mock.patch("pcs.lib.external.time.monotonic")
+    def test_run_records(self, mock_monotonic, mock_popen):
+        mock_monotonic.side_effect = [10.0, 12.5, 20.0, 20.25]
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = ("stdout", "stderr")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+        run_records = []
+
+        lib.CommandRunner(
+            self.mock_logger, self.mock_reporter, run_records=run_records
+        ).run(["command1", "arg"], stdin_string="stdin string")
+        runner = lib.CommandRunner(
+            self.mock_logger, self.mock_reporter, run_records=run_records
+        )
+        runner.run(["command2"])
+
+        expected_records = [
+            lib.ProcessRunRecord(
+                args=("command1", "arg"),
+                duration=2.5,
+                stdin_size=12,
+                stdout_size=6,
+                stderr_size=6,
+            ),
+            lib.ProcessRunRecord(
+                args=("command2",),
+                duration=0.25,
+                stdin_size=0,
+                stdout_size=6,
+                stderr_size=6,
+            ),
+        ]
+        self.assertEqual(run_records, expected_records)
+        self.assertEqual(runner.run_records, expected_records)
+
+    @mock.patch("pcs.lib.external.time.monotonic")
+    def test_timeout(self, mock_monotonic, mock_popen):
+        mock_monotonic.side_effect = [10.0, 15.5]
+        mock_process = mock.MagicMock(
+            spec_set=["communicate", "kill", "returncode"]
+        )
+        mock_process.communicate.side_effect = [
+            TimeoutExpired(["a_command"], 5),
+            ("stdout", "stderr"),
+        ]
+        mock_popen.return_value = mock_process
+
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        assert_raise_library_error(
+            lambda: runner.run(["a_command"], timeout=5),
+            (
+                severity.ERROR,
+                report_codes.RUN_EXTERNAL_PROCESS_TIMED_OUT,
+                {"command": "a_command", "timeout": 5},
+            ),
+        )
+        mock_process.kill.assert_called_once_with()
+        mock_process.communicate.assert_has_calls(
+            [mock.call(None, timeout=5), mock.call(timeout=1)]
+        )
+        self.assertEqual(
+            runner.run_records,
+            [
+                lib.ProcessRunRecord(
+                    args=("a_command",),
+                    duration=5.5,
+                    stdin_size=0,
+                    stdout_size=6,
+                    stderr_size=6,
+                )
+            ],
+        )
+
+    @mock.patch("pcs.lib.external.threading.Thread")
+    @mock.patch("pcs.lib.external.time.monotonic")
+    def test_timeout_process_not_terminated(
+        self, mock_monotonic, mock_thread, mock_popen
+    ):
+        # a process in uninterruptible I/O does not terminate on SIGKILL
+        mock_monotonic.side_effect = [10.0, 16.0]
+        mock_process = mock.MagicMock(
+            spec_set=[
+                "communicate",
+                "kill",
+                "returncode",
+                "stdin",
+                "stdout",
+                "stderr",
+                "wait",
+            ]
+        )
+        mock_process.communicate.side_effect = [
+            TimeoutExpired(["a_command"], 5),
+            TimeoutExpired(["a_command"], 1),
+        ]
+        mock_process.stdin = None
+        mock_popen.return_value = mock_process
+
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        assert_raise_library_error(
+            lambda: runner.run(["a_command"], timeout=5),
+            (
+                severity.ERROR,
+                report_codes.RUN_EXTERNAL_PROCESS_TIMED_OUT,
+                {"command": "a_command", "timeout": 5},
+            ),
+        )
+        mock_process.kill.assert_called_once_with()
+        mock_process.stdout.close.assert_called_once_with()
+        mock_process.stderr.close.assert_called_once_with()
+        mock_process.wait.assert_not_called()
+        mock_thread.assert_called_once_with(
+            target=mock_process.wait,
+            name="pcs-reap-killed-process",
+            daemon=True,
+        )
+        mock_thread.return_value.start.assert_called_once_with()
+        self.assertEqual(
+            runner.run_records,
+            [
+                lib.ProcessRunRecord(
+                    args=("a_command",),
+                    duration=6.0,
+                    stdin_size=0,
+                    stdout_size=0,
+                    stderr_size=0,
+                )
+            ],
+        )
+
+    def test_run_records_not_created_on_error(self, mock_popen):
+        exception = OSError()
+        exception.strerror = "expected error"
+        mock_popen.side_effect = exception
+
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        assert_raise_library_error(
+            lambda: runner.run(["a_command"]),
+            (
+                severity.ERROR,
+                report_codes.RUN_EXTERNAL_PROCESS_ERROR,
+                {"command": "a_command", "reason": "expected error"},
+            ),
+        )
+        self.assertEqual(runner.run_records, [])
+
 
 class KillServicesTest(TestCase):
     def setUp(self):
@@ -0,0 +1,55 @@
+import threading
+from unittest import TestCase, mock
+
+from pcs.lib.parallel import CollectorPool
+
+
+class CollectorPoolSequential(TestCase):
+    def test_run_on_submit(self):
+        call_list = []
+        with CollectorPool(0) as pool:
+            future_a = pool.submit("a", lambda: call_list.append("a") or 1)
+            call_list.append("between")
+            future_b = pool.submit("b", lambda: call_list.append("b") or 2)
+        self.assertEqual(call_list, ["a", "between", "b"])
+        self.assertEqual(future_a.result(), 1)
+        self.assertEqual(future_b.result(), 2)
+
+    def test_exception_raised_on_submit(self):
+        def collector():
+            raise ValueError("error")
+
+        with CollectorPool(0) as pool, self.assertRaises(ValueError):
+            pool.submit("a", collector)
+
+    @mock.patch("pcs.lib.parallel.time.monotonic")
+    def test_timings(self, mock_monotonic):
+        mock_monotonic.side_effect = [1.0, 1.5, 2.0, 4.0]
+        with CollectorPool(0) as pool:
+            pool.submit("b", lambda: None)
+            pool.submit("a", lambda: None)
+        self.assertEqual(list(pool.timings.items()), [("b", 0.5), ("a", 2.0)])
+
+
+class CollectorPoolParallel(TestCase):
+    def test_run_concurrently(self):
+        # both collectors must be running at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        with CollectorPool(2) as pool:
+            future_a = pool.submit("a", lambda: barrier.wait() is not None)
+            future_b = pool.submit("b", lambda: barrier.wait() is not None)
+            self.assertTrue(future_a.result())
+            self.assertTrue(future_b.result())
+        self.assertEqual(list(pool.timings), ["a", "b"])
+
+    def test_exception_raised_on_result(self):
+        def collector():
+            raise ValueError("error")
+
+        with CollectorPool(2) as pool:
+            future_a = pool.submit("a", collector)
+            future_b = pool.submit("b", lambda: "b")
+            self.assertEqual(future_b.result(), "b")
+            with self.assertRaises(ValueError):
+                future_a.result()
+        self.assertIn("a", pool.timings)
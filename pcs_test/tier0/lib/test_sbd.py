@@ -1,3 +1,6 @@
+import logging
+import os
+from tempfile import TemporaryDirectory
 from unittest import TestCase, mock
 
 import pcs.lib.sbd as lib_sbd
@@ -14,7 +17,7 @@ from pcs_test.tools.assertions import (
     assert_report_item_list_equal,
 )
 from pcs_test.tools.custom_mock import MockLibraryReportProcessor
-from pcs_test.tools.misc import outdent
+from pcs_test.tools.misc import get_test_resource, outdent
 
 
 class TestException(Exception):
@@ -461,7 +464,7 @@ class GetDeviceMessagesInfoTest(TestCase):
             output, lib_sbd.get_device_messages_info(self.mock_runner, device)
         )
         self.mock_runner.run.assert_called_once_with(
-            [settings.sbd_exec, "-d", device, "list"]
+            [settings.sbd_exec, "-d", device, "list"], timeout=None
         )
 
     def test_failed(self):
@@ -480,7 +483,7 @@ class GetDeviceMessagesInfoTest(TestCase):
             ),
         )
         self.mock_runner.run.assert_called_once_with(
-            [settings.sbd_exec, "-d", device, "list"]
+            [settings.sbd_exec, "-d", device, "list"], timeout=None
         )
 
 
@@ -496,7 +499,7 @@ class GetDeviceSbdHeaderDumpTest(TestCase):
             output, lib_sbd.get_device_sbd_header_dump(self.mock_runner, device)
         )
         self.mock_runner.run.assert_called_once_with(
-            [settings.sbd_exec, "-d", device, "dump"]
+            [settings.sbd_exec, "-d", device, "dump"], timeout=None
         )
 
     def test_failed(self):
@@ -517,7 +520,7 @@ class GetDeviceSbdHeaderDumpTest(TestCase):
             ),
         )
         self.mock_runner.run.assert_called_once_with(
-            [settings.sbd_exec, "-d", device, "dump"]
+            [settings.sbd_exec, "-d", device, "dump"], timeout=None
         )
 
 
@@ -613,6 +616,116 @@ class ValidateDeviceDictTest(TestCase):
         )
 
 
+class GetDevicesInfoTest(TestCase):
+    def setUp(self):
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = tmp_dir.name
+        self.run_records = []
+        self.runner = CommandRunner(
+            mock.MagicMock(logging.Logger),
+            MockLibraryReportProcessor(),
+            {"PATH": os.environ.get("PATH", "/usr/bin:/bin")},
+            run_records=self.run_records,
+        )
+        patcher = mock.patch.object(
+            settings, "sbd_exec", get_test_resource("sbd_stub")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fixture_device(self, name, delay):
+        # sbd stub reads the device for the number of seconds in the file
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "w") as device:
+            device.write(f"{delay}\n")
+        return path
+
+    def fixture_info(self, device, dump=True):
+        return {
+            "device": device,
+            "list": "0\tnode1\tclear\n1\tnode2\tclear\n",
+            "dump": (
+                outdent(
+                    f"""\
+                    ==Dumping header on disk {device}
+                    Header version     : 2.1
+                    Number of slots    : 255
+                    ==Header on disk {device} is dumped
+                    """
+                )
+                if dump
+                else None
+            ),
+        }
+
+    def get_run_count(self, sbd_command):
+        return len(
+            [
+                record
+                for record in self.run_records
+                if record.args[-1] == sbd_command
+            ]
+        )
+
+    def test_devices_read_concurrently(self):
+        # a device is not read until all the devices are being read
+        barrier_dir = os.path.join(self.tmp_dir, "barrier")
+        os.mkdir(barrier_dir)
+        device_list = [
+            self.fixture_device(f"device{i}", f"barrier {barrier_dir} 3")
+            for i in range(3)
+        ]
+        info_list, report_list = lib_sbd.get_devices_info(
+            self.runner, device_list, dump=True
+        )
+        self.assertEqual(
+            info_list, [self.fixture_info(device) for device in device_list]
+        )
+        self.assertEqual(report_list, [])
+
+    def test_timeout(self):
+        slow_device = self.fixture_device("slow", 3)
+        device = self.fixture_device("device", 0)
+        info_list, report_list = lib_sbd.get_devices_info(
+            self.runner, [slow_device, device], timeout=1
+        )
+        self.assertEqual(
+            info_list,
+            [
+                {"device": slow_device, "list": None, "dump": None},
+                self.fixture_info(device, dump=False),
+            ],
+        )
+        assert_report_item_list_equal(
+            report_list,
+            [
+                (
+                    Severities.ERROR,
+                    report_codes.RUN_EXTERNAL_PROCESS_TIMED_OUT,
+                    {
+                        "command": (
+                            f"{settings.sbd_exec} -d {slow_device} list"
+                        ),
+                        "timeout": 1,
+                    },
+                )
+            ],
+        )
+
+    def test_device_read_failure(self):
+        device = os.path.join(self.tmp_dir, "missing")
+        info_list, report_list = lib_sbd.get_devices_info(
+            self.runner, [device], dump=True
+        )
+        self.assertEqual(
+            info_list, [{"device": device, "list": None, "dump": None}]
+        )
+        self.assertEqual(len(report_list), 1)
+        self.assertEqual(self.get_run_count("list"), 1)
+        self.assertEqual(self.get_run_count("dump"), 0)
+
+
 class GetAvailableWatchdogs(TestCase):
     """
     Tested in pcs_test.tier0.lib.commands.sbd.test_watchdog_list
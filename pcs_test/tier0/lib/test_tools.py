@@ -1,7 +1,11 @@
+import os
+import stat
 from unittest import TestCase
 
 from pcs.lib import tools
 
+from pcs_test.tools.misc import get_tmp_dir
+
 
 class EnvironmentFileToDictTest(TestCase):
     def test_success(self):
@@ -38,3 +42,35 @@ ANOTHER ONE="complex value"
 OPTION=value
 """
         self.assertEqual(expected, tools.dict_to_environment_file(cfg_dict))
+
+
+class WriteFileAtomically(TestCase):
+    def setUp(self):
+        self.tmp_dir = get_tmp_dir("tier0_lib_tools")
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "cache.json")
+
+    def assert_file(self, content, mode):
+        with open(self.path) as file:
+            self.assertEqual(file.read(), content)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), mode)
+        # no temporary file is left behind
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["cache.json"])
+
+    def test_new_file(self):
+        tools.write_file_atomically(self.path, "new data")
+        self.assert_file("new data", 0o600)
+
+    def test_existing_file_mode_kept(self):
+        with open(self.path, "w") as file:
+            file.write("old data")
+        os.chmod(self.path, 0o640)
+        tools.write_file_atomically(self.path, "new data")
+        self.assert_file("new data", 0o640)
+
+    def test_error(self):
+        with self.assertRaises(OSError):
+            tools.write_file_atomically(
+                os.path.join(self.tmp_dir.name, "missing", "cache.json"), "data"
+            )
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
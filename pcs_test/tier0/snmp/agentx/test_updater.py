@@ -0,0 +1,158 @@
+from unittest import TestCase
+
+from pcs.snmp.agentx import updater
+from pcs.snmp.agentx.types import IntegerType, Oid, StringType
+
+OID_TREE = Oid(
+    0,
+    "root",
+    member_list=[
+        Oid(
+            1,
+            "scalars",
+            member_list=[
+                Oid(1, "name", StringType),
+                Oid(2, "count", IntegerType),
+            ],
+        ),
+        Oid(
+            2,
+            "table",
+            member_list=[
+                Oid(
+                    1,
+                    "entry",
+                    member_list=[
+                        Oid(1, "id", StringType),
+                        Oid(2, "node", StringType),
+                        Oid(3, "value", IntegerType),
+                    ],
+                )
+            ],
+        ),
+    ],
+)
+
+STRING = StringType("").data_type
+INTEGER = IntegerType(0).data_type
+# index "r1", "n1" encoded as an oid
+ROW_ID = "2.114.49.2.110.49"
+
+
+def fixture_value(oid, data_type, value):
+    return {oid: {"name": oid, "type": data_type, "value": value}}
+
+
+class Updater(updater.AgentxUpdaterBase):
+    _oid_tree = OID_TREE
+
+
+def fixture_updater():
+    updater_obj = Updater()
+    # pyagentx empties the data before each update
+    updater_obj._data = {}  # pylint: disable=protected-access
+    return updater_obj
+
+
+class StrOidToOid(TestCase):
+    def test_value(self):
+        oid, oid_cls = updater._str_oid_to_oid(OID_TREE, "scalars.count")
+        self.assertEqual(oid, "1.2")
+        self.assertEqual(oid_cls.str_oid, "count")
+
+    def test_object_identifier(self):
+        # a partial oid is returned for an entity which is not a value, e.g.
+        # to be used as a base oid of a table
+        oid, oid_cls = updater._str_oid_to_oid(OID_TREE, "table.entry")
+        self.assertEqual(oid, "2.1")
+        self.assertEqual(oid_cls.str_oid, "entry")
+        self.assertIsNone(oid_cls.data_type)
+
+    def test_not_found(self):
+        with self.assertRaises(AssertionError):
+            updater._str_oid_to_oid(OID_TREE, "table.missing")
+
+
+class SetValue(TestCase):
+    def test_value(self):
+        updater_obj = fixture_updater()
+        updater_obj.set_value("scalars.count", 5)
+        self.assertEqual(
+            updater_obj.get_raw_values(), fixture_value("1.2.0", INTEGER, 5)
+        )
+
+    def test_list(self):
+        updater_obj = fixture_updater()
+        updater_obj.set_value("scalars.name", ["a", "b"])
+        self.assertEqual(
+            updater_obj.get_raw_values(),
+            {
+                **fixture_value("1.1.0", STRING, "a"),
+                **fixture_value("1.1.1", STRING, "b"),
+            },
+        )
+
+    def test_object_identifier(self):
+        updater_obj = fixture_updater()
+        with self.assertRaises(AssertionError):
+            updater_obj.set_value("table.entry", 5)
+        self.assertEqual(updater_obj.get_raw_values(), {})
+
+    def test_get_oid(self):
+        self.assertEqual(fixture_updater().get_oid("table.entry"), "2.1")
+
+
+class Table(TestCase):
+    row = [StringType("r1"), StringType("n1"), IntegerType(7)]
+
+    def test_row_to_raw_values(self):
+        self.assertEqual(
+            updater.AgentxUpdaterBase.table_row_to_raw_values(
+                "2.1", self.row, index_size=2
+            ),
+            fixture_value(f"2.1.3.{ROW_ID}", INTEGER, 7),
+        )
+
+    def test_row_to_raw_values_one_column_index(self):
+        self.assertEqual(
+            updater.AgentxUpdaterBase.table_row_to_raw_values("2.1", self.row),
+            {
+                **fixture_value("2.1.2.2.114.49", STRING, "n1"),
+                **fixture_value("2.1.3.2.114.49", INTEGER, 7),
+            },
+        )
+
+    def test_empty_row(self):
+        self.assertEqual(
+            updater.AgentxUpdaterBase.table_row_to_raw_values("2.1", []), {}
+        )
+
+    def test_set_table(self):
+        updater_obj = fixture_updater()
+        updater_obj.set_table(
+            "2.1",
+            [
+                self.row,
+                [],
+                [StringType("r1"), StringType("n2"), IntegerType(8)],
+            ],
+            index_size=2,
+        )
+        self.assertEqual(
+            updater_obj.get_raw_values(),
+            {
+                **fixture_value(f"2.1.3.{ROW_ID}", INTEGER, 7),
+                **fixture_value("2.1.3.2.114.49.2.110.50", INTEGER, 8),
+            },
+        )
+
+    def test_set_raw_values(self):
+        updater_obj = fixture_updater()
+        updater_obj.set_value("scalars.count", 1)
+        raw_values = updater_obj.get_raw_values()
+        updater_obj.set_value("scalars.count", 2)
+        # get_raw_values returns a copy, not the live data
+        self.assertEqual(raw_values, fixture_value("1.2.0", INTEGER, 1))
+        updater_obj._data = {}  # pylint: disable=protected-access
+        updater_obj.set_raw_values(raw_values)
+        self.assertEqual(updater_obj.get_raw_values(), raw_values)
@@ -0,0 +1,258 @@
+from textwrap import dedent
+from unittest import TestCase, mock
+
+from pcs import settings
+from pcs.lib.external import CommandRunner
+from pcs.snmp import cluster_status as lib
+
+from pcs_test.tools.misc import get_test_resource as rc
+from pcs_test.tools.misc import read_test_resource
+
+
+def fixture_node(name, online=True, standby=False, node_type="member"):
+    return f"""
+        <node name="{name}" id="{name}" online="{str(online).lower()}"
+            standby="{str(standby).lower()}" standby_onfail="false"
+            maintenance="false" pending="false" unclean="false"
+            shutdown="false" expected_up="true" is_dc="false"
+            resources_running="0" type="{node_type}"
+        />
+    """
+
+
+def fixture_primitive(
+    resource_id,
+    node_names=(),
+    role="Started",
+    target_role=None,
+    failed=False,
+):
+    target_role = (
+        f'target_role="{target_role}"' if target_role is not None else ""
+    )
+    nodes = "".join(
+        f'<node name="{node}" id="{node}" cached="true"/>'
+        for node in node_names
+    )
+    return f"""
+        <resource id="{resource_id}" resource_agent="ocf:heartbeat:Dummy"
+            role="{role}" {target_role} active="{str(bool(node_names)).lower()}"
+            orphaned="false" removed="false" blocked="false"
+            maintenance="false"
+            managed="true" failed="{str(failed).lower()}"
+            failure_ignored="false" nodes_running_on="{len(node_names)}"
+        >{nodes}</resource>
+    """
+
+
+def fixture_crm_mon(nodes, resources, node_history="", with_quorum=True):
+    return f"""
+        <pacemaker-result api-version="2.30"
+            request="crm_mon --one-shot --inactive --output-as xml"
+        >
+          <summary>
+            <stack type="corosync"/>
+            <current_dc present="true" version="2.1.7" name="rh7-1" id="1"
+                with_quorum="{str(with_quorum).lower()}"
+                mixed_version="false"
+            />
+            <last_update time="Wed Jan 31 12:03:35 2024"/>
+            <last_change time="Wed Jan 31 12:03:35 2024" user=""
+                client="crmd" origin="rh7-1"
+            />
+            <nodes_configured number="3"/>
+            <resources_configured number="0" disabled="0" blocked="0"/>
+            <cluster_options stonith-enabled="true" symmetric-cluster="true"
+                no-quorum-policy="stop" maintenance-mode="false"
+                stop-all-resources="false" stonith-timeout-ms="60000"
+                priority-fencing-delay-ms="0"
+            />
+          </summary>
+          <nodes>{"".join(nodes)}</nodes>
+          <resources>{"".join(resources)}</resources>
+          {node_history}
+          <status code="0" message="OK"/>
+        </pacemaker-result>
+    """
+
+
+QUORUM_STATUS = dedent(
+    """\
+    Quorum information
+    ------------------
+    Date:             Fri Jan 16 13:03:28 2015
+    Quorum provider:  corosync_votequorum
+    Nodes:            2
+    Node ID:          1
+    Ring ID:          19860
+    Quorate:          Yes
+
+    Votequorum information
+    ----------------------
+    Expected votes:   3
+    Highest expected: 3
+    Total votes:      2
+    Quorum:           2
+    Flags:            Quorate
+
+    Membership information
+    ----------------------
+        Nodeid      Votes    Qdevice Name
+             1          1         NR rh7-1 (local)
+             2          1         NR rh7-2
+    """
+)
+
+
+@mock.patch.object(
+    settings, "pacemaker_api_result_schema", rc("pcmk_rng/api/api-result.rng")
+)
+@mock.patch(
+    "pcs.snmp.cluster_status.get_local_corosync_conf",
+    lambda: read_test_resource("corosync-3nodes.conf"),
+)
+class GetClusterStatus(TestCase):
+    def setUp(self):
+        self.crm_mon = fixture_crm_mon(
+            [
+                fixture_node("rh7-1"),
+                fixture_node("rh7-2", standby=True),
+                fixture_node("rh7-3", online=False),
+                fixture_node("remote-1", node_type="remote"),
+            ],
+            [
+                fixture_primitive("R1", ["rh7-1"]),
+                fixture_primitive("R2", role="Stopped", target_role="Stopped"),
+                fixture_primitive("R3", role="Stopped", failed=True),
+                f"""
+                <clone id="C-clone" multi_state="false" unique="false"
+                    maintenance="false" managed="true" disabled="false"
+                    failed="false" failure_ignored="false"
+                >
+                    {fixture_primitive("C", ["rh7-1"])}
+                    {fixture_primitive("C", ["rh7-2"])}
+                </clone>
+                """,
+                fixture_primitive("R4", role="Stopped"),
+            ],
+            """
+            <node_history>
+              <node name="rh7-1">
+                <resource_history id="R3" removed="false" orphan="false"
+                    migration-threshold="1000000" fail-count="INFINITY"
+                />
+                <resource_history id="C:0" removed="false" orphan="false"
+                    migration-threshold="1000000" fail-count="2"
+                />
+                <resource_history id="C:1" removed="false" orphan="false"
+                    migration-threshold="1000000" fail-count="1"
+                />
+              </node>
+            </node_history>
+            """,
+        )
+        self.quorum_status = QUORUM_STATUS
+        self.runner = mock.Mock(spec_set=CommandRunner)
+        self.runner.run.side_effect = self._run
+
+    def _run(self, args, **kwargs):
+        del kwargs
+        if args[0] == settings.crm_mon_exec:
+            return self.crm_mon, "", 0
+        if args[0] == settings.corosync_quorumtool_exec:
+            if self.quorum_status is None:
+                return "", "Cannot initialize CMAP service", 1
+            return self.quorum_status, "", 0
+        raise AssertionError(f"Unexpected command {args}")
+
+    def test_success(self):
+        self.assertEqual(
+            lib.get_cluster_status(self.runner),
+            lib.ClusterStatus(
+                cluster_name="test99",
+                quorate=True,
+                known_nodes=("rh7-1", "rh7-2", "rh7-3"),
+                corosync_nodes_online=("rh7-1", "rh7-2"),
+                corosync_nodes_offline=("rh7-3",),
+                pacemaker_nodes_online=("rh7-1",),
+                pacemaker_nodes_standby=("rh7-2",),
+                pacemaker_nodes_offline=("rh7-3",),
+                resource_list=(
+                    lib.ResourceStatus(
+                        "R1",
+                        lib.RESOURCE_STATUS_RUNNING,
+                        (
+                            lib.ResourceInstanceStatus(
+                                "R1", "rh7-1", "Started", 0
+                            ),
+                        ),
+                    ),
+                    lib.ResourceStatus(
+                        "R2",
+                        lib.RESOURCE_STATUS_DISABLED,
+                        (lib.ResourceInstanceStatus("R2", "", "Stopped", 0),),
+                    ),
+                    lib.ResourceStatus(
+                        "R3",
+                        lib.RESOURCE_STATUS_FAILED,
+                        (
+                            lib.ResourceInstanceStatus(
+                                "R3", "rh7-1", "Stopped", 1000000
+                            ),
+                        ),
+                    ),
+                    lib.ResourceStatus(
+                        "C",
+                        lib.RESOURCE_STATUS_RUNNING,
+                        (
+                            lib.ResourceInstanceStatus(
+                                "C", "rh7-1", "Started", 3
+                            ),
+                            lib.ResourceInstanceStatus(
+                                "C", "rh7-2", "Started", 0
+                            ),
+                        ),
+                    ),
+                    lib.ResourceStatus(
+                        "R4",
+                        lib.RESOURCE_STATUS_BLOCKED,
+                        (lib.ResourceInstanceStatus("R4", "", "Stopped", 0),),
+                    ),
+                ),
+            ),
+        )
+
+    def test_status_is_comparable(self):
+        self.assertEqual(
+            lib.get_cluster_status(self.runner),
+            lib.get_cluster_status(self.runner),
+        )
+
+    def test_corosync_not_running(self):
+        self.quorum_status = None
+        status = lib.get_cluster_status(self.runner)
+        self.assertEqual(status.corosync_nodes_online, ())
+        self.assertEqual(
+            status.corosync_nodes_offline, ("rh7-1", "rh7-2", "rh7-3")
+        )
+
+    def test_not_quorate(self):
+        self.crm_mon = fixture_crm_mon([], [], with_quorum=False)
+        status = lib.get_cluster_status(self.runner)
+        self.assertFalse(status.quorate)
+        self.assertEqual(status.resource_list, ())
+
+    def test_pacemaker_not_running(self):
+        self.crm_mon = "error: Connection to cluster failed"
+        with self.assertRaises(lib.ClusterStatusError):
+            lib.get_cluster_status(self.runner)
+
+    def test_corosync_conf_not_readable(self):
+        with (
+            mock.patch(
+                "pcs.snmp.cluster_status.get_local_corosync_conf",
+                lambda: "totem {",
+            ),
+            self.assertRaises(lib.ClusterStatusError),
+        ):
+            lib.get_cluster_status(self.runner)
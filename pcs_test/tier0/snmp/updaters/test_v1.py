@@ -0,0 +1,236 @@
+from unittest import TestCase, mock
+
+from pcs.snmp.agentx.types import IntegerType, StringType
+from pcs.snmp.cluster_status import (
+    RESOURCE_STATUS_DISABLED,
+    RESOURCE_STATUS_FAILED,
+    RESOURCE_STATUS_RUNNING,
+    ClusterStatus,
+    ClusterStatusError,
+    ResourceInstanceStatus,
+    ResourceStatus,
+)
+from pcs.snmp.updaters import v1
+
+STRING = StringType("").data_type
+INTEGER = IntegerType(0).data_type
+CLUSTER_OID = "1"
+TABLE_OID = "3.1.1"
+
+
+def fixture_resource(resource_id, status, node_list=("node1",), fail_count=0):
+    return ResourceStatus(
+        resource_id,
+        status,
+        tuple(
+            ResourceInstanceStatus(
+                resource_id,
+                node,
+                "Started" if status == RESOURCE_STATUS_RUNNING else "Stopped",
+                fail_count,
+            )
+            for node in node_list
+        ),
+    )
+
+
+def fixture_status(resource_list):
+    return ClusterStatus(
+        cluster_name="test-cluster",
+        quorate=True,
+        known_nodes=("node1", "node2"),
+        corosync_nodes_online=("node1", "node2"),
+        corosync_nodes_offline=(),
+        pacemaker_nodes_online=("node1",),
+        pacemaker_nodes_standby=("node2",),
+        pacemaker_nodes_offline=(),
+        resource_list=tuple(resource_list),
+    )
+
+
+def str_to_oid(value):
+    return ".".join([str(len(value))] + [str(ord(char)) for char in value])
+
+
+def get_value(raw_values, oid):
+    return raw_values[oid]["value"]
+
+
+def get_row(raw_values, resource_id, node):
+    row_id = f"{str_to_oid(resource_id)}.{str_to_oid(node)}"
+    return [
+        get_value(raw_values, f"{TABLE_OID}.{column}.{row_id}")
+        for column in (3, 4, 5)
+    ]
+
+
+def get_table_oids(raw_values):
+    return {oid for oid in raw_values if oid.startswith(f"{TABLE_OID}.")}
+
+
+@mock.patch("pcs.snmp.updaters.v1.cmd_runner", lambda: None)
+@mock.patch("pcs.snmp.updaters.v1.get_cluster_status")
+class ClusterPcsV1Updater(TestCase):
+    def setUp(self):
+        self.updater = v1.ClusterPcsV1Updater()
+        self.resource_a = fixture_resource(
+            "A", RESOURCE_STATUS_RUNNING, ("node1",)
+        )
+        self.resource_b = fixture_resource("B", RESOURCE_STATUS_DISABLED, ("",))
+
+    def run_update(self):
+        # pyagentx empties the data before each update and sends the data set
+        # by the update to snmpd
+        self.updater._data = {}  # pylint: disable=protected-access
+        self.updater.update()
+        return self.updater.get_raw_values()
+
+    def test_values(self, mock_get_status):
+        mock_get_status.return_value = fixture_status(
+            [
+                self.resource_a,
+                self.resource_b,
+                fixture_resource(
+                    "C", RESOURCE_STATUS_FAILED, ("node1", "node2"), 3
+                ),
+            ]
+        )
+        raw_values = self.run_update()
+        self.assertEqual(
+            raw_values[f"{CLUSTER_OID}.1.0"],
+            {"name": "1.1.0", "type": STRING, "value": "test-cluster"},
+        )
+        self.assertEqual(get_value(raw_values, f"{CLUSTER_OID}.2.0"), 1)
+        self.assertEqual(get_value(raw_values, f"{CLUSTER_OID}.11.0"), 1)
+        self.assertEqual(get_value(raw_values, f"{CLUSTER_OID}.12.0"), "node2")
+        self.assertEqual(get_value(raw_values, f"{CLUSTER_OID}.15.0"), 3)
+        self.assertEqual(get_value(raw_values, f"{CLUSTER_OID}.17.0"), 1)
+        self.assertEqual(get_value(raw_values, f"{CLUSTER_OID}.18.0"), "A")
+        self.assertEqual(get_value(raw_values, f"{CLUSTER_OID}.20.0"), "B")
+        self.assertEqual(get_value(raw_values, f"{CLUSTER_OID}.22.0"), "C")
+        self.assertEqual(
+            get_row(raw_values, "A", "node1"),
+            ["Started", RESOURCE_STATUS_RUNNING, 0],
+        )
+        self.assertEqual(
+            get_row(raw_values, "B", ""),
+            ["Stopped", RESOURCE_STATUS_DISABLED, 0],
+        )
+        self.assertEqual(
+            get_row(raw_values, "C", "node2"),
+            ["Stopped", RESOURCE_STATUS_FAILED, 3],
+        )
+        self.assertEqual(
+            raw_values[
+                f"{TABLE_OID}.5.{str_to_oid('C')}.{str_to_oid('node2')}"
+            ]["type"],
+            INTEGER,
+        )
+        self.assertEqual(len(get_table_oids(raw_values)), 4 * 3)
+
+    def test_status_not_changed(self, mock_get_status):
+        mock_get_status.side_effect = [
+            fixture_status([self.resource_a, self.resource_b]),
+            fixture_status([self.resource_a, self.resource_b]),
+        ]
+        first_raw_values = self.run_update()
+        with (
+            mock.patch.object(self.updater, "set_value") as mock_set_value,
+            mock.patch.object(
+                self.updater, "table_row_to_raw_values"
+            ) as mock_row,
+        ):
+            second_raw_values = self.run_update()
+        # values are not computed again, the last ones are reused
+        mock_set_value.assert_not_called()
+        mock_row.assert_not_called()
+        self.assertEqual(second_raw_values, first_raw_values)
+
+    def test_resource_changed(self, mock_get_status):
+        resource_a_failed = fixture_resource(
+            "A", RESOURCE_STATUS_FAILED, ("node1",), 1
+        )
+        mock_get_status.side_effect = [
+            fixture_status([self.resource_a, self.resource_b]),
+            fixture_status([resource_a_failed, self.resource_b]),
+        ]
+        self.run_update()
+        with mock.patch.object(
+            self.updater,
+            "table_row_to_raw_values",
+            wraps=self.updater.table_row_to_raw_values,
+        ) as mock_row:
+            raw_values = self.run_update()
+        # only the row of the changed resource is encoded again
+        self.assertEqual(
+            mock_row.call_args_list,
+            [
+                mock.call(
+                    TABLE_OID,
+                    [
+                        StringType("A"),
+                        StringType("node1"),
+                        StringType("Stopped"),
+                        StringType(RESOURCE_STATUS_FAILED),
+                        IntegerType(1),
+                    ],
+                    index_size=2,
+                )
+            ],
+        )
+        self.assertEqual(
+            get_row(raw_values, "A", "node1"),
+            ["Stopped", RESOURCE_STATUS_FAILED, 1],
+        )
+        self.assertEqual(
+            get_row(raw_values, "B", ""),
+            ["Stopped", RESOURCE_STATUS_DISABLED, 0],
+        )
+        self.assertEqual(get_value(raw_values, f"{CLUSTER_OID}.17.0"), 0)
+        self.assertEqual(get_value(raw_values, f"{CLUSTER_OID}.22.0"), "A")
+
+    def test_resource_removed(self, mock_get_status):
+        mock_get_status.side_effect = [
+            fixture_status([self.resource_a, self.resource_b]),
+            fixture_status([self.resource_b]),
+            fixture_status([self.resource_a, self.resource_b]),
+        ]
+        self.run_update()
+        raw_values = self.run_update()
+        self.assertEqual(
+            get_table_oids(raw_values),
+            {
+                f"{TABLE_OID}.{column}.{str_to_oid('B')}.{str_to_oid('')}"
+                for column in (3, 4, 5)
+            },
+        )
+        self.assertEqual(get_value(raw_values, f"{CLUSTER_OID}.15.0"), 1)
+        # the removed resource is encoded again once it is back
+        with mock.patch.object(
+            self.updater,
+            "table_row_to_raw_values",
+            wraps=self.updater.table_row_to_raw_values,
+        ) as mock_row:
+            raw_values = self.run_update()
+        self.assertEqual(mock_row.call_count, 1)
+        self.assertEqual(len(get_table_oids(raw_values)), 2 * 3)
+
+    @mock.patch("pcs.snmp.updaters.v1.logger")
+    def test_status_error(self, mock_logger, mock_get_status):
+        mock_get_status.side_effect = [
+            fixture_status([self.resource_a]),
+            ClusterStatusError("crm_mon failed"),
+            fixture_status([self.resource_a]),
+        ]
+        self.run_update()
+        self.assertEqual(self.run_update(), {})
+        mock_logger.error.assert_called_once_with(
+            "Unable to obtain cluster status: %s", mock.ANY
+        )
+        # the last successfully obtained status is still used for comparison
+        with mock.patch.object(
+            self.updater, "table_row_to_raw_values"
+        ) as mock_row:
+            raw_values = self.run_update()
+        mock_row.assert_not_called()
+        self.assertEqual(len(get_table_oids(raw_values)), 3)
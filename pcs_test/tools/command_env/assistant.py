@@ -61,7 +61,7 @@ def patch_env(call_queue, config, init_env):
     mock_communicator_factory = mock.Mock(spec_set=NodeCommunicatorFactory)
     mock_communicator_factory.get_communicator = (
         # TODO: use request_timeout
-        lambda request_timeout=None: (
+        lambda request_timeout=None, communicator_logger=None: (
             NodeCommunicator(call_queue)
             if not config.spy
             else spy.NodeCommunicator(get_node_communicator())
@@ -81,8 +81,8 @@ def patch_env(call_queue, config, init_env):
         )
     )
 
-    def get_cmd_runner(self, env=None):
-        del self
+    def get_cmd_runner(self, env=None, report_processor=None):
+        del self, report_processor
         if config.spy:
             return spy.Runner(orig_cmd_runner())
         env_vars = {}
@@ -103,11 +103,21 @@ def patch_env(call_queue, config, init_env):
             ),
         ),
         patch_lib_env("communicator_factory", mock_communicator_factory),
+        # Do not cache features of and metadata from pacemaker tools, the
+        # tests expect them to be obtained by running the tools
+        mock.patch(
+            "pcs.lib.pacemaker.tool_features.get_tool_identity",
+            lambda tool: None,
+        ),
         # Use our custom ServiceManager in tests
         # TODO: add support for Spy
         patch_lib_env(
             "_get_service_manager", lambda _: ServiceManagerMock(call_queue)
         ),
+        patch_lib_env(
+            "create_service_manager",
+            lambda _self, _report_processor: ServiceManagerMock(call_queue),
+        ),
     ]
     if is_fcntl_call_in(call_queue):
         fcntl_mock = get_fcntl_mock(call_queue)
@@ -258,6 +268,7 @@ class EnvAssistant:
         self,
         user_login: str | None = None,
         user_groups: StringIterable | None = None,
+        request_timeout: int | None = None,
     ):
         self.__call_queue = CallQueue(self.__config.calls)
         self._env = LibraryEnvironment(
@@ -273,6 +284,7 @@ class EnvAssistant:
             booth_files_data=self.__config.env.booth,
             user_login=user_login,
             user_groups=user_groups,
+            request_timeout=request_timeout,
         )
         self.__unpatch = patch_env(
             self.__call_queue,
@@ -81,3 +81,92 @@ class SbdShortcuts:
             communication_list,
             action="remote/set_sbd_config",
         )
+
+    def check_sbd_on_online_nodes(
+        self,
+        communication_list,
+        check_auth_communication_list=None,
+        name="http.sbd.check_sbd_on_online_nodes",
+    ):
+        """
+        Create a call for checking nodes are online and checking sbd on each
+        node once it is known to be online
+
+        communication_list list -- custom check_sbd responses of online nodes
+        check_auth_communication_list list -- custom check_auth responses,
+            defaults to success responses from nodes in communication_list
+        name string -- the key of this call
+        """
+        if check_auth_communication_list is None:
+            check_auth_communication_list = [
+                dict(label=com["label"]) for com in communication_list
+            ]
+        place_multinode_call(
+            self.__calls,
+            name,
+            None,
+            # check_sbd is requested from each node separately right after
+            # the node responds to check_auth
+            [
+                [
+                    dict(
+                        action="remote/check_auth",
+                        output='{"success":true}',
+                        param_list=[("check_auth_only", 1)],
+                    )
+                    | com
+                    for com in check_auth_communication_list
+                ]
+            ]
+            + [
+                [dict(action="remote/check_sbd") | com]
+                for com in communication_list
+            ],
+        )
+
+    def enable_sbd_on_nodes(
+        self,
+        config_generator=None,
+        node_labels=None,
+        remove_communication_list=None,
+        enable_communication_list=None,
+        name="http.sbd.enable_sbd_on_nodes",
+    ):
+        """
+        Create calls for distributing sbd config to all nodes, removing
+        stonith-watchdog-timeout from the first node that succeeds and
+        enabling sbd on all nodes
+
+        config_generator callable -- create sbd config for a node label
+        node_labels list -- create success responses from these nodes
+        remove_communication_list list -- custom
+            remove_stonith_watchdog_timeout responses, one list of responses
+            for each attempt, defaults to a success response from the first
+            node
+        enable_communication_list list -- custom sbd_enable responses, if
+            False, sbd is not expected to be enabled
+        name string -- the key of this call
+        """
+        self.set_sbd_config(
+            config_generator=config_generator,
+            node_labels=node_labels,
+            name=f"{name}.set_sbd_config",
+        )
+        if remove_communication_list is None:
+            remove_communication_list = [
+                [dict(label=node)] for node in node_labels
+            ]
+        place_multinode_call(
+            self.__calls,
+            f"{name}.remove_stonith_watchdog_timeout",
+            None,
+            remove_communication_list,
+            action="remote/remove_stonith_watchdog_timeout",
+        )
+        if enable_communication_list is False:
+            return
+        self.enable_sbd(
+            node_labels=None if enable_communication_list else node_labels,
+            communication_list=enable_communication_list,
+            name=f"{name}.enable_sbd",
+        )
@@ -164,6 +164,7 @@ class ServiceManagerConfig:
         name="services.is_enabled",
         before=None,
         instead=None,
+        exception=None,
     ):
         self.__calls.place(
             name,
@@ -172,6 +173,7 @@ class ServiceManagerConfig:
                 service=service,
                 instance=instance,
                 return_value=return_value,
+                exception=exception,
             ),
             before=before,
             instead=instead,
@@ -185,6 +187,7 @@ class ServiceManagerConfig:
         return_value=True,
         before=None,
         instead=None,
+        exception=None,
     ):
         self.__calls.place(
             name,
@@ -193,6 +196,32 @@ class ServiceManagerConfig:
                 service,
                 instance=instance,
                 return_value=return_value,
+                exception=exception,
+            ),
+            before=before,
+            instead=instead,
+        )
+
+    def get_services_state(
+        self,
+        services_state,
+        name="services.get_services_state",
+        before=None,
+        instead=None,
+        exception=None,
+    ):
+        """
+        services_state dict -- expected services and their state, keys are
+            service names, values are ServiceState instances
+        exception -- exception raised instead of returning the state
+        """
+        self.__calls.place(
+            name,
+            Call(
+                "get_services_state",
+                service=tuple(services_state.keys()),
+                return_value=dict(services_state),
+                exception=exception,
             ),
             before=before,
             instead=instead,
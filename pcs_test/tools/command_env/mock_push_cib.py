@@ -66,6 +66,10 @@ def get_push_cib(call_queue):
         if expected_call.exception:
             raise expected_call.exception
 
+        # the CIB can be loaded again after it has been pushed
+        lib_env._LibraryEnvironment__loaded_cib_diff_source = None
+        lib_env._LibraryEnvironment__loaded_cib_to_modify = None
+
     return push_cib
 
 
@@ -120,9 +120,14 @@ class Runner:
         return self.__env_vars
 
     def run(
-        self, args, stdin_string=None, env_extend=None, binary_output=False
+        self,
+        args,
+        stdin_string=None,
+        env_extend=None,
+        binary_output=False,
+        timeout=None,
     ):
-        del binary_output
+        del binary_output, timeout
         i, call = self.__call_queue.take(CALL_TYPE_RUNNER, args)
 
         if args != call.command:
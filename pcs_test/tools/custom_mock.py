@@ -1,7 +1,9 @@
 import contextlib
 import io
 import socket
-from collections.abc import Callable, Iterable, Mapping
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from hashlib import md5
 from pathlib import Path
@@ -9,9 +11,11 @@ from unittest import mock
 
 import pcs.common.pcs_pycurl as pycurl
 from pcs import settings
+from pcs.common.node_communicator import Request, Response
 from pcs.common.reports import ReportItemSeverity, ReportProcessor
 from pcs.common.types import CibRuleInEffectStatus
 from pcs.lib.cib.rule.in_effect import RuleInEffectEval
+from pcs.lib.corosync import address_resolver
 from pcs.lib.external import CommandRunner
 
 from pcs_test.tools.assertions import assert_report_item_list_equal
@@ -44,6 +48,9 @@ def patch_getaddrinfo(test_case, addr_list):
     patcher = mock.patch("socket.getaddrinfo", get_getaddrinfo_mock(addr_list))
     patcher.start()
     test_case.addCleanup(patcher.stop)
+    # do not let addresses resolved in other tests affect the test
+    address_resolver.clear_cache()
+    test_case.addCleanup(address_resolver.clear_cache)
     return addr_list
 
 
@@ -165,6 +172,10 @@ class MockLibraryReportProcessor(ReportProcessor):
         self.debug = debug
         self.items = []
 
+    @property
+    def is_debug_enabled(self):
+        return self.debug
+
     def _do_report(self, report_item):
         if self.debug or report_item.severity != ReportItemSeverity.DEBUG:
             self.items.append(report_item)
@@ -265,6 +276,66 @@ class MockCurlSimple:
             raise AssertionError("info '#{0}' not defined".format(opt)) from e
 
 
+class GatedNodeCommunicator:
+    """
+    Run requests concurrently, a response may be held back until another
+    request is sent
+
+    Concurrency is asserted by holding a response of one node until another
+    node sends its request. If the code under test waited for the held
+    response first, the gate would not open and it would be recorded in
+    unmet_gate_list once the timeout expires.
+
+    get_response -- get a response for a request and a gate: (action, target
+        label) of a request which must be sent before the response is
+        returned, or None
+    timeout -- how long to wait for a gate to open, in seconds
+    """
+
+    def __init__(
+        self,
+        get_response: Callable[
+            [Request], tuple[tuple[str, str] | None, Response]
+        ],
+        timeout: float = 5,
+        max_workers: int = 8,
+    ):
+        self._get_response = get_response
+        self._timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._future_set: set[Future[Response]] = set()
+        self._lock = threading.Lock()
+        self._sent: dict[tuple[str, str], threading.Event] = {}
+        self.unmet_gate_list: list[tuple[tuple[str, str], tuple[str, str]]] = []
+
+    def _get_event(self, key: tuple[str, str]) -> threading.Event:
+        with self._lock:
+            return self._sent.setdefault(key, threading.Event())
+
+    def _respond(self, request: Request) -> Response:
+        gate, response = self._get_response(request)
+        if gate is not None and not self._get_event(gate).wait(self._timeout):
+            with self._lock:
+                self.unmet_gate_list.append(
+                    ((request.action, request.target.label), gate)
+                )
+        return response
+
+    def add_requests(self, request_list: Iterable[Request]) -> None:
+        for request in request_list:
+            self._get_event((request.action, request.target.label)).set()
+            self._future_set.add(self._executor.submit(self._respond, request))
+
+    def start_loop(self) -> Iterator[Response]:
+        with self._executor:
+            while self._future_set:
+                done, self._future_set = wait(
+                    self._future_set, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+
+
 class MockCurlMulti:
     def __init__(self, number_of_performed_list):
         self._number_of_performed_list = number_of_performed_list